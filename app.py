@@ -6,15 +6,12 @@ Club Atlético Colón
 import streamlit as st
 
 # Importar módulos refactorizados
-from utils.ui_utils import inicializar_session_state, aplicar_estilos_css, crear_header_principal, crear_footer, configurar_tema_oscuro
-from utils.data_utils import cargar_datos_optimizado
-from components.sidebar import crear_sidebar
-from modules.fuerza_analysis import analizar_fuerza, analizar_fuerza_grupal, analizar_fuerza_comparativo
-from modules.movilidad_analysis import (
-	analizar_movilidad,
-	analizar_movilidad_grupal,
-	analizar_movilidad_comparativo,
-)
+from utils.ui_utils import inicializar_session_state, aplicar_estilos_css, crear_header_principal, crear_footer, configurar_tema_oscuro, refrescar_con_datos_nuevos
+from utils.data_utils import cargar_datos_optimizado, cargar_historial_optimizado, obtener_datos_jugador
+from components.sidebar import crear_sidebar, crear_resumen_calidad
+from modules.secciones import analizar_vista
+from modules.heatmap_analysis import analizar_heatmap_grupal
+from modules.evolucion_analysis import analizar_evolucion
 from utils.pdf_report import construir_contexto_reporte_perfil, generar_pdf_reporte
 
 # ========= CONFIGURACIÓN DE PÁGINA ==========
@@ -48,10 +45,18 @@ def main():
 	aplicar_estilos_css()
 	
 	# Cargar datos (modo demo/real se resuelve dentro de cargar_datos_optimizado)
-	df = cargar_datos_optimizado()
+	df_historial = cargar_datos_optimizado()
+	historial = cargar_historial_optimizado(df_historial)
+	# Excel local: cuando el vigilante publica datos nuevos la app se vuelve a ejecutar sola
+	refrescar_con_datos_nuevos()
 	
 	# Crear sidebar y obtener selecciones (el botón de exportar ahora está dentro de la sidebar)
-	categoria, jugador, vista, seccion, exportar = crear_sidebar(df)
+	categoria, jugador, vista, seccion, exportar, fecha, referencia = crear_sidebar(historial)
+	# Valores anulados u observados por el control de calidad al cargar el Excel
+	crear_resumen_calidad(df_historial)
+	
+	# Las vistas trabajan con una fila por jugador: su evaluación vigente a la fecha elegida
+	df = historial.foto(fecha)
 	
 	# Crear header principal
 	crear_header_principal()
@@ -62,14 +67,10 @@ def main():
 		crear_header_seccion(seccion, jugador, categoria)
 		
 		# Obtener datos del jugador seleccionado
-		datos_jugador = df[(df["categoria"] == categoria) & (df["Deportista"] == jugador)].iloc[0]
+		datos_jugador = obtener_datos_jugador(df, categoria, jugador)
 		
-		# Análisis por sección
-		if seccion == "Fuerza":
-			analizar_fuerza(df, datos_jugador, jugador, categoria)
-			
-		elif seccion == "Movilidad":
-			analizar_movilidad(df, datos_jugador, jugador, categoria)
+		# Análisis de la sección (registrada en modules/secciones.py)
+		analizar_vista(vista, seccion, df, categoria, jugador, datos_jugador, referencia)
 	
 	elif vista == "Perfil del Grupo":
 		# Header de sección grupal - EXACTAMENTE IGUAL AL INDIVIDUAL
@@ -83,26 +84,39 @@ def main():
 		</div>
 		""", unsafe_allow_html=True)
 		
-		# Análisis por sección
-		if seccion == "Fuerza":
-			analizar_fuerza_grupal(df, categoria)
-			
-		elif seccion == "Movilidad":
-			analizar_movilidad_grupal(df, categoria)
+		# Análisis de la sección (registrada en modules/secciones.py)
+		analizar_vista(vista, seccion, df, categoria)
 		
 	elif vista == "Comparación Jugador vs Grupo":
 		# Header de sección comparativa
 		crear_header_seccion(seccion, jugador, categoria)
 		
 		# Obtener datos del jugador seleccionado
-		datos_jugador = df[(df["categoria"] == categoria) & (df["Deportista"] == jugador)].iloc[0]
+		datos_jugador = obtener_datos_jugador(df, categoria, jugador)
+		
+		# Análisis de la sección (registrada en modules/secciones.py)
+		analizar_vista(vista, seccion, df, categoria, jugador, datos_jugador, referencia)
+	
+	elif vista == "Heatmap del Grupo":
+		# Header de sección grupal
+		st.markdown(f"""
+		<div style='background: linear-gradient(135deg, rgba(220, 38, 38, 0.2), rgba(31, 41, 55, 0.2)); 
+					padding: 20px; border-radius: 15px; margin-bottom: 40px; margin-top: 30px;
+					border-left: 5px solid rgba(220, 38, 38, 1);'>
+			<h2 style='margin: 0; color: white; font-family: "Source Sans Pro", sans-serif; font-weight: 600; font-size: 1.5rem; line-height: 1.2; padding: 0.75rem 0 1rem;'>
+				Heatmap del Grupo – {seccion}
+			</h2>
+		</div>
+		""", unsafe_allow_html=True)
 		
-		# Análisis por sección
-		if seccion == "Fuerza":
-			analizar_fuerza_comparativo(df, datos_jugador, jugador, categoria)
+		analizar_heatmap_grupal(df, categoria, seccion)
+	
+	elif vista == "Evolución Longitudinal":
+		# Header de sección individual
+		crear_header_seccion(seccion, jugador, categoria)
 		
-		elif seccion == "Movilidad":
-			analizar_movilidad_comparativo(df, datos_jugador, jugador, categoria)
+		# Las tendencias se calculan sobre todas las sesiones, no solo la foto a la fecha
+		analizar_evolucion(historial.df, jugador, categoria, seccion, fecha)
 	
 	else:
 		st.warning("Esta visualización detallada está disponible solo en el modo 'Perfil del Jugador'.")
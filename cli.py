@@ -0,0 +1,445 @@
+"""
+Generador de reportes por línea de comandos (sin Streamlit)
+
+Pensado para ejecuciones batch en servidor (por ejemplo, un cron nocturno).
+Desde la carpeta del proyecto:
+
+	python -m cli report --out reportes/
+	python -m cli report --categoria Evaluacion_2910 --seccion Fuerza --formato html --out reportes/
+	python -m cli report --vista grupo --formato png --out reportes/
+	python -m cli report --graficos svg --graficos-en-archivos --formato html --out reportes/
+	python -m cli report --backend-pdf fpdf2 --out reportes/
+	python -m cli report --fecha 29/10/2025 --out reportes/
+	python -m cli report --fuentes data/fuentes.json --vista grupo --formato html --out reportes/
+	python -m cli comparar-graficos --jugador "JUGADOR 2"
+	python -m cli generar-datos --filas 50000 --categorias 3 --fechas 4 --out data/sintetico.xlsx
+	python -m cli benchmark --filas 100 1000 10000 --out benchmark.json
+	python -m cli memoria --excel data/sintetico.xlsx
+	python -m cli calidad --excel data/EVALUACIONES.xlsx --out calidad.csv
+
+Ninguno de los módulos usados aquí importa Streamlit: los cálculos son los mismos
+`obtener_componentes_perfil_*` que usa la exportación a PDF desde la app.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from config.settings import DATA_PATH, DATA_PATH_DEMO, VISTAS_GRUPALES
+from utils.esquemas import reporte_memoria
+from utils.data_utils import leer_evaluaciones_excel, procesar_datos_categoria, obtener_particion_categorias, obtener_datos_jugador
+from utils.longitudinal import EvaluacionesLongitudinales
+from utils.fuentes import leer_fuentes, IngestaFuentes
+from utils.ingesta import IngestaIncremental
+from utils.calidad import REGLAS_CALIDAD
+from utils.normas import obtener_servicio_normas
+from utils.pdf_report import (
+	construir_contexto_reporte_perfil,
+	generar_html_reporte,
+	generar_pdf_reporte,
+	obtener_componentes_reporte,
+	obtener_fecha_reporte,
+	renderizar_html_reporte,
+)
+from utils import pdf_report
+from utils.datos_sinteticos import escribir_libro_sintetico, jugadores_para_filas
+from utils.pdf_backends import BACKENDS_PDF, backends_pdf_disponibles, obtener_backend_pdf
+from modules.secciones import secciones_disponibles
+
+# Vista CLI → (nombre de la vista en la app, sufijo del archivo igual que en la sidebar)
+VISTAS = {
+	"perfil": ("Perfil del Jugador", "perfil"),
+	"grupo": ("Perfil del Grupo", "grupo"),
+	"comparacion": ("Comparación Jugador vs Grupo", "comparacion"),
+	"heatmap": ("Heatmap del Grupo", "heatmap"),
+}
+SECCIONES = secciones_disponibles()
+FORMATOS = ["pdf", "html", "png"]
+FORMATOS_GRAFICOS = list(pdf_report.FORMATOS_GRAFICOS)
+
+
+def _ruta_excel_por_defecto():
+	"""Resuelve el Excel según MODO_DATOS, igual que la app pero sin Google Drive"""
+	if os.getenv("MODO_DATOS", "demo").lower() == "real":
+		return DATA_PATH
+	return DATA_PATH_DEMO
+
+
+def _nombre_archivo(texto):
+	"""Normaliza un texto para usarlo como nombre de archivo"""
+	return "".join(c if c.isalnum() or c in " -_." else "_" for c in str(texto)).strip()
+
+
+def _sin_coincidencias():
+	"""Informa por stderr que ningún jugador ni categoría coincide con los filtros; devuelve el código de salida"""
+	print("❌ Ningún jugador ni categoría coincide con los filtros: no se generaron reportes", file=sys.stderr)
+	return 1
+
+
+def _cargar_historial(args):
+	"""Carga el historial y devuelve (historial, foto a la fecha pedida, fecha)"""
+	# Varias planillas (manifiesto o carpeta de utils.fuentes) o un único Excel
+	df = leer_fuentes(args.fuentes) if args.fuentes else leer_evaluaciones_excel(args.excel)
+	historial = EvaluacionesLongitudinales(df)
+	fecha = pd.to_datetime(args.fecha, dayfirst=True) if args.fecha else historial.ultima_fecha()
+	return historial, historial.foto(fecha), fecha
+
+
+def escribir_reporte(df, datos_jugador, jugador, categoria, seccion, vista, formato, destino,
+		formato_graficos=None, graficos_en_archivos=False, backend_pdf=None, referencia=None):
+	"""Genera un reporte en `formato` y devuelve la lista de archivos escritos.
+
+	`destino` es la ruta sin extensión; para PNG se escribe un archivo por gráfico.
+	Con `graficos_en_archivos` los gráficos se guardan como archivos y el HTML los
+	referencia por nombre (junto al HTML, o en una carpeta temporal para el PDF).
+	Sin `formato_graficos` se usa el recomendado por el motor de PDF (PNG para HTML).
+	`referencia` es el grupo de comparación (None = categoría del jugador).
+	"""
+	if formato == "png":
+		componentes = obtener_componentes_reporte(df, datos_jugador, jugador, categoria, seccion, vista, referencia)
+		archivos = []
+		for i, fig in enumerate(componentes.get("figuras", []), start=1):
+			ruta = destino.with_name(f"{destino.name}_{i}.png")
+			fig.write_image(str(ruta))
+			archivos.append(ruta)
+		return archivos
+
+	backend = obtener_backend_pdf(backend_pdf) if formato == "pdf" else None
+	if formato_graficos is None:
+		formato_graficos = backend.formato_graficos if backend else "png"
+
+	with tempfile.TemporaryDirectory() as directorio_temporal:
+		directorio_graficos = None
+		if graficos_en_archivos:
+			directorio_graficos = destino.parent if formato == "html" else directorio_temporal
+
+		contexto = construir_contexto_reporte_perfil(
+			df=df,
+			datos_jugador=datos_jugador,
+			jugador=jugador,
+			categoria=categoria,
+			seccion=seccion,
+			vista=vista,
+			fecha=obtener_fecha_reporte(datos_jugador),
+			formato_graficos=formato_graficos,
+			directorio_graficos=directorio_graficos,
+			referencia=referencia,
+		)
+		ruta = destino.with_name(f"{destino.name}.{formato}")
+		if formato == "html":
+			with open(ruta, "w", encoding="utf-8") as archivo:
+				archivo.writelines(generar_html_reporte(contexto))
+		else:
+			ruta.write_bytes(backend.generar(contexto))
+	return [ruta]
+
+
+def generar_reportes(args):
+	"""Genera los reportes pedidos por línea de comandos. Devuelve el código de salida."""
+	historial, df, fecha = _cargar_historial(args)
+	vista, sufijo_vista = VISTAS[args.vista]
+	secciones = args.seccion or SECCIONES
+	categorias = args.categoria or obtener_particion_categorias(df).categorias()
+	if df.empty or not categorias:
+		print(f"❌ Sin evaluaciones a la fecha {args.fecha or 'más reciente'}", file=sys.stderr)
+		return 1
+
+	referencias = obtener_servicio_normas(df).referencias()
+	if args.referencia and args.referencia not in referencias:
+		print(f"❌ Grupo de referencia desconocido: {args.referencia}. Disponibles: {', '.join(referencias)}", file=sys.stderr)
+		return 2
+
+	directorio = Path(args.out)
+	directorio.mkdir(parents=True, exist_ok=True)
+
+	errores = 0
+	categorias_con_jugadores = 0
+	for categoria in categorias:
+		# Solo jugadores reales (sin filas de resumen MEDIA/SD/RIESGO)
+		df_categoria = procesar_datos_categoria(df, categoria)
+		jugadores = list(df_categoria["Deportista"].dropna().unique())
+		if args.jugador:
+			jugadores = [j for j in jugadores if j in args.jugador]
+		if not jugadores:
+			print(f"⚠️ Sin jugadores para la categoría '{categoria}'", file=sys.stderr)
+			continue
+		categorias_con_jugadores += 1
+
+		for seccion in secciones:
+			# Las vistas grupales generan un único reporte por categoría; los de jugador
+			# llevan la categoría para que los homónimos de otra categoría no se pisen
+			if vista in VISTAS_GRUPALES:
+				tareas = [(jugadores[0], f"{categoria}_{seccion}_{sufijo_vista}")]
+			else:
+				tareas = [(jugador, f"{jugador}_{categoria}_{seccion}_{sufijo_vista}") for jugador in jugadores]
+
+			for jugador, nombre in tareas:
+				datos_jugador = obtener_datos_jugador(df, categoria, jugador)
+				destino = directorio / _nombre_archivo(nombre)
+				try:
+					archivos = escribir_reporte(
+						df, datos_jugador, jugador, categoria, seccion, vista, args.formato, destino,
+						formato_graficos=args.graficos,
+						graficos_en_archivos=args.graficos_en_archivos,
+						backend_pdf=args.backend_pdf,
+						referencia=args.referencia,
+					)
+				except RuntimeError as e:
+					# Errores de entorno (weasyprint/kaleido ausentes): no tiene sentido seguir
+					print(f"❌ {e}", file=sys.stderr)
+					return 2
+				except Exception as e:
+					errores += 1
+					print(f"⚠️ {nombre}: {e}", file=sys.stderr)
+					continue
+
+				for archivo in archivos:
+					print(f"✅ {archivo}")
+
+	if not categorias_con_jugadores:
+		return _sin_coincidencias()
+	return 1 if errores else 0
+
+
+def comparar_graficos(args):
+	"""Compara tamaño y tiempo del reporte con gráficos PNG inline, SVG inline y SVG en archivos.
+
+	El PDF se mide con cada motor disponible (weasyprint, fpdf2).
+	"""
+	historial, df, fecha = _cargar_historial(args)
+	categorias = obtener_particion_categorias(df).categorias()
+	if not args.categoria and not categorias:
+		return _sin_coincidencias()
+	categoria = args.categoria or categorias[0]
+	jugadores = procesar_datos_categoria(df, categoria)["Deportista"].dropna()
+	if not args.jugador and jugadores.empty:
+		return _sin_coincidencias()
+	jugador = args.jugador or jugadores.iloc[0]
+	datos_jugador = obtener_datos_jugador(df, categoria, jugador)
+	if datos_jugador is None:
+		return _sin_coincidencias()
+	vista = VISTAS[args.vista][0]
+
+	variantes = [("png", False), ("svg", False), ("svg", True)]
+	backends = backends_pdf_disponibles()
+	print(f"Jugador: {jugador} | Sección: {args.seccion} | Vista: {vista}")
+	encabezado = f"{'Variante':<16}{'Gráficos (s)':>14}{'HTML (KB)':>12}{'Archivos (KB)':>15}"
+	for nombre_backend in backends:
+		encabezado += f"{nombre_backend + ' (s)':>18}{nombre_backend + ' (KB)':>18}"
+	print(encabezado)
+	for formato_graficos, en_archivos in variantes:
+		nombre = f"{formato_graficos} {'archivos' if en_archivos else 'inline'}"
+		with tempfile.TemporaryDirectory() as directorio:
+			inicio = time.perf_counter()
+			try:
+				contexto = construir_contexto_reporte_perfil(
+					df=df,
+					datos_jugador=datos_jugador,
+					jugador=jugador,
+					categoria=categoria,
+					seccion=args.seccion,
+					vista=vista,
+					fecha=obtener_fecha_reporte(datos_jugador),
+					formato_graficos=formato_graficos,
+					directorio_graficos=directorio if en_archivos else None,
+				)
+			except RuntimeError as e:
+				print(f"{nombre:<16}no disponible: {e}")
+				continue
+			t_graficos = time.perf_counter() - inicio
+
+			kb_html = len(renderizar_html_reporte(contexto).encode("utf-8")) / 1024
+			kb_archivos = sum(p.stat().st_size for p in Path(directorio).iterdir()) / 1024
+
+			fila = f"{nombre:<16}{t_graficos:>14.3f}{kb_html:>12.1f}{kb_archivos:>15.1f}"
+			for nombre_backend in backends:
+				inicio = time.perf_counter()
+				try:
+					pdf_bytes = generar_pdf_reporte(contexto, backend=nombre_backend)
+				except Exception:
+					fila += f"{'error':>18}{'-':>18}"
+					continue
+				fila += f"{time.perf_counter() - inicio:>18.3f}{len(pdf_bytes) / 1024:>18.1f}"
+			print(fila)
+	return 0
+
+
+def generar_datos(args):
+	"""Escribe un Excel de evaluaciones sintético para pruebas de escala"""
+	jugadores = args.jugadores or jugadores_para_filas(args.filas, args.fechas)
+	inicio = time.perf_counter()
+	filas = escribir_libro_sintetico(
+		args.out,
+		jugadores=jugadores,
+		categorias=args.categorias,
+		fechas=args.fechas,
+		tasa_faltantes=args.faltantes,
+		filas_resumen=not args.sin_resumen,
+		formato_anterior=args.formato_anterior,
+		semilla=args.semilla,
+	)
+	print(f"✅ {args.out}: {jugadores} jugadores, {args.fechas} fechas, {filas} filas ({time.perf_counter() - inicio:.1f} s)")
+	return 0
+
+
+def correr_benchmark(args):
+	"""Mide los caminos críticos sobre datos sintéticos y guarda los resultados en JSON.
+
+	Devuelve 1 si algún caso falla o, con --comparar, si alguna mediana empeoró más que el umbral.
+	"""
+	from utils import benchmark
+
+	resultados = benchmark.ejecutar_benchmarks(
+		filas=args.filas,
+		repeticiones=args.repeticiones,
+		grupos=args.grupo,
+		patron=args.caso,
+		fechas=args.fechas,
+		categorias=args.categorias,
+		formato_graficos=args.graficos,
+	)
+	benchmark.guardar_resultados(resultados, args.out)
+	print(f"✅ {args.out}")
+	errores = [r for r in resultados["resultados"] if "error" in r]
+	for r in errores:
+		print(f"❌ {r['caso']} ({r['filas']} filas): {r['error']}", file=sys.stderr)
+	if not args.comparar:
+		return 1 if errores else 0
+
+	base = json.loads(Path(args.comparar).read_text(encoding="utf-8"))
+	comparacion = benchmark.comparar_resultados(resultados, base, args.umbral)
+	print(f"\nComparación con {args.comparar} (commit {base.get('commit')}):")
+	print(comparacion.to_string(index=False, float_format=lambda x: f"{x:.3f}"))
+	regresiones = comparacion[comparacion["regresion"]]
+	if len(regresiones):
+		print(f"⚠️ {len(regresiones)} caso(s) más lentos que {args.umbral:.2f}× la base", file=sys.stderr)
+		return 1
+	return 1 if errores else 0
+
+
+def informe_memoria(args):
+	"""Compara la memoria del historial leído con y sin el plan de tipos (utils.esquemas)"""
+	reporte = reporte_memoria(
+		leer_evaluaciones_excel(args.excel, tipos_compactos=False),
+		leer_evaluaciones_excel(args.excel)
+	)
+	print(reporte.to_string(float_format=lambda x: f"{x:.1f}"))
+	total = reporte.loc["TOTAL"]
+	print(f"\n✅ {total['kb_antes']:.0f} KB → {total['kb_despues']:.0f} KB ({total['reduccion_%']:.0f} % menos)")
+	return 0
+
+
+def informe_calidad(args):
+	"""Valores que el control de calidad de la carga anula u observa (utils.calidad)"""
+	ingesta = IngestaFuentes(args.fuentes) if args.fuentes else IngestaIncremental(args.excel)
+	inicio = time.perf_counter()
+	ingesta.actualizar()
+	segundos = time.perf_counter() - inicio
+	calidad = ingesta.calidad
+	if not calidad:
+		print(f"✅ Sin observaciones en {len(ingesta.df)} filas ({segundos:.2f} s de carga)")
+		return 0
+
+	resumen = calidad.resumen()
+	resumen["regla"] = resumen["regla"].map(REGLAS_CALIDAD)
+	print(resumen.to_string(index=False))
+	print(
+		f"\n{calidad.anulados} valores anulados, {len(calidad.reporte) - calidad.anulados} observados; "
+		f"{int((~calidad.mascara).sum())} de {len(calidad.mascara)} filas con observaciones"
+	)
+	if args.out:
+		calidad.reporte.to_csv(args.out, index=False)
+		print(f"✅ {args.out}")
+	return 0
+
+
+def crear_parser():
+	"""Crea el parser de argumentos de la CLI"""
+	parser = argparse.ArgumentParser(
+		prog="python -m cli",
+		description="Reportes de Evaluación Física Integral sin Streamlit",
+	)
+	subparsers = parser.add_subparsers(dest="comando", required=True)
+
+	report = subparsers.add_parser("report", help="Genera reportes por jugador o por grupo")
+	report.add_argument("--excel", default=_ruta_excel_por_defecto(), help="Ruta del Excel de evaluaciones (por defecto según MODO_DATOS)")
+	report.add_argument("--fuentes", help="Manifiesto JSON o carpeta con un .xlsx por categoría (reemplaza a --excel)")
+	report.add_argument("--categoria", action="append", help="Categoría a procesar (repetible). Por defecto todas")
+	report.add_argument("--jugador", action="append", help="Limitar a uno o más deportistas (repetible)")
+	report.add_argument("--seccion", action="append", choices=SECCIONES, help="Sección a exportar (repetible). Por defecto todas")
+	report.add_argument("--vista", choices=list(VISTAS), default="perfil", help="Tipo de análisis")
+	report.add_argument("--fecha", help="Fecha de evaluación (dd/mm/aaaa). Por defecto la más reciente")
+	report.add_argument("--formato", choices=FORMATOS, default="pdf", help="Formato de salida")
+	report.add_argument("--graficos", choices=FORMATOS_GRAFICOS, help="Formato de los gráficos (por defecto el recomendado por el motor de PDF)")
+	report.add_argument("--graficos-en-archivos", action="store_true", help="Guardar los gráficos como archivos en lugar de base64 inline")
+	report.add_argument("--referencia", help="Grupo de referencia de las comparaciones (categoría o norma externa). Por defecto la categoría del jugador")
+	report.add_argument("--backend-pdf", choices=["auto", *BACKENDS_PDF], help="Motor de PDF (por defecto BACKEND_PDF)")
+	report.add_argument("--out", required=True, help="Carpeta de salida")
+	report.set_defaults(func=generar_reportes)
+
+	comparar = subparsers.add_parser("comparar-graficos", help="Compara tamaño y tiempo de render PNG vs SVG")
+	comparar.add_argument("--excel", default=_ruta_excel_por_defecto(), help="Ruta del Excel de evaluaciones")
+	comparar.add_argument("--fuentes", help="Manifiesto JSON o carpeta con un .xlsx por categoría (reemplaza a --excel)")
+	comparar.add_argument("--categoria", help="Categoría (por defecto la primera)")
+	comparar.add_argument("--jugador", help="Deportista (por defecto el primero de la categoría)")
+	comparar.add_argument("--seccion", choices=SECCIONES, default="Fuerza", help="Sección del reporte")
+	comparar.add_argument("--vista", choices=list(VISTAS), default="perfil", help="Tipo de análisis")
+	comparar.add_argument("--fecha", help="Fecha de evaluación (dd/mm/aaaa). Por defecto la más reciente")
+	comparar.set_defaults(func=comparar_graficos)
+
+	generar = subparsers.add_parser("generar-datos", help="Escribe un Excel sintético con el esquema de EVALUACION 2910")
+	generar.add_argument("--filas", type=int, default=1000, help="Filas de deportistas aproximadas (jugadores × fechas)")
+	generar.add_argument("--jugadores", type=int, help="Jugadores del plantel (tiene prioridad sobre --filas)")
+	generar.add_argument("--categorias", type=int, default=1, help="Cantidad de categorías")
+	generar.add_argument("--fechas", type=int, default=1, help="Sesiones de evaluación (una hoja por fecha)")
+	generar.add_argument("--faltantes", type=float, default=0.1, help="Probabilidad de que falte un test de un jugador")
+	generar.add_argument("--sin-resumen", action="store_true", help="No agregar filas MEDIA/SD/RIESGO")
+	generar.add_argument("--formato-anterior", action="store_true", help="Encabezados del formato anterior (MAPEO_COLUMNAS_NUEVA_EVALUACION)")
+	generar.add_argument("--semilla", type=int, default=0, help="Semilla del generador aleatorio")
+	generar.add_argument("--out", required=True, help="Ruta del .xlsx a escribir")
+	generar.set_defaults(func=generar_datos)
+
+	bench = subparsers.add_parser("benchmark", help="Mide carga, estadísticas, gráficos y reporte sobre datos sintéticos")
+	bench.add_argument("--filas", type=int, nargs="+", default=[100, 1000, 10000], help="Tamaños a medir (filas de deportistas)")
+	bench.add_argument("--repeticiones", type=int, default=5, help="Repeticiones medidas por caso (más una de calentamiento)")
+	bench.add_argument("--grupo", action="append", choices=["datos", "estadisticas", "graficos", "componentes", "reporte"], help="Limitar a un grupo de casos (repetible)")
+	bench.add_argument("--caso", help="Limitar a los casos cuyo nombre contenga este texto")
+	bench.add_argument("--fechas", type=int, default=2, help="Sesiones del libro sintético")
+	bench.add_argument("--categorias", type=int, default=1, help="Categorías del libro sintético (se mide la primera)")
+	bench.add_argument("--graficos", choices=FORMATOS_GRAFICOS, default="svg", help="Formato de los gráficos del reporte")
+	bench.add_argument("--comparar", help="JSON de una corrida anterior para detectar regresiones")
+	bench.add_argument("--umbral", type=float, default=1.25, help="Razón actual/base de la mediana que cuenta como regresión")
+	bench.add_argument("--out", required=True, help="Ruta del JSON de resultados")
+	bench.set_defaults(func=correr_benchmark)
+
+	memoria = subparsers.add_parser("memoria", help="Memoria del historial por columna con y sin el plan de tipos")
+	memoria.add_argument("--excel", default=_ruta_excel_por_defecto(), help="Ruta del Excel de evaluaciones")
+	memoria.set_defaults(func=informe_memoria)
+
+	calidad = subparsers.add_parser("calidad", help="Valores anulados u observados por el control de calidad de la carga")
+	calidad.add_argument("--excel", default=_ruta_excel_por_defecto(), help="Ruta del Excel de evaluaciones")
+	calidad.add_argument("--fuentes", help="Manifiesto JSON o carpeta con un .xlsx por categoría (reemplaza a --excel)")
+	calidad.add_argument("--out", help="CSV con una fila por valor observado")
+	calidad.set_defaults(func=informe_calidad)
+
+	return parser
+
+
+def main(argv=None):
+	"""Punto de entrada de la CLI"""
+	args = crear_parser().parse_args(argv)
+	try:
+		return args.func(args)
+	except (FileNotFoundError, ValueError) as e:
+		print(f"❌ {e}", file=sys.stderr)
+		return 2
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -4,11 +4,20 @@ Componentes de la sidebar
 
 import streamlit as st
 from utils.ui_utils import get_base64_image
-from utils.data_utils import obtener_jugadores_categoria, limpiar_cache_si_cambio
-from config.settings import ESCUDO_PATH
+from utils.data_utils import obtener_jugadores_categoria, obtener_particion_categorias, obtener_datos_jugador, limpiar_cache_si_cambio, calidad_datos
+from utils.calidad import REGLAS_CALIDAD
+from utils.normas import obtener_servicio_normas
+from modules.secciones import secciones_disponibles
+from utils.tendencias import VENTANA_POR_DEFECTO
+from config.settings import ESCUDO_PATH, VISTAS_GRUPALES, VISTAS_CON_REFERENCIA, nombre_categoria
 
-def crear_sidebar(df):
-	"""Crea la sidebar completa con todos sus componentes"""
+def crear_sidebar(historial):
+	"""Crea la sidebar completa con todos sus componentes.
+
+	Recibe el historial longitudinal (utils.longitudinal) y devuelve también la
+	fecha de evaluación elegida; las vistas trabajan con `historial.foto(fecha)`.
+	El último valor es el grupo de referencia de las comparaciones (utils.normas).
+	"""
 	with st.sidebar:
 		# Escudo centrado
 		escudo_base64 = get_base64_image(ESCUDO_PATH)
@@ -19,24 +28,28 @@ def crear_sidebar(df):
 		</div>
 		""", unsafe_allow_html=True)
 
+		# Selector de fecha de evaluación (por defecto la más reciente)
+		fechas = historial.fechas()
+		fecha = None
+		if fechas:
+			fecha = st.selectbox(
+				"Fecha de evaluación",
+				list(reversed(fechas)),
+				format_func=lambda f: f.strftime("%d/%m/%Y"),
+				key="fecha_evaluacion_selector",
+				help="Cada jugador se muestra con su última evaluación hasta esta fecha"
+			)
+		df = historial.foto(fecha)
+
 		# Selector de categoría con mapeo para nombres amigables
-		categorias_originales = df["categoria"].dropna().unique()
+		categorias_originales = obtener_particion_categorias(df).categorias()
 		
 		# Mapeo simple: nombre_hoja → nombre_mostrar
 		mapeo_nombres = {}
 		categorias_display = []
 		
 		for cat_original in categorias_originales:
-			# Mapeo específico para la hoja actual y futuras categorías
-			if cat_original == "Evaluacion_2910":
-				cat_display = "Primer Equipo"
-			elif cat_original.lower() in ['reserva', 'reserve']:
-				cat_display = "Reserva"
-			elif cat_original.lower() in ['4ta', 'cuarta']:
-				cat_display = "4ta División"
-			else:
-				cat_display = cat_original  # Mantener nombre original para otros casos
-			
+			cat_display = nombre_categoria(cat_original)
 			categorias_display.append(cat_display)
 			mapeo_nombres[cat_display] = cat_original
 		
@@ -49,17 +62,18 @@ def crear_sidebar(df):
 		
 		# Obtener el nombre original para filtrar los datos
 		categoria = mapeo_nombres[categoria_seleccionada]
+		mapeo_nombres_inverso = {original: display for display, original in mapeo_nombres.items()}
 		
 		# Opciones de análisis (mover antes del selector de deportista)
 		vista = st.radio(
 			"Tipo de Análisis", 
-			["Perfil del Jugador", "Perfil del Grupo", "Comparación Jugador vs Grupo"]
+			["Perfil del Jugador", "Perfil del Grupo", "Comparación Jugador vs Grupo", "Heatmap del Grupo", "Evolución Longitudinal"]
 		)
 		
 		jugadores_filtrados = obtener_jugadores_categoria(df, categoria)
 		
 		# Selector de deportista - BLOQUEADO para análisis grupal
-		if vista == "Perfil del Grupo":
+		if vista in VISTAS_GRUPALES:
 			st.selectbox(
 				"Deportista", 
 				["--- Análisis Grupal ---"],
@@ -86,39 +100,49 @@ def crear_sidebar(df):
 		
 		seccion = st.radio(
 			"Evaluación", 
-			["Fuerza", "Movilidad"]
+			secciones_disponibles()
 		)
 
+		# Grupo de referencia de las comparaciones jugador vs grupo (elegido explícitamente)
+		referencia = categoria
+		if vista in VISTAS_CON_REFERENCIA:
+			referencias = obtener_servicio_normas(df).referencias()
+			referencia = st.selectbox(
+				"Grupo de referencia",
+				referencias,
+				index=referencias.index(categoria) if categoria in referencias else 0,
+				format_func=lambda ref: mapeo_nombres_inverso.get(ref, ref),
+				# Una clave por categoría: al cambiar de categoría vuelve a su propia referencia
+				key=f"referencia_normas_{categoria}",
+				help="Grupo contra el que se comparan los valores del jugador (categoría o norma externa)"
+			)
+
 		st.markdown("---")
 
 		# Botón de exportación DIRECTO en la sidebar (mismo PDF para todos los tipos de análisis)
 		# Optimizado: solo generar el PDF cuando el usuario lo solicita explícitamente
 		exportar = False
 		if jugador and jugador != "Sin jugadores":
-			# Detectar si la librería de PDF (weasyprint) está disponible.
-			try:
-				import weasyprint  # type: ignore  # Solo para detección de entorno
-				pdf_disponible = True
-			except ModuleNotFoundError:
-				pdf_disponible = False
-
-			if pdf_disponible:
+			# Detectar qué motor de PDF está disponible (weasyprint o, si faltan sus librerías nativas, fpdf2)
+			from utils.pdf_backends import backends_pdf_disponibles, obtener_backend_pdf
+			pdf_disponible = len(backends_pdf_disponibles()) > 0
+
+			if not pdf_disponible:
+				st.caption("Exportación a PDF no disponible: instala 'weasyprint' o 'fpdf2'.")
+			else:
 				if "pdf_bytes" not in st.session_state:
 					st.session_state.pdf_bytes = None
 
 				if st.button("📄 Generar reporte en PDF"):
 					try:
-						from utils.pdf_report import construir_contexto_reporte_perfil, generar_pdf_reporte
+						from utils.pdf_report import construir_contexto_reporte_perfil, obtener_fecha_reporte
 
 						# Obtener datos actualizados del jugador seleccionado
-						datos_jugador_export = df[(df["categoria"] == categoria) & (df["Deportista"] == jugador)].iloc[0]
-						# Extraer fecha desde la columna 'Fecha'
-						fecha_valor = datos_jugador_export.get("Fecha", "")
-						if hasattr(fecha_valor, "strftime"):
-							fecha_str = fecha_valor.strftime("%d/%m/%Y")
-						else:
-							fecha_str = str(fecha_valor)
+						datos_jugador_export = obtener_datos_jugador(df, categoria, jugador)
+						# Extraer fecha desde la columna de fecha de evaluación
+						fecha_str = obtener_fecha_reporte(datos_jugador_export)
 
+						backend_pdf = obtener_backend_pdf()
 						contexto = construir_contexto_reporte_perfil(
 							df=df,
 							datos_jugador=datos_jugador_export,
@@ -127,8 +151,15 @@ def crear_sidebar(df):
 							seccion=seccion,
 							vista=vista,
 							fecha=fecha_str,
+							formato_graficos=backend_pdf.formato_graficos,
+							referencia=referencia,
+							# Evolución: todas las sesiones y la métrica/ventana elegidas en la vista
+							df_historial=historial.df,
+							fecha_corte=fecha,
+							metrica=st.session_state.get(f"evolucion_metrica_{seccion}"),
+							ventana=st.session_state.get("evolucion_ventana", VENTANA_POR_DEFECTO),
 						)
-						st.session_state.pdf_bytes = generar_pdf_reporte(contexto)
+						st.session_state.pdf_bytes = backend_pdf.generar(contexto)
 						st.success("Reporte generado correctamente. Ahora puedes descargar el PDF.")
 						exportar = True
 					except Exception as e:
@@ -144,6 +175,10 @@ def crear_sidebar(df):
 						sufijo_vista = "grupo"
 					elif vista == "Comparación Jugador vs Grupo":
 						sufijo_vista = "comparacion"
+					elif vista == "Heatmap del Grupo":
+						sufijo_vista = "heatmap"
+					elif vista == "Evolución Longitudinal":
+						sufijo_vista = "evolucion"
 					else:
 						sufijo_vista = "reporte"
 
@@ -155,4 +190,25 @@ def crear_sidebar(df):
 					)
 					exportar = True
 
-		return categoria, jugador, vista, seccion, exportar
+		return categoria, jugador, vista, seccion, exportar, fecha, referencia
+
+def crear_resumen_calidad(df_historial):
+	"""Expander de la sidebar con los valores que el control de calidad de la carga anuló u observó"""
+	calidad = calidad_datos(df_historial)
+	if not calidad:
+		return
+
+	reporte = calidad.reporte
+	with st.sidebar:
+		with st.expander(f"🧪 Calidad de datos ({len(reporte)})"):
+			st.caption(
+				f"{calidad.anulados} valores anulados (fuera de rango o cargados en kg): se tratan como test no realizado. "
+				"Los atípicos y las posibles inversiones DER/IZQ solo se informan."
+			)
+			st.dataframe(
+				reporte.assign(
+					FECHA=reporte["FECHA"].dt.strftime("%d/%m/%Y"),
+					regla=reporte["regla"].map(REGLAS_CALIDAD),
+				)[["Deportista", "FECHA", "columna", "valor", "regla", "referencia", "anulado"]],
+				hide_index=True,
+			)
@@ -0,0 +1,121 @@
+"""
+Tablas de métricas con st.dataframe sin pandas Styler
+
+Las tablas comparativas se mostraban con `df.style.format(...).apply(lambda ...)`:
+el Styler formatea y arma el CSS celda por celda en Python y envía un estilo por
+celda, lo que pesa con tablas del tamaño del plantel (y st.dataframe ignora
+`set_table_styles`). Aquí:
+
+- los números siguen siendo numéricos (se pueden ordenar) y el formato lo aplica
+  la grilla con `column_config` (NumberColumn con formato printf),
+- los textos que dependen de la fila (unidad, nivel) se precalculan sobre columnas
+  completas,
+- el color de cada celda pasa a un marcador de banda (MARCADORES_BANDA) elegido
+  para toda la columna con una sola clasificación (utils.bandas), y el de cada
+  columna, a un marcador en el encabezado como en las leyendas de los gráficos.
+"""
+
+import numpy as np
+import pandas as pd
+
+from config.metricas import obtener_metrica
+from config.settings import MARCADORES_BANDA
+from utils.bandas import clasificar_zscores
+
+# Formato de los valores de las tablas de métricas (un decimal, como las estadísticas)
+FORMATO_VALOR = "%.1f"
+
+
+def columnas_numericas(etiquetas, formato=FORMATO_VALOR):
+	"""
+	column_config de columnas numéricas con el formato aplicado por la grilla
+
+	Args:
+		etiquetas: {columna: etiqueta del encabezado}
+		formato: Formato printf (por ejemplo "%.1f", "%+.1f%%")
+	"""
+	import streamlit as st
+
+	return {
+		columna: st.column_config.NumberColumn(etiqueta, format=formato)
+		for columna, etiqueta in etiquetas.items()
+	}
+
+
+def niveles_zscore(valores, medias, desvios, bandas="resumen"):
+	"""
+	Nivel de cada valor frente a su grupo ("🟢 Superior") con una sola clasificación
+
+	Args:
+		valores, medias, desvios: Arrays alineados (una posición por fila de la tabla).
+			Los valores van sin completar: NaN es test no realizado, no 0.0
+		bandas: Tabla de BANDAS_ZSCORE
+
+	Returns:
+		Array de textos; "—" si el valor falta o el grupo no tiene dispersión
+	"""
+	valores = np.asarray(valores, dtype=float)
+	medias = np.asarray(medias, dtype=float)
+	desvios = np.asarray(desvios, dtype=float)
+	with np.errstate(divide="ignore", invalid="ignore"):
+		zscores = np.where(desvios > 0, (valores - medias) / desvios, np.nan)
+
+	clasificacion = clasificar_zscores(zscores, bandas)
+	# Un texto por banda; cada fila toma el de su banda por índice
+	textos = np.array(
+		[f"{MARCADORES_BANDA.get(categoria, '')} {categoria}".strip() for categoria in clasificacion.tabla.categorias],
+		dtype=object
+	)
+	return np.where(clasificacion.indices < 0, "—", textos[clasificacion.indices])
+
+
+def tabla_jugador_vs_grupo(metricas, metricas_columnas, datos_jugador, estadisticas_grupales, jugador):
+	"""
+	Tabla comparativa jugador vs grupo (una fila por métrica) y su column_config
+
+	Las bilaterales muestran el promedio DER/IZQ y las totales su columna; solo
+	entran las métricas con media en el grupo de referencia. Diferencia, % y nivel
+	se calculan sobre los arrays de todas las métricas a la vez.
+
+	Args:
+		metricas: Claves del registro seleccionadas, en orden
+		metricas_columnas: {clave: (DER, IZQ) | (TOTAL, TOTAL)}
+		datos_jugador: Series o dict con los valores del jugador
+		estadisticas_grupales: {"media": {col: valor}, "std": {col: valor}, ...}
+		jugador: Nombre del jugador (encabezado de su columna)
+
+	Returns:
+		(DataFrame indexado por métrica, column_config para st.dataframe)
+	"""
+	metricas = [
+		metrica for metrica in metricas
+		if all(col in estadisticas_grupales['media'] for col in metricas_columnas[metrica])
+	]
+	# (métricas × 2): DER/IZQ, o la columna total repetida (su promedio es el total)
+	pares = [metricas_columnas[metrica] for metrica in metricas]
+
+	def _promedios(valores_por_columna):
+		return np.array(
+			[[valores_por_columna(col) for col in par] for par in pares], dtype=float
+		).reshape(-1, 2).mean(axis=1)
+
+	valores = _promedios(lambda col: datos_jugador.get(col, np.nan))
+	medias = _promedios(estadisticas_grupales['media'].get)
+	desvios = _promedios(estadisticas_grupales['std'].get)
+	with np.errstate(divide="ignore", invalid="ignore"):
+		porcentajes = np.where(medias > 0, valores / medias * 100 - 100, 0.0)
+
+	tabla = pd.DataFrame({
+		jugador: valores,
+		"Media grupo": medias,
+		"Diferencia": valores - medias,
+		"% vs Grupo": porcentajes,
+		"Unidad": [obtener_metrica(metrica).unidad for metrica in metricas],
+		"Nivel": niveles_zscore(valores, medias, desvios)
+	}, index=pd.Index(metricas, name="Métrica"))
+	configuracion = {
+		**columnas_numericas({jugador: f"🔴 {jugador}", "Media grupo": "🔵 Media grupo"}),
+		**columnas_numericas({"Diferencia": "Diferencia"}, "%+.1f"),
+		**columnas_numericas({"% vs Grupo": "🟡 % vs Grupo"}, "%+.1f%%")
+	}
+	return tabla, configuracion
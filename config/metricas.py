@@ -0,0 +1,197 @@
+"""
+Registro declarativo de métricas de evaluación
+
+Cada métrica (test) se define una sola vez: sección, columnas del Excel (par
+DER/IZQ o columna total), unidad, etiqueta y umbrales LSI. Las vistas, los
+gráficos y el reporte PDF derivan de aquí la lista de métricas disponibles, la
+selección por defecto y las columnas de las tablas, así que agregar un test es
+agregar una entrada a REGISTRO_METRICAS.
+
+Las columnas se resuelven a índices NumPy del DataFrame con
+`utils.data_utils.compilar_metricas` (una vez por esquema de columnas). `tipo`
+es el dtype con que se guardan sus columnas al cargar el Excel
+(`utils.esquemas.aplicar_tipos`): float32 alcanza para N, cm y grados y
+representa exactos los enteros chicos (escala 0-4 de THOMAS) con NaN como faltante.
+`rango` son los valores plausibles de cada columna (por lado o total): fuera de
+él, el control de calidad de la carga (`utils.calidad`) anula el valor.
+
+Las métricas con `expresion` no vienen en el Excel: `utils.derivadas` calcula sus
+columnas a partir de otras métricas al cargar cada versión del dataset (ver la
+sintaxis allí) y desde ahí se usan como cualquier otra. Los cocientes se expresan
+en % porque tablas y estadísticas redondean a un decimal.
+
+Las métricas con `resumen` son las de las vistas resumidas (radar Z-Score,
+distribución grupal y tarjetas): un valor por métrica, las bilaterales como
+promedio (DER + IZQ) / 2 bajo la clave `clave_radar`.
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# Zonas LSI (%): dentro de `optimo` → óptimo; dentro de `alerta` → alerta; fuera → riesgo
+UMBRALES_LSI = {
+	"optimo": (90.0, 110.0),
+	"alerta": (80.0, 120.0)
+}
+
+
+@dataclass(frozen=True)
+class Metrica:
+	"""Definición de una métrica: bilateral (der/izq) o total (una sola columna)"""
+	clave: str
+	seccion: str
+	etiqueta: str
+	unidad: str
+	der: Optional[str] = None
+	izq: Optional[str] = None
+	total: Optional[str] = None
+	por_defecto: bool = False
+	resumen: bool = False
+	tipo: str = "float32"
+	rango: Tuple[float, float] = (0.0, float("inf"))
+	expresion: Optional[str] = None
+	umbral_optimo: Tuple[float, float] = UMBRALES_LSI["optimo"]
+	umbral_alerta: Tuple[float, float] = UMBRALES_LSI["alerta"]
+
+	@property
+	def bilateral(self):
+		return self.total is None
+
+	@property
+	def derivada(self):
+		"""True si la métrica se calcula con `expresion` (no es una columna del Excel)"""
+		return self.expresion is not None
+
+	@property
+	def columnas(self):
+		"""Columnas del Excel que usa la métrica"""
+		return (self.der, self.izq) if self.bilateral else (self.total,)
+
+	@property
+	def par(self):
+		"""Formato legacy de `metricas_columnas`: (DER, IZQ) o (TOTAL, TOTAL)"""
+		return (self.der, self.izq) if self.bilateral else (self.total, self.total)
+
+	@property
+	def clave_radar(self):
+		"""Clave del valor resumido: la columna total o "<clave>_PROMEDIO" en las bilaterales"""
+		return f"{self.clave}_PROMEDIO" if self.bilateral else self.total
+
+	@property
+	def etiquetas(self):
+		"""{columna: etiqueta} con el lado en las bilaterales ("CUAD Der", "CUAD Izq")"""
+		if self.bilateral:
+			return {self.der: f"{self.etiqueta} Der", self.izq: f"{self.etiqueta} Izq"}
+		return {self.total: self.etiqueta}
+
+	def zona_lsi(self, lsi):
+		"""Zona del LSI (%): "optimo", "alerta" o "riesgo" """
+		if self.umbral_optimo[0] <= lsi <= self.umbral_optimo[1]:
+			return "optimo"
+		if self.umbral_alerta[0] <= lsi <= self.umbral_alerta[1]:
+			return "alerta"
+		return "riesgo"
+
+
+# Orden = orden de los selectores, de las tablas (pares y luego totales) y de los gráficos
+REGISTRO_METRICAS = (
+	# ===== FUERZA =====
+	Metrica("CUAD", "Fuerza", "CUAD", "N", der="CUAD DER (N)", izq="CUAD IZQ (N)", por_defecto=True, resumen=True, rango=(100.0, 2500.0)),
+	Metrica("WOLLIN", "Fuerza", "ISQ Wollin", "N", der="WOLLIN DER", izq="WOLLIN IZQ", por_defecto=True, resumen=True, rango=(50.0, 1200.0)),
+	Metrica("IMTP", "Fuerza", "IMTP", "N", der="F PICO DER (IMTP) (N)", izq="F PICO IZQ (IMTP) (N)", por_defecto=True, rango=(200.0, 4000.0)),
+	Metrica("CMJ Propulsiva", "Fuerza", "CMJ FP", "N", der="FP DER (CMJ) (N)", izq="FP IZQ (CMJ) (N)", por_defecto=True, rango=(150.0, 3500.0)),
+	Metrica("CMJ Frenado", "Fuerza", "CMJ FF", "N", der="FF DER (CMJ) (N)", izq="FF IZQ (CMJ) (N)", rango=(150.0, 3500.0)),
+	Metrica("TRIPLE SALTO", "Fuerza", "Triple Salto", "cm", der="TRIPLE SALTO DER", izq="TRIPLE SALTO IZQ", resumen=True, rango=(100.0, 900.0)),
+	Metrica("IMTP Total", "Fuerza", "IMTP Total", "N", total="F PICO (IMTP) (N)", resumen=True, rango=(400.0, 8000.0)),
+	Metrica("CMJ FP Total", "Fuerza", "CMJ FP Total", "N", total="FP (CMJ) (N)", resumen=True, rango=(300.0, 7000.0)),
+	Metrica("CMJ FF Total", "Fuerza", "CMJ FF Total", "N", total="FF (CMJ) (N)", resumen=True, rango=(300.0, 7000.0)),
+	# Derivadas (utils.derivadas): cociente isquiotibiales/cuádriceps e índice de fuerza dinámica
+	Metrica("H:Q", "Fuerza", "H:Q", "%", der="H:Q DER (%)", izq="H:Q IZQ (%)", resumen=True, expresion="100 * WOLLIN / CUAD"),
+	Metrica("DSI", "Fuerza", "DSI", "%", total="DSI (CMJ/IMTP) (%)", resumen=True, expresion="100 * `CMJ FP Total` / `IMTP Total`"),
+	# ===== MOVILIDAD =====
+	Metrica("AKE", "Movilidad", "AKE", "°", der="AKE DER", izq="AKE IZQ", por_defecto=True, resumen=True, rango=(0.0, 90.0)),
+	Metrica("THOMAS", "Movilidad", "THOMAS", "°", der="THOMAS DER", izq="THOMAS IZQ", por_defecto=True, resumen=True, rango=(-30.0, 30.0)),
+	Metrica("LUNGE", "Movilidad", "LUNGE", "°", der="LUNGE DER", izq="LUNGE IZQ", por_defecto=True, resumen=True, rango=(0.0, 70.0)),
+)
+
+_POR_CLAVE = {metrica.clave: metrica for metrica in REGISTRO_METRICAS}
+_POR_CLAVE_RADAR = {metrica.clave_radar: metrica for metrica in REGISTRO_METRICAS if metrica.resumen}
+
+
+def obtener_metrica(clave):
+	"""Definición de la métrica (KeyError si no está registrada)"""
+	return _POR_CLAVE[clave]
+
+
+def metrica_radar(clave_radar):
+	"""Métrica resumida por su `clave_radar` (None si no es una métrica resumida)"""
+	return _POR_CLAVE_RADAR.get(clave_radar)
+
+
+def es_total(clave):
+	"""True si la métrica es un valor total (una sola columna, sin LSI)"""
+	metrica = _POR_CLAVE.get(clave)
+	return metrica is not None and not metrica.bilateral
+
+
+def metricas_seccion(seccion):
+	"""Métricas de la sección en el orden del registro"""
+	return [metrica for metrica in REGISTRO_METRICAS if metrica.seccion == seccion]
+
+
+def claves_seccion(seccion):
+	"""Opciones del selector de métricas de la sección"""
+	return [metrica.clave for metrica in metricas_seccion(seccion)]
+
+
+def claves_por_defecto(seccion):
+	"""Selección inicial del selector de métricas de la sección"""
+	return [metrica.clave for metrica in metricas_seccion(seccion) if metrica.por_defecto]
+
+
+def metricas_resumen(seccion):
+	"""Métricas del radar, la distribución grupal y las tarjetas de la sección"""
+	return [metrica for metrica in metricas_seccion(seccion) if metrica.resumen]
+
+
+def metricas_radar(seccion):
+	"""{clave_radar: etiqueta} de las métricas resumidas de la sección, en el orden del registro"""
+	return {metrica.clave_radar: metrica.etiqueta for metrica in metricas_resumen(seccion)}
+
+
+def metricas_derivadas():
+	"""Métricas del registro que se calculan con una expresión, en el orden del registro"""
+	return [metrica for metrica in REGISTRO_METRICAS if metrica.derivada]
+
+
+def etiquetas_derivadas(seccion):
+	"""{columna: etiqueta} de las métricas derivadas de la sección (heatmap y evolución)"""
+	return {
+		columna: etiqueta
+		for metrica in metricas_seccion(seccion) if metrica.derivada
+		for columna, etiqueta in metrica.etiquetas.items()
+	}
+
+
+def metricas_columnas(seccion):
+	"""{clave: (DER, IZQ) | (TOTAL, TOTAL)} que consumen los gráficos multifuerza/multimovilidad"""
+	return {metrica.clave: metrica.par for metrica in metricas_seccion(seccion)}
+
+
+def columnas_tabla(seccion):
+	"""{DER: IZQ} de las métricas bilaterales (formato de las tablas comparativas)"""
+	return {metrica.der: metrica.izq for metrica in metricas_seccion(seccion) if metrica.bilateral}
+
+
+def columnas_totales(seccion):
+	"""Columnas de las métricas totales de la sección"""
+	return [metrica.total for metrica in metricas_seccion(seccion) if not metrica.bilateral]
+
+
+def columnas_seccion(seccion):
+	"""Columnas de la sección en el orden de las tablas: pares DER/IZQ y luego totales"""
+	columnas = []
+	for der, izq in columnas_tabla(seccion).items():
+		columnas.extend([der, izq])
+	columnas.extend(columnas_totales(seccion))
+	return columnas
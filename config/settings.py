@@ -4,6 +4,9 @@ Configuración general de la aplicación
 
 # ========= CONFIGURACIÓN DE RUTAS ==========
 import os
+import tempfile
+
+from config.metricas import metricas_seccion, etiquetas_derivadas, metricas_radar
 
 # Rutas relativas para compatibilidad local y Streamlit Cloud
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -11,6 +14,10 @@ DATA_PATH = os.path.join(BASE_DIR, "data", "EVALUACIONES.xlsx")
 DATA_PATH_DEMO = os.path.join(BASE_DIR, "data", "EVALUACIONES_demo.xlsx")
 ESCUDO_PATH = os.path.join(BASE_DIR, "data", "escudo.png")
 
+# Grupos de referencia externos (opcional). Formato JSON:
+# {"Nombre del grupo": {"n_jugadores": 40, "media": {"CUAD DER (N)": 420.0, ...}, "std": {...}}}
+NORMAS_EXTERNAS_PATH = os.getenv("NORMAS_EXTERNAS_PATH", os.path.join(BASE_DIR, "data", "normas_referencia.json"))
+
 # ========= CONFIGURACIÓN DE CACHE ==========
 CACHE_TTL = {
 	'datos_principales': 7200,  # 2 horas - datos cambian poco
@@ -21,6 +28,57 @@ CACHE_TTL = {
 	'jugadores_categoria': 3600 # 1 hora - listas de jugadores
 }
 
+# Segundos entre revisiones del Excel local por el hilo vigilante (utils.ingesta); 0 = sin vigilancia
+VIGILANCIA_EXCEL_SEGUNDOS = float(os.getenv("VIGILANCIA_EXCEL_SEGUNDOS", "2"))
+
+# ========= GOOGLE DRIVE (MODO_DATOS = "real") ==========
+# El Excel de Drive se descarga por bloques a esta carpeta y se lee desde disco (utils.drive)
+DRIVE_DESCARGAS_DIR = os.getenv(
+	"DRIVE_DESCARGAS_DIR",
+	os.path.join(tempfile.gettempdir(), "reporte_evaluaciones_drive")
+)
+DRIVE_TAMANO_BLOQUE = 8 * 1024 * 1024  # bytes por pedido de la descarga
+DRIVE_REINTENTOS = 5                   # reintentos por bloque y reanudaciones de la descarga
+
+# ========= CATEGORÍAS ==========
+# Nombre visible de cada categoría (hoja o columna CATEGORIA del Excel), en minúsculas
+NOMBRES_CATEGORIAS = {
+	"evaluacion_2910": "Primer Equipo",
+	"reserva": "Reserva",
+	"reserve": "Reserva",
+	"4ta": "4ta División",
+	"cuarta": "4ta División"
+}
+
+
+def nombre_categoria(categoria):
+	"""Nombre visible de la categoría; las que no están en NOMBRES_CATEGORIAS conservan su nombre"""
+	return NOMBRES_CATEGORIAS.get(str(categoria).lower(), categoria)
+
+# ========= VARIAS PLANILLAS (utils.fuentes) ==========
+# Manifiesto JSON con un archivo por plantel, o carpeta con un .xlsx por categoría.
+# En Streamlit también se puede definir como lista "FUENTES" en st.secrets. Vacío = un solo Excel
+FUENTES_EVALUACIONES = os.getenv("FUENTES_EVALUACIONES", "")
+# Procesos que parsean los archivos en paralelo: 0 = uno por núcleo, 1 = sin procesos
+PROCESOS_LECTURA_FUENTES = int(os.getenv("PROCESOS_LECTURA_FUENTES", "0"))
+
+# ========= CONTROL DE CALIDAD DE LA CARGA (utils.calidad) ==========
+# Anular (NaN) los valores fuera de rango o cargados en kg; 0 = solo informarlos
+CALIDAD_ANULAR_INVALIDOS = os.getenv("CALIDAD_ANULAR_INVALIDOS", "1") != "0"
+CALIDAD_Z_ATIPICO = 3.5        # |z robusto| (mediana y MAD de la categoría en la fecha) que cuenta como atípico
+CALIDAD_MINIMO_GRUPO = 5       # valores mínimos del grupo para comparar contra su mediana
+CALIDAD_ASIMETRIA_INVERSION = 10.0  # asimetría DER/IZQ (%) a partir de la cual se busca una inversión de lados
+
+# ========= CONFIGURACIÓN DE REPORTES PDF ==========
+# Motor de PDF: "auto" (weasyprint si está disponible, si no fpdf2), "weasyprint" o "fpdf2"
+BACKEND_PDF = os.getenv("BACKEND_PDF", "auto").lower()
+
+# Cache de bytecode de las plantillas Jinja2 (compartido entre procesos batch)
+JINJA_BYTECODE_CACHE_DIR = os.getenv(
+	"JINJA_BYTECODE_CACHE_DIR",
+	os.path.join(tempfile.gettempdir(), "reporte_evaluaciones_jinja")
+)
+
 # ========= MAPEO DE COLUMNAS NUEVA EVALUACIÓN ==========
 MAPEO_COLUMNAS_NUEVA_EVALUACION = {
 	# Mapeo de columnas: Formato Anterior → Formato Nuevo
@@ -82,25 +140,80 @@ METRICAS_ZSCORE_FUERZA = {
 	'FF (CMJ) (N)': 'CMJ FF Total'
 }
 
-# Configuración simplificada para radar (máximo 5 métricas)
-METRICAS_ZSCORE_RADAR_SIMPLE = {
-	# Usar métricas totales o promediar bilaterales automáticamente
-	'F PICO (IMTP) (N)': 'IMTP',
-	'FP (CMJ) (N)': 'CMJ Propulsiva', 
-	'FF (CMJ) (N)': 'CMJ Frenado',
-	# Para bilaterales, calcular promedio automáticamente
-	'CUAD_PROMEDIO': 'CUAD',
-	'WOLLIN_PROMEDIO': 'ISQ Wollin'
-}
+# Métricas del radar, la distribución grupal y las tarjetas ({clave_radar: etiqueta}):
+# las marcadas `resumen` en el registro; las bilaterales se promedian automáticamente
+METRICAS_ZSCORE_RADAR_SIMPLE = metricas_radar("Fuerza")
 
 # Configuración de métricas de movilidad para radar
-METRICAS_ZSCORE_MOVILIDAD = {
-	# Para bilaterales, calcular promedio automáticamente
-	'AKE_PROMEDIO': 'AKE',
-	'THOMAS_PROMEDIO': 'THOMAS',
-	'LUNGE_PROMEDIO': 'LUNGE'
+METRICAS_ZSCORE_MOVILIDAD = metricas_radar("Movilidad")
+
+# Bandas de interpretación del Z-Score (utils.bandas), de menor a mayor:
+# (desde, categoría, interpretación, color, percentil); cada banda llega hasta el `desde` de la siguiente
+BANDAS_ZSCORE = {
+	# Banderas clínicas con percentiles aproximados de la normal estándar
+	"clinica": (
+		(float("-inf"), "Crítico", "Muy Inferior (<2.5%)", "#dc2626", "<2.5"),
+		(-2.0, "Bajo", "Inferior (2.5-16%)", "#ef4444", "2.5-16"),
+		(-1.0, "Promedio-", "Promedio Bajo (16-50%)", "#f59e0b", "16-50"),
+		(0.0, "Promedio+", "Promedio Alto (50-84%)", "#fbbf24", "50-84"),
+		(1.0, "Bueno", "Superior (84-97.5%)", "#16a34a", "84-97.5"),
+		(2.0, "Excelente", "Excepcional (>97.5%)", "#22c55e", ">97.5")
+	),
+	# Resumen de cuatro niveles de las tarjetas y tablas bajo los radares
+	"resumen": (
+		(float("-inf"), "Inferior", "Inferior (<16%)", "#ef4444", "<16"),
+		(-1.0, "Promedio-", "Promedio Bajo (16-50%)", "#f59e0b", "16-50"),
+		(0.0, "Promedio+", "Promedio Alto (50-84%)", "#fbbf24", "50-84"),
+		(1.0, "Superior", "Superior (>84%)", "#22c55e", ">84")
+	)
+}
+# Valor sin Z-Score: (categoría, interpretación, color, percentil)
+BANDA_SIN_DATOS = ("N/A", "Sin datos", "gray", None)
+# Marcador de cada categoría en las tablas (st.dataframe no colorea celdas sin Styler)
+MARCADORES_BANDA = {
+	"Excelente": "🟢", "Bueno": "🟢", "Superior": "🟢",
+	"Promedio+": "🟡", "Promedio-": "🟠",
+	"Bajo": "🔴", "Inferior": "🔴", "Crítico": "🔴"
 }
 
+# ========= CONFIGURACIÓN DEL HEATMAP DEL GRUPO ==========
+# Métricas (columna → etiqueta) de la matriz jugadores × métricas por sección; las derivadas del registro al final
+METRICAS_HEATMAP = {
+	"Fuerza": {
+		**METRICAS_ZSCORE_FUERZA,
+		'TRIPLE SALTO DER': 'Triple Salto Der',
+		'TRIPLE SALTO IZQ': 'Triple Salto Izq',
+		**etiquetas_derivadas("Fuerza")
+	},
+	"Movilidad": {
+		'AKE DER': 'AKE Der',
+		'AKE IZQ': 'AKE Izq',
+		'THOMAS DER': 'THOMAS Der',
+		'THOMAS IZQ': 'THOMAS Izq',
+		'LUNGE DER': 'LUNGE Der',
+		'LUNGE IZQ': 'LUNGE Izq',
+		**etiquetas_derivadas("Movilidad")
+	}
+}
+
+# Pares bilaterales (etiqueta → (DER, IZQ)) para la capa LSI, derivados del registro de métricas
+PARES_LSI = {
+	seccion: {metrica.etiqueta: (metrica.der, metrica.izq) for metrica in metricas_seccion(seccion) if metrica.bilateral}
+	for seccion in ("Fuerza", "Movilidad")
+}
+
+# Vistas que analizan a toda la categoría (sin jugador seleccionado)
+VISTAS_GRUPALES = ("Perfil del Grupo", "Heatmap del Grupo")
+
+# Vistas que comparan al jugador contra un grupo de referencia (ver utils/normas.py)
+VISTAS_CON_REFERENCIA = ("Perfil del Jugador", "Comparación Jugador vs Grupo")
+
+# ========= CAMBIOS ENTRE SESIONES ==========
+# Cambio mínimo relevante (SWC) = FACTOR_SWC × SD entre jugadores de la sesión
+FACTOR_SWC = 0.2
+# Jugadores con ambas evaluaciones necesarios para estimar el error típico
+MIN_JUGADORES_ERROR_TIPICO = 3
+
 # Configuración legacy para compatibilidad (si existe en Excel)
 Z_SCORE_METRICAS = {
 	'Z SCORE CUAD Der': 'CUAD Der',
@@ -0,0 +1,173 @@
+"""
+Módulo de análisis longitudinal - Tendencias por jugador y del grupo
+"""
+
+import numpy as np
+from visualizations.charts import crear_grafico_tendencia_jugador, crear_grafico_pendientes_grupo
+from utils.data_utils import procesar_datos_categoria
+from utils.tendencias import (
+	calcular_tendencias,
+	resumir_tendencias,
+	calcular_cambios_sesion,
+	cambios_significativos,
+	VENTANA_POR_DEFECTO
+)
+from config.settings import PLOTLY_CONFIG, METRICAS_HEATMAP, FACTOR_SWC, nombre_categoria
+
+VENTANAS_TENDENCIA = [2, 3, 4, 6]
+
+def calcular_tendencias_categoria(df_historial, categoria, seccion, ventana=VENTANA_POR_DEFECTO):
+	"""
+	Tendencias de todas las métricas de la sección para la categoría (una sola pasada)
+
+	Args:
+		df_historial: DataFrame con todas las sesiones (historial.df)
+		categoria: Categoría a analizar
+		seccion: "Fuerza" o "Movilidad"
+		ventana: Cantidad de evaluaciones de la ventana móvil
+
+	Returns:
+		DataFrame largo de calcular_tendencias
+	"""
+	df_categoria = procesar_datos_categoria(df_historial, categoria)
+	return calcular_tendencias(df_categoria, METRICAS_HEATMAP[seccion], ventana)
+
+def calcular_cambios_categoria(df_historial, categoria, seccion):
+	"""Cambios entre sesiones consecutivas de todas las métricas de la sección para la categoría"""
+	df_categoria = procesar_datos_categoria(df_historial, categoria)
+	return calcular_cambios_sesion(df_categoria, METRICAS_HEATMAP[seccion])
+
+def tabla_cambios_significativos(cambios, fecha=None):
+	"""
+	Tabla "cambios significativos" lista para mostrar (ordenada por |delta| / SWC)
+
+	Args:
+		cambios: Resultado de calcular_cambios_categoria
+		fecha: Fecha de corte (None = última sesión de cada jugador)
+
+	Returns:
+		DataFrame con columnas en castellano; las métricas que no se reevaluaron en
+		el último par de sesiones van al final con Δ vacío y "—" en Sentido
+	"""
+	tabla = cambios_significativos(cambios, fecha)
+	sentido = np.select(
+		[tabla["actual"].isna(), tabla["anterior"].isna(), tabla["delta"].gt(0)],
+		["— No reevaluada", "— Sin evaluación anterior", "▲ Aumento"],
+		"▼ Descenso"
+	)
+	tabla = tabla.assign(Sentido=sentido)
+	return tabla[[
+		"Deportista", "metrica", "FECHA_ANTERIOR", "FECHA", "anterior", "actual",
+		"delta", "delta_pct", "swc", "error_tipico", "magnitud", "Sentido"
+	]].rename(columns={
+		"metrica": "Métrica",
+		"FECHA_ANTERIOR": "Evaluación anterior",
+		"FECHA": "Evaluación actual",
+		"anterior": "Anterior",
+		"actual": "Actual",
+		"delta": "Δ",
+		"delta_pct": "Δ (%)",
+		"swc": "SWC",
+		"error_tipico": "Error típico",
+		"magnitud": "|Δ| / SWC"
+	})
+
+def obtener_componentes_evolucion(df_historial, jugador, categoria, seccion, metrica, fecha=None, ventana=VENTANA_POR_DEFECTO, tendencias=None, cambios=None):
+	"""
+	Construye los gráficos y la tabla de tendencias sin depender de Streamlit
+
+	Args:
+		df_historial: DataFrame con todas las sesiones
+		jugador: Jugador seleccionado
+		categoria: Categoría a analizar
+		seccion: "Fuerza" o "Movilidad"
+		metrica: Etiqueta de la métrica (valor de METRICAS_HEATMAP[seccion])
+		fecha: Fecha de corte (None = última evaluación)
+		ventana: Cantidad de evaluaciones de la ventana móvil
+		tendencias: Resultado de calcular_tendencias_categoria (se calcula si es None)
+		cambios: Resultado de calcular_cambios_categoria (se calcula si es None)
+
+	Returns:
+		Dict {"figuras": [fig_jugador, fig_grupo],
+		      "tablas": {"tendencias": DataFrame, "cambios_significativos": DataFrame}}
+	"""
+	if tendencias is None:
+		tendencias = calcular_tendencias_categoria(df_historial, categoria, seccion, ventana)
+	if cambios is None:
+		cambios = calcular_cambios_categoria(df_historial, categoria, seccion)
+	if fecha is not None:
+		tendencias = tendencias[tendencias["FECHA"] <= fecha]
+
+	de_metrica = tendencias[tendencias["metrica"] == metrica]
+	fig_jugador = crear_grafico_tendencia_jugador(
+		de_metrica[de_metrica["Deportista"] == jugador], jugador, metrica
+	)
+
+	resumen = resumir_tendencias(tendencias)
+	fig_grupo = crear_grafico_pendientes_grupo(
+		resumen[resumen["metrica"] == metrica], nombre_categoria(categoria), metrica, jugador
+	)
+
+	tabla = resumen[resumen["Deportista"] == jugador][
+		["metrica", "FECHA", "valor", "n", "media_movil", "pendiente_mensual", "cv"]
+	].rename(columns={
+		"metrica": "Métrica",
+		"FECHA": "Última evaluación",
+		"valor": "Valor",
+		"n": "Evaluaciones en ventana",
+		"media_movil": "Media móvil",
+		"pendiente_mensual": "Pendiente / mes",
+		"cv": "CV (%)"
+	}).reset_index(drop=True)
+
+	return {
+		"figuras": [fig_jugador, fig_grupo],
+		"tablas": {
+			"tendencias": tabla,
+			"cambios_significativos": tabla_cambios_significativos(cambios, fecha)
+		}
+	}
+
+def analizar_evolucion(df_historial, jugador, categoria, seccion, fecha=None):
+	"""Muestra la evolución del jugador y la tendencia del grupo en una métrica"""
+	import streamlit as st
+
+	metricas = METRICAS_HEATMAP[seccion]
+	col_metrica, col_ventana = st.columns([3, 1])
+	with col_metrica:
+		metrica = st.selectbox("Métrica", list(metricas.values()), key=f"evolucion_metrica_{seccion}")
+	with col_ventana:
+		ventana = st.selectbox(
+			"Ventana (evaluaciones)",
+			VENTANAS_TENDENCIA,
+			index=VENTANAS_TENDENCIA.index(VENTANA_POR_DEFECTO),
+			key="evolucion_ventana",
+			help="Cantidad de evaluaciones usadas para la media móvil, la pendiente y el CV"
+		)
+
+	tendencias = calcular_tendencias_categoria(df_historial, categoria, seccion, ventana)
+	if tendencias.empty:
+		st.warning("⚠️ No hay evaluaciones con fecha para calcular tendencias.")
+		return
+
+	componentes = obtener_componentes_evolucion(
+		df_historial, jugador, categoria, seccion, metrica, fecha, ventana, tendencias=tendencias
+	)
+
+	st.markdown("<br>", unsafe_allow_html=True)
+	st.plotly_chart(componentes["figuras"][0], use_container_width=True, config=PLOTLY_CONFIG)
+	st.plotly_chart(componentes["figuras"][1], use_container_width=True, config=PLOTLY_CONFIG)
+
+	with st.expander("Ver tendencias del jugador"):
+		st.dataframe(componentes["tablas"]["tendencias"], use_container_width=True)
+
+	st.markdown("#### Cambios significativos del grupo")
+	st.caption(
+		f"Cambio respecto de la evaluación anterior que supera el SWC ({FACTOR_SWC:g} × SD entre jugadores) "
+		"y el error típico de la sesión."
+	)
+	cambios = componentes["tablas"]["cambios_significativos"]
+	if cambios.empty:
+		st.info("Sin cambios significativos: se necesitan al menos dos evaluaciones por jugador.")
+	else:
+		st.dataframe(cambios, use_container_width=True, hide_index=True)
@@ -0,0 +1,102 @@
+"""
+Módulo de análisis grupal - Heatmap de Z-Scores (jugadores × métricas)
+"""
+
+from visualizations.charts import crear_heatmap_grupal
+from utils.data_utils import (
+	ordenar_matriz_grupo,
+	ORDEN_ALFABETICO,
+	ORDEN_PROMEDIO,
+	ORDEN_CLUSTER
+)
+from modules.secciones import resultados_seccion
+from components.tablas import columnas_numericas
+from config.settings import PLOTLY_CONFIG, nombre_categoria
+
+CAPAS_HEATMAP = ["Z-Score", "LSI"]
+ORDENES_HEATMAP = [ORDEN_CLUSTER, ORDEN_PROMEDIO, ORDEN_ALFABETICO]
+
+def calcular_matrices_heatmap(df, categoria, seccion):
+	"""
+	Matrices del heatmap de la categoría y sección (compartidas con las demás vistas)
+
+	Returns:
+		Dict {"Z-Score": (matriz, valores_crudos), "LSI": (matriz, None)}
+	"""
+	resultados = resultados_seccion(df, categoria, seccion)
+	matriz_z, valores = resultados.zscores
+	matriz_lsi = resultados.lsi
+	return {
+		"Z-Score": (matriz_z, valores),
+		"LSI": (matriz_lsi, None)
+	}
+
+def obtener_componentes_heatmap_grupal(df, categoria, seccion, capa="Z-Score", orden=ORDEN_CLUSTER, matrices=None):
+	"""
+	Construye el heatmap y la tabla de la matriz sin depender de Streamlit (para PDF/CLI)
+
+	Args:
+		df: DataFrame completo
+		categoria: Categoría a analizar
+		seccion: "Fuerza" o "Movilidad"
+		capa: "Z-Score" o "LSI"
+		orden: Criterio de ordenamiento de jugadores (ver ordenar_matriz_grupo)
+		matrices: Resultado de calcular_matrices_heatmap (se calcula si es None)
+
+	Returns:
+		Dict {"figuras": [fig], "tablas": {"comparativa_grupal": DataFrame}}
+	"""
+	if matrices is None:
+		matrices = calcular_matrices_heatmap(df, categoria, seccion)
+	matriz, valores = matrices[capa]
+
+	# Ordenar sobre la matriz precalculada: solo se reindexan filas
+	posiciones = ordenar_matriz_grupo(matriz, orden)
+	matriz = matriz.iloc[posiciones]
+	if valores is not None:
+		valores = valores.iloc[posiciones]
+
+	fig = crear_heatmap_grupal(matriz, valores, nombre_categoria(categoria), seccion, capa)
+
+	tabla = matriz.copy()
+	tabla.index.name = "Deportista"
+	return {
+		"figuras": [fig],
+		"tablas": {"comparativa_grupal": tabla}
+	}
+
+def analizar_heatmap_grupal(df, categoria, seccion):
+	"""Muestra el heatmap jugadores × métricas de la categoría"""
+	import streamlit as st
+
+	col_capa, col_orden = st.columns(2)
+	with col_capa:
+		capa = st.radio("Capa", CAPAS_HEATMAP, horizontal=True, key="heatmap_capa")
+
+	matrices = calcular_matrices_heatmap(df, categoria, seccion)
+	matriz = matrices[capa][0]
+
+	with col_orden:
+		orden = st.selectbox(
+			"Ordenar jugadores por",
+			ORDENES_HEATMAP + list(matriz.columns),
+			key="heatmap_orden",
+			help="Clúster agrupa a los jugadores con perfiles parecidos; una métrica ordena de mayor a menor"
+		)
+
+	if matriz.empty:
+		st.warning("⚠️ No hay métricas suficientes (mínimo 3 jugadores con datos) para construir el heatmap.")
+		return
+
+	componentes = obtener_componentes_heatmap_grupal(df, categoria, seccion, capa, orden, matrices=matrices)
+
+	st.markdown("<br>", unsafe_allow_html=True)
+	st.plotly_chart(componentes["figuras"][0], use_container_width=True, config=PLOTLY_CONFIG)
+
+	with st.expander("Ver matriz del grupo"):
+		tabla = componentes["tablas"]["comparativa_grupal"]
+		st.dataframe(
+			tabla,
+			column_config=columnas_numericas({col: col for col in tabla.columns}, "%.2f" if capa == "Z-Score" else "%.1f"),
+			use_container_width=True
+		)
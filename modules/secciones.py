@@ -0,0 +1,596 @@
+"""
+Motor de secciones de evaluación (Fuerza, Movilidad, ...)
+
+Cada sección se registra como SeccionEvaluacion: sus métricas salen del
+registro (config/metricas.py) y su módulo aporta solo lo propio (los gráficos
+de la sección y la distribución grupal). Las vistas Perfil del Jugador, Perfil
+del Grupo y Comparación, y sus figuras y tablas sin Streamlit (exportación PDF
+y CLI), son las de este módulo para todas las secciones. La app, el PDF y la
+CLI despachan por este registro en lugar de encadenar `if seccion == ...`, así
+que una sección nueva (por ejemplo, Funcionalidad) es un módulo que llama a
+`registrar_seccion` más sus métricas en el registro.
+
+Los cálculos del grupo que comparten las vistas (estadísticas por métrica,
+tabla media/SD, radar, distribución, matrices Z-Score y LSI del heatmap) pasan
+por `resultados_seccion`: se calculan la primera vez que se piden, una vez por
+DataFrame, categoría y sección, y se guardan junto a la partición por
+categoría. Cambiar de vista o de jugador reutiliza lo ya calculado.
+"""
+
+import importlib
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Optional
+
+import pandas as pd
+
+from config.metricas import (
+	claves_seccion, claves_por_defecto, columnas_tabla, columnas_totales, columnas_seccion,
+	metricas_columnas, metricas_seccion
+)
+from config.settings import PLOTLY_CONFIG, nombre_categoria
+from utils.data_utils import (
+	obtener_particion_categorias,
+	procesar_datos_categoria,
+	calcular_estadisticas_metricas_grupo,
+	calcular_estadisticas_completas_categoria,
+	calcular_zscores_radar_simple,
+	generar_zscores_radar_simple,
+	preparar_datos_jugador_completo,
+	calcular_matriz_zscores_grupo,
+	calcular_matriz_lsi_grupo
+)
+from utils.normas import estadisticas_referencia
+from utils.bandas import clasificar_zscores
+from components.tablas import columnas_numericas, niveles_zscore, tabla_jugador_vs_grupo
+
+# Módulos que registran las secciones incorporadas (en el orden del selector)
+MODULOS_SECCIONES = ("modules.fuerza_analysis", "modules.movilidad_analysis")
+
+# nombre → SeccionEvaluacion, en orden de registro
+_SECCIONES = {}
+
+
+@dataclass(frozen=True)
+class SeccionEvaluacion:
+	"""
+	Definición de una sección: métricas del grupo y lo propio de sus vistas
+
+	Los gráficos reciben los mismos argumentos en todas las secciones:
+	- grafico_jugador(datos_jugador_dict, metricas, metricas_columnas)
+	- grafico_grupal(estadisticas_grupales, metricas, categoria_display)
+	- grafico_comparativo(datos_jugador_dict, estadisticas_grupales, metricas, metricas_columnas, jugador)
+	- radar_jugador(zscores_radar, jugador)
+	- radar_comparativo(zscores_radar, estadisticas_radar, jugador, categoria); None = radar_jugador
+	- grafico_distribucion(estadisticas_distribucion, categoria_display)
+	"""
+	nombre: str
+	metricas_radar: dict
+	metricas_heatmap: dict
+	distribucion: Callable
+	grafico_jugador: Callable
+	grafico_grupal: Callable
+	grafico_comparativo: Callable
+	radar_jugador: Callable
+	grafico_distribucion: Callable
+	radar_comparativo: Optional[Callable] = None
+	# Unidad de la media en las tarjetas de la distribución grupal
+	unidad_tarjetas: str = ""
+
+
+def registrar_seccion(seccion):
+	"""Registra (o reemplaza) una sección; devuelve la misma definición"""
+	_SECCIONES[seccion.nombre] = seccion
+	return seccion
+
+
+def _cargar_secciones():
+	"""Importa los módulos de las secciones incorporadas (se registran al importarse)"""
+	for modulo in MODULOS_SECCIONES:
+		importlib.import_module(modulo)
+
+
+def secciones_disponibles():
+	"""Nombres de las secciones registradas (opciones del selector "Evaluación")"""
+	_cargar_secciones()
+	return list(_SECCIONES)
+
+
+def obtener_seccion(nombre):
+	"""Definición de la sección; ValueError si no está registrada"""
+	if nombre not in _SECCIONES:
+		_cargar_secciones()
+	if nombre not in _SECCIONES:
+		raise ValueError(f"Sección no registrada: {nombre}")
+	return _SECCIONES[nombre]
+
+
+class ResultadosSeccion:
+	"""Cálculos del grupo de una categoría y sección, hechos una vez y bajo demanda"""
+
+	def __init__(self, df_categoria, seccion):
+		"""
+		Args:
+			df_categoria: Filas de deportistas de la categoría
+			seccion: SeccionEvaluacion
+		"""
+		self.df_categoria = df_categoria
+		self.seccion = seccion
+
+	@cached_property
+	def estadisticas(self):
+		"""Media/SD por métrica del registro (formato de los gráficos grupales)"""
+		nombre = self.seccion.nombre
+		return calcular_estadisticas_metricas_grupo(self.df_categoria, nombre, claves_seccion(nombre))
+
+	def estadisticas_metricas(self, claves):
+		"""`estadisticas` de las métricas seleccionadas, en el orden de la selección"""
+		return {clave: self.estadisticas[clave] for clave in claves if clave in self.estadisticas}
+
+	@cached_property
+	def tabla(self):
+		"""Media y SD por columna (tabla grupal): {'media', 'std', 'n_jugadores'}"""
+		nombre = self.seccion.nombre
+		return calcular_estadisticas_completas_categoria(self.df_categoria, columnas_tabla(nombre), columnas_totales(nombre))
+
+	@cached_property
+	def radar(self):
+		"""Media y SD de las métricas del radar Z-Score"""
+		return calcular_zscores_radar_simple(self.df_categoria, self.seccion.metricas_radar)
+
+	@cached_property
+	def distribucion(self):
+		"""Media, mínimo y máximo de las métricas del gráfico de distribución grupal"""
+		return self.seccion.distribucion(self.df_categoria)
+
+	@cached_property
+	def zscores(self):
+		"""(matriz Z-Score jugadores × métricas, valores crudos) del heatmap"""
+		return calcular_matriz_zscores_grupo(self.df_categoria, self.seccion.metricas_heatmap)
+
+	@cached_property
+	def lsi(self):
+		"""Matriz LSI jugadores × pares bilaterales del heatmap"""
+		pares = {
+			metrica.etiqueta: (metrica.der, metrica.izq)
+			for metrica in metricas_seccion(self.seccion.nombre) if metrica.bilateral
+		}
+		return calcular_matriz_lsi_grupo(self.df_categoria, pares)
+
+
+def resultados_seccion(df, categoria, seccion):
+	"""
+	Resultados compartidos de la sección para la categoría (se construyen una vez por DataFrame)
+
+	Args:
+		df: DataFrame con todas las categorías (foto a la fecha)
+		categoria: Categoría a analizar
+		seccion: Nombre de la sección registrada
+
+	Returns:
+		ResultadosSeccion
+	"""
+	particion = obtener_particion_categorias(df)
+	clave = ("seccion", categoria, seccion)
+	if clave not in particion.derivados:
+		particion.derivados[clave] = ResultadosSeccion(
+			procesar_datos_categoria(df, categoria),
+			obtener_seccion(seccion)
+		)
+	return particion.derivados[clave]
+
+
+# ========= FIGURAS Y TABLAS DE LAS VISTAS ==========
+
+def _datos_dict(datos_jugador):
+	"""Fila del jugador como dict (los gráficos cacheados reciben dicts)"""
+	return datos_jugador.to_dict() if hasattr(datos_jugador, "to_dict") else dict(datos_jugador)
+
+
+def _tabla_metricas(filas, indice, columnas):
+	"""
+	Tabla métrica × estadístico con las columnas presentes en todas las filas
+
+	Args:
+		filas: Dicts {columna: valor} (jugador, media, SD, ...)
+		indice: Nombre de cada fila (pasan a ser las columnas de la tabla)
+		columnas: Columnas de la sección en el orden de la tabla
+
+	Returns:
+		(DataFrame con índice "Métrica", columnas que faltan en alguna fila)
+	"""
+	validas = [col for col in columnas if all(col in fila for fila in filas)]
+	faltantes = [col for col in columnas if col not in validas]
+	if not validas:
+		return pd.DataFrame(), faltantes
+	tabla = pd.DataFrame(filas)[validas]
+	tabla.index = indice
+	tabla = tabla.T
+	tabla.index.name = "Métrica"
+	return tabla, faltantes
+
+
+def tabla_jugador_referencia(seccion, datos_jugador, estadisticas_grupales, jugador):
+	"""Valor del jugador, media y SD del grupo de referencia por columna de la sección"""
+	jugador_dict = preparar_datos_jugador_completo(
+		_datos_dict(datos_jugador), columnas_tabla(seccion), columnas_totales(seccion)
+	)
+	return _tabla_metricas(
+		[jugador_dict, estadisticas_grupales["media"], estadisticas_grupales["std"]],
+		[f"{jugador}", "Media", "Desviación Estándar"],
+		columnas_seccion(seccion)
+	)
+
+
+def tabla_grupal(seccion, estadisticas_tabla):
+	"""Media y SD del grupo por columna de la sección"""
+	return _tabla_metricas(
+		[estadisticas_tabla["media"], estadisticas_tabla["std"]],
+		["Media Grupal", "Desviación Estándar"],
+		columnas_seccion(seccion)
+	)
+
+
+def zscores_radar_jugador(df, datos_jugador, categoria, seccion):
+	"""
+	Z-Scores del jugador en las métricas del radar frente a su categoría
+
+	Returns:
+		(estadísticas del radar, {etiqueta: {zscore, valor_original, media_poblacion}});
+		ambos vacíos si la categoría no tiene jugadores suficientes
+	"""
+	estadisticas_radar = resultados_seccion(df, categoria, seccion).radar
+	if not estadisticas_radar:
+		return {}, {}
+	definicion = obtener_seccion(seccion)
+	return estadisticas_radar, generar_zscores_radar_simple(datos_jugador, estadisticas_radar, definicion.metricas_radar)
+
+
+def tabla_zscores(zscores_radar):
+	"""Resumen de los Z-Scores del radar (lo que muestran las tarjetas debajo del radar)"""
+	bandas = clasificar_zscores([data["zscore"] for data in zscores_radar.values()], "resumen")
+	filas = [
+		{
+			"Métrica": metrica,
+			"Z-Score": data["zscore"],
+			"Valor": data["valor_original"],
+			"Categoría": categoria_nivel,
+		}
+		for (metrica, data), categoria_nivel in zip(zscores_radar.items(), bandas.categoria)
+	]
+	return pd.DataFrame(filas).set_index("Métrica") if filas else pd.DataFrame()
+
+
+def obtener_componentes_perfil(seccion, df, datos_jugador, jugador, categoria, metricas_seleccionadas=None, referencia=None):
+	"""
+	Figuras y tablas del perfil del jugador SIN usar Streamlit (lo que muestra `analizar_perfil`)
+
+	Args:
+		seccion: Nombre de la sección registrada
+		df: DataFrame completo con todos los jugadores
+		datos_jugador: Fila del jugador (Series o dict)
+		jugador: Nombre del jugador
+		categoria: Categoría del jugador
+		metricas_seleccionadas: Claves del registro; None = las por defecto de la sección
+		referencia: Grupo de referencia de la tabla (ver utils.normas); None = la categoría
+
+	Returns:
+		{"figuras": [gráfico del jugador, radar], "tablas": {"zscores": ..., "comparativa": ...}}
+	"""
+	definicion = obtener_seccion(seccion)
+	if metricas_seleccionadas is None:
+		metricas_seleccionadas = claves_por_defecto(seccion)
+
+	figuras = [definicion.grafico_jugador(
+		_datos_dict(datos_jugador), tuple(metricas_seleccionadas), metricas_columnas(seccion)
+	)]
+
+	estadisticas_radar, zscores_radar = zscores_radar_jugador(df, datos_jugador, categoria, seccion)
+	if estadisticas_radar:
+		figuras.append(definicion.radar_jugador(zscores_radar, jugador))
+
+	estadisticas_grupales = estadisticas_referencia(
+		df, referencia or categoria, columnas_tabla(seccion), columnas_totales(seccion)
+	)
+	comparativa, _ = tabla_jugador_referencia(seccion, datos_jugador, estadisticas_grupales, jugador)
+
+	return {
+		"figuras": figuras,
+		"tablas": {
+			"zscores": tabla_zscores(zscores_radar),
+			"comparativa": comparativa,
+		},
+	}
+
+
+def obtener_componentes_grupal(seccion, df, categoria, metricas_seleccionadas=None):
+	"""
+	Figuras y tabla del perfil del grupo SIN usar Streamlit (lo que muestra `analizar_grupal`)
+
+	Returns:
+		{"figuras": [gráfico grupal, distribución], "tablas": {"comparativa_grupal": ...}}
+	"""
+	definicion = obtener_seccion(seccion)
+	if metricas_seleccionadas is None:
+		metricas_seleccionadas = claves_por_defecto(seccion)
+	categoria_display = nombre_categoria(categoria)
+
+	# Resultados del grupo compartidos por todas las vistas de la sección
+	resultados = resultados_seccion(df, categoria, seccion)
+	figuras = [definicion.grafico_grupal(
+		resultados.estadisticas_metricas(metricas_seleccionadas), tuple(metricas_seleccionadas), categoria_display
+	)]
+	if resultados.distribucion:
+		figuras.append(definicion.grafico_distribucion(resultados.distribucion, categoria_display))
+
+	tabla, _ = tabla_grupal(seccion, resultados.tabla)
+	return {
+		"figuras": figuras,
+		"tablas": {"comparativa_grupal": tabla},
+	}
+
+
+# ========= VISTAS (STREAMLIT) ==========
+
+def _config_descarga(nombre_archivo, alto):
+	"""PLOTLY_CONFIG con el nombre y tamaño de la imagen descargada (sin modificar el original)"""
+	return {
+		**PLOTLY_CONFIG,
+		'toImageButtonOptions': {**PLOTLY_CONFIG['toImageButtonOptions'], 'filename': nombre_archivo, 'height': alto, 'width': 800}
+	}
+
+
+def _encabezado(st, titulo):
+	"""Encabezado rojo de cada bloque de la vista"""
+	st.markdown("<br><br>", unsafe_allow_html=True)
+	st.markdown(f"""
+	<div style='background: linear-gradient(90deg, rgba(220, 38, 38, 0.8), rgba(17, 24, 39, 0.8));
+				border-left: 4px solid rgba(220, 38, 38, 1); padding: 15px; border-radius: 8px;'>
+		<h4 style='margin: 0; color: white; font-family: "Source Sans Pro", sans-serif; font-weight: 600; font-size: 1.5rem; line-height: 1.2; padding: 0.75rem 0 1rem;'>
+			{titulo}
+		</h4>
+	</div>
+	""", unsafe_allow_html=True)
+	# Espaciado para mejorar el estilo visual
+	st.markdown("<br>", unsafe_allow_html=True)
+
+
+def _selector_metricas(st, seccion, para):
+	"""Multiselect de métricas de la sección (opciones y selección inicial del registro)"""
+	return st.multiselect(
+		f"Selección de Métricas - Selecciona las evaluaciones para {para}:",
+		claves_seccion(seccion),
+		default=claves_por_defecto(seccion)
+	)
+
+
+def _grafico_principal(st, fig):
+	"""Gráfico de barras de la vista, con animación de entrada"""
+	st.markdown("""
+	<div style="animation: fadeInUp 0.8s ease-out;">
+	""", unsafe_allow_html=True)
+	st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+	st.markdown("</div>", unsafe_allow_html=True)
+
+
+def _tarjetas(st, tarjetas):
+	"""Tarjetas debajo del radar o de la distribución: (título, valor, pie, color, fondo)"""
+	cols = st.columns(len(tarjetas))
+	for col, (titulo, valor, pie, color, fondo) in zip(cols, tarjetas):
+		with col:
+			st.markdown(f"""
+			<div style='text-align: center; padding: 10px; background: {fondo}; 
+						border-radius: 8px; border-top: 3px solid {color};'>
+				<h5 style='margin: 0; color: white; font-size: 12px;'>{titulo}</h5>
+				<p style='margin: 2px 0; color: {color}; font-weight: bold; font-size: 16px;'>
+					{valor}
+				</p>
+				<p style='margin: 0; color: rgba(255,255,255,0.7); font-size: 10px;'>
+					{pie}
+				</p>
+			</div>
+			""", unsafe_allow_html=True)
+
+
+def _sin_jugadores_suficientes(st, analisis):
+	"""Aviso de categoría con menos de 3 jugadores con datos"""
+	st.warning(f"Datos insuficientes para {analisis}. Se requieren al menos 3 jugadores en la categoría.")
+	col1, col_center, col2 = st.columns([1, 2, 1])
+	with col_center:
+		st.info(f"Agregue más jugadores a la categoría para habilitar el {analisis}.")
+
+
+def analizar_perfil(seccion, df, datos_jugador, jugador, categoria, referencia=None):
+	"""Perfil del jugador: barras, radar Z-Score y tabla frente a `referencia` (por defecto la categoría)"""
+	import streamlit as st
+
+	definicion = obtener_seccion(seccion)
+	metricas_seleccionadas = _selector_metricas(st, seccion, "el análisis")
+	if not metricas_seleccionadas:
+		st.info("Selecciona al menos una métrica para visualizar el gráfico.")
+		return
+
+	st.markdown("<br>", unsafe_allow_html=True)
+	_grafico_principal(st, definicion.grafico_jugador(
+		_datos_dict(datos_jugador), tuple(metricas_seleccionadas), metricas_columnas(seccion)
+	))
+
+	# === RADAR Z-SCORE SIMPLIFICADO ===
+	_encabezado(st, "Comparación vs Grupo")
+	with st.spinner("Calculando estadísticas para radar..."):
+		estadisticas_radar, zscores_radar = zscores_radar_jugador(df, datos_jugador, categoria, seccion)
+
+	if estadisticas_radar:
+		st.plotly_chart(
+			definicion.radar_jugador(zscores_radar, jugador),
+			use_container_width=True,
+			config=_config_descarga(f"radar_simple_{seccion.lower()}_{jugador}_{categoria}", 600)
+		)
+		if zscores_radar:
+			# Color y nivel de todas las tarjetas según Z-Score (bandas "resumen")
+			bandas = clasificar_zscores([data['zscore'] for data in zscores_radar.values()], "resumen")
+			_tarjetas(st, [
+				(metrica, f"{data['zscore']:.1f}", bandas.categoria[i], bandas.color[i], "rgba(31, 41, 55, 0.6)")
+				for i, (metrica, data) in enumerate(zscores_radar.items())
+			])
+	else:
+		_sin_jugadores_suficientes(st, "análisis Z-Score")
+
+	# === TABLA COMPARATIVA ===
+	st.markdown(f"#### Tabla - {jugador}")
+
+	# Estadísticas del grupo de referencia elegido (precalculadas por el servicio de normas)
+	referencia = referencia or categoria
+	estadisticas_grupales = estadisticas_referencia(df, referencia, columnas_tabla(seccion), columnas_totales(seccion))
+	st.caption(f"Referencia: {nombre_categoria(referencia)} · {estadisticas_grupales['n_jugadores']} jugadores")
+
+	tabla, faltantes = tabla_jugador_referencia(seccion, datos_jugador, estadisticas_grupales, jugador)
+	for col in faltantes:
+		st.warning(f"⚠️ Columna '{col}' no encontrada en los datos")
+	if tabla.empty:
+		st.error("❌ No se encontraron columnas válidas para la tabla")
+		return
+
+	# Nivel del jugador frente a la referencia en todas las métricas a la vez
+	niveles = niveles_zscore(tabla.iloc[:, 0], tabla["Media"], tabla["Desviación Estándar"])
+	st.dataframe(
+		tabla.assign(Nivel=niveles),
+		column_config=columnas_numericas({
+			jugador: f"🔴 {jugador}",
+			"Media": "⚪ Media",
+			"Desviación Estándar": "🔵 Desviación Estándar"
+		}),
+		use_container_width=True
+	)
+
+
+def analizar_grupal(seccion, df, categoria):
+	"""Perfil del grupo: medias por métrica, distribución del grupo y tabla media/SD"""
+	import streamlit as st
+
+	definicion = obtener_seccion(seccion)
+	categoria_display = nombre_categoria(categoria)
+	metricas_seleccionadas = _selector_metricas(st, seccion, "el análisis grupal")
+	if not metricas_seleccionadas:
+		st.info("Selecciona al menos una métrica para visualizar el análisis grupal.")
+		return
+
+	st.markdown("<br>", unsafe_allow_html=True)
+
+	# Resultados del grupo compartidos por todas las vistas de la sección
+	resultados = resultados_seccion(df, categoria, seccion)
+	_grafico_principal(st, definicion.grafico_grupal(
+		resultados.estadisticas_metricas(metricas_seleccionadas), tuple(metricas_seleccionadas), categoria_display
+	))
+
+	# === DISTRIBUCIÓN GRUPAL ===
+	_encabezado(st, "Distribución del Grupo")
+	with st.spinner("Calculando distribución grupal..."):
+		distribucion = resultados.distribucion
+
+	if distribucion:
+		st.plotly_chart(
+			definicion.grafico_distribucion(distribucion, categoria_display),
+			use_container_width=True,
+			config=_config_descarga(f"distribucion_grupal_{seccion.lower()}_{categoria}", 600)
+		)
+		_tarjetas(st, [
+			(stats['label'], f"{stats['media']:.0f}{definicion.unidad_tarjetas}", "Media Grupal", "#dc2626", "rgba(220, 38, 38, 0.15)")
+			for stats in distribucion.values()
+		])
+	else:
+		_sin_jugadores_suficientes(st, "análisis grupal")
+
+	# === TABLA COMPARATIVA GRUPAL ===
+	st.markdown(f"#### Tabla - {categoria_display}")
+	tabla, faltantes = tabla_grupal(seccion, resultados.tabla)
+	for col in faltantes:
+		st.warning(f"⚠️ Columna '{col}' no encontrada en los datos grupales")
+	if tabla.empty:
+		st.error("❌ No se encontraron columnas válidas para la tabla grupal")
+		return
+
+	st.dataframe(
+		tabla,
+		column_config=columnas_numericas({
+			"Media Grupal": "🔴 Media Grupal",
+			"Desviación Estándar": "⚫ Desviación Estándar"
+		}),
+		use_container_width=True
+	)
+
+
+def analizar_comparativo(seccion, df, datos_jugador, jugador, categoria, referencia=None):
+	"""Comparación jugador vs grupo de referencia (por defecto la categoría): barras superpuestas, radar y tabla"""
+	import streamlit as st
+
+	definicion = obtener_seccion(seccion)
+	metricas_seleccionadas = _selector_metricas(st, seccion, "la comparación")
+	if not metricas_seleccionadas:
+		st.info("Selecciona al menos una métrica para visualizar la comparación.")
+		return
+
+	st.markdown("<br>", unsafe_allow_html=True)
+
+	# === GRÁFICO DE BARRAS COMPARATIVO ===
+	with st.spinner("Calculando estadísticas grupales para comparación..."):
+		estadisticas_grupales = estadisticas_referencia(
+			df, referencia or categoria, columnas_tabla(seccion), columnas_totales(seccion)
+		)
+	_grafico_principal(st, definicion.grafico_comparativo(
+		_datos_dict(datos_jugador), estadisticas_grupales, tuple(metricas_seleccionadas), metricas_columnas(seccion), jugador
+	))
+
+	# === RADAR Z-SCORE COMPARATIVO ===
+	_encabezado(st, "Radar Comparativo Z-Score")
+	with st.spinner("Calculando estadísticas para radar comparativo..."):
+		estadisticas_radar, zscores_radar = zscores_radar_jugador(df, datos_jugador, categoria, seccion)
+
+	if estadisticas_radar:
+		if definicion.radar_comparativo is not None:
+			fig_radar = definicion.radar_comparativo(zscores_radar, estadisticas_radar, jugador, categoria)
+		else:
+			fig_radar = definicion.radar_jugador(zscores_radar, jugador)
+		st.plotly_chart(
+			fig_radar,
+			use_container_width=True,
+			config=_config_descarga(f"radar_comparativo_{seccion.lower()}_{jugador}_{categoria}", 650)
+		)
+	else:
+		st.warning("Datos insuficientes para Z-Scores en el radar. Se requieren al menos 3 jugadores en la categoría.")
+
+	# === TABLA COMPARATIVA ===
+	_encabezado(st, f"Tabla comparativa – {jugador} vs Grupo")
+
+	# Valores numéricos; formato y encabezados en column_config
+	tabla, configuracion = tabla_jugador_vs_grupo(
+		metricas_seleccionadas, metricas_columnas(seccion), datos_jugador, estadisticas_grupales, jugador
+	)
+	if tabla.empty:
+		st.info("No se pudo generar la tabla comparativa. Verificar datos disponibles.")
+		return
+	st.dataframe(tabla, column_config=configuracion, use_container_width=True)
+
+
+def analizar_vista(vista, seccion, df, categoria, jugador=None, datos_jugador=None, referencia=None):
+	"""
+	Muestra en Streamlit una de las vistas propias de la sección
+
+	Args:
+		vista: "Perfil del Jugador", "Perfil del Grupo" o "Comparación Jugador vs Grupo"
+		seccion: Nombre de la sección registrada
+		df, categoria, jugador, datos_jugador, referencia: Selección de la sidebar
+	"""
+	if vista == "Perfil del Grupo":
+		analizar_grupal(seccion, df, categoria)
+	elif vista == "Comparación Jugador vs Grupo":
+		analizar_comparativo(seccion, df, datos_jugador, jugador, categoria, referencia)
+	else:
+		analizar_perfil(seccion, df, datos_jugador, jugador, categoria, referencia)
+
+
+def componentes_vista(vista, seccion, df, categoria, jugador=None, datos_jugador=None, referencia=None):
+	"""Figuras y tablas de la vista sin Streamlit ({"figuras": [...], "tablas": {...}})"""
+	if vista == "Perfil del Grupo":
+		return obtener_componentes_grupal(seccion, df, categoria)
+	return obtener_componentes_perfil(seccion, df, datos_jugador, jugador, categoria, referencia=referencia)
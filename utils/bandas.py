@@ -0,0 +1,105 @@
+"""
+Clasificación de Z-Scores en bandas clínicas sobre arrays
+
+Los umbrales (Z ≥ 2 excepcional, ≥ 1 superior, ...) estaban en una cadena
+if/elif por valor (`interpretar_zscore_clinico`) y copiados en las tarjetas de
+fuerza y movilidad. Las tablas de bandas están ahora en BANDAS_ZSCORE
+(config/settings.py) y `clasificar_zscores` ubica todos los valores de un array
+(las métricas de un jugador o la matriz jugadores × métricas del grupo) con un
+solo `np.digitize`: categoría, interpretación, color y percentil salen de tomar
+por índice de arrays precalculados, sin un llamado por celda.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from config.settings import BANDAS_ZSCORE, BANDA_SIN_DATOS
+
+
+@dataclass(frozen=True)
+class TablaBandas:
+	"""Bandas compiladas: límites para np.digitize y atributos por índice (el último = sin datos)"""
+	limites: np.ndarray
+	categorias: np.ndarray
+	interpretaciones: np.ndarray
+	colores: np.ndarray
+	percentiles: np.ndarray
+
+
+@lru_cache(maxsize=16)
+def compilar_bandas(bandas):
+	"""
+	Compila una tabla de bandas (una vez por tabla)
+
+	Args:
+		bandas: Nombre en BANDAS_ZSCORE o tupla de (desde, categoría, interpretación,
+			color, percentil) ordenada de menor a mayor
+
+	Returns:
+		TablaBandas
+	"""
+	filas = BANDAS_ZSCORE[bandas] if isinstance(bandas, str) else bandas
+	desde = np.array([fila[0] for fila in filas], dtype=float)
+	if np.any(np.diff(desde) <= 0):
+		raise ValueError("Las bandas deben estar ordenadas de menor a mayor sin límites repetidos")
+	# La banda sin datos va al final: el índice -1 la selecciona
+	atributos = [*(fila[1:] for fila in filas), BANDA_SIN_DATOS]
+	return TablaBandas(
+		limites=desde[1:],
+		categorias=np.array([fila[0] for fila in atributos], dtype=object),
+		interpretaciones=np.array([fila[1] for fila in atributos], dtype=object),
+		colores=np.array([fila[2] for fila in atributos], dtype=object),
+		percentiles=np.array([fila[3] for fila in atributos], dtype=object)
+	)
+
+
+@dataclass(frozen=True)
+class BandasZScore:
+	"""Banda de cada valor de un array de Z-Scores (misma forma que el array)"""
+	indices: np.ndarray
+	tabla: TablaBandas
+
+	@property
+	def categoria(self):
+		return self.tabla.categorias[self.indices]
+
+	@property
+	def interpretacion(self):
+		return self.tabla.interpretaciones[self.indices]
+
+	@property
+	def color(self):
+		return self.tabla.colores[self.indices]
+
+	@property
+	def percentil(self):
+		return self.tabla.percentiles[self.indices]
+
+	def banda(self, *posicion):
+		"""Banda de un valor en el formato de los dicts de interpretación ('interpretacion', 'color', ...)"""
+		i = self.indices[posicion]
+		return {
+			'interpretacion': self.tabla.interpretaciones[i],
+			'color': self.tabla.colores[i],
+			'percentil': self.tabla.percentiles[i],
+			'categoria': self.tabla.categorias[i]
+		}
+
+
+def clasificar_zscores(zscores, bandas="clinica"):
+	"""
+	Clasifica un array de Z-Scores de cualquier forma en una sola pasada
+
+	Args:
+		zscores: Array, lista o DataFrame de Z-Scores (None/NaN = sin datos)
+		bandas: Nombre en BANDAS_ZSCORE o tabla de bandas (ver compilar_bandas)
+
+	Returns:
+		BandasZScore
+	"""
+	tabla = compilar_bandas(bandas)
+	valores = np.asarray(zscores, dtype=float)
+	indices = np.digitize(valores, tabla.limites)
+	return BandasZScore(np.where(np.isnan(valores), -1, indices), tabla)
@@ -0,0 +1,391 @@
+"""
+Benchmarks de los caminos críticos (carga, estadísticas, gráficos y reporte)
+
+Mide, sobre libros sintéticos de varios tamaños (utils.datos_sinteticos), la
+carga del Excel, el filtrado por categoría, las funciones `calcular_*` y
+`generar_*`, los constructores de gráficos `crear_*`, los
+`obtener_componentes_*` y el contexto del reporte. Corre sin Streamlit: el
+decorador `cache_data` devuelve las funciones sin caché, y cada repetición que
+recibe el DataFrame usa una copia nueva para no reutilizar la partición ni los
+resultados de sección de la repetición anterior (se mide el costo en frío).
+
+Los resultados se guardan en JSON (con commit, versiones y tiempos por caso y
+tamaño) y se pueden comparar contra una corrida anterior:
+
+	python -m cli benchmark --filas 100 1000 10000 --out benchmark_actual.json
+	python -m cli benchmark --filas 1000 --comparar benchmark_base.json --out benchmark_actual.json
+"""
+
+import json
+import pickle
+import platform
+import shutil
+import statistics
+import subprocess
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import plotly
+
+from config import metricas as registro
+from config.settings import METRICAS_ZSCORE_FUERZA, METRICAS_ZSCORE_RADAR_SIMPLE, METRICAS_ZSCORE_MOVILIDAD, METRICAS_HEATMAP, PARES_LSI
+from utils.cache_utils import streamlit_activo
+from utils.data_utils import (
+	leer_evaluaciones_excel, procesar_datos_categoria, calcular_estadisticas_metricas_grupo,
+	calcular_estadisticas_categoria, calcular_estadisticas_completas_categoria, calcular_zscores_automaticos,
+	calcular_zscore_jugador, generar_zscores_jugador, calcular_metricas_bilaterales_promedio,
+	calcular_zscores_radar_simple, generar_zscores_radar_simple, calcular_estadisticas_distribucion_grupal,
+	calcular_matriz_zscores_grupo, calcular_matriz_lsi_grupo, ordenar_matriz_grupo, ORDEN_CLUSTER
+)
+from utils.datos_sinteticos import escribir_libro_sintetico, jugadores_para_filas
+from utils.derivadas import agregar_derivadas
+from utils.esquemas import precision_calculo
+from utils.ingesta import IngestaIncremental
+from utils.longitudinal import EvaluacionesLongitudinales
+from utils.normas import estadisticas_referencia
+from utils.tendencias import resumir_tendencias
+from utils.pdf_report import construir_contexto_reporte_perfil, generar_html_reporte, generar_pdf_reporte
+from modules.fuerza_analysis import obtener_componentes_perfil_fuerza, obtener_componentes_perfil_fuerza_grupal
+from modules.movilidad_analysis import (
+	calcular_distribucion_movilidad, obtener_componentes_perfil_movilidad, obtener_componentes_perfil_movilidad_grupal
+)
+from modules.heatmap_analysis import calcular_matrices_heatmap, obtener_componentes_heatmap_grupal
+from modules.evolucion_analysis import calcular_tendencias_categoria, calcular_cambios_categoria, obtener_componentes_evolucion
+from visualizations import charts
+from visualizations.svg_export import figura_a_svg
+
+# Tamaños por defecto (filas de deportistas del libro: jugadores × fechas)
+FILAS_POR_DEFECTO = (100, 1000, 10000)
+
+# Una mediana más lenta que la base en este factor se informa como regresión
+UMBRAL_REGRESION = 1.25
+
+
+@dataclass
+class DatosBenchmark:
+	"""Dataset sintético cargado y los insumos intermedios que reciben las funciones medidas"""
+	filas: int
+	ruta_excel: str
+	historial: EvaluacionesLongitudinales
+	foto: pd.DataFrame
+	categoria: str
+	jugador: str
+	datos_jugador: pd.Series
+	df_categoria: pd.DataFrame
+	insumos: dict = field(default_factory=dict)
+	# Mismo libro sin la última sesión (para medir la ingesta de una sesión nueva)
+	ruta_excel_anterior: str = None
+
+	def foto_nueva(self):
+		"""Copia de la foto: objeto nuevo, sin partición ni resultados de sección en caché"""
+		return self.foto.copy()
+
+
+@dataclass(frozen=True)
+class CasoBenchmark:
+	"""Función medida: `preparar(datos)` (fuera del tiempo) devuelve (función, args)"""
+	nombre: str
+	grupo: str
+	preparar: Callable
+
+
+def preparar_datos(filas, directorio, fechas=2, categorias=1, formato_graficos="svg", semilla=0):
+	"""
+	Escribe el libro sintético de `filas` filas y prepara los insumos de los casos
+
+	Args:
+		filas: Filas de deportistas (jugadores × fechas)
+		directorio: Carpeta donde se escribe el .xlsx
+		fechas: Sesiones de evaluación (al menos 2 para las tendencias)
+		categorias: Categorías del libro (se mide la primera)
+		formato_graficos: "svg" o "png" para el contexto del reporte
+		semilla: Semilla del generador
+
+	Returns:
+		DatosBenchmark
+	"""
+	ruta = str(Path(directorio) / f"benchmark_{filas}.xlsx")
+	escribir_libro_sintetico(
+		ruta, jugadores=jugadores_para_filas(filas, fechas), categorias=categorias, fechas=fechas, semilla=semilla
+	)
+	ruta_anterior = None
+	if fechas > 1:
+		# Con la misma semilla, las primeras sesiones son idénticas a las del libro completo
+		ruta_anterior = str(Path(directorio) / f"benchmark_{filas}_anterior.xlsx")
+		escribir_libro_sintetico(
+			ruta_anterior, jugadores=jugadores_para_filas(filas, fechas), categorias=categorias, fechas=fechas - 1, semilla=semilla
+		)
+	historial = EvaluacionesLongitudinales(leer_evaluaciones_excel(ruta))
+	foto = historial.foto()
+	categoria = foto["categoria"].iloc[0]
+	df_categoria = procesar_datos_categoria(foto, categoria)
+
+	# Jugador con más métricas cargadas (todas las figuras tienen datos)
+	columnas = [c for c in registro.columnas_seccion("Fuerza") + registro.columnas_seccion("Movilidad") if c in df_categoria.columns]
+	fila = df_categoria[columnas].notna().sum(axis=1).idxmax()
+	datos_jugador = precision_calculo(df_categoria.loc[fila])
+	jugador = datos_jugador["Deportista"]
+
+	datos = DatosBenchmark(filas, ruta, historial, foto, categoria, jugador, datos_jugador, df_categoria, ruta_excel_anterior=ruta_anterior)
+	_preparar_insumos(datos, formato_graficos)
+	return datos
+
+
+def _preparar_insumos(datos, formato_graficos):
+	"""Salidas intermedias (estadísticas, Z-Scores, matrices) que consumen los gráficos"""
+	insumos = datos.insumos
+	df_categoria = datos.df_categoria
+	datos_dict = datos.datos_jugador.to_dict()
+	insumos["datos_dict"] = datos_dict
+	insumos["formato_graficos"] = formato_graficos
+	for seccion, metricas_radar in (("Fuerza", METRICAS_ZSCORE_RADAR_SIMPLE), ("Movilidad", METRICAS_ZSCORE_MOVILIDAD)):
+		claves = tuple(registro.claves_por_defecto(seccion))
+		radar = calcular_zscores_radar_simple(df_categoria, metricas_radar)
+		zscores_radar = generar_zscores_radar_simple(datos.datos_jugador, radar, metricas_radar)
+		insumos[seccion] = {
+			"claves": claves,
+			"metricas_columnas": registro.metricas_columnas(seccion),
+			"radar": radar,
+			"zscores_radar": zscores_radar,
+			"grupo_radar": {
+				metricas_radar[clave]: {"zscore": 0, "valor_original": stats["media"]}
+				for clave, stats in radar.items() if clave in metricas_radar
+			},
+			"estadisticas_grupo": calcular_estadisticas_metricas_grupo(df_categoria, seccion, claves),
+			"referencia": estadisticas_referencia(
+				datos.foto, datos.categoria, registro.columnas_tabla(seccion), registro.columnas_totales(seccion)
+			),
+		}
+	insumos["Fuerza"]["distribucion"] = calcular_estadisticas_distribucion_grupal(df_categoria, METRICAS_ZSCORE_RADAR_SIMPLE)
+	estadisticas_zscore = calcular_zscores_automaticos(df_categoria, METRICAS_ZSCORE_FUERZA)
+	insumos["zscores_automaticos"] = generar_zscores_jugador(datos.datos_jugador, estadisticas_zscore, METRICAS_ZSCORE_FUERZA)
+	insumos["estadisticas_zscore"] = estadisticas_zscore
+
+	matriz, valores = calcular_matriz_zscores_grupo(df_categoria, METRICAS_HEATMAP["Fuerza"])
+	posiciones = ordenar_matriz_grupo(matriz, ORDEN_CLUSTER)
+	insumos["heatmap"] = (matriz.iloc[posiciones], valores.iloc[posiciones])
+
+	tendencias = calcular_tendencias_categoria(datos.historial.df, datos.categoria, "Fuerza")
+	metrica = next(iter(METRICAS_HEATMAP["Fuerza"].values()))
+	de_metrica = tendencias[tendencias["metrica"] == metrica]
+	resumen = resumir_tendencias(tendencias)
+	insumos["tendencias"] = {
+		"metrica": metrica,
+		"jugador": de_metrica[de_metrica["Deportista"] == datos.jugador],
+		"grupo": resumen[resumen["metrica"] == metrica],
+	}
+	insumos["contexto_reporte"] = _contexto_reporte(datos, datos.foto)
+
+
+def _contexto_reporte(datos, df):
+	"""Contexto del reporte del perfil de fuerza del jugador de referencia"""
+	return construir_contexto_reporte_perfil(
+		df=df,
+		datos_jugador=datos.datos_jugador,
+		jugador=datos.jugador,
+		categoria=datos.categoria,
+		seccion="Fuerza",
+		vista="Perfil del Jugador",
+		fecha=datos.historial.ultima_fecha().strftime("%d/%m/%Y"),
+		formato_graficos=datos.insumos["formato_graficos"],
+	)
+
+
+def _ingesta_sesion_nueva(datos):
+	"""Ingesta ya cargada con el libro sin la última sesión; la medición lee solo la hoja nueva"""
+	if datos.ruta_excel_anterior is None:
+		raise ValueError("hace falta más de una fecha (--fechas) para medir la ingesta de una sesión nueva")
+	ruta = str(Path(datos.ruta_excel).with_name(f"benchmark_{datos.filas}_ingesta.xlsx"))
+	shutil.copyfile(datos.ruta_excel_anterior, ruta)
+	ingesta = IngestaIncremental(ruta)
+	ingesta.actualizar()
+	shutil.copyfile(datos.ruta_excel, ruta)
+	return ingesta.actualizar, ()
+
+
+def _heatmap_cacheado(datos):
+	"""Heatmap serializado y recuperado como lo devuelve st.cache_data (z queda como typed array de Plotly)"""
+	fig = charts.crear_heatmap_grupal(*datos.insumos["heatmap"], datos.categoria, "Fuerza")
+	return figura_a_svg, (pickle.loads(pickle.dumps(fig)),)
+
+
+# (nombre, grupo, preparar): `preparar(datos)` devuelve (función, args) y corre fuera del tiempo medido
+CASOS = [
+	# ===== CARGA Y FILTRADO =====
+	CasoBenchmark("IngestaIncremental.actualizar (libro completo)", "datos", lambda d: (IngestaIncremental(d.ruta_excel).actualizar, ())),
+	CasoBenchmark("IngestaIncremental.actualizar (sesión nueva)", "datos", _ingesta_sesion_nueva),
+	CasoBenchmark("leer_evaluaciones_excel", "datos", lambda d: (leer_evaluaciones_excel, (d.ruta_excel,))),
+	CasoBenchmark("agregar_derivadas", "datos", lambda d: (agregar_derivadas, (d.historial.df,))),
+	CasoBenchmark("historial.foto", "datos", lambda d: (EvaluacionesLongitudinales(d.historial.df.copy()).foto, ())),
+	CasoBenchmark("procesar_datos_categoria", "datos", lambda d: (procesar_datos_categoria, (d.foto_nueva(), d.categoria))),
+	# ===== ESTADÍSTICAS (calcular_* / generar_*) =====
+	CasoBenchmark("calcular_estadisticas_metricas_grupo", "estadisticas", lambda d: (calcular_estadisticas_metricas_grupo, (d.df_categoria, "Fuerza", tuple(registro.claves_seccion("Fuerza"))))),
+	CasoBenchmark("calcular_estadisticas_categoria", "estadisticas", lambda d: (calcular_estadisticas_categoria, (d.df_categoria, registro.columnas_tabla("Fuerza")))),
+	CasoBenchmark("calcular_estadisticas_completas_categoria", "estadisticas", lambda d: (calcular_estadisticas_completas_categoria, (d.df_categoria, registro.columnas_tabla("Fuerza"), registro.columnas_totales("Fuerza")))),
+	CasoBenchmark("calcular_zscores_automaticos", "estadisticas", lambda d: (calcular_zscores_automaticos, (d.df_categoria, METRICAS_ZSCORE_FUERZA))),
+	CasoBenchmark("calcular_zscore_jugador", "estadisticas", lambda d: (calcular_zscore_jugador, (950.0, 850.0, 120.0))),
+	CasoBenchmark("generar_zscores_jugador", "estadisticas", lambda d: (generar_zscores_jugador, (d.datos_jugador, d.insumos["estadisticas_zscore"], METRICAS_ZSCORE_FUERZA))),
+	CasoBenchmark("calcular_metricas_bilaterales_promedio", "estadisticas", lambda d: (calcular_metricas_bilaterales_promedio, (d.datos_jugador,))),
+	CasoBenchmark("calcular_zscores_radar_simple", "estadisticas", lambda d: (calcular_zscores_radar_simple, (d.df_categoria, METRICAS_ZSCORE_RADAR_SIMPLE))),
+	CasoBenchmark("generar_zscores_radar_simple", "estadisticas", lambda d: (generar_zscores_radar_simple, (d.datos_jugador, d.insumos["Fuerza"]["radar"], METRICAS_ZSCORE_RADAR_SIMPLE))),
+	CasoBenchmark("calcular_estadisticas_distribucion_grupal", "estadisticas", lambda d: (calcular_estadisticas_distribucion_grupal, (d.df_categoria, METRICAS_ZSCORE_RADAR_SIMPLE))),
+	CasoBenchmark("calcular_distribucion_movilidad", "estadisticas", lambda d: (calcular_distribucion_movilidad, (d.df_categoria,))),
+	CasoBenchmark("calcular_matriz_zscores_grupo", "estadisticas", lambda d: (calcular_matriz_zscores_grupo, (d.df_categoria, METRICAS_HEATMAP["Fuerza"]))),
+	CasoBenchmark("calcular_matriz_lsi_grupo", "estadisticas", lambda d: (calcular_matriz_lsi_grupo, (d.df_categoria, PARES_LSI["Fuerza"]))),
+	CasoBenchmark("calcular_matrices_heatmap", "estadisticas", lambda d: (calcular_matrices_heatmap, (d.foto_nueva(), d.categoria, "Fuerza"))),
+	CasoBenchmark("calcular_tendencias_categoria", "estadisticas", lambda d: (calcular_tendencias_categoria, (d.historial.df.copy(), d.categoria, "Fuerza"))),
+	CasoBenchmark("calcular_cambios_categoria", "estadisticas", lambda d: (calcular_cambios_categoria, (d.historial.df.copy(), d.categoria, "Fuerza"))),
+	# ===== GRÁFICOS (crear_*) =====
+	CasoBenchmark("crear_grafico_multifuerza", "graficos", lambda d: (charts.crear_grafico_multifuerza, (d.insumos["datos_dict"], d.insumos["Fuerza"]["claves"], d.insumos["Fuerza"]["metricas_columnas"]))),
+	CasoBenchmark("crear_grafico_multifuerza_grupal", "graficos", lambda d: (charts.crear_grafico_multifuerza_grupal, (d.insumos["Fuerza"]["estadisticas_grupo"], d.insumos["Fuerza"]["claves"], d.categoria))),
+	CasoBenchmark("crear_grafico_multifuerza_comparativo", "graficos", lambda d: (charts.crear_grafico_multifuerza_comparativo, (d.insumos["datos_dict"], d.insumos["Fuerza"]["referencia"], d.insumos["Fuerza"]["claves"], d.insumos["Fuerza"]["metricas_columnas"], d.jugador))),
+	CasoBenchmark("crear_grafico_multimovilidad", "graficos", lambda d: (charts.crear_grafico_multimovilidad, (d.insumos["datos_dict"], d.insumos["Movilidad"]["claves"], d.insumos["Movilidad"]["metricas_columnas"]))),
+	CasoBenchmark("crear_grafico_multimovilidad_grupal", "graficos", lambda d: (charts.crear_grafico_multimovilidad_grupal, (d.insumos["Movilidad"]["estadisticas_grupo"], d.insumos["Movilidad"]["claves"], d.categoria))),
+	CasoBenchmark("crear_grafico_multimovilidad_comparativo", "graficos", lambda d: (charts.crear_grafico_multimovilidad_comparativo, (d.insumos["datos_dict"], d.insumos["Movilidad"]["referencia"], d.insumos["Movilidad"]["claves"], d.insumos["Movilidad"]["metricas_columnas"], d.jugador))),
+	CasoBenchmark("crear_radar_zscore", "graficos", lambda d: (charts.crear_radar_zscore, (d.insumos["datos_dict"], d.jugador))),
+	CasoBenchmark("crear_radar_zscore_automatico", "graficos", lambda d: (charts.crear_radar_zscore_automatico, (d.insumos["zscores_automaticos"], d.jugador))),
+	CasoBenchmark("crear_radar_zscore_simple", "graficos", lambda d: (charts.crear_radar_zscore_simple, (d.insumos["Fuerza"]["zscores_radar"], d.jugador))),
+	CasoBenchmark("crear_radar_zscore_simple_movilidad", "graficos", lambda d: (charts.crear_radar_zscore_simple_movilidad, (d.insumos["Movilidad"]["zscores_radar"], d.jugador))),
+	CasoBenchmark("crear_radar_zscore_grupal", "graficos", lambda d: (charts.crear_radar_zscore_grupal, (d.insumos["Fuerza"]["grupo_radar"], d.categoria))),
+	CasoBenchmark("crear_radar_zscore_comparativo", "graficos", lambda d: (charts.crear_radar_zscore_comparativo, (d.insumos["Fuerza"]["zscores_radar"], d.insumos["Fuerza"]["grupo_radar"], d.jugador, d.categoria))),
+	CasoBenchmark("crear_grafico_distribucion_grupal", "graficos", lambda d: (charts.crear_grafico_distribucion_grupal, (d.insumos["Fuerza"]["distribucion"], d.categoria))),
+	CasoBenchmark("crear_heatmap_grupal", "graficos", lambda d: (charts.crear_heatmap_grupal, (*d.insumos["heatmap"], d.categoria, "Fuerza"))),
+	CasoBenchmark("crear_grafico_tendencia_jugador", "graficos", lambda d: (charts.crear_grafico_tendencia_jugador, (d.insumos["tendencias"]["jugador"], d.jugador, d.insumos["tendencias"]["metrica"]))),
+	CasoBenchmark("crear_grafico_pendientes_grupo", "graficos", lambda d: (charts.crear_grafico_pendientes_grupo, (d.insumos["tendencias"]["grupo"], d.categoria, d.insumos["tendencias"]["metrica"], d.jugador))),
+	# ===== COMPONENTES DE LAS VISTAS (obtener_componentes_*) =====
+	CasoBenchmark("obtener_componentes_perfil_fuerza", "componentes", lambda d: (obtener_componentes_perfil_fuerza, (d.foto_nueva(), d.datos_jugador, d.jugador, d.categoria))),
+	CasoBenchmark("obtener_componentes_perfil_fuerza_grupal", "componentes", lambda d: (obtener_componentes_perfil_fuerza_grupal, (d.foto_nueva(), d.categoria))),
+	CasoBenchmark("obtener_componentes_perfil_movilidad", "componentes", lambda d: (obtener_componentes_perfil_movilidad, (d.foto_nueva(), d.datos_jugador, d.jugador, d.categoria))),
+	CasoBenchmark("obtener_componentes_perfil_movilidad_grupal", "componentes", lambda d: (obtener_componentes_perfil_movilidad_grupal, (d.foto_nueva(), d.categoria))),
+	CasoBenchmark("obtener_componentes_heatmap_grupal", "componentes", lambda d: (obtener_componentes_heatmap_grupal, (d.foto_nueva(), d.categoria, "Fuerza"))),
+	CasoBenchmark("obtener_componentes_evolucion", "componentes", lambda d: (obtener_componentes_evolucion, (d.historial.df.copy(), d.jugador, d.categoria, "Fuerza", d.insumos["tendencias"]["metrica"]))),
+	# ===== REPORTE =====
+	CasoBenchmark("construir_contexto_reporte_perfil", "reporte", lambda d: (_contexto_reporte, (d, d.foto_nueva()))),
+	CasoBenchmark("generar_html_reporte", "reporte", lambda d: (lambda contexto: "".join(generar_html_reporte(contexto)), (d.insumos["contexto_reporte"],))),
+	CasoBenchmark("generar_pdf_reporte", "reporte", lambda d: (generar_pdf_reporte, (d.insumos["contexto_reporte"],))),
+	CasoBenchmark("figura_a_svg (heatmap cacheado)", "reporte", _heatmap_cacheado),
+]
+
+
+def medir(caso, datos, repeticiones=5):
+	"""
+	Tiempos de un caso (segundos); la primera ejecución es de calentamiento y no se cuenta
+
+	Returns:
+		Dict con n, min, mediana, media y sd, o {"error": mensaje} si la función falla
+	"""
+	tiempos = []
+	try:
+		for i in range(repeticiones + 1):
+			funcion, args = caso.preparar(datos)
+			inicio = time.perf_counter()
+			funcion(*args)
+			if i:
+				tiempos.append(time.perf_counter() - inicio)
+	except Exception as e:
+		return {"error": f"{type(e).__name__}: {e}"}
+	return {
+		"n": len(tiempos),
+		"min_s": min(tiempos),
+		"mediana_s": statistics.median(tiempos),
+		"media_s": statistics.fmean(tiempos),
+		"sd_s": statistics.stdev(tiempos) if len(tiempos) > 1 else 0.0,
+	}
+
+
+def _commit_actual():
+	try:
+		salida = subprocess.run(
+			["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+			cwd=Path(__file__).resolve().parent.parent
+		)
+		return salida.stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+
+def ejecutar_benchmarks(filas=FILAS_POR_DEFECTO, repeticiones=5, grupos=None, patron=None, fechas=2,
+		categorias=1, formato_graficos="svg", semilla=0, progreso=print):
+	"""
+	Corre los casos sobre un libro sintético por tamaño
+
+	Args:
+		filas: Tamaños (filas de deportistas) a medir
+		repeticiones: Repeticiones medidas por caso (más una de calentamiento)
+		grupos: Limitar a estos grupos ("datos", "estadisticas", "graficos", "componentes", "reporte")
+		patron: Limitar a casos cuyo nombre contenga este texto
+		fechas, categorias, semilla: Parámetros del libro sintético
+		formato_graficos: Formato de los gráficos del reporte ("svg" no requiere kaleido)
+		progreso: Función que recibe una línea de progreso (None = silencioso)
+
+	Returns:
+		Dict serializable a JSON con metadatos y la lista de resultados
+	"""
+	casos = [
+		caso for caso in CASOS
+		if (not grupos or caso.grupo in grupos) and (not patron or patron in caso.nombre)
+	]
+	resultados = []
+	with tempfile.TemporaryDirectory() as directorio:
+		for n_filas in filas:
+			datos = preparar_datos(n_filas, directorio, fechas, categorias, formato_graficos, semilla)
+			for caso in casos:
+				medicion = medir(caso, datos, repeticiones)
+				resultados.append({"caso": caso.nombre, "grupo": caso.grupo, "filas": n_filas, **medicion})
+				if progreso:
+					tiempo = medicion.get("error") or f"{medicion['mediana_s'] * 1000:.2f} ms"
+					progreso(f"{n_filas:>7} {caso.grupo:<13}{caso.nombre:<46}{tiempo}")
+	return {
+		"fecha": datetime.now().isoformat(timespec="seconds"),
+		"commit": _commit_actual(),
+		"streamlit_cache": streamlit_activo(),
+		"versiones": {
+			"python": platform.python_version(),
+			"pandas": pd.__version__,
+			"numpy": np.__version__,
+			"plotly": plotly.__version__,
+		},
+		"plataforma": platform.platform(),
+		"parametros": {
+			"repeticiones": repeticiones, "fechas": fechas, "categorias": categorias,
+			"formato_graficos": formato_graficos, "semilla": semilla
+		},
+		"resultados": resultados,
+	}
+
+
+def guardar_resultados(resultados, ruta):
+	"""Escribe los resultados en JSON (UTF-8, indentado)"""
+	Path(ruta).write_text(json.dumps(resultados, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def comparar_resultados(actual, base, umbral=UMBRAL_REGRESION):
+	"""
+	Compara medianas por (caso, filas) contra una corrida anterior
+
+	Returns:
+		DataFrame con base, actual, razón (actual / base) y si es regresión (razón > umbral)
+	"""
+	def _medianas(resultados):
+		return {
+			(r["caso"], r["filas"]): r["mediana_s"]
+			for r in resultados["resultados"] if "mediana_s" in r
+		}
+
+	medianas_base = _medianas(base)
+	filas = []
+	for clave, mediana in _medianas(actual).items():
+		if clave in medianas_base:
+			razon = mediana / medianas_base[clave] if medianas_base[clave] > 0 else np.nan
+			filas.append({
+				"caso": clave[0], "filas": clave[1],
+				"base_ms": medianas_base[clave] * 1000, "actual_ms": mediana * 1000,
+				"razon": razon, "regresion": bool(razon > umbral)
+			})
+	return pd.DataFrame(filas, columns=["caso", "filas", "base_ms", "actual_ms", "razon", "regresion"])
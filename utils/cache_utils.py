@@ -0,0 +1,26 @@
+"""
+Utilidades de cache compatibles con ejecución web (Streamlit) y headless (CLI)
+"""
+
+import sys
+
+
+def streamlit_activo():
+	"""Indica si la aplicación web ya importó Streamlit (app.py lo hace antes que el resto)"""
+	return "streamlit" in sys.modules
+
+
+def cache_data(**kwargs):
+	"""Decorador equivalente a `st.cache_data` que no importa Streamlit en modo headless.
+
+	- Si Streamlit ya está cargado (ejecución con `streamlit run app.py`), delega en
+	  `st.cache_data` con los mismos argumentos (ttl, show_spinner, ...).
+	- En la CLI o en procesos batch devuelve la función sin decorar, de modo que los
+	  cálculos se ejecutan sin runtime de Streamlit.
+	"""
+	def decorador(func):
+		if not streamlit_activo():
+			return func
+		import streamlit as st
+		return st.cache_data(**kwargs)(func)
+	return decorador
@@ -0,0 +1,312 @@
+"""
+Control de calidad de las evaluaciones al cargarlas
+
+Un valor mal cargado no daba error: un test vacío o escrito como 0 se grafica
+como una barra en cero y un 9500 en lugar de 950 como una barra absurda. Al leer
+cada hoja (o archivo) se revisan todas las columnas de métricas del registro con
+operaciones sobre la matriz de valores, sin recorrer filas:
+
+- rango: fuera de `Metrica.rango` (config.metricas),
+- unidad: en una columna en N, un valor cercano a la mediana del grupo / 9.81
+  (cargado en kg),
+- atipico: |z robusto| > CALIDAD_Z_ATIPICO, con mediana y MAD de la categoría en
+  la fecha (no los mueve el propio valor atípico, como a la media y la SD),
+- inversion: en una métrica bilateral asimétrica, DER e IZQ se parecen más a IZQ y
+  DER de la sesión anterior del jugador que a sí mismos.
+
+Los valores de rango y unidad se anulan (NaN, igual que un test no realizado) si
+CALIDAD_ANULAR_INVALIDOS; los atípicos y las inversiones solo se informan. Las
+filas de resumen (MEDIA/SD/RIESGO) no se revisan. El resultado es una máscara por
+fila (True = sin observaciones) y un reporte con una fila por valor observado.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from config.metricas import REGISTRO_METRICAS
+from config.settings import (
+	CALIDAD_ANULAR_INVALIDOS, CALIDAD_Z_ATIPICO, CALIDAD_MINIMO_GRUPO, CALIDAD_ASIMETRIA_INVERSION
+)
+from utils.data_utils import mascara_filas_jugador
+
+FACTOR_KG_A_N = 9.81
+# Un valor en kg queda cerca de mediana / 9.81; se acepta ±60 % por la dispersión del grupo
+_RAZON_KG = (1 / (FACTOR_KG_A_N * 1.6), 1.6 / FACTOR_KG_A_N)
+# Unidades de las métricas donde se buscan inversiones DER/IZQ: en movilidad (grados,
+# escala 0-4 de THOMAS) la variación entre sesiones es del orden de la asimetría
+UNIDADES_INVERSION = ("N", "cm")
+# Constante que lleva la MAD a la escala de la SD en datos normales (Iglewicz y Hoaglin)
+_ESCALA_MAD = 0.6745
+
+REGLAS_CALIDAD = {
+	"rango": "Fuera del rango plausible",
+	"unidad": "Cargado en kg en una columna en N",
+	"atipico": "Atípico en su categoría y fecha (z robusto)",
+	"inversion": "DER/IZQ invertidos respecto de la sesión anterior",
+}
+# Reglas cuyo valor se anula en el dataset; las demás solo se informan
+REGLAS_ANULAN = ("rango", "unidad")
+
+COLUMNAS_REPORTE = [
+	"fila", "Deportista", "categoria", "FECHA", "metrica", "columna", "regla", "valor", "referencia", "anulado"
+]
+
+
+@dataclass(frozen=True)
+class ResultadoCalidad:
+	"""Resultado del control de un DataFrame"""
+	mascara: np.ndarray
+	reporte: pd.DataFrame
+
+	@property
+	def anulados(self):
+		"""Valores anulados en el dataset"""
+		return int(self.reporte["anulado"].sum())
+
+	def __bool__(self):
+		return len(self.reporte) > 0
+
+	def resumen(self):
+		"""Observaciones por regla y columna"""
+		return (
+			self.reporte.groupby(["regla", "columna"], sort=False)
+			.agg(valores=("valor", "size"), anulados=("anulado", "sum"))
+			.reset_index()
+		)
+
+
+def _reporte_vacio():
+	return pd.DataFrame({columna: pd.Series(dtype=object) for columna in COLUMNAS_REPORTE}).astype(
+		{"fila": np.int64, "valor": float, "anulado": bool}
+	)
+
+
+@dataclass(frozen=True)
+class _ColumnasControl:
+	"""Columnas del registro presentes en el DataFrame, con sus límites por columna"""
+	nombres: list
+	metricas: np.ndarray
+	minimos: np.ndarray
+	maximos: np.ndarray
+	en_newton: np.ndarray
+	pares: list
+
+
+def _columnas_control(columnas):
+	presentes = set(columnas)
+	nombres, metricas, minimos, maximos, en_newton, pares = [], [], [], [], [], []
+	for metrica in REGISTRO_METRICAS:
+		# Las derivadas se calculan después del control, con los valores ya depurados
+		if metrica.derivada or not all(columna in presentes for columna in metrica.columnas):
+			continue
+		inicio = len(nombres)
+		for columna in metrica.columnas:
+			nombres.append(columna)
+			metricas.append(metrica.clave)
+			minimos.append(metrica.rango[0])
+			maximos.append(metrica.rango[1])
+			en_newton.append(metrica.unidad == "N")
+		if metrica.bilateral and metrica.unidad in UNIDADES_INVERSION:
+			pares.append((inicio, inicio + 1))
+	return _ColumnasControl(
+		nombres, np.array(metricas, dtype=object), np.array(minimos), np.array(maximos), np.array(en_newton, dtype=bool), pares
+	)
+
+
+def _valores(df, control):
+	"""Matriz float64 (filas × columnas del control) con NaN en las filas que no son de deportistas"""
+	bloque = df[control.nombres]
+	if not all(pd.api.types.is_numeric_dtype(tipo) for tipo in bloque.dtypes):
+		bloque = bloque.apply(pd.to_numeric, errors="coerce")
+	valores = bloque.to_numpy(dtype=float, copy=True)
+	valores[~np.asarray(mascara_filas_jugador(df), dtype=bool)] = np.nan
+	return valores
+
+
+def _codigos(df, columnas):
+	"""Código entero de grupo por fila según las `columnas` presentes (NaN es un valor más)"""
+	codigos = np.zeros(len(df), dtype=np.int64)
+	for columna in columnas:
+		if columna in df.columns:
+			valores, unicos = pd.factorize(df[columna])
+			codigos = codigos * (len(unicos) + 1) + valores + 1
+	return codigos
+
+
+def _filas_reporte(df, control, filas, posiciones, regla, valores, referencias, anulado):
+	"""Filas del reporte para los valores (filas[k], columna posiciones[k])"""
+	def columna(nombre):
+		if nombre not in df.columns:
+			return np.full(len(filas), None, dtype=object)
+		return df[nombre].iloc[filas].to_numpy()
+
+	return pd.DataFrame({
+		"fila": filas.astype(np.int64),
+		"Deportista": columna("Deportista"),
+		"categoria": columna("categoria"),
+		"FECHA": columna("FECHA"),
+		"metrica": control.metricas[posiciones],
+		"columna": np.array(control.nombres, dtype=object)[posiciones],
+		"regla": regla,
+		"valor": valores,
+		"referencia": referencias,
+		"anulado": anulado,
+	})
+
+
+def _resultado(n_filas, partes):
+	reporte = pd.concat(partes, ignore_index=True) if partes else _reporte_vacio()
+	mascara = np.ones(n_filas, dtype=bool)
+	mascara[reporte["fila"].to_numpy(dtype=np.int64)] = False
+	return ResultadoCalidad(mascara, reporte)
+
+
+def _hallazgos_valores(df, control, valores, anular):
+	"""Reglas de rango, unidad y atípico; devuelve (partes del reporte, máscara de valores a anular)"""
+	grupos = _codigos(df, ["categoria", "FECHA"])
+	por_grupo = pd.DataFrame(valores).groupby(grupos)
+	mediana = por_grupo.transform("median").to_numpy()
+	cantidad = por_grupo.transform("count").to_numpy()
+	desvio = np.abs(valores - mediana)
+	mad = pd.DataFrame(desvio).groupby(grupos).transform("median").to_numpy()
+
+	with np.errstate(divide="ignore", invalid="ignore"):
+		presentes = ~np.isnan(valores)
+		comparable = presentes & (cantidad >= CALIDAD_MINIMO_GRUPO)
+		razon = valores / mediana
+		unidad = comparable & control.en_newton & (razon > _RAZON_KG[0]) & (razon < _RAZON_KG[1])
+		rango = presentes & ~unidad & ((valores < control.minimos) | (valores > control.maximos))
+		z = _ESCALA_MAD * (valores - mediana) / mad
+		atipico = comparable & ~unidad & ~rango & (mad > 0) & (np.abs(z) > CALIDAD_Z_ATIPICO)
+
+	partes = []
+	filas, posiciones = np.nonzero(unidad)
+	if len(filas):
+		en_kg = valores[filas, posiciones]
+		partes.append(_filas_reporte(
+			df, control, filas, posiciones, "unidad", en_kg,
+			[f"≈ {valor * FACTOR_KG_A_N:.0f} N (mediana {m:.0f} N)" for valor, m in zip(en_kg, mediana[filas, posiciones])],
+			anular
+		))
+	filas, posiciones = np.nonzero(rango)
+	if len(filas):
+		partes.append(_filas_reporte(
+			df, control, filas, posiciones, "rango", valores[filas, posiciones],
+			[f"[{control.minimos[p]:g}, {control.maximos[p]:g}]" for p in posiciones],
+			anular
+		))
+	filas, posiciones = np.nonzero(atipico)
+	if len(filas):
+		partes.append(_filas_reporte(
+			df, control, filas, posiciones, "atipico", valores[filas, posiciones],
+			[f"z = {zeta:+.1f} (mediana {m:.0f})" for zeta, m in zip(z[filas, posiciones], mediana[filas, posiciones])],
+			False
+		))
+	return partes, (unidad | rango) if anular else None
+
+
+def _hallazgos_inversion(df, control, valores):
+	"""Pares DER/IZQ que coinciden mejor con la sesión anterior del jugador si se invierten"""
+	if not control.pares or "Deportista" not in df.columns or "FECHA" not in df.columns:
+		return []
+	# Mismo jugador en la misma categoría (en planteles distintos puede repetirse un nombre)
+	jugadores = _codigos(df, ["categoria", "Deportista"])
+	fechas = pd.to_datetime(df["FECHA"], errors="coerce").to_numpy(dtype="datetime64[ns]").view(np.int64)
+	# Filas ordenadas por jugador y fecha: la sesión anterior es la última fila previa del mismo jugador con el par completo
+	orden = np.lexsort((fechas, jugadores))
+	ordenados = valores[orden]
+	jugadores = jugadores[orden]
+	secuencia = np.arange(len(orden))
+
+	partes = []
+	with np.errstate(divide="ignore", invalid="ignore"):
+		for der, izq in control.pares:
+			d, i = ordenados[:, der], ordenados[:, izq]
+			completas = np.where(~np.isnan(d) & ~np.isnan(i), secuencia, -1)
+			previa = np.full(len(orden), -1)
+			previa[1:] = np.maximum.accumulate(completas)[:-1]
+			previa[(previa >= 0) & (jugadores[np.maximum(previa, 0)] != jugadores)] = -1
+			d_ant = np.where(previa >= 0, d[previa], np.nan)
+			i_ant = np.where(previa >= 0, i[previa], np.nan)
+			# Asimetría con signo (%): una inversión la cambia de lado con una magnitud parecida
+			asimetria = (d - i) / np.maximum(d, i) * 100
+			asimetria_ant = (d_ant - i_ant) / np.maximum(d_ant, i_ant) * 100
+			iguales = np.abs(d - d_ant) + np.abs(i - i_ant)
+			cruzados = np.abs(d - i_ant) + np.abs(i - d_ant)
+			# Las comparaciones con NaN dan False: solo pares completos en ambas sesiones
+			invertido = (
+				(np.abs(asimetria) > CALIDAD_ASIMETRIA_INVERSION)
+				& (asimetria * asimetria_ant < 0)
+				& (np.abs(asimetria_ant) > CALIDAD_ASIMETRIA_INVERSION)
+				& (cruzados < 0.5 * iguales)
+			)
+			indices = np.flatnonzero(invertido)
+			if not len(indices):
+				continue
+			partes.append(_filas_reporte(
+				df, control, orden[indices], np.full(len(indices), der), "inversion", d[indices],
+				[f"IZQ {izq_valor:.0f}; anterior DER {da:.0f} / IZQ {ia:.0f}" for izq_valor, da, ia in zip(i[indices], d_ant[indices], i_ant[indices])],
+				False
+			))
+	return partes
+
+
+def depurar_evaluaciones(df, inversiones=True, anular=CALIDAD_ANULAR_INVALIDOS):
+	"""
+	Revisa las métricas del registro y anula los valores inválidos
+
+	Args:
+		df: Evaluaciones con las columnas de compatibilidad (Deportista, categoria)
+		inversiones: Buscar DER/IZQ invertidos (necesita las sesiones anteriores en `df`)
+		anular: Reemplazar por NaN los valores de las reglas REGLAS_ANULAN
+
+	Returns:
+		(DataFrame depurado, ResultadoCalidad); el DataFrame es `df` si no se anuló nada
+	"""
+	control = _columnas_control(df.columns)
+	if not control.nombres or not len(df):
+		return df, _resultado(len(df), [])
+	valores = _valores(df, control)
+	partes, invalidos = _hallazgos_valores(df, control, valores, anular)
+
+	if invalidos is not None and invalidos.any():
+		anuladas = {
+			columna: df[columna].mask(invalidos[:, posicion])
+			for posicion, columna in enumerate(control.nombres)
+			if invalidos[:, posicion].any()
+		}
+		df = df.assign(**anuladas)
+		valores[invalidos] = np.nan
+	if inversiones:
+		partes.extend(_hallazgos_inversion(df, control, valores))
+	return df, _resultado(len(df), partes)
+
+
+def validar_evaluaciones(df, inversiones=True):
+	"""Control de calidad sin modificar `df` (ResultadoCalidad con anulado=False)"""
+	return depurar_evaluaciones(df, inversiones=inversiones, anular=False)[1]
+
+
+def detectar_inversiones(df):
+	"""Solo la regla de inversión DER/IZQ (sobre el historial completo)"""
+	control = _columnas_control(df.columns)
+	if not control.nombres or not len(df):
+		return _resultado(len(df), [])
+	return _resultado(len(df), _hallazgos_inversion(df, control, _valores(df, control)))
+
+
+def combinar_calidad(n_filas, partes, adicional=None):
+	"""
+	Resultado de un dataset armado por partes (hojas o archivos)
+
+	Args:
+		n_filas: Filas del dataset
+		partes: Lista de (posición de inicio de la parte en el dataset, ResultadoCalidad)
+		adicional: ResultadoCalidad sobre el dataset completo (por ejemplo, inversiones)
+	"""
+	reportes = [resultado.reporte.assign(fila=resultado.reporte["fila"] + inicio) for inicio, resultado in partes if resultado]
+	if adicional:
+		reportes.append(adicional.reporte)
+	return _resultado(n_filas, reportes)
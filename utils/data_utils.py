@@ -2,19 +2,147 @@
 Utilidades para manejo de datos
 """
 
+import numpy as np
 import pandas as pd
-import streamlit as st
 import json
 import hashlib
 import os
-import io
+from dataclasses import dataclass
+from functools import lru_cache
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-from config.settings import CACHE_TTL, DATA_PATH, DATA_PATH_DEMO, MAPEO_COLUMNAS_NUEVA_EVALUACION
+from config.settings import CACHE_TTL, DATA_PATH, DATA_PATH_DEMO, VIGILANCIA_EXCEL_SEGUNDOS, FUENTES_EVALUACIONES
+from config.metricas import REGISTRO_METRICAS, metricas_seccion, metrica_radar
+from utils.cache_utils import cache_data
+from utils.particiones import obtener_particion
+from utils.esquemas import migrar_esquema, aplicar_tipos, precision_calculo, valores_calculo
+from utils.derivadas import agregar_derivadas
+from utils.bandas import clasificar_zscores
+
+# Cada sesión de evaluación es una hoja "EVALUACION <ddmm>" dentro del mismo Excel
+PREFIJO_HOJA_EVALUACION = "EVALUACION"
+VALORES_NULOS_EXCEL = ['', ' ', 'N/A', 'n/a', 'NULL', 'null']
+
+
+def _normalizar_evaluaciones(df_evaluacion):
+	"""Aplica las columnas de compatibilidad comunes a todos los orígenes de datos"""
+	# Mapear columna de jugadores para compatibilidad
+	if "JUGADOR" in df_evaluacion.columns:
+		df_evaluacion["Deportista"] = df_evaluacion["JUGADOR"]
+	
+	# Categoría de cada fila si el Excel trae la columna CATEGORIA; si no, una sola categoría
+	if "CATEGORIA" in df_evaluacion.columns:
+		df_evaluacion["categoria"] = df_evaluacion["CATEGORIA"].astype(object).fillna("Evaluacion_2910")
+	else:
+		df_evaluacion["categoria"] = "Evaluacion_2910"
+	
+	return df_evaluacion
+
+
+def hojas_evaluacion(nombres_hojas):
+	"""Hojas de evaluación ("EVALUACION <ddmm>") de un libro, en su orden"""
+	return [h for h in nombres_hojas if h.strip().upper().startswith(PREFIJO_HOJA_EVALUACION)]
+
+
+def leer_hoja_evaluacion(excel, hoja):
+	"""Lee una hoja de evaluación llevada al esquema actual.
+
+	Args:
+		excel: pd.ExcelFile abierto (o ruta/buffer del .xlsx)
+		hoja: Nombre de la hoja
+
+	La hoja se lleva al esquema actual según la huella de su encabezado
+	(utils.esquemas). Las filas sin FECHA (por ejemplo, las filas de resumen
+	MEDIA/SD) toman la fecha más frecuente de la hoja.
+	"""
+	df_hoja = migrar_esquema(pd.read_excel(
+		excel,
+		sheet_name=hoja,
+		na_values=VALORES_NULOS_EXCEL  # Valores nulos explícitos
+	))
+	if "FECHA" in df_hoja.columns:
+		fechas = pd.to_datetime(df_hoja["FECHA"], errors='coerce')
+		fecha_hoja = fechas.mode()
+		if len(fecha_hoja):
+			fechas = fechas.fillna(fecha_hoja.iloc[0])
+		df_hoja["FECHA"] = fechas
+	return df_hoja
+
+
+def _leer_hojas_evaluacion(origen):
+	"""Lee y concatena todas las hojas de evaluación (una por fecha) de un Excel.
+
+	Args:
+		origen: Ruta o buffer del archivo .xlsx
+
+	Cada hoja pasa por `leer_hoja_evaluacion`, así que se pueden mezclar hojas del
+	formato anterior y del nuevo.
+
+	Returns:
+		DataFrame con todas las sesiones
+	"""
+	with pd.ExcelFile(origen, engine='openpyxl') as excel:
+		hojas = hojas_evaluacion(excel.sheet_names)
+		if not hojas:
+			raise ValueError(f"No hay hojas '{PREFIJO_HOJA_EVALUACION} ...' en el archivo")
+		sesiones = [leer_hoja_evaluacion(excel, hoja) for hoja in hojas]
+	
+	if len(sesiones) == 1:
+		return sesiones[0]
+	return pd.concat(sesiones, ignore_index=True)
+
+
+def preparar_evaluaciones(df_evaluacion, tipos_compactos=True):
+	"""Columnas de compatibilidad (Deportista, categoria) y plan de tipos de utils.esquemas"""
+	df_evaluacion = _normalizar_evaluaciones(df_evaluacion)
+	return aplicar_tipos(df_evaluacion) if tipos_compactos else df_evaluacion
+
+
+def leer_evaluaciones_excel(path_excel, tipos_compactos=True, control_calidad=True, metricas_derivadas=True):
+	"""Lee y procesa el Excel de evaluaciones SIN usar Streamlit.
+
+	Es el cargador que usan la CLI y los procesos batch. Devuelve el historial
+	completo (todas las hojas de evaluación); ver `utils.longitudinal` para obtener
+	la foto de una fecha. Con `tipos_compactos` las columnas se guardan con el plan
+	de tipos de `utils.esquemas` (métricas float32, identidad categórica); sin él,
+	como las lee pandas (para comparar memoria). Con `control_calidad` los valores
+	fuera de rango o cargados en kg se anulan (utils.calidad; el reporte se obtiene
+	con `validar_evaluaciones` sobre la lectura sin control). Con `metricas_derivadas`
+	se agregan las columnas de las métricas con expresión (utils.derivadas), ya con
+	los valores depurados. Lanza excepciones en lugar de mostrar mensajes en pantalla:
+
+	- FileNotFoundError si el archivo no existe.
+	- ValueError si las hojas de evaluación no se pueden leer.
+	"""
+	if not os.path.exists(path_excel):
+		raise FileNotFoundError(f"No se encontró el archivo Excel en: {path_excel}")
+	
+	try:
+		df_evaluacion = _leer_hojas_evaluacion(path_excel)
+	except Exception as e:
+		raise ValueError(f"Error al leer las hojas de evaluación: {str(e)}") from e
+	
+	df_evaluacion = preparar_evaluaciones(df_evaluacion, tipos_compactos)
+	if control_calidad:
+		from utils.calidad import depurar_evaluaciones
+		df_evaluacion, _ = depurar_evaluaciones(df_evaluacion)
+	if metricas_derivadas:
+		df_evaluacion = agregar_derivadas(df_evaluacion)
+	return df_evaluacion
+
 
-@st.cache_data(ttl=CACHE_TTL['datos_principales'], show_spinner="Cargando datos de evaluaciones...")
 def cargar_evaluaciones(path_excel):
-	"""Carga y procesa datos de evaluaciones con cache optimizado - Nueva versión EVALUACIONES.xlsx"""
+	"""Carga el Excel local de evaluaciones leyendo solo las hojas que cambiaron
+
+	La ingesta (utils.ingesta) es una por archivo y se comparte entre sesiones:
+	si el archivo no cambió desde la última lectura devuelve el mismo DataFrame
+	sin releerlo; si se agregó una sesión, lee solo esa hoja. Con
+	VIGILANCIA_EXCEL_SEGUNDOS > 0 la relectura la hace el hilo vigilante en
+	segundo plano y aquí solo se lee al arrancar.
+	"""
+	import streamlit as st
+	from utils.ingesta import obtener_ingesta
+	
 	# Validar que el archivo existe
 	if not os.path.exists(path_excel):
 		st.error(f"❌ No se encontró el archivo Excel en: {path_excel}")
@@ -22,50 +150,30 @@ def cargar_evaluaciones(path_excel):
 		st.stop()
 	
 	try:
-		# Cargar desde la nueva hoja EVALUACION 2910 con optimizaciones
-		df_evaluacion = pd.read_excel(
-			path_excel, 
-			sheet_name="EVALUACION 2910",
-			engine='openpyxl',  # Motor más rápido para archivos .xlsx
-			na_values=['', ' ', 'N/A', 'n/a', 'NULL', 'null']  # Valores nulos explícitos
-		)
-		
-		# Optimizar tipos de datos para reducir memoria
-		for col in df_evaluacion.columns:
-			if df_evaluacion[col].dtype == 'object':
-				# Intentar convertir a numérico si es posible
-				try:
-					numeric_col = pd.to_numeric(df_evaluacion[col])
-					df_evaluacion[col] = numeric_col
-				except (ValueError, TypeError):
-					# Si no es convertible a numérico, optimizar strings como categorías si tienen pocos valores únicos
-					unique_ratio = len(df_evaluacion[col].unique()) / len(df_evaluacion[col])
-					if unique_ratio < 0.5:  # Si menos del 50% son valores únicos
-						df_evaluacion[col] = df_evaluacion[col].astype('category')
-		
+		ingesta = obtener_ingesta(path_excel, vigilar=VIGILANCIA_EXCEL_SEGUNDOS)
+		if ingesta.df is None or not ingesta.vigilando:
+			with st.spinner("Cargando datos de evaluaciones..."):
+				ingesta.actualizar()
+		return ingesta.df
 	except Exception as e:
 		st.error(f"❌ Error al leer el archivo Excel: {str(e)}")
-		st.info("💡 Verifica que la hoja 'EVALUACION 2910' exista en el archivo")
+		st.info("💡 Verifica que exista al menos una hoja 'EVALUACION ...' (por ejemplo 'EVALUACION 2910') en el archivo")
 		st.stop()
 
-	# Mapear columna de jugadores para compatibilidad
-	if "JUGADOR" in df_evaluacion.columns:
-		df_evaluacion["Deportista"] = df_evaluacion["JUGADOR"]
-	
-	# Por ahora, asignar todos a una categoría (se puede expandir después)
-	# TODO: Implementar lógica de categorías si está disponible en el Excel
-	df_evaluacion["categoria"] = "Evaluacion_2910"
-	
-	return df_evaluacion
 
-
-@st.cache_data(ttl=CACHE_TTL['datos_principales'], show_spinner="Cargando datos desde Google Drive...")
 def cargar_evaluaciones_desde_drive():
 	"""Descarga el archivo de Google Drive y carga la hoja de evaluación.
 
 	Usa una service account configurada en st.secrets["google_service_account"] y
 	 el identificador del archivo en st.secrets["DRIVE_FILE_ID"].
+
+	El archivo se descarga por bloques a disco (utils.drive), solo si cambió en
+	Drive, y se lee con la ingesta incremental compartida entre sesiones.
 	"""
+	import streamlit as st
+	from utils.drive import sincronizar_archivo_drive
+	from utils.ingesta import obtener_ingesta
+	
 	# Validar secretos necesarios
 	try:
 		service_info = dict(st.secrets["google_service_account"])
@@ -79,37 +187,80 @@ def cargar_evaluaciones_desde_drive():
 		st.stop()
 	
 	try:
-		# Crear credenciales de la service account
-		creds = service_account.Credentials.from_service_account_info(
-			service_info,
-			scopes=["https://www.googleapis.com/auth/drive.readonly"],
-		)
-		service = build("drive", "v3", credentials=creds)
-		
-		# Descargar el archivo binario tal cual está en Drive (Excel subido)
-		request = service.files().get_media(fileId=file_id)
-		data = request.execute()
-		buffer = io.BytesIO(data)
-		
-		# Leer el contenido descargado como si fuera un Excel normal
-		df_evaluacion = pd.read_excel(
-			buffer,
-			sheet_name="EVALUACION 2910",
-			engine='openpyxl',
-			na_values=['', ' ', 'N/A', 'n/a', 'NULL', 'null'],
-		)
+		with st.spinner("Cargando datos desde Google Drive..."):
+			# Crear credenciales de la service account
+			creds = service_account.Credentials.from_service_account_info(
+				service_info,
+				scopes=["https://www.googleapis.com/auth/drive.readonly"],
+			)
+			service = build("drive", "v3", credentials=creds)
+			
+			# Descargar el Excel a disco por bloques (sin tenerlo entero en memoria)
+			ruta_excel, _ = sincronizar_archivo_drive(service, file_id)
+			
+			# Leer desde disco: todas las fechas, solo las hojas que cambiaron desde la última lectura
+			ingesta = obtener_ingesta(ruta_excel)
+			ingesta.actualizar()
 	except Exception as e:
 		st.error(f"❌ Error al leer el archivo desde Google Drive: {str(e)}")
 		st.stop()
 	
-	# Mapear columna de jugadores para compatibilidad
-	if "JUGADOR" in df_evaluacion.columns:
-		df_evaluacion["Deportista"] = df_evaluacion["JUGADOR"]
-	
-	# Asignar categoría por defecto (igual que en cargar_evaluaciones)
-	df_evaluacion["categoria"] = "Evaluacion_2910"
-	
-	return df_evaluacion
+	# Misma normalización y tipos que en cargar_evaluaciones (los aplica la ingesta)
+	return ingesta.df
+
+def _crear_servicio_drive():
+	"""Cliente de la API de Drive con la service account de st.secrets (uno por descarga)"""
+	import streamlit as st
+
+	creds = service_account.Credentials.from_service_account_info(
+		dict(st.secrets["google_service_account"]),
+		scopes=["https://www.googleapis.com/auth/drive.readonly"],
+	)
+	return build("drive", "v3", credentials=creds)
+
+def manifiesto_fuentes():
+	"""Manifiesto de varias planillas: st.secrets["FUENTES"] o FUENTES_EVALUACIONES; None si hay un solo Excel"""
+	import streamlit as st
+
+	try:
+		fuentes = st.secrets.get("FUENTES")
+	except Exception:
+		fuentes = None
+	if fuentes:
+		# Las tablas de st.secrets no son dicts comunes: se copian para poder serializarlas
+		return [dict(fuente) for fuente in fuentes]
+	return FUENTES_EVALUACIONES or None
+
+def cargar_evaluaciones_fuentes(manifiesto):
+	"""Carga y une las planillas del manifiesto (utils.fuentes) en un único DataFrame
+
+	Los archivos se traen en paralelo y se parsean en procesos; solo se releen los
+	que cambiaron. Los archivos locales se vigilan como el Excel local; las fuentes
+	de Drive se sincronizan una vez por sesión, como el Excel único de Drive.
+	"""
+	import streamlit as st
+	from utils.fuentes import fuentes_manifiesto, obtener_fuentes
+
+	try:
+		usa_drive = any(fuente.drive_file_id for fuente in fuentes_manifiesto(manifiesto))
+		ingesta = obtener_fuentes(
+			manifiesto,
+			crear_servicio=_crear_servicio_drive,
+			vigilar=0 if usa_drive else VIGILANCIA_EXCEL_SEGUNDOS
+		)
+		sincronizada = usa_drive and st.session_state.get('fuentes_sincronizadas') == ingesta.ruta
+		if ingesta.df is None or not (ingesta.vigilando or sincronizada):
+			with st.spinner("Cargando planillas de evaluación..."):
+				ingesta.actualizar()
+			if usa_drive:
+				st.session_state.fuentes_sincronizadas = ingesta.ruta
+	except Exception as e:
+		st.error(f"❌ Error al leer las planillas del manifiesto de fuentes: {str(e)}")
+		st.info("💡 Verifica que cada fuente tenga 'ruta' o 'drive_file_id' y al menos una hoja 'EVALUACION ...'")
+		st.stop()
+
+	st.session_state.ingesta_clave = ingesta.ruta
+	return ingesta.df
 
 def cargar_datos_optimizado(path_excel=None):
 	"""Carga datos con optimización de session state.
@@ -121,6 +272,15 @@ def cargar_datos_optimizado(path_excel=None):
 	- MODO_DATOS = "demo"  → usa DATA_PATH_DEMO (EVALUACIONES_demo.xlsx)
 	- Por defecto (si no está definido) → demo (seguro para repos públicos)
 	"""
+	import streamlit as st
+	from utils.ingesta import clave_ingesta
+
+	# Varias planillas (un archivo por plantel) si hay un manifiesto de fuentes configurado
+	if path_excel is None:
+		manifiesto = manifiesto_fuentes()
+		if manifiesto is not None:
+			st.session_state.df_cache = cargar_evaluaciones_fuentes(manifiesto)
+			return st.session_state.df_cache
 
 	# Resolver origen de datos si no se pasa un path explícito
 	usar_drive = False
@@ -146,57 +306,214 @@ def cargar_datos_optimizado(path_excel=None):
 		usar_drive = False
 	
 	# Cache en session_state para evitar recargas innecesarias
-	if 'df_cache' not in st.session_state or st.session_state.df_cache is None:
-		if usar_drive:
+	if usar_drive:
+		if 'df_cache' not in st.session_state or st.session_state.df_cache is None:
 			st.session_state.df_cache = cargar_evaluaciones_desde_drive()
-		else:
-			st.session_state.df_cache = cargar_evaluaciones(path_excel)
+	else:
+		# Excel local: si cambió desde la última lectura se leen solo las hojas nuevas o modificadas
+		st.session_state.df_cache = cargar_evaluaciones(path_excel)
+		st.session_state.ingesta_clave = clave_ingesta(path_excel)
 	return st.session_state.df_cache
 
-@st.cache_data(ttl=CACHE_TTL['jugadores_categoria'])
+def hay_datos_nuevos():
+	"""True si la ingesta de los archivos locales publicó una versión posterior a la que usa la sesión"""
+	import streamlit as st
+	from utils.ingesta import ingesta_registrada
+
+	clave = st.session_state.get('ingesta_clave')
+	ingesta = ingesta_registrada(clave) if clave is not None else None
+	if ingesta is None or not ingesta.vigilando:
+		return False
+	df = ingesta.df
+	return df is not None and df is not st.session_state.get('df_cache')
+
+def calidad_datos(df):
+	"""Control de calidad del dataset cargado: el de su ingesta (con los valores anulados) o uno nuevo"""
+	from utils.calidad import validar_evaluaciones
+	from utils.ingesta import calidad_ingesta
+
+	calidad = calidad_ingesta(df)
+	return calidad if calidad is not None else validar_evaluaciones(df)
+
+def cargar_historial_optimizado(df):
+	"""Devuelve el historial longitudinal del DataFrame cargado (cacheado en session state)"""
+	import streamlit as st
+	from utils.longitudinal import EvaluacionesLongitudinales
+	from utils.ingesta import historial_ingesta
+
+	if st.session_state.get('historial_cache') is None or st.session_state.get('historial_origen') is not df:
+		# El historial de un Excel local es el de su ingesta: compartido y actualizado por sesión agregada
+		historial = historial_ingesta(df)
+		st.session_state.historial_cache = historial if historial is not None else EvaluacionesLongitudinales(df)
+		st.session_state.historial_origen = df
+	return st.session_state.historial_cache
+
+# Filas de resumen estadístico que el Excel intercala entre los deportistas
+VALORES_RESUMEN_EXCEL = ['MEDIA', 'SD', 'TOTAL EN RIESGO ALTO', 'RIESGO RELATIVO', 
+						'TOTAL EN RIESGO MODERADO', 'TOTAL EN BAJO RIESGO', 
+						'Apellido y Nombre', 'ALTO RIESGO', 'MODERADO RIESGO', 'BAJO RIESGO']
+
+def mascara_filas_jugador(df):
+	"""Máscara de filas de deportistas (sin filas de resumen MEDIA/SD/RIESGO)"""
+	if 'Deportista' not in df.columns:
+		return np.ones(len(df), dtype=bool)
+	deportista = df['Deportista']
+	return (
+		(~deportista.isin(VALORES_RESUMEN_EXCEL)) & 
+		(deportista.notna()) &
+		(~deportista.str.contains('RIESGO|MEDIA|TOTAL|SD', case=False, na=False))
+	).to_numpy()
+
+def obtener_particion_categorias(df):
+	"""
+	Partición por categoría del DataFrame (se construye una vez por DataFrame)
+
+	Reemplaza los filtros `df[df["categoria"] == categoria]` que recorrían toda la
+	tabla en cada rerun: la consulta por categoría pasa a ser un acceso O(1).
+	"""
+	return obtener_particion(df, mascara_filas_jugador)
+
+def obtener_datos_jugador(df, categoria, jugador):
+	"""
+	Fila del jugador en la categoría vía el índice (categoria, Deportista) de la partición
+
+	Equivale a `df[(df["categoria"] == categoria) & (df["Deportista"] == jugador)].iloc[0]`
+	sin recorrer la tabla. Devuelve None si el jugador no está en la categoría.
+	"""
+	fila = obtener_particion_categorias(df).fila(categoria, jugador)
+	return None if fila is None else precision_calculo(fila)
+
 def obtener_jugadores_categoria(df, categoria_sel):
 	"""Obtiene jugadores filtrados por categoría"""
 	# Usar la columna correcta según el mapeo
 	columna_jugador = "Deportista" if "Deportista" in df.columns else "JUGADOR"
-	return df[df["categoria"] == categoria_sel][columna_jugador].dropna().unique()
+	return obtener_particion_categorias(df).jugadores(categoria_sel, columna_jugador)
 
-@st.cache_data(ttl=CACHE_TTL['preparacion_datos'])
 def procesar_datos_categoria(df, categoria):
-	"""Procesa y filtra datos por categoría con cache"""
-	df_categoria = df[df["categoria"] == categoria].copy()
-	
-	# FILTRAR filas de resumen estadístico
-	valores_a_excluir = ['MEDIA', 'SD', 'TOTAL EN RIESGO ALTO', 'RIESGO RELATIVO', 
-						'TOTAL EN RIESGO MODERADO', 'TOTAL EN BAJO RIESGO', 
-						'Apellido y Nombre', 'ALTO RIESGO', 'MODERADO RIESGO', 'BAJO RIESGO']
-	
-	df_categoria = df_categoria[
-		(~df_categoria['Deportista'].isin(valores_a_excluir)) & 
-		(df_categoria['Deportista'].notna()) &
-		(~df_categoria['Deportista'].str.contains('RIESGO|MEDIA|TOTAL|SD', case=False, na=False))
-	].copy()
-	
-	return df_categoria
+	"""
+	Filas de deportistas de la categoría (sin filas de resumen estadístico)
+
+	Devuelve una copia de las filas de la partición (modificarla no altera `df`).
+	Las métricas siguen en float32; cada estadística convierte a float64 solo las
+	columnas que reduce (`valores_calculo`).
+	"""
+	return obtener_particion_categorias(df).filas(categoria, solo_validas=True)
 
-@st.cache_data(ttl=CACHE_TTL['estadisticas'])
+@dataclass(frozen=True)
+class MetricasCompiladas:
+	"""Métricas de una sección resueltas a posiciones de columna de un esquema concreto"""
+	claves: tuple
+	bilateral: np.ndarray
+	der: np.ndarray
+	izq: np.ndarray
+
+@lru_cache(maxsize=32)
+def compilar_metricas(columnas, seccion):
+	"""
+	Compila las métricas registradas de la sección a índices de columna NumPy
+
+	Se resuelve una vez por esquema (tupla de columnas): las estadísticas del
+	grupo indexan el bloque numérico por posición en lugar de buscar cada
+	columna por nombre en cada métrica.
+
+	Args:
+		columnas: Tupla con las columnas del DataFrame
+		seccion: "Fuerza" o "Movilidad"
+
+	Returns:
+		MetricasCompiladas (índice -1 = columna ausente; en las totales der == izq)
+	"""
+	metricas = metricas_seccion(seccion)
+	indice = pd.Index(columnas)
+	pares = [metrica.par for metrica in metricas]
+	return MetricasCompiladas(
+		claves=tuple(metrica.clave for metrica in metricas),
+		bilateral=np.array([metrica.bilateral for metrica in metricas], dtype=bool),
+		der=indice.get_indexer([der for der, _ in pares]),
+		izq=indice.get_indexer([izq for _, izq in pares])
+	)
+
+def calcular_estadisticas_metricas_grupo(df_categoria, seccion, claves):
+	"""
+	Medias y desviaciones del grupo por métrica (gráficos multifuerza/multimovilidad grupales)
+
+	Convierte a número una sola vez las columnas usadas por las métricas y calcula
+	conteos, medias y SD de todas a la vez sobre la matriz.
+
+	Args:
+		df_categoria: Filas de deportistas de la categoría
+		seccion: "Fuerza" o "Movilidad"
+		claves: Métricas seleccionadas (claves del registro), en orden
+
+	Returns:
+		Dict {clave: {"media_der", "media_izq", "std_der", "std_izq", "n_jugadores"}} para
+		bilaterales y {clave: {"media_total", "std_total", "n_jugadores"}} para totales;
+		las métricas sin datos no aparecen
+	"""
+	compiladas = compilar_metricas(tuple(df_categoria.columns), seccion)
+	indices = np.concatenate((compiladas.der, compiladas.izq))
+	usadas = np.unique(indices[indices >= 0])
+	valores = df_categoria.iloc[:, usadas].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+	validos = ~np.isnan(valores)
+	n = validos.sum(axis=0)
+	media = np.where(n > 0, np.where(validos, valores, 0.0).sum(axis=0) / np.maximum(n, 1), np.nan)
+	desvios = np.where(validos, valores - media, 0.0)
+	std = np.where(n > 1, np.sqrt((desvios ** 2).sum(axis=0) / np.maximum(n - 1, 1)), 0.0)
+
+	# Índice de columna del DataFrame → columna de la matriz (-1 si falta)
+	columna = np.full(len(df_categoria.columns) + 1, -1)
+	columna[usadas] = np.arange(len(usadas))
+
+	def _lado(posicion):
+		j = columna[posicion]
+		if j < 0 or n[j] == 0:
+			return None
+		return round(float(media[j]), 1), round(float(std[j]), 1), int(n[j])
+
+	estadisticas = {}
+	for clave in claves:
+		if clave not in compiladas.claves:
+			continue
+		i = compiladas.claves.index(clave)
+		der, izq = _lado(compiladas.der[i]), _lado(compiladas.izq[i])
+		if der is None or izq is None:
+			continue
+		if compiladas.bilateral[i]:
+			estadisticas[clave] = {
+				'media_der': der[0],
+				'media_izq': izq[0],
+				'std_der': der[1],
+				'std_izq': izq[1],
+				'n_jugadores': min(der[2], izq[2])
+			}
+		else:
+			estadisticas[clave] = {
+				'media_total': der[0],
+				'std_total': der[1],
+				'n_jugadores': der[2]
+			}
+	return estadisticas
+
+@cache_data(ttl=CACHE_TTL['estadisticas'])
 def calcular_estadisticas_categoria(df_categoria, columnas_tabla):
 	"""Calcula medias y desviaciones estándar con cache"""
-	# Forzar a número para evitar errores silenciosos
-	for col in list(columnas_tabla.keys()) + list(columnas_tabla.values()):
-		if col in df_categoria.columns:
-			df_categoria[col] = pd.to_numeric(df_categoria[col], errors="coerce")
+	# Solo las columnas que se reducen, como número en float64 (sin modificar df_categoria)
+	valores = valores_calculo(df_categoria[[
+		col for col in list(columnas_tabla.keys()) + list(columnas_tabla.values()) if col in df_categoria.columns
+	]])
 
 	# Calcular medias del grupo
 	media_dict = {}
 	for col_der, col_izq in columnas_tabla.items():
 		if col_der in df_categoria.columns:
-			media_val = df_categoria[col_der].mean(skipna=True)
+			media_val = valores[col_der].mean(skipna=True)
 			media_dict[col_der] = round(media_val, 1) if pd.notna(media_val) else 0.0
 		else:
 			media_dict[col_der] = 0.0
 			
 		if col_izq in df_categoria.columns:
-			media_val = df_categoria[col_izq].mean(skipna=True)
+			media_val = valores[col_izq].mean(skipna=True)
 			media_dict[col_izq] = round(media_val, 1) if pd.notna(media_val) else 0.0
 		else:
 			media_dict[col_izq] = 0.0
@@ -208,7 +525,7 @@ def calcular_estadisticas_categoria(df_categoria, columnas_tabla):
 	for col_der, col_izq in columnas_tabla.items():
 		if col_der in df_categoria.columns:
 			if n_jugadores > 1:
-				std_val = df_categoria[col_der].std(skipna=True)
+				std_val = valores[col_der].std(skipna=True)
 				std_dict[col_der] = round(std_val, 1) if pd.notna(std_val) else 0.0
 			else:
 				std_dict[col_der] = 0.0  # Solo un jugador, no hay desviación
@@ -217,7 +534,7 @@ def calcular_estadisticas_categoria(df_categoria, columnas_tabla):
 			
 		if col_izq in df_categoria.columns:
 			if n_jugadores > 1:
-				std_val = df_categoria[col_izq].std(skipna=True)
+				std_val = valores[col_izq].std(skipna=True)
 				std_dict[col_izq] = round(std_val, 1) if pd.notna(std_val) else 0.0
 			else:
 				std_dict[col_izq] = 0.0  # Solo un jugador, no hay desviación
@@ -226,16 +543,21 @@ def calcular_estadisticas_categoria(df_categoria, columnas_tabla):
 	
 	return media_dict, std_dict
 
-@st.cache_data(ttl=CACHE_TTL['preparacion_datos'])
+def _valor_jugador(datos_jugador, columna):
+	"""Valor del jugador redondeado a 1 decimal; NaN si falta, no es numérico o lo anuló el control de calidad"""
+	valor = pd.to_numeric(datos_jugador.get(columna, np.nan), errors='coerce')
+	return np.nan if pd.isna(valor) else round(float(valor), 1)
+
+@cache_data(ttl=CACHE_TTL['preparacion_datos'])
 def preparar_datos_jugador(datos_jugador, columnas_tabla):
 	"""Prepara datos del jugador para visualización con cache"""
 	jugador_dict = {}
 	for col_der, col_izq in columnas_tabla.items():
-		jugador_dict[col_der] = round(datos_jugador.get(col_der, 0), 1)
-		jugador_dict[col_izq] = round(datos_jugador.get(col_izq, 0), 1)
+		jugador_dict[col_der] = _valor_jugador(datos_jugador, col_der)
+		jugador_dict[col_izq] = _valor_jugador(datos_jugador, col_izq)
 	return jugador_dict
 
-@st.cache_data(ttl=CACHE_TTL['estadisticas'])
+@cache_data(ttl=CACHE_TTL['estadisticas'])
 def calcular_estadisticas_completas_categoria(df_categoria, columnas_tabla, columnas_totales):
 	"""
 	Calcula TODAS las estadísticas de la categoría UNA SOLA VEZ (fijas)
@@ -247,20 +569,21 @@ def calcular_estadisticas_completas_categoria(df_categoria, columnas_tabla, colu
 		'n_jugadores': len(df_categoria)
 	}
 	
-	# Forzar a número para evitar errores silenciosos
-	for col in list(columnas_tabla.keys()) + list(columnas_tabla.values()) + columnas_totales:
-		if col in df_categoria.columns:
-			df_categoria[col] = pd.to_numeric(df_categoria[col], errors="coerce")
+	# Solo las columnas que se reducen, como número en float64 (sin modificar df_categoria)
+	valores = valores_calculo(df_categoria[[
+		col for col in list(columnas_tabla.keys()) + list(columnas_tabla.values()) + columnas_totales
+		if col in df_categoria.columns
+	]])
 
 	# Calcular estadísticas para métricas bilaterales
 	for col_der, col_izq in columnas_tabla.items():
 		# Derecha
 		if col_der in df_categoria.columns:
-			media_val = df_categoria[col_der].mean(skipna=True)
+			media_val = valores[col_der].mean(skipna=True)
 			estadisticas['media'][col_der] = round(media_val, 1) if pd.notna(media_val) else 0.0
 			
 			if estadisticas['n_jugadores'] > 1:
-				std_val = df_categoria[col_der].std(skipna=True)
+				std_val = valores[col_der].std(skipna=True)
 				estadisticas['std'][col_der] = round(std_val, 1) if pd.notna(std_val) else 0.0
 			else:
 				estadisticas['std'][col_der] = 0.0
@@ -270,11 +593,11 @@ def calcular_estadisticas_completas_categoria(df_categoria, columnas_tabla, colu
 			
 		# Izquierda
 		if col_izq in df_categoria.columns:
-			media_val = df_categoria[col_izq].mean(skipna=True)
+			media_val = valores[col_izq].mean(skipna=True)
 			estadisticas['media'][col_izq] = round(media_val, 1) if pd.notna(media_val) else 0.0
 			
 			if estadisticas['n_jugadores'] > 1:
-				std_val = df_categoria[col_izq].std(skipna=True)
+				std_val = valores[col_izq].std(skipna=True)
 				estadisticas['std'][col_izq] = round(std_val, 1) if pd.notna(std_val) else 0.0
 			else:
 				estadisticas['std'][col_izq] = 0.0
@@ -285,7 +608,7 @@ def calcular_estadisticas_completas_categoria(df_categoria, columnas_tabla, colu
 	# Calcular estadísticas para métricas totales
 	for col_total in columnas_totales:
 		if col_total in df_categoria.columns:
-			valores_totales = pd.to_numeric(df_categoria[col_total], errors="coerce").dropna()
+			valores_totales = valores[col_total].dropna()
 			if len(valores_totales) > 0:
 				estadisticas['media'][col_total] = round(valores_totales.mean(), 1)
 				if len(valores_totales) > 1:
@@ -301,47 +624,27 @@ def calcular_estadisticas_completas_categoria(df_categoria, columnas_tabla, colu
 	
 	return estadisticas
 
-@st.cache_data(ttl=CACHE_TTL['preparacion_datos'])
+@cache_data(ttl=CACHE_TTL['preparacion_datos'])
 def preparar_datos_jugador_completo(datos_jugador, columnas_tabla, columnas_totales):
 	"""
 	Prepara SOLO los datos del jugador seleccionado (dinámico)
-	Incluye métricas bilaterales y totales
+	Incluye métricas bilaterales y totales. Un test no realizado o anulado queda
+	en NaN (no 0.0): las tablas lo muestran vacío y los gráficos sin barra.
 	"""
 	jugador_dict = {}
 	
 	# Procesar métricas bilaterales
 	for col_der, col_izq in columnas_tabla.items():
-		# Derecha
-		val_der = datos_jugador.get(col_der, 0)
-		try:
-			val_der = pd.to_numeric(val_der, errors='coerce')
-			val_der = 0.0 if pd.isna(val_der) else round(float(val_der), 1)
-		except (ValueError, TypeError):
-			val_der = 0.0
-		jugador_dict[col_der] = val_der
-		
-		# Izquierda
-		val_izq = datos_jugador.get(col_izq, 0)
-		try:
-			val_izq = pd.to_numeric(val_izq, errors='coerce')
-			val_izq = 0.0 if pd.isna(val_izq) else round(float(val_izq), 1)
-		except (ValueError, TypeError):
-			val_izq = 0.0
-		jugador_dict[col_izq] = val_izq
+		jugador_dict[col_der] = _valor_jugador(datos_jugador, col_der)
+		jugador_dict[col_izq] = _valor_jugador(datos_jugador, col_izq)
 	
 	# Procesar métricas totales
 	for col_total in columnas_totales:
-		val_total = datos_jugador.get(col_total, 0)
-		try:
-			val_total = pd.to_numeric(val_total, errors='coerce')
-			val_total = 0.0 if pd.isna(val_total) else round(float(val_total), 1)
-		except (ValueError, TypeError):
-			val_total = 0.0
-		jugador_dict[col_total] = val_total
+		jugador_dict[col_total] = _valor_jugador(datos_jugador, col_total)
 	
 	return jugador_dict
 
-@st.cache_data(ttl=CACHE_TTL['selecciones'])
+@cache_data(ttl=CACHE_TTL['selecciones'])
 def crear_hash_jugador(datos_jugador):
 	"""Crea hash único para datos del jugador para optimizar cache"""
 	# Convertir Series a dict para hashear
@@ -357,6 +660,8 @@ def crear_hash_jugador(datos_jugador):
 
 def limpiar_cache_si_cambio(jugador, categoria):
 	"""Limpia cache si hay cambio en la selección"""
+	import streamlit as st
+	
 	if (st.session_state.get('ultimo_jugador') != jugador or 
 		st.session_state.get('ultima_categoria') != categoria):
 		# Limpiar cache de métricas al cambiar selección
@@ -364,7 +669,7 @@ def limpiar_cache_si_cambio(jugador, categoria):
 		return True
 	return False
 
-@st.cache_data(ttl=CACHE_TTL['estadisticas'])
+@cache_data(ttl=CACHE_TTL['estadisticas'])
 def calcular_zscores_automaticos(df_categoria, metricas_zscore):
 	"""
 	Calcula Z-Scores automáticamente basado en la población actual
@@ -387,7 +692,7 @@ def calcular_zscores_automaticos(df_categoria, metricas_zscore):
 	for metrica_original, metrica_label in metricas_zscore.items():
 		if metrica_original in df_limpio.columns:
 			# Convertir a numérico y eliminar valores nulos
-			valores = pd.to_numeric(df_limpio[metrica_original], errors='coerce').dropna()
+			valores = valores_calculo(df_limpio[metrica_original]).dropna()
 			
 			if len(valores) >= 3:  # Mínimo 3 valores para estadísticas confiables
 				media = valores.mean()
@@ -402,7 +707,7 @@ def calcular_zscores_automaticos(df_categoria, metricas_zscore):
 	
 	return estadisticas
 
-@st.cache_data(ttl=CACHE_TTL['estadisticas'])
+@cache_data(ttl=CACHE_TTL['estadisticas'])
 def calcular_zscore_jugador(valor_jugador, media_poblacion, std_poblacion):
 	"""
 	Calcula Z-Score individual para un jugador
@@ -421,70 +726,7 @@ def calcular_zscore_jugador(valor_jugador, media_poblacion, std_poblacion):
 	zscore = (valor_jugador - media_poblacion) / std_poblacion
 	return round(zscore, 2)
 
-@st.cache_data(ttl=CACHE_TTL['estadisticas'])
-def interpretar_zscore_clinico(zscore_valor):
-	"""
-	Interpreta Z-Score con banderas clínicas y percentiles aproximados
-	
-	Args:
-		zscore_valor: Valor del Z-Score
-		
-	Returns:
-		Dict con interpretación clínica
-	"""
-	if zscore_valor is None or pd.isna(zscore_valor):
-		return {
-			'interpretacion': 'Sin datos',
-			'color': 'gray',
-			'percentil': None,
-			'categoria': 'N/A'
-		}
-	
-	# Interpretación basada en distribución normal estándar
-	if zscore_valor >= 2.0:
-		return {
-			'interpretacion': 'Excepcional (>97.5%)',
-			'color': '#22c55e',  # Verde brillante
-			'percentil': '>97.5',
-			'categoria': 'Excelente'
-		}
-	elif zscore_valor >= 1.0:
-		return {
-			'interpretacion': 'Superior (84-97.5%)',
-			'color': '#16a34a',  # Verde
-			'percentil': '84-97.5',
-			'categoria': 'Bueno'
-		}
-	elif zscore_valor >= 0.0:
-		return {
-			'interpretacion': 'Promedio Alto (50-84%)',
-			'color': '#fbbf24',  # Amarillo
-			'percentil': '50-84',
-			'categoria': 'Promedio+'
-		}
-	elif zscore_valor >= -1.0:
-		return {
-			'interpretacion': 'Promedio Bajo (16-50%)',
-			'color': '#f59e0b',  # Naranja
-			'percentil': '16-50',
-			'categoria': 'Promedio-'
-		}
-	elif zscore_valor >= -2.0:
-		return {
-			'interpretacion': 'Inferior (2.5-16%)',
-			'color': '#ef4444',  # Rojo
-			'percentil': '2.5-16',
-			'categoria': 'Bajo'
-		}
-	else:
-		return {
-			'interpretacion': 'Muy Inferior (<2.5%)',
-			'color': '#dc2626',  # Rojo oscuro
-			'percentil': '<2.5',
-			'categoria': 'Crítico'
-		}
-
-@st.cache_data(ttl=CACHE_TTL['preparacion_datos'])
+@cache_data(ttl=CACHE_TTL['preparacion_datos'])
 def generar_zscores_jugador(datos_jugador, estadisticas_poblacion, metricas_zscore):
 	"""
 	Genera todos los Z-Scores para un jugador específico
@@ -495,7 +737,7 @@ def generar_zscores_jugador(datos_jugador, estadisticas_poblacion, metricas_zsco
 		metricas_zscore: Dict con mapeo de métricas
 		
 	Returns:
-		Dict con Z-Scores y sus interpretaciones
+		Dict con Z-Scores y sus interpretaciones (bandas clínicas de BANDAS_ZSCORE)
 	"""
 	zscores_jugador = {}
 	
@@ -511,21 +753,22 @@ def generar_zscores_jugador(datos_jugador, estadisticas_poblacion, metricas_zsco
 				stats['std']
 			)
 			
-			# Interpretar clínicamente
-			interpretacion = interpretar_zscore_clinico(zscore)
-			
 			zscores_jugador[metrica_label] = {
 				'valor_original': valor_jugador,
 				'zscore': zscore,
-				'interpretacion': interpretacion,
 				'media_poblacion': stats['media'],
 				'std_poblacion': stats['std'],
 				'n_poblacion': stats['n']
 			}
 	
+	# Interpretación clínica de todas las métricas en una sola clasificación
+	bandas = clasificar_zscores([datos['zscore'] for datos in zscores_jugador.values()])
+	for i, datos in enumerate(zscores_jugador.values()):
+		datos['interpretacion'] = bandas.banda(i)
+	
 	return zscores_jugador
 
-@st.cache_data(ttl=CACHE_TTL['preparacion_datos'])
+@cache_data(ttl=CACHE_TTL['preparacion_datos'])
 def calcular_metricas_bilaterales_promedio(datos_jugador):
 	"""
 	Calcula promedios de métricas bilaterales para simplificar el radar
@@ -534,146 +777,72 @@ def calcular_metricas_bilaterales_promedio(datos_jugador):
 		datos_jugador: Series o dict con datos del jugador
 		
 	Returns:
-		Dict con métricas promediadas
+		Dict {clave_radar: (DER + IZQ) / 2} de las métricas resumidas con ambos lados cargados
 	"""
 	metricas_promedio = {}
 	
-	# CUAD promedio
-	cuad_der = datos_jugador.get('CUAD DER (N)', 0)
-	cuad_izq = datos_jugador.get('CUAD IZQ (N)', 0)
-	if cuad_der > 0 and cuad_izq > 0:
-		metricas_promedio['CUAD_PROMEDIO'] = (cuad_der + cuad_izq) / 2
-	
-	# WOLLIN promedio  
-	wollin_der = datos_jugador.get('WOLLIN DER', 0)
-	wollin_izq = datos_jugador.get('WOLLIN IZQ', 0)
-	if wollin_der > 0 and wollin_izq > 0:
-		metricas_promedio['WOLLIN_PROMEDIO'] = (wollin_der + wollin_izq) / 2
-	
-	# === MÉTRICAS DE MOVILIDAD ===
-	# AKE promedio
-	ake_der = datos_jugador.get('AKE DER', 0)
-	ake_izq = datos_jugador.get('AKE IZQ', 0)
-	if ake_der > 0 and ake_izq > 0:
-		metricas_promedio['AKE_PROMEDIO'] = (ake_der + ake_izq) / 2
-	
-	# THOMAS promedio
-	thomas_der = datos_jugador.get('THOMAS DER', 0)
-	thomas_izq = datos_jugador.get('THOMAS IZQ', 0)
-	if thomas_der > 0 and thomas_izq > 0:
-		metricas_promedio['THOMAS_PROMEDIO'] = (thomas_der + thomas_izq) / 2
-	
-	# LUNGE promedio
-	lunge_der = datos_jugador.get('LUNGE DER', 0)
-	lunge_izq = datos_jugador.get('LUNGE IZQ', 0)
-	if lunge_der > 0 and lunge_izq > 0:
-		metricas_promedio['LUNGE_PROMEDIO'] = (lunge_der + lunge_izq) / 2
+	for metrica in REGISTRO_METRICAS:
+		if not (metrica.resumen and metrica.bilateral):
+			continue
+		der = pd.to_numeric(datos_jugador.get(metrica.der), errors='coerce')
+		izq = pd.to_numeric(datos_jugador.get(metrica.izq), errors='coerce')
+		if pd.notna(der) and pd.notna(izq):
+			metricas_promedio[metrica.clave_radar] = (float(der) + float(izq)) / 2
 	
 	return metricas_promedio
 
-@st.cache_data(ttl=CACHE_TTL['estadisticas'])
-def calcular_zscores_radar_simple(df_categoria, metricas_radar_simple):
-	"""
-	Calcula Z-Scores para el radar simplificado (5 métricas máximo)
-	
-	Args:
-		df_categoria: DataFrame filtrado por categoría
-		metricas_radar_simple: Dict con métricas simplificadas
-		
-	Returns:
-		Dict con estadísticas para radar simple
-	"""
+def _valores_resumen(df_limpio, metrica):
+	"""Valores de la métrica resumida por jugador: la columna total o el promedio (DER + IZQ) / 2"""
+	if any(columna not in df_limpio.columns for columna in metrica.columnas):
+		return pd.Series(dtype="float64")
+	valores = valores_calculo(df_limpio[list(metrica.columnas)])
+	return valores.mean(axis=1, skipna=False).dropna()
+
+def _estadisticas_resumen(df_categoria, metricas_radar_simple, extremos):
+	"""Media, SD y n (y mínimo/máximo con `extremos`) de cada métrica resumida con al menos 3 jugadores"""
 	estadisticas = {}
 	
 	# Filtrar solo jugadores
 	df_limpio = df_categoria[
 		(~df_categoria['Deportista'].str.contains('RIESGO|MEDIA|TOTAL|SD', case=False, na=False)) &
 		(df_categoria['Deportista'].notna())
-	].copy()
-	
-	# Calcular estadísticas para métricas directas (totales)
-	metricas_directas = {
-		'F PICO (IMTP) (N)': 'IMTP',
-		'FP (CMJ) (N)': 'CMJ Propulsiva',
-		'FF (CMJ) (N)': 'CMJ Frenado'
-	}
-	
-	for metrica_col, metrica_label in metricas_directas.items():
-		if metrica_col in df_limpio.columns:
-			valores = pd.to_numeric(df_limpio[metrica_col], errors='coerce').dropna()
-			if len(valores) >= 3:
-				estadisticas[metrica_col] = {
-					'media': round(valores.mean(), 2),
-					'std': round(valores.std(ddof=1), 2),
-					'n': len(valores),
-					'label': metrica_label
-				}
-	
-	# Calcular estadísticas para métricas bilaterales (promedios)
-	# CUAD promedio
-	cuad_der_vals = pd.to_numeric(df_limpio.get('CUAD DER (N)', []), errors='coerce').dropna()
-	cuad_izq_vals = pd.to_numeric(df_limpio.get('CUAD IZQ (N)', []), errors='coerce').dropna()
-	if len(cuad_der_vals) >= 3 and len(cuad_izq_vals) >= 3:
-		cuad_promedios = (cuad_der_vals + cuad_izq_vals) / 2
-		estadisticas['CUAD_PROMEDIO'] = {
-			'media': round(cuad_promedios.mean(), 2),
-			'std': round(cuad_promedios.std(ddof=1), 2),
-			'n': len(cuad_promedios),
-			'label': 'CUAD'
-		}
-	
-	# WOLLIN promedio
-	wollin_der_vals = pd.to_numeric(df_limpio.get('WOLLIN DER', []), errors='coerce').dropna()
-	wollin_izq_vals = pd.to_numeric(df_limpio.get('WOLLIN IZQ', []), errors='coerce').dropna()
-	if len(wollin_der_vals) >= 3 and len(wollin_izq_vals) >= 3:
-		wollin_promedios = (wollin_der_vals + wollin_izq_vals) / 2
-		estadisticas['WOLLIN_PROMEDIO'] = {
-			'media': round(wollin_promedios.mean(), 2),
-			'std': round(wollin_promedios.std(ddof=1), 2),
-			'n': len(wollin_promedios),
-			'label': 'ISQ Wollin'
-		}
-	
-	# === MÉTRICAS DE MOVILIDAD ===
-	# AKE promedio
-	ake_der_vals = pd.to_numeric(df_limpio.get('AKE DER', []), errors='coerce').dropna()
-	ake_izq_vals = pd.to_numeric(df_limpio.get('AKE IZQ', []), errors='coerce').dropna()
-	if len(ake_der_vals) >= 3 and len(ake_izq_vals) >= 3:
-		ake_promedios = (ake_der_vals + ake_izq_vals) / 2
-		estadisticas['AKE_PROMEDIO'] = {
-			'media': round(ake_promedios.mean(), 2),
-			'std': round(ake_promedios.std(ddof=1), 2),
-			'n': len(ake_promedios),
-			'label': 'AKE'
-		}
+	]
 	
-	# THOMAS promedio
-	thomas_der_vals = pd.to_numeric(df_limpio.get('THOMAS DER', []), errors='coerce').dropna()
-	thomas_izq_vals = pd.to_numeric(df_limpio.get('THOMAS IZQ', []), errors='coerce').dropna()
-	if len(thomas_der_vals) >= 3 and len(thomas_izq_vals) >= 3:
-		thomas_promedios = (thomas_der_vals + thomas_izq_vals) / 2
-		estadisticas['THOMAS_PROMEDIO'] = {
-			'media': round(thomas_promedios.mean(), 2),
-			'std': round(thomas_promedios.std(ddof=1), 2),
-			'n': len(thomas_promedios),
-			'label': 'THOMAS'
-		}
-	
-	# LUNGE promedio
-	lunge_der_vals = pd.to_numeric(df_limpio.get('LUNGE DER', []), errors='coerce').dropna()
-	lunge_izq_vals = pd.to_numeric(df_limpio.get('LUNGE IZQ', []), errors='coerce').dropna()
-	if len(lunge_der_vals) >= 3 and len(lunge_izq_vals) >= 3:
-		lunge_promedios = (lunge_der_vals + lunge_izq_vals) / 2
-		estadisticas['LUNGE_PROMEDIO'] = {
-			'media': round(lunge_promedios.mean(), 2),
-			'std': round(lunge_promedios.std(ddof=1), 2),
-			'n': len(lunge_promedios),
-			'label': 'LUNGE'
+	for metrica_key, metrica_label in metricas_radar_simple.items():
+		metrica = metrica_radar(metrica_key)
+		if metrica is None:
+			continue
+		valores = _valores_resumen(df_limpio, metrica)
+		if len(valores) < 3:
+			continue
+		stats = {
+			'media': round(valores.mean(), 2),
+			'std': round(valores.std(ddof=1), 2),
 		}
+		if extremos:
+			stats['minimo'] = round(valores.min(), 2)
+			stats['maximo'] = round(valores.max(), 2)
+		stats['n'] = len(valores)
+		stats['label'] = metrica_label
+		estadisticas[metrica_key] = stats
 	
 	return estadisticas
 
-@st.cache_data(ttl=CACHE_TTL['preparacion_datos'])
+@cache_data(ttl=CACHE_TTL['estadisticas'])
+def calcular_zscores_radar_simple(df_categoria, metricas_radar_simple):
+	"""
+	Calcula las estadísticas poblacionales del radar simplificado
+	
+	Args:
+		df_categoria: DataFrame filtrado por categoría
+		metricas_radar_simple: Dict {clave_radar: etiqueta} (`config.metricas.metricas_radar`)
+		
+	Returns:
+		Dict {clave_radar: {media, std, n, label}} en el orden de `metricas_radar_simple`
+	"""
+	return _estadisticas_resumen(df_categoria, metricas_radar_simple, extremos=False)
+
+@cache_data(ttl=CACHE_TTL['preparacion_datos'])
 def generar_zscores_radar_simple(datos_jugador, estadisticas_poblacion, metricas_radar_simple):
 	"""
 	Genera Z-Scores para el radar simplificado
@@ -717,87 +886,127 @@ def generar_zscores_radar_simple(datos_jugador, estadisticas_poblacion, metricas
 	
 	return zscores_radar
 
-@st.cache_data(ttl=CACHE_TTL['estadisticas'])
+@cache_data(ttl=CACHE_TTL['estadisticas'])
 def calcular_estadisticas_distribucion_grupal(df_categoria, metricas_radar_simple):
 	"""
 	Calcula estadísticas completas para distribución grupal (media, min, max)
 	
 	Args:
 		df_categoria: DataFrame filtrado por categoría
-		metricas_radar_simple: Dict con métricas simplificadas
+		metricas_radar_simple: Dict {clave_radar: etiqueta} (`config.metricas.metricas_radar`)
 		
 	Returns:
-		Dict con estadísticas completas para distribución grupal
+		Dict {clave_radar: {media, std, minimo, maximo, n, label}} en el orden de `metricas_radar_simple`
 	"""
-	estadisticas = {}
-	
-	# Filtrar solo jugadores
-	df_limpio = df_categoria[
-		(~df_categoria['Deportista'].str.contains('RIESGO|MEDIA|TOTAL|SD', case=False, na=False)) &
-		(df_categoria['Deportista'].notna())
-	].copy()
-	
-	# Calcular estadísticas para métricas directas (totales)
-	metricas_directas = {
-		'F PICO (IMTP) (N)': 'IMTP Total',
-		'FP (CMJ) (N)': 'CMJ FP Total',
-		'FF (CMJ) (N)': 'CMJ FF Total'
-	}
-	
-	for metrica_col, metrica_label in metricas_directas.items():
-		if metrica_col in df_limpio.columns:
-			valores = pd.to_numeric(df_limpio[metrica_col], errors='coerce').dropna()
-			if len(valores) >= 3:
-				estadisticas[metrica_col] = {
-					'media': round(valores.mean(), 2),
-					'std': round(valores.std(ddof=1), 2),
-					'minimo': round(valores.min(), 2),
-					'maximo': round(valores.max(), 2),
-					'n': len(valores),
-					'label': metrica_label
-				}
+	return _estadisticas_resumen(df_categoria, metricas_radar_simple, extremos=True)
+
+# ========= MATRIZ DEL GRUPO (HEATMAP) ==========
+
+ORDEN_ALFABETICO = "Alfabético"
+ORDEN_PROMEDIO = "Promedio (mayor a menor)"
+ORDEN_CLUSTER = "Clúster (similitud)"
+
+@cache_data(ttl=CACHE_TTL['estadisticas'])
+def calcular_matriz_zscores_grupo(df_categoria, metricas_zscore):
+	"""
+	Calcula de una sola vez la matriz jugadores × métricas de Z-Scores (vectorizado)
 	
-	# Calcular estadísticas para métricas bilaterales (promedios)
-	# CUAD promedio
-	cuad_der_vals = pd.to_numeric(df_limpio.get('CUAD DER (N)', []), errors='coerce').dropna()
-	cuad_izq_vals = pd.to_numeric(df_limpio.get('CUAD IZQ (N)', []), errors='coerce').dropna()
-	if len(cuad_der_vals) >= 3 and len(cuad_izq_vals) >= 3:
-		cuad_promedios = (cuad_der_vals + cuad_izq_vals) / 2
-		estadisticas['CUAD_PROMEDIO'] = {
-			'media': round(cuad_promedios.mean(), 2),
-			'std': round(cuad_promedios.std(ddof=1), 2),
-			'minimo': round(cuad_promedios.min(), 2),
-			'maximo': round(cuad_promedios.max(), 2),
-			'n': len(cuad_promedios),
-			'label': 'CUAD'
-		}
+	Args:
+		df_categoria: DataFrame de la categoría con solo jugadores (procesar_datos_categoria)
+		metricas_zscore: Dict columna → etiqueta
+		
+	Returns:
+		Tuple (matriz_zscores, matriz_valores): DataFrames con índice Deportista y columnas
+		= etiquetas. Las métricas con menos de 3 valores o sin variación quedan fuera.
+	"""
+	columnas = [col for col in metricas_zscore if col in df_categoria.columns]
+	valores = valores_calculo(df_categoria[columnas])
+	valores.index = df_categoria['Deportista'].to_numpy()
+	
+	# Mismo criterio que calcular_zscores_automaticos: mínimo 3 valores, SD muestral
+	n = valores.count()
+	media = valores.mean()
+	std = valores.std(ddof=1)
+	validas = valores.columns[(n >= 3) & (std > 0)]
+	
+	valores = valores[validas]
+	matriz = ((valores - media[validas]) / std[validas]).round(2)
+	
+	etiquetas = [metricas_zscore[col] for col in validas]
+	matriz.columns = etiquetas
+	valores.columns = etiquetas
+	return matriz, valores
+
+@cache_data(ttl=CACHE_TTL['estadisticas'])
+def calcular_matriz_lsi_grupo(df_categoria, pares_lsi):
+	"""
+	Calcula el LSI (min/max × 100) de cada jugador para cada par bilateral
 	
-	# WOLLIN promedio
-	wollin_der_vals = pd.to_numeric(df_limpio.get('WOLLIN DER', []), errors='coerce').dropna()
-	wollin_izq_vals = pd.to_numeric(df_limpio.get('WOLLIN IZQ', []), errors='coerce').dropna()
-	if len(wollin_der_vals) >= 3 and len(wollin_izq_vals) >= 3:
-		wollin_promedios = (wollin_der_vals + wollin_izq_vals) / 2
-		estadisticas['WOLLIN_PROMEDIO'] = {
-			'media': round(wollin_promedios.mean(), 2),
-			'std': round(wollin_promedios.std(ddof=1), 2),
-			'minimo': round(wollin_promedios.min(), 2),
-			'maximo': round(wollin_promedios.max(), 2),
-			'n': len(wollin_promedios),
-			'label': 'ISQ Wollin'
-		}
+	Args:
+		df_categoria: DataFrame de la categoría con solo jugadores
+		pares_lsi: Dict etiqueta → (columna DER, columna IZQ)
+		
+	Returns:
+		DataFrame con índice Deportista y una columna por par (NaN si falta un lado)
+	"""
+	matriz = {}
+	for etiqueta, (col_der, col_izq) in pares_lsi.items():
+		if col_der not in df_categoria.columns or col_izq not in df_categoria.columns:
+			continue
+		der = pd.to_numeric(df_categoria[col_der], errors='coerce').to_numpy(dtype=float)
+		izq = pd.to_numeric(df_categoria[col_izq], errors='coerce').to_numpy(dtype=float)
+		maximo = np.fmax(der, izq)
+		with np.errstate(divide='ignore', invalid='ignore'):
+			lsi = np.where(maximo > 0, np.fmin(der, izq) / maximo * 100, np.nan)
+		# Si falta un lado no hay asimetría que calcular
+		lsi[np.isnan(der) | np.isnan(izq)] = np.nan
+		matriz[etiqueta] = np.round(lsi, 1)
+	return pd.DataFrame(matriz, index=df_categoria['Deportista'].to_numpy())
+
+def _media_sin_nan(datos, eje):
+	"""Media ignorando NaN; NaN si toda la fila/columna está vacía (sin warnings)"""
+	validos = ~np.isnan(datos)
+	n = validos.sum(axis=eje)
+	suma = np.where(validos, datos, 0.0).sum(axis=eje)
+	return np.where(n > 0, suma / np.maximum(n, 1), np.nan)
+
+def ordenar_matriz_grupo(matriz, criterio):
+	"""
+	Devuelve el orden de filas (jugadores) de la matriz según el criterio elegido
 	
-	# TRIPLE SALTO promedio
-	triple_der_vals = pd.to_numeric(df_limpio.get('TRIPLE SALTO DER', []), errors='coerce').dropna()
-	triple_izq_vals = pd.to_numeric(df_limpio.get('TRIPLE SALTO IZQ', []), errors='coerce').dropna()
-	if len(triple_der_vals) >= 3 and len(triple_izq_vals) >= 3:
-		triple_promedios = (triple_der_vals + triple_izq_vals) / 2
-		estadisticas['TRIPLE_SALTO_PROMEDIO'] = {
-			'media': round(triple_promedios.mean(), 2),
-			'std': round(triple_promedios.std(ddof=1), 2),
-			'minimo': round(triple_promedios.min(), 2),
-			'maximo': round(triple_promedios.max(), 2),
-			'n': len(triple_promedios),
-			'label': 'TRIPLE SALTO'
-		}
+	Args:
+		matriz: DataFrame jugadores × métricas
+		criterio: ORDEN_ALFABETICO, ORDEN_PROMEDIO, ORDEN_CLUSTER o una columna
+			de la matriz (de mayor a menor)
+		
+	Returns:
+		ndarray con las posiciones de fila en el orden resultante (usar con .iloc;
+		puede haber nombres de jugador repetidos)
+	"""
+	if matriz.empty:
+		return np.arange(len(matriz))
+	
+	if criterio == ORDEN_ALFABETICO:
+		return np.argsort(matriz.index.astype(str), kind='stable')
+	
+	if criterio in matriz.columns:
+		clave = matriz[criterio].to_numpy(dtype=float)
+	elif criterio == ORDEN_CLUSTER:
+		# Seriación espectral: jugadores con perfiles parecidos quedan contiguos al
+		# ordenarlos por su proyección sobre la primera componente principal
+		datos = matriz.to_numpy(dtype=float)
+		datos = np.where(np.isnan(datos), _media_sin_nan(datos, 0), datos)
+		datos = np.nan_to_num(datos - datos.mean(axis=0))
+		if len(datos) < 2 or not datos.any():
+			return np.arange(len(matriz))
+		_, _, vt = np.linalg.svd(datos, full_matrices=False)
+		clave = datos @ vt[0]
+		# Orientar la componente para que los perfiles altos queden arriba
+		if np.corrcoef(clave, datos.mean(axis=1))[0, 1] < 0:
+			clave = -clave
+	else:
+		clave = _media_sin_nan(matriz.to_numpy(dtype=float), 1)
 	
-	return estadisticas
+	# Descendente, con NaN al final
+	clave = np.where(np.isnan(clave), -np.inf, clave)
+	return np.argsort(-clave, kind='stable')
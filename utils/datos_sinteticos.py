@@ -0,0 +1,183 @@
+"""
+Generador de planillas de evaluación sintéticas (plantel grande)
+
+El Excel de demo tiene una sola hoja con un puñado de jugadores, así que no
+sirve para medir cómo escalan la carga, la partición por categoría o las vistas
+grupales. Este módulo genera libros con el mismo esquema que "EVALUACION 2910"
+(una hoja "EVALUACION ddmm" por fecha) y tamaño configurable:
+
+- jugadores y categorías (columna CATEGORIA cuando hay más de una),
+- fechas de evaluación con progresión leve de cada jugador entre sesiones,
+- tasa de valores faltantes por test (el test completo queda vacío, como en el
+  Excel real cuando un jugador no hizo la prueba),
+- filas de resumen MEDIA/SD/RIESGO al final de cada categoría,
+- encabezados del formato anterior (claves de MAPEO_COLUMNAS_NUEVA_EVALUACION).
+
+Los valores son reproducibles con `semilla`. Desde la carpeta del proyecto:
+
+	python -m cli generar-datos --filas 50000 --categorias 3 --fechas 4 --out data/sintetico.xlsx
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from config.settings import MAPEO_COLUMNAS_NUEVA_EVALUACION
+from utils.esquemas import COLUMNAS_EVALUACION
+
+# Test → (columna DER, columna IZQ, columna total o None, media por lado, SD entre jugadores)
+# Medias y dispersiones aproximadas a las del plantel de la hoja de demo
+TESTS_SINTETICOS = {
+	"AKE": ("AKE DER", "AKE IZQ", None, 18.0, 5.0),
+	"THOMAS": ("THOMAS DER", "THOMAS IZQ", None, 1.8, 1.0),
+	"LUNGE": ("LUNGE DER", "LUNGE IZQ", None, 36.0, 5.0),
+	"CUAD": ("CUAD DER (N)", "CUAD IZQ (N)", None, 850.0, 120.0),
+	"WOLLIN": ("WOLLIN DER", "WOLLIN IZQ", None, 350.0, 70.0),
+	"IMTP": ("F PICO DER (IMTP) (N)", "F PICO IZQ (IMTP) (N)", "F PICO (IMTP) (N)", 1100.0, 180.0),
+	"CMJ FP": ("FP DER (CMJ) (N)", "FP IZQ (CMJ) (N)", "FP (CMJ) (N)", 850.0, 120.0),
+	"CMJ FF": ("FF DER (CMJ) (N)", "FF IZQ (CMJ) (N)", "FF (CMJ) (N)", 850.0, 120.0),
+	"TRIPLE SALTO": ("TRIPLE SALTO DER", "TRIPLE SALTO IZQ", None, 460.0, 60.0),
+}
+
+# Tests de movilidad: no dependen del nivel de fuerza del jugador ni progresan entre sesiones
+TESTS_MOVILIDAD = ("AKE", "THOMAS", "LUNGE")
+
+# Categorías sintéticas: primero las que la app ya muestra con nombre amigable
+CATEGORIAS_SINTETICAS = ["Evaluacion_2910", "Reserva", "4ta"]
+
+FILAS_RESUMEN = ["MEDIA", "SD", "TOTAL EN RIESGO ALTO", "TOTAL EN RIESGO MODERADO", "TOTAL EN BAJO RIESGO"]
+
+
+def jugadores_para_filas(filas, fechas=1):
+	"""Jugadores necesarios para llegar a `filas` filas de deportistas con `fechas` sesiones"""
+	return max(1, math.ceil(filas / max(1, fechas)))
+
+
+def _nombres_categorias(n):
+	return [
+		CATEGORIAS_SINTETICAS[i] if i < len(CATEGORIAS_SINTETICAS) else f"Categoria {i + 1}"
+		for i in range(n)
+	]
+
+
+def _nombres_hojas(fechas):
+	"""'EVALUACION ddmm' por fecha (se agrega el año si dos fechas coinciden en día y mes)"""
+	cortos = [f"EVALUACION {fecha:%d%m}" for fecha in fechas]
+	if len(set(cortos)) == len(cortos):
+		return cortos
+	return [f"EVALUACION {fecha:%d%m%y}" for fecha in fechas]
+
+
+def _filas_resumen(bloque, columnas_metricas):
+	"""Filas MEDIA/SD y conteos de riesgo (Z < -1, -1 ≤ Z < 0, Z ≥ 0) de un bloque de jugadores"""
+	valores = bloque[columnas_metricas]
+	media = valores.mean()
+	sd = valores.std()
+	z = (valores - media) / sd.replace(0, np.nan)
+	filas = pd.DataFrame(
+		[media, sd, (z < -1).sum(), ((z >= -1) & (z < 0)).sum(), (z >= 0).sum()],
+		columns=columnas_metricas
+	)
+	filas.insert(0, "JUGADOR", FILAS_RESUMEN)
+	filas.insert(0, "FECHA", pd.NaT)
+	return filas
+
+
+def generar_evaluaciones_sinteticas(jugadores=200, categorias=1, fechas=1, tasa_faltantes=0.1,
+		filas_resumen=True, formato_anterior=False, fecha_inicial="2025-10-29", dias_entre_fechas=30, semilla=0):
+	"""
+	Genera las hojas de un libro de evaluaciones sintético
+
+	Args:
+		jugadores: Jugadores del plantel (se reparten entre las categorías)
+		categorias: Cantidad de categorías
+		fechas: Sesiones de evaluación (una hoja por fecha)
+		tasa_faltantes: Probabilidad de que un jugador no tenga cargado un test en una sesión
+		filas_resumen: Agregar filas MEDIA/SD/RIESGO al final de cada categoría
+		formato_anterior: Encabezados del formato anterior (claves de MAPEO_COLUMNAS_NUEVA_EVALUACION)
+		fecha_inicial: Fecha de la primera sesión
+		dias_entre_fechas: Días entre sesiones consecutivas
+		semilla: Semilla del generador aleatorio
+
+	Returns:
+		Dict {nombre de hoja: DataFrame}, en orden de fecha
+	"""
+	if jugadores < 1 or categorias < 1 or fechas < 1:
+		raise ValueError("jugadores, categorias y fechas deben ser al menos 1")
+	if not 0 <= tasa_faltantes < 1:
+		raise ValueError("tasa_faltantes debe estar en [0, 1)")
+
+	rng = np.random.default_rng(semilla)
+	nombres_categorias = _nombres_categorias(categorias)
+	categoria_jugador = np.sort(rng.integers(0, categorias, jugadores))
+	nombres_jugadores = np.array([f"JUGADOR {i + 1}" for i in range(jugadores)], dtype=object)
+	fechas_sesion = pd.date_range(fecha_inicial, periods=fechas, freq=f"{dias_entre_fechas}D")
+
+	# Perfil fijo de cada jugador: nivel de fuerza, movilidad propia por test y asimetría por lado
+	nivel_fuerza = rng.standard_normal(jugadores)
+	nivel_test = {test: rng.standard_normal(jugadores) for test in TESTS_SINTETICOS}
+	asimetria = {test: rng.normal(1.0, 0.07, jugadores) for test in TESTS_SINTETICOS}
+	# La fuerza mejora levemente sesión a sesión (1 % ± 3 % por sesión, propio de cada jugador)
+	mejora_por_sesion = rng.normal(0.01, 0.03, jugadores)
+	columnas_metricas = COLUMNAS_EVALUACION[2:]
+
+	hojas = {}
+	for i_fecha, (nombre_hoja, fecha) in enumerate(zip(_nombres_hojas(fechas_sesion), fechas_sesion)):
+		valores = {}
+		for test, (der, izq, total, media, sd) in TESTS_SINTETICOS.items():
+			if test in TESTS_MOVILIDAD:
+				base = media + sd * nivel_test[test]
+			else:
+				base = (media + sd * (0.7 * nivel_fuerza + 0.3 * nivel_test[test])) * (1 + i_fecha * mejora_por_sesion)
+			# Variabilidad de la medición: 3 % en fuerza, un cuarto de la SD del plantel en movilidad
+			ruido = rng.normal(0, 0.25 * sd if test in TESTS_MOVILIDAD else 0.03 * media, (2, jugadores))
+			lado_der = np.clip(base * np.sqrt(asimetria[test]) + ruido[0], 0, None)
+			lado_izq = np.clip(base / np.sqrt(asimetria[test]) + ruido[1], 0, None)
+			lado_der, lado_izq = np.round(lado_der), np.round(lado_izq)
+			if test == "THOMAS":
+				# Escala 0-4 (músculos acortados)
+				lado_der, lado_izq = np.clip(lado_der, 0, 4), np.clip(lado_izq, 0, 4)
+
+			# Test no realizado: todas sus columnas vacías para ese jugador
+			faltante = rng.random(jugadores) < tasa_faltantes
+			valores[der] = np.where(faltante, np.nan, lado_der)
+			valores[izq] = np.where(faltante, np.nan, lado_izq)
+			if total is not None:
+				valores[total] = np.where(faltante, np.nan, lado_der + lado_izq)
+
+		df_sesion = pd.DataFrame(valores)[columnas_metricas]
+		df_sesion.insert(0, "JUGADOR", nombres_jugadores)
+		df_sesion.insert(0, "FECHA", fecha)
+
+		bloques = []
+		for i_categoria, nombre_categoria in enumerate(nombres_categorias):
+			bloque = df_sesion[categoria_jugador == i_categoria]
+			if filas_resumen and len(bloque):
+				bloque = pd.concat([bloque, _filas_resumen(bloque, columnas_metricas)], ignore_index=True)
+			if categorias > 1:
+				bloque = bloque.assign(CATEGORIA=nombre_categoria)
+			bloques.append(bloque)
+		df_hoja = pd.concat(bloques, ignore_index=True)
+
+		if formato_anterior:
+			# En el Excel anterior los encabezados de CMJ estaban repetidos (pandas lee el segundo como ".1")
+			df_hoja = df_hoja.rename(columns={
+				nuevo: anterior.removesuffix(".1") for anterior, nuevo in MAPEO_COLUMNAS_NUEVA_EVALUACION.items()
+			})
+		hojas[nombre_hoja] = df_hoja
+	return hojas
+
+
+def escribir_libro_sintetico(ruta, **parametros):
+	"""
+	Escribe un libro .xlsx sintético (ver `generar_evaluaciones_sinteticas` para los parámetros)
+
+	Returns:
+		Cantidad total de filas escritas (deportistas + resumen)
+	"""
+	hojas = generar_evaluaciones_sinteticas(**parametros)
+	with pd.ExcelWriter(ruta, engine="openpyxl") as writer:
+		for nombre_hoja, df_hoja in hojas.items():
+			df_hoja.to_excel(writer, sheet_name=nombre_hoja, index=False)
+	return sum(len(df_hoja) for df_hoja in hojas.values())
@@ -0,0 +1,198 @@
+"""
+Métricas derivadas: columnas calculadas con una expresión sobre otras métricas
+
+Cada cociente nuevo (H:Q, DSI, fuerza relativa al peso) era otro bucle en
+data_utils y otro gráfico. Ahora una métrica derivada es una entrada de
+REGISTRO_METRICAS con `expresion` (config/metricas.py): aritmética (+ - * / **,
+abs, min, max) sobre métricas del registro, por clave, o sobre columnas del
+dataset. Los nombres con espacios o símbolos van entre comillas invertidas, como
+en `DataFrame.eval`:
+
+    100 * WOLLIN / CUAD
+    100 * `CMJ FP Total` / `IMTP Total`
+    `IMTP Total` / `PESO (KG)`
+
+En una métrica bilateral la expresión se evalúa una vez por lado: cada métrica
+bilateral citada aporta su columna del mismo lado y una total, su única columna.
+Una métrica total no puede citar una bilateral por clave (se cita la columna DER
+o IZQ). Una columna ausente o una división por cero dan NaN, como un test no
+realizado. La fuerza relativa al peso (tercer ejemplo) necesita una columna de
+peso corporal que las planillas actuales no traen: se registra cuando la tengan.
+
+Las expresiones se compilan una sola vez a código que opera con arrays NumPy y se
+evalúan sobre todas las filas a la vez. La carga (`leer_evaluaciones_excel` y
+`utils.ingesta.armar_version`) agrega las columnas al armar cada versión del
+dataset, después del control de calidad y solo sobre las hojas releídas: las
+vistas, z-scores, LSI, gráficos y el PDF las leen como cualquier columna del
+registro, sin recalcularlas.
+"""
+
+import ast
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from config.metricas import metricas_derivadas, obtener_metrica
+
+# Funciones permitidas; min/max (np.fmin/np.fmax) devuelven el otro valor si uno es NaN
+FUNCIONES_EXPRESION = {"abs": np.abs, "min": np.fmin, "max": np.fmax}
+
+_NODOS_PERMITIDOS = (
+	ast.Expression, ast.BinOp, ast.UnaryOp, ast.Constant, ast.Name, ast.Load, ast.Call,
+	ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow, ast.USub, ast.UAdd
+)
+_CITA = re.compile(r"`([^`]+)`")
+_PREFIJO_VARIABLE = "_v"
+
+
+@dataclass(frozen=True)
+class ExpresionCompilada:
+	"""Expresión validada y compilada: variable `_v<i>` = i-ésimo nombre citado"""
+	texto: str
+	codigo: object
+	nombres: tuple
+
+	def evaluar(self, valores):
+		"""
+		Args:
+			valores: Un array float64 por nombre citado, en el orden de `nombres`
+
+		Returns:
+			Resultado de la expresión (array, o escalar si no cita nombres)
+		"""
+		variables = {f"{_PREFIJO_VARIABLE}{i}": valor for i, valor in enumerate(valores)}
+		return eval(self.codigo, {"__builtins__": {}, **FUNCIONES_EXPRESION}, variables)
+
+
+class _Nombres(ast.NodeTransformer):
+	"""Reemplaza cada nombre citado sin comillas por su variable"""
+
+	def __init__(self, nombres):
+		self.nombres = nombres
+
+	def visit_Call(self, nodo):
+		nodo.args = [self.visit(argumento) for argumento in nodo.args]
+		return nodo
+
+	def visit_Name(self, nodo):
+		if not nodo.id.startswith(_PREFIJO_VARIABLE):
+			nodo.id = _variable(self.nombres, nodo.id)
+		return nodo
+
+
+def _variable(nombres, nombre):
+	if nombre not in nombres:
+		nombres.append(nombre)
+	return f"{_PREFIJO_VARIABLE}{nombres.index(nombre)}"
+
+
+@lru_cache(maxsize=None)
+def compilar_expresion(texto):
+	"""
+	Valida y compila una expresión (una vez por texto)
+
+	Lanza ValueError si la expresión no se puede interpretar o usa algo más que
+	números, nombres, operadores aritméticos y FUNCIONES_EXPRESION.
+	"""
+	nombres = []
+	fuente = _CITA.sub(lambda cita: _variable(nombres, cita.group(1).strip()), texto)
+	try:
+		arbol = ast.parse(fuente.strip(), mode="eval")
+	except SyntaxError as e:
+		raise ValueError(f"Expresión inválida '{texto}': {e.msg}") from e
+
+	for nodo in ast.walk(arbol):
+		if not isinstance(nodo, _NODOS_PERMITIDOS):
+			raise ValueError(f"Expresión inválida '{texto}': no se permite {type(nodo).__name__}")
+		if isinstance(nodo, ast.Constant) and (isinstance(nodo.value, bool) or not isinstance(nodo.value, (int, float))):
+			raise ValueError(f"Expresión inválida '{texto}': constante {nodo.value!r}")
+		if isinstance(nodo, ast.Call) and (
+			not isinstance(nodo.func, ast.Name) or nodo.func.id not in FUNCIONES_EXPRESION or nodo.keywords
+		):
+			raise ValueError(f"Expresión inválida '{texto}': solo se permiten {', '.join(FUNCIONES_EXPRESION)}")
+
+	arbol = ast.fix_missing_locations(_Nombres(nombres).visit(arbol))
+	return ExpresionCompilada(texto, compile(arbol, f"<{texto}>", "eval"), tuple(nombres))
+
+
+@dataclass(frozen=True)
+class ColumnaDerivada:
+	"""Una columna de una métrica derivada (un lado o el total) con sus columnas de entrada"""
+	metrica: str
+	columna: str
+	expresion: ExpresionCompilada
+	entradas: tuple
+	tipo: str
+
+
+def _columna_citada(nombre, lado, metrica):
+	"""Columna del dataset que aporta `nombre` en el lado ("der", "izq" o "total")"""
+	try:
+		citada = obtener_metrica(nombre)
+	except KeyError:
+		return nombre
+	if not citada.bilateral:
+		return citada.total
+	if lado == "total":
+		raise ValueError(
+			f"La métrica total '{metrica}' cita la bilateral '{nombre}': usar su columna DER o IZQ"
+		)
+	return getattr(citada, lado)
+
+
+@lru_cache(maxsize=1)
+def compilar_derivadas():
+	"""
+	Columnas derivadas del registro, compiladas y resueltas a columnas del dataset
+
+	Se arma una sola vez: las entradas no dependen del DataFrame (una columna que
+	falta se evalúa como NaN). Van en el orden del registro, así una derivada puede
+	citar a otra definida antes.
+
+	Returns:
+		Tupla de ColumnaDerivada
+	"""
+	columnas = []
+	for metrica in metricas_derivadas():
+		expresion = compilar_expresion(metrica.expresion)
+		lados = (("der", metrica.der), ("izq", metrica.izq)) if metrica.bilateral else (("total", metrica.total),)
+		for lado, columna in lados:
+			entradas = tuple(_columna_citada(nombre, lado, metrica.clave) for nombre in expresion.nombres)
+			columnas.append(ColumnaDerivada(metrica.clave, columna, expresion, entradas, metrica.tipo))
+	return tuple(columnas)
+
+
+def _valores_columna(df, calculadas, columna):
+	if columna in calculadas:
+		return calculadas[columna]
+	if columna not in df.columns:
+		return np.full(len(df), np.nan)
+	return pd.to_numeric(df[columna], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+
+def calcular_derivadas(df):
+	"""
+	Valores de todas las columnas derivadas del registro para las filas de `df`
+
+	Returns:
+		{columna: array float64} (NaN si falta una entrada o el resultado no es finito)
+	"""
+	calculadas = {}
+	with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+		for derivada in compilar_derivadas():
+			entradas = [_valores_columna(df, calculadas, columna) for columna in derivada.entradas]
+			resultado = np.broadcast_to(np.asarray(derivada.expresion.evaluar(entradas), dtype=float), (len(df),))
+			calculadas[derivada.columna] = np.where(np.isfinite(resultado), resultado, np.nan)
+	return calculadas
+
+
+def agregar_derivadas(df):
+	"""DataFrame con las columnas derivadas del registro (reemplaza las que ya tuviera)"""
+	tipos = {derivada.columna: derivada.tipo for derivada in compilar_derivadas()}
+	if not tipos:
+		return df
+	calculadas = calcular_derivadas(df)
+	return df.assign(**{columna: valores.astype(tipos[columna]) for columna, valores in calculadas.items()})
@@ -0,0 +1,116 @@
+"""
+Descarga del Excel de evaluaciones desde Google Drive a disco
+
+`request.execute()` devuelve el archivo entero como bytes y envolverlo en un
+BytesIO para leerlo dejaba dos copias completas en memoria. Aquí el archivo se
+descarga por bloques (MediaIoBaseDownload, un pedido HTTP con Range por bloque)
+directo a un archivo en DRIVE_DESCARGAS_DIR:
+
+- cada bloque se reintenta con backoff exponencial y, si aun así falla, la
+  descarga se retoma desde el último byte escrito (no desde el principio),
+- el archivo se escribe como `.parcial` y se renombra al terminar, así nunca se
+  lee un Excel a medio descargar,
+- si los metadatos del archivo (md5, tamaño, fecha) no cambiaron desde la
+  última descarga, no se descarga de nuevo.
+
+El archivo local se lee con la ingesta incremental (utils.ingesta), igual que
+el Excel local: al subir una versión nueva a Drive solo se parsean las hojas que
+cambiaron.
+"""
+
+import json
+import os
+import threading
+import time
+
+import httplib2
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload
+
+from config.settings import DRIVE_DESCARGAS_DIR, DRIVE_TAMANO_BLOQUE, DRIVE_REINTENTOS
+
+# Campos de files().get que identifican una versión del archivo
+CAMPOS_VERSION_DRIVE = "md5Checksum,size,modifiedTime"
+
+# Una descarga a la vez por archivo (las sesiones comparten el archivo local)
+_LOCKS_DESCARGA = {}
+_LOCK_REGISTRO = threading.Lock()
+
+
+def ruta_local_drive(file_id):
+	"""Ruta del archivo descargado de Drive"""
+	return os.path.join(DRIVE_DESCARGAS_DIR, f"{file_id}.xlsx")
+
+
+def _reintentable(error):
+	"""Errores de red y HTTP 429/5xx: se puede retomar; 4xx (permisos, no existe): no"""
+	if isinstance(error, HttpError):
+		return error.resp.status == 429 or error.resp.status >= 500
+	return True
+
+
+def descargar_por_bloques(request, destino, tamano_bloque=DRIVE_TAMANO_BLOQUE, reintentos=DRIVE_REINTENTOS):
+	"""
+	Descarga un pedido de medios (files().get_media) a disco por bloques
+
+	Args:
+		request: HttpRequest de `files().get_media(fileId=...)`
+		destino: Ruta final del archivo
+		tamano_bloque: Bytes por pedido (en memoria hay un bloque a la vez)
+		reintentos: Reintentos por bloque (backoff de la librería) y reanudaciones
+			de la descarga cuando un bloque agota sus reintentos
+
+	Returns:
+		Bytes descargados
+	"""
+	parcial = f"{destino}.parcial"
+	with open(parcial, "wb") as archivo:
+		descarga = MediaIoBaseDownload(archivo, request, chunksize=tamano_bloque)
+		terminado, fallos = False, 0
+		while not terminado:
+			try:
+				progreso, terminado = descarga.next_chunk(num_retries=reintentos)
+				fallos = 0
+			except (HttpError, httplib2.HttpLib2Error, OSError) as e:
+				# MediaIoBaseDownload solo escribe bloques completos: se retoma desde su progreso
+				fallos += 1
+				if fallos > reintentos or not _reintentable(e):
+					raise
+				time.sleep(min(2 ** fallos, 30))
+	os.replace(parcial, destino)
+	return progreso.resumable_progress if progreso is not None else os.path.getsize(destino)
+
+
+def _leer_metadatos(ruta):
+	try:
+		with open(ruta, encoding="utf-8") as archivo:
+			return json.load(archivo)
+	except (OSError, ValueError):
+		return None
+
+
+def sincronizar_archivo_drive(service, file_id):
+	"""
+	Deja en disco la versión actual del archivo de Drive (descarga solo si cambió)
+
+	Args:
+		service: Cliente de la API de Drive v3 (`googleapiclient.discovery.build`)
+		file_id: Identificador del archivo
+
+	Returns:
+		(ruta local, True si se descargó una versión nueva)
+	"""
+	destino = ruta_local_drive(file_id)
+	with _LOCK_REGISTRO:
+		lock = _LOCKS_DESCARGA.setdefault(file_id, threading.Lock())
+	with lock:
+		metadatos = service.files().get(fileId=file_id, fields=CAMPOS_VERSION_DRIVE).execute(num_retries=DRIVE_REINTENTOS)
+		ruta_metadatos = f"{destino}.json"
+		if os.path.exists(destino) and _leer_metadatos(ruta_metadatos) == metadatos:
+			return destino, False
+
+		os.makedirs(DRIVE_DESCARGAS_DIR, exist_ok=True)
+		descargar_por_bloques(service.files().get_media(fileId=file_id), destino)
+		with open(ruta_metadatos, "w", encoding="utf-8") as archivo:
+			json.dump(metadatos, archivo)
+		return destino, True
@@ -0,0 +1,210 @@
+"""
+Versiones del esquema de las hojas de evaluación y su migración al formato actual
+
+El Excel cambió de encabezados ("CUAD 70° Der", "ISQ Wollin Der", "IMTP F. Der (N)",
+"Deportista", ... → "CUAD DER (N)", "WOLLIN DER", "F PICO DER (IMTP) (N)",
+"JUGADOR", ...; ver MAPEO_COLUMNAS_NUEVA_EVALUACION). Al leer cada hoja se
+identifica su esquema por la huella del encabezado y se aplica un plan de
+migración compilado una sola vez por huella: posiciones de las columnas a
+conservar, en el orden de la hoja "EVALUACION 2910", y sus nombres actuales.
+Aplicarlo es un `iloc` más `set_axis` (sin revisar columna por columna), así
+que hojas de ambos formatos se concatenan en un único historial.
+
+Después de concatenar, `aplicar_tipos` guarda cada columna con el dtype del plan
+(float32 para las métricas del registro, categórico para las columnas de
+identidad) y `reporte_memoria` compara el consumo antes y después. El float32 es
+solo de almacenamiento: la fila de un jugador pasa por `precision_calculo` y las
+columnas que se reducen (medias, SD) por `valores_calculo` al calcular cada
+estadística, así se calculan en float64 y un 926.7 no se muestra como 926.700012.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from config.metricas import REGISTRO_METRICAS
+from config.settings import MAPEO_COLUMNAS_NUEVA_EVALUACION
+
+# Columnas de la hoja "EVALUACION 2910" (esquema actual), en su orden
+COLUMNAS_EVALUACION = [
+	"FECHA", "JUGADOR",
+	"AKE DER", "AKE IZQ", "THOMAS DER", "THOMAS IZQ", "LUNGE DER", "LUNGE IZQ",
+	"CUAD DER (N)", "CUAD IZQ (N)", "WOLLIN DER", "WOLLIN IZQ",
+	"F PICO (IMTP) (N)", "F PICO DER (IMTP) (N)", "F PICO IZQ (IMTP) (N)",
+	"FP (CMJ) (N)", "FP DER (CMJ) (N)", "FP IZQ (CMJ) (N)",
+	"FF (CMJ) (N)", "FF DER (CMJ) (N)", "FF IZQ (CMJ) (N)",
+	"TRIPLE SALTO DER", "TRIPLE SALTO IZQ"
+]
+
+# Versión → descripción. La versión se detecta por los encabezados propios de cada formato.
+VERSIONES_ESQUEMA = {
+	1: "Formato anterior (CUAD 70°, ISQ Wollin, IMTP F., CMJ F., Deportista)",
+	2: "EVALUACION 2910",
+}
+VERSION_ACTUAL = max(VERSIONES_ESQUEMA)
+
+_ORDEN_ACTUAL = {columna: i for i, columna in enumerate(COLUMNAS_EVALUACION)}
+
+
+@dataclass(frozen=True)
+class PlanMigracion:
+	"""Migración compilada de un encabezado concreto al esquema actual"""
+	version: int
+	huella: str
+	posiciones: np.ndarray
+	nombres: tuple
+	identidad: bool
+
+	def aplicar(self, df):
+		"""DataFrame con las columnas renombradas y ordenadas según el esquema actual"""
+		if self.identidad:
+			return df
+		return df.iloc[:, self.posiciones].set_axis(list(self.nombres), axis=1)
+
+
+def huella_encabezado(columnas):
+	"""Huella (SHA-1 corta) del encabezado: mismo texto y orden → misma huella"""
+	return hashlib.sha1("\x1f".join(map(str, columnas)).encode("utf-8")).hexdigest()[:12]
+
+
+def detectar_version(columnas):
+	"""Versión del esquema de la hoja (1 si aparece algún encabezado del formato anterior)"""
+	anteriores = set(MAPEO_COLUMNAS_NUEVA_EVALUACION)
+	return 1 if any(columna in anteriores for columna in columnas) else VERSION_ACTUAL
+
+
+@lru_cache(maxsize=64)
+def compilar_plan(columnas):
+	"""
+	Plan de migración de un encabezado (se compila una vez por huella)
+
+	Las columnas del formato anterior se renombran con MAPEO_COLUMNAS_NUEVA_EVALUACION;
+	si la hoja ya trae también la columna nueva se conserva la nueva. Las columnas del
+	esquema actual quedan en el orden de "EVALUACION 2910" y las demás (por ejemplo,
+	CATEGORIA) al final, en su orden original.
+
+	Args:
+		columnas: Tupla con los encabezados de la hoja
+
+	Returns:
+		PlanMigracion
+	"""
+	version = detectar_version(columnas)
+	presentes = set(columnas)
+	conservadas = []
+	for posicion, columna in enumerate(columnas):
+		nombre = MAPEO_COLUMNAS_NUEVA_EVALUACION.get(columna, columna) if version < VERSION_ACTUAL else columna
+		if nombre != columna and nombre in presentes:
+			continue
+		conservadas.append((_ORDEN_ACTUAL.get(nombre, len(_ORDEN_ACTUAL)), posicion, nombre))
+	conservadas.sort(key=lambda item: (item[0], item[1]))
+
+	posiciones = np.array([posicion for _, posicion, _ in conservadas], dtype=np.intp)
+	nombres = tuple(nombre for _, _, nombre in conservadas)
+	return PlanMigracion(
+		version=version,
+		huella=huella_encabezado(columnas),
+		posiciones=posiciones,
+		nombres=nombres,
+		identidad=nombres == tuple(columnas)
+	)
+
+
+def migrar_esquema(df):
+	"""Lleva una hoja de evaluación (de cualquier versión) al esquema actual"""
+	return compilar_plan(tuple(df.columns)).aplicar(df)
+
+
+# Columnas de identidad: pocos valores distintos que se repiten en todas las sesiones
+COLUMNAS_CATEGORICAS = ("categoria", "CATEGORIA", "Deportista", "JUGADOR")
+
+
+def plan_tipos():
+	"""{columna: dtype} de las métricas del registro y de las columnas de identidad"""
+	tipos = {
+		columna: metrica.tipo
+		for metrica in REGISTRO_METRICAS
+		for columna in metrica.columnas
+	}
+	tipos.update({columna: "category" for columna in COLUMNAS_CATEGORICAS})
+	return tipos
+
+
+def _convertir(serie, tipo):
+	if tipo == "category":
+		return serie.astype("category")
+	return pd.to_numeric(serie, errors="coerce").astype(tipo)
+
+
+def aplicar_tipos(df):
+	"""
+	Convierte las columnas presentes al dtype del plan (las demás quedan como se leyeron)
+
+	Los textos en columnas de métricas (por ejemplo, "-") pasan a NaN, igual que el
+	`pd.to_numeric(errors='coerce')` que aplican los cálculos.
+	"""
+	convertidas = {
+		columna: _convertir(df[columna], tipo)
+		for columna, tipo in plan_tipos().items()
+		if columna in df.columns and str(df[columna].dtype) != tipo
+	}
+	return df.assign(**convertidas) if convertidas else df
+
+
+def precision_calculo(fila):
+	"""
+	Fila de un jugador con las métricas float32 en float64
+
+	Args:
+		fila: Series (fila de un jugador de la partición)
+
+	Returns:
+		Series; sin copiar si no hay valores float32
+	"""
+	if fila.dtype == np.float32:
+		return fila.astype(np.float64)
+	if fila.dtype == object:
+		return fila.map(lambda valor: float(valor) if isinstance(valor, np.float32) else valor)
+	return fila
+
+
+def valores_calculo(valores):
+	"""
+	Valores a reducir (media, SD, mínimo, ...) como número en float64
+
+	Se aplica solo a las columnas que se promedian y en el punto donde se calcula
+	la estadística: las columnas de la categoría que no se reducen no se
+	convierten.
+
+	Args:
+		valores: Series o DataFrame con las columnas a reducir (o una lista de valores)
+
+	Returns:
+		Mismo tipo en float64; NaN donde el valor no es numérico
+	"""
+	if isinstance(valores, pd.DataFrame):
+		return valores.apply(pd.to_numeric, errors='coerce').astype(np.float64)
+	return pd.to_numeric(valores, errors='coerce').astype(np.float64)
+
+
+def reporte_memoria(antes, despues):
+	"""
+	Memoria por columna (bytes, incluyendo textos) antes y después del plan de tipos
+
+	Returns:
+		DataFrame con dtype y KB antes/después por columna y una fila TOTAL
+	"""
+	kb_antes = antes.memory_usage(deep=True, index=False) / 1024
+	kb_despues = despues.memory_usage(deep=True, index=False) / 1024
+	reporte = pd.DataFrame({
+		"dtype_antes": antes.dtypes.astype(str),
+		"dtype_despues": despues.dtypes.astype(str).reindex(antes.columns),
+		"kb_antes": kb_antes,
+		"kb_despues": kb_despues.reindex(antes.columns),
+	})
+	reporte.loc["TOTAL"] = ["", "", kb_antes.sum(), kb_despues.sum()]
+	reporte["reduccion_%"] = (1 - reporte["kb_despues"].astype(float) / reporte["kb_antes"].astype(float)) * 100
+	return reporte
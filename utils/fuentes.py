@@ -0,0 +1,296 @@
+"""
+Varias planillas de evaluación (un archivo por plantel) como un único dataset
+
+Cada cuerpo técnico mantiene su propio libro (Primer Equipo, Reserva,
+inferiores). Un manifiesto lista esos archivos y la categoría de cada uno:
+
+	{"fuentes": [
+		{"nombre": "Primer Equipo", "categoria": "Evaluacion_2910", "drive_file_id": "1AbC..."},
+		{"nombre": "Reserva", "categoria": "Reserva", "drive_file_id": "1XyZ..."},
+		{"nombre": "4ta", "categoria": "4ta", "ruta": "data/4ta.xlsx"}
+	]}
+
+En lugar del JSON se puede indicar una carpeta: cada .xlsx es una fuente y su
+categoría es el nombre del archivo (reemplazo local de los archivos de Drive para
+probar sin red).
+
+La carga no suma los tiempos de cada archivo:
+
+- los archivos se traen en paralelo con un pool de hilos (descarga de Drive con
+  utils.drive; los locales solo se revisan),
+- cada archivo nuevo o modificado se parsea en un proceso del pool de lectura
+  apenas termina de bajar (openpyxl es Python puro y en hilos se serializaría),
+- los resultados se unen con `armar_version` de utils.ingesta, igual que las
+  hojas de un libro: los archivos que no cambiaron no se vuelven a leer y el
+  historial conserva las fotos y resultados de las categorías no afectadas.
+
+Las filas de un archivo sin columna CATEGORIA toman la categoría de su fuente,
+así que `agrupar_por_categoria` y la partición por categoría funcionan igual que
+con un único libro.
+"""
+
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
+
+from config.settings import PROCESOS_LECTURA_FUENTES
+from utils.drive import ruta_local_drive, sincronizar_archivo_drive
+from utils.data_utils import leer_evaluaciones_excel, preparar_evaluaciones
+from utils.ingesta import (
+	IngestaIncremental, CambiosIngesta, armar_version, ingesta_compartida
+)
+
+
+@dataclass(frozen=True)
+class Fuente:
+	"""Un archivo del manifiesto"""
+	nombre: str
+	categoria: str
+	ruta: str = None
+	drive_file_id: str = None
+
+
+def fuentes_directorio(directorio):
+	"""Fuentes de una carpeta: un .xlsx por categoría, con el nombre del archivo como categoría"""
+	fuentes = []
+	for archivo in sorted(os.listdir(directorio)):
+		nombre, extension = os.path.splitext(archivo)
+		# "~$..." son los bloqueos que deja Excel mientras el libro está abierto
+		if extension.lower() == ".xlsx" and not archivo.startswith("~$"):
+			fuentes.append(Fuente(nombre, nombre, ruta=os.path.join(directorio, archivo)))
+	return fuentes
+
+
+def _fuente(entrada, base):
+	"""Fuente de una entrada del manifiesto (rutas relativas a la carpeta del manifiesto)"""
+	nombre = entrada.get("nombre") or entrada.get("categoria")
+	if not nombre:
+		raise ValueError(f"Fuente sin 'nombre' ni 'categoria' en el manifiesto: {entrada}")
+	ruta, file_id = entrada.get("ruta"), entrada.get("drive_file_id")
+	if bool(ruta) == bool(file_id):
+		raise ValueError(f"La fuente '{nombre}' debe tener 'ruta' o 'drive_file_id' (uno solo)")
+	if ruta and not os.path.isabs(ruta):
+		ruta = os.path.join(base, ruta)
+	return Fuente(nombre, entrada.get("categoria") or nombre, ruta=ruta, drive_file_id=file_id)
+
+
+def fuentes_manifiesto(origen):
+	"""
+	Lista de fuentes de un manifiesto
+
+	Args:
+		origen: Ruta de un manifiesto JSON, carpeta con un .xlsx por categoría, o el
+			contenido del manifiesto ya leído (dict con "fuentes" o lista de entradas,
+			por ejemplo desde st.secrets)
+
+	Returns:
+		Lista de Fuente en el orden del manifiesto
+	"""
+	base = os.getcwd()
+	if isinstance(origen, (str, os.PathLike)):
+		if os.path.isdir(origen):
+			fuentes = fuentes_directorio(origen)
+			if not fuentes:
+				raise ValueError(f"No hay archivos .xlsx en la carpeta: {origen}")
+			return fuentes
+		if not os.path.exists(origen):
+			raise FileNotFoundError(f"No se encontró el manifiesto de fuentes en: {origen}")
+		with open(origen, encoding="utf-8") as archivo:
+			contenido = json.load(archivo)
+		base = os.path.dirname(os.path.abspath(origen))
+	else:
+		contenido = origen
+
+	entradas = contenido.get("fuentes", []) if isinstance(contenido, dict) else contenido
+	fuentes = [_fuente(dict(entrada), base) for entrada in entradas]
+	if not fuentes:
+		raise ValueError("El manifiesto no tiene fuentes")
+	nombres = [fuente.nombre for fuente in fuentes]
+	if len(set(nombres)) != len(nombres):
+		raise ValueError(f"Nombres de fuente repetidos en el manifiesto: {nombres}")
+	return fuentes
+
+
+def leer_fuente(ruta, categoria):
+	"""
+	Lee un archivo del manifiesto (corre en un proceso del pool de lectura)
+
+	Las filas sin CATEGORIA toman la categoría de la fuente; el resultado ya tiene
+	el plan de tipos aplicado (se devuelve al proceso principal compacto).
+	"""
+	# El control de calidad y las métricas derivadas se aplican al unir (armar_version), donde queda su reporte
+	df = leer_evaluaciones_excel(ruta, tipos_compactos=False, control_calidad=False, metricas_derivadas=False)
+	if "CATEGORIA" in df.columns:
+		df["CATEGORIA"] = df["CATEGORIA"].astype(object).fillna(categoria)
+	else:
+		df["CATEGORIA"] = categoria
+	return preparar_evaluaciones(df)
+
+
+# Pool de procesos de lectura, compartido y creado al primer uso (arrancarlo cuesta más que leer un libro chico)
+_POOL_LECTURA = None
+_LOCK_POOL = threading.Lock()
+
+
+def _contexto_procesos():
+	"""forkserver (con los módulos de lectura ya importados) donde exista; si no, spawn"""
+	if "forkserver" in multiprocessing.get_all_start_methods():
+		contexto = multiprocessing.get_context("forkserver")
+		contexto.set_forkserver_preload([__name__])
+		return contexto
+	return multiprocessing.get_context("spawn")
+
+
+def procesos_lectura():
+	"""Procesos del pool de lectura (PROCESOS_LECTURA_FUENTES, o uno por núcleo)"""
+	return PROCESOS_LECTURA_FUENTES or os.cpu_count() or 1
+
+
+def _pool_lectura():
+	global _POOL_LECTURA
+	with _LOCK_POOL:
+		if _POOL_LECTURA is None:
+			_POOL_LECTURA = ProcessPoolExecutor(max_workers=procesos_lectura(), mp_context=_contexto_procesos())
+		return _POOL_LECTURA
+
+
+def _descartar_pool():
+	global _POOL_LECTURA
+	with _LOCK_POOL:
+		if _POOL_LECTURA is not None:
+			_POOL_LECTURA.shutdown(wait=False, cancel_futures=True)
+		_POOL_LECTURA = None
+
+
+def _huella_archivo(ruta):
+	estado = os.stat(ruta)
+	return (estado.st_mtime_ns, estado.st_size)
+
+
+def _sin_cambios():
+	return CambiosIngesta((), (), (), 0, 0, frozenset(), frozenset())
+
+
+class IngestaFuentes(IngestaIncremental):
+	"""Dataset de varios archivos de un manifiesto que se actualiza releyendo solo los que cambiaron"""
+
+	def __init__(self, origen, crear_servicio=None, clave=None):
+		"""
+		Args:
+			origen: Manifiesto (ver `fuentes_manifiesto`)
+			crear_servicio: Función sin argumentos que devuelve un cliente de la API de
+				Drive v3; se llama una vez por descarga (el cliente no es seguro entre hilos).
+				Solo hace falta si hay fuentes con drive_file_id
+			clave: Nombre de la ingesta (por defecto, el origen)
+		"""
+		super().__init__(clave or str(origen))
+		self.origen = origen
+		self.crear_servicio = crear_servicio
+
+	def _ruta_fuente(self, fuente, descargar=True):
+		"""Ruta local del archivo de la fuente (con `descargar`, trae la versión actual de Drive)"""
+		if fuente.ruta is not None:
+			if not os.path.exists(fuente.ruta):
+				raise FileNotFoundError(f"No se encontró el archivo de la fuente '{fuente.nombre}': {fuente.ruta}")
+			return fuente.ruta
+		if not descargar:
+			return ruta_local_drive(fuente.drive_file_id)
+		if self.crear_servicio is None:
+			raise ValueError(f"La fuente '{fuente.nombre}' está en Drive y no hay credenciales configuradas")
+		ruta, _ = sincronizar_archivo_drive(self.crear_servicio(), fuente.drive_file_id)
+		return ruta
+
+	def _firma_archivo(self):
+		# Para el vigilante: solo archivos en disco (las fuentes de Drive, su última descarga)
+		return tuple(
+			(fuente.nombre, _huella_archivo(self._ruta_fuente(fuente, descargar=False)))
+			for fuente in fuentes_manifiesto(self.origen)
+		)
+
+	def actualizar(self):
+		"""
+		Trae todas las fuentes en paralelo, relee las que cambiaron y publica la versión nueva
+
+		Cada archivo nuevo o modificado se parsea en el pool de procesos apenas se
+		descarga, mientras los demás siguen bajando. Con una sola fuente o un solo
+		proceso de lectura (PROCESOS_LECTURA_FUENTES = 1, o un núcleo) se lee en los
+		hilos del proceso actual.
+
+		Returns:
+			CambiosIngesta (hojas_* son nombres de fuente; falso si no hubo cambios)
+		"""
+		with self._lock:
+			anterior = self._actual
+			fuentes = fuentes_manifiesto(self.origen)
+			en_procesos = len(fuentes) > 1 and procesos_lectura() > 1
+			huellas, lecturas = {}, {}
+			try:
+				with ThreadPoolExecutor(max_workers=len(fuentes), thread_name_prefix="fuente") as hilos:
+					descargas = {hilos.submit(self._ruta_fuente, fuente): fuente for fuente in fuentes}
+					for descarga in as_completed(descargas):
+						fuente = descargas[descarga]
+						ruta = descarga.result()
+						huellas[fuente.nombre] = _huella_archivo(ruta)
+						if fuente.nombre in anterior.hojas and anterior.hojas[fuente.nombre].huella == huellas[fuente.nombre]:
+							continue
+						if en_procesos:
+							lecturas[fuente.nombre] = _pool_lectura().submit(leer_fuente, ruta, fuente.categoria)
+						else:
+							lecturas[fuente.nombre] = hilos.submit(leer_fuente, ruta, fuente.categoria)
+				leidas = {}
+				for nombre, lectura in lecturas.items():
+					try:
+						leidas[nombre] = lectura.result()
+					except BrokenProcessPool:
+						raise
+					except Exception as e:
+						raise ValueError(f"Error al leer la fuente '{nombre}': {e}") from e
+			except BrokenProcessPool:
+				# Un proceso murió (memoria, señal): el próximo intento arranca un pool nuevo
+				_descartar_pool()
+				raise
+
+			nombres = [fuente.nombre for fuente in fuentes]
+			firma = tuple((nombre, huellas[nombre]) for nombre in nombres)
+			eliminadas = tuple(nombre for nombre in anterior.hojas if nombre not in huellas)
+			if not leidas and not eliminadas:
+				if anterior.firma != firma:
+					self._actual = replace(anterior, firma=firma)
+				return _sin_cambios()
+
+			nueva, cambios = armar_version(anterior, nombres, huellas, leidas, eliminadas)
+			nueva.firma = firma
+			# Publicación atómica: quien lea `_actual` ve la versión anterior o la nueva completa
+			self._actual = nueva
+			return cambios
+
+
+def clave_fuentes(origen):
+	"""Clave de registro del manifiesto (ruta absoluta, o su contenido si vino de st.secrets)"""
+	if isinstance(origen, (str, os.PathLike)):
+		return f"fuentes:{os.path.abspath(origen)}"
+	return f"fuentes:{json.dumps(origen, sort_keys=True, default=str)}"
+
+
+def obtener_fuentes(origen, crear_servicio=None, vigilar=0):
+	"""
+	IngestaFuentes del manifiesto (una por manifiesto y proceso, compartida entre sesiones)
+
+	Args:
+		origen: Manifiesto (ver `fuentes_manifiesto`)
+		crear_servicio: Fábrica del cliente de Drive (solo para fuentes con drive_file_id)
+		vigilar: Segundos entre revisiones de los archivos en disco (0 = sin hilo)
+	"""
+	clave = clave_fuentes(origen)
+	return ingesta_compartida(clave, lambda: IngestaFuentes(origen, crear_servicio, clave), vigilar)
+
+
+def leer_fuentes(origen, crear_servicio=None):
+	"""Lee todas las fuentes de un manifiesto sin Streamlit (CLI); devuelve el dataset unido"""
+	ingesta = IngestaFuentes(origen, crear_servicio)
+	ingesta.actualizar()
+	return ingesta.df
@@ -0,0 +1,431 @@
+"""
+Ingesta incremental del Excel de evaluaciones
+
+Cada día de evaluación agrega una hoja "EVALUACION <ddmm>" (o filas al final de
+una hoja existente) y antes eso obligaba a releer el libro completo y a tirar
+todas las cachés. Un .xlsx es un zip con un XML por hoja y el directorio del zip
+trae el CRC de cada parte, así que sin descomprimir nada se sabe qué hojas
+cambiaron desde la última lectura:
+
+- solo se leen las hojas nuevas o con CRC distinto (las sesiones anteriores no se
+  vuelven a parsear),
+- las filas de una hoja releída se comparan por hash con las que ya estaban: las
+  que no cambiaron no cuentan como afectadas,
+- el dataset nuevo es el anterior con las filas de esas hojas reemplazadas, y el
+  historial (utils.longitudinal) reutiliza las fotos previas a la primera fecha
+  afectada y los resultados de las categorías que no cambiaron.
+
+Una instancia por archivo (`obtener_ingesta`) se comparte entre sesiones de la
+app; `actualizar` es barato si el archivo no cambió (un `os.stat`). Con
+`vigilar` un hilo revisa el archivo periódicamente, lee los cambios en segundo
+plano y publica la versión nueva de una sola vez (VersionDataset): las sesiones
+la toman en su siguiente ejecución sin esperar la lectura.
+"""
+
+import os
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+import pandas as pd
+
+from utils.calidad import depurar_evaluaciones, validar_evaluaciones, detectar_inversiones, combinar_calidad
+from utils.derivadas import agregar_derivadas
+from utils.data_utils import (
+	hojas_evaluacion, leer_hoja_evaluacion, preparar_evaluaciones, mascara_filas_jugador, PREFIJO_HOJA_EVALUACION
+)
+
+_NS_LIBRO = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_NS_RELACION = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+
+
+@dataclass(frozen=True)
+class EstadoHoja:
+	"""Hoja leída: huella de su XML y filas que ocupa en el dataset"""
+	huella: tuple
+	inicio: int
+	fin: int
+
+
+@dataclass(frozen=True)
+class CambiosIngesta:
+	"""Resultado de una actualización: qué hojas se leyeron y qué quedó afectado"""
+	hojas_nuevas: tuple
+	hojas_modificadas: tuple
+	hojas_eliminadas: tuple
+	filas_agregadas: int
+	filas_eliminadas: int
+	categorias: frozenset
+	fechas: frozenset
+
+	def __bool__(self):
+		return bool(self.hojas_nuevas or self.hojas_modificadas or self.hojas_eliminadas)
+
+
+def huellas_hojas(ruta):
+	"""
+	{hoja: (CRC32, tamaño)} del XML de cada hoja, leídos del directorio del .xlsx
+
+	No descomprime las hojas: solo lee xl/workbook.xml y sus relaciones para saber
+	qué parte del zip corresponde a cada nombre de hoja.
+	"""
+	with zipfile.ZipFile(ruta) as libro:
+		partes = {info.filename: (info.CRC, info.file_size) for info in libro.infolist()}
+		relaciones = ET.fromstring(libro.read("xl/_rels/workbook.xml.rels"))
+		destinos = {relacion.get("Id"): relacion.get("Target") for relacion in relaciones}
+		huellas = {}
+		for hoja in ET.fromstring(libro.read("xl/workbook.xml")).iter(f"{_NS_LIBRO}sheet"):
+			destino = destinos.get(hoja.get(f"{_NS_RELACION}id"), "")
+			parte = destino.lstrip("/") if destino.startswith("/") else f"xl/{destino}"
+			huellas[hoja.get("name")] = partes.get(parte)
+	return huellas
+
+
+def _filas_distintas(antes, despues):
+	"""Máscaras de filas de `antes` y `despues` sin una fila idéntica del otro lado (hash por fila)"""
+	columnas = list(dict.fromkeys([*antes.columns, *despues.columns]))
+	hash_antes = pd.util.hash_pandas_object(antes.reindex(columns=columnas), index=False).to_numpy()
+	hash_despues = pd.util.hash_pandas_object(despues.reindex(columns=columnas), index=False).to_numpy()
+	return ~np.isin(hash_antes, hash_despues), ~np.isin(hash_despues, hash_antes)
+
+
+@dataclass
+class VersionDataset:
+	"""Versión publicada del dataset: se reemplaza entera, nunca se modifica en partes"""
+	numero: int
+	df: pd.DataFrame = None
+	hojas: dict = field(default_factory=dict)
+	firma: tuple = None
+	historial: object = None
+	# Control de calidad (utils.calidad) de cada parte al leerla y del dataset completo
+	calidad_partes: dict = field(default_factory=dict)
+	calidad: object = None
+
+	def filas_hoja(self, hoja):
+		"""Filas de la hoja dentro de `df`"""
+		estado = self.hojas[hoja]
+		return self.df.iloc[estado.inicio:estado.fin]
+
+
+class IngestaIncremental:
+	"""Dataset de un Excel local que se actualiza leyendo solo las hojas que cambiaron"""
+
+	def __init__(self, ruta):
+		"""
+		Args:
+			ruta: Ruta del .xlsx de evaluaciones
+		"""
+		self.ruta = ruta
+		self.ultimo_error = None
+		# Una actualización a la vez; los lectores solo leen `_actual` (asignación atómica)
+		self._lock = threading.Lock()
+		self._lock_historial = threading.Lock()
+		self._actual = VersionDataset(0)
+		self._vigilante = None
+		self._detener = threading.Event()
+
+	@property
+	def version(self):
+		"""Número de la versión publicada (0 antes de la primera lectura)"""
+		return self._actual.numero
+
+	@property
+	def df(self):
+		"""Dataset completo de la versión publicada (None antes de la primera lectura)"""
+		return self._actual.df
+
+	@property
+	def historial(self):
+		"""EvaluacionesLongitudinales de la versión publicada (se arma una vez por versión)"""
+		return self._historial_de(self._actual)
+
+	def historial_para(self, df):
+		"""Historial de la versión publicada si `df` es esa versión; None si no lo es"""
+		actual = self._actual
+		return self._historial_de(actual) if df is not None and df is actual.df else None
+
+	@property
+	def calidad(self):
+		"""ResultadoCalidad de la versión publicada (valores anulados y observaciones al leer)"""
+		return self._actual.calidad
+
+	def calidad_para(self, df):
+		"""Control de calidad de la versión publicada si `df` es esa versión; None si no lo es"""
+		actual = self._actual
+		return actual.calidad if df is not None and df is actual.df else None
+
+	def _historial_de(self, version):
+		from utils.longitudinal import EvaluacionesLongitudinales
+
+		if version.historial is None and version.df is not None:
+			with self._lock_historial:
+				if version.historial is None:
+					version.historial = EvaluacionesLongitudinales(version.df)
+		return version.historial
+
+	def _firma_archivo(self):
+		estado = os.stat(self.ruta)
+		return (estado.st_mtime_ns, estado.st_size)
+
+	def actualizar(self):
+		"""
+		Lee las hojas nuevas o modificadas desde la versión publicada y publica la nueva
+
+		La primera llamada lee el libro completo. Lanza FileNotFoundError si el
+		archivo no existe y ValueError si no tiene hojas de evaluación.
+
+		Returns:
+			CambiosIngesta (falso si no hubo cambios)
+		"""
+		if not os.path.exists(self.ruta):
+			raise FileNotFoundError(f"No se encontró el archivo Excel en: {self.ruta}")
+		with self._lock:
+			anterior = self._actual
+			firma = self._firma_archivo()
+			if firma == anterior.firma:
+				return CambiosIngesta((), (), (), 0, 0, frozenset(), frozenset())
+			nueva, cambios = self._leer_cambios(anterior, huellas_hojas(self.ruta))
+			nueva.firma = firma
+			# Publicación atómica: quien lea `_actual` ve la versión anterior o la nueva completa
+			self._actual = nueva
+			return cambios
+
+	def _leer_cambios(self, anterior, huellas):
+		hojas = hojas_evaluacion(huellas)
+		if not hojas:
+			raise ValueError(f"No hay hojas '{PREFIJO_HOJA_EVALUACION} ...' en el archivo")
+		releer = [hoja for hoja in hojas if anterior.hojas.get(hoja, EstadoHoja(None, 0, 0)).huella != huellas[hoja]]
+		eliminadas = tuple(hoja for hoja in anterior.hojas if hoja not in huellas)
+		if not releer and not eliminadas:
+			return replace(anterior, firma=None), CambiosIngesta((), (), (), 0, 0, frozenset(), frozenset())
+
+		with pd.ExcelFile(self.ruta, engine="openpyxl") as excel:
+			leidas = {hoja: preparar_evaluaciones(leer_hoja_evaluacion(excel, hoja)) for hoja in releer}
+		return armar_version(anterior, hojas, huellas, leidas, eliminadas)
+
+	# ===== VIGILANCIA EN SEGUNDO PLANO =====
+
+	@property
+	def vigilando(self):
+		"""True si hay un hilo vigilando el archivo"""
+		return self._vigilante is not None and self._vigilante.is_alive()
+
+	def iniciar_vigilancia(self, intervalo):
+		"""
+		Revisa el archivo cada `intervalo` segundos en un hilo y publica las versiones nuevas
+
+		Un cambio se lee cuando la firma del archivo (mtime, tamaño) se repite en dos
+		revisiones seguidas, para no leer un .xlsx a medio guardar. Si la lectura
+		falla (archivo abierto, zip incompleto) se conserva la versión publicada, el
+		error queda en `ultimo_error` y se reintenta en la revisión siguiente.
+		"""
+		if self.vigilando or intervalo <= 0:
+			return
+		self._detener.clear()
+		self._vigilante = threading.Thread(
+			target=self._vigilar, args=(intervalo,), name=f"vigilante-{os.path.basename(self.ruta)}", daemon=True
+		)
+		self._vigilante.start()
+
+	def detener_vigilancia(self):
+		"""Detiene el hilo de vigilancia (espera a que termine la revisión en curso)"""
+		self._detener.set()
+		if self._vigilante is not None:
+			self._vigilante.join()
+		self._vigilante = None
+
+	def _vigilar(self, intervalo):
+		pendiente = None
+		while not self._detener.wait(intervalo):
+			try:
+				firma = self._firma_archivo()
+			except OSError as e:
+				self.ultimo_error = e
+				continue
+			if firma == self._actual.firma:
+				pendiente = None
+				continue
+			if firma != pendiente:
+				# Cambió desde la revisión anterior: puede estar guardándose todavía
+				pendiente = firma
+				continue
+			try:
+				self.actualizar()
+				self.ultimo_error = None
+			except Exception as e:
+				self.ultimo_error = e
+			pendiente = None
+
+
+def armar_version(anterior, partes, huellas, leidas, eliminadas):
+	"""
+	Versión siguiente a `anterior` con las partes releídas reemplazadas
+
+	Las partes son las hojas del libro (IngestaIncremental) o los archivos de un
+	manifiesto (utils.fuentes): las que no se releyeron se copian de `anterior`.
+	Las releídas pasan por el control de calidad (utils.calidad) y se les agregan
+	las métricas derivadas (utils.derivadas) antes de compararlas, así una
+	corrección en el Excel cuenta como fila cambiada y las derivadas de las demás
+	partes no se recalculan.
+
+	Args:
+		anterior: VersionDataset publicada
+		partes: Nombres de las partes, en el orden del dataset nuevo
+		huellas: {parte: huella}
+		leidas: {parte: DataFrame preparado} de las partes releídas
+		eliminadas: Partes de `anterior` que ya no existen
+
+	Returns:
+		(VersionDataset, CambiosIngesta)
+	"""
+	calidad_partes = {}
+	leidas = dict(leidas)
+	for parte, df_parte in leidas.items():
+		df_parte, calidad_partes[parte] = depurar_evaluaciones(df_parte, inversiones=False)
+		leidas[parte] = agregar_derivadas(df_parte)
+
+	# Filas afectadas: las de partes nuevas o eliminadas y las que cambiaron en partes releídas
+	agregadas, quitadas = [], []
+	for parte in eliminadas:
+		quitadas.append(anterior.filas_hoja(parte))
+	for parte, df_parte in leidas.items():
+		if parte in anterior.hojas:
+			antes = anterior.filas_hoja(parte)
+			mascara_antes, mascara_despues = _filas_distintas(antes, df_parte)
+			quitadas.append(antes[mascara_antes])
+			agregadas.append(df_parte[mascara_despues])
+		else:
+			agregadas.append(df_parte)
+
+	# Dataset nuevo en el orden de las partes: las que no cambiaron se copian del anterior
+	bloques, estados, inicio = [], {}, 0
+	for parte in partes:
+		bloque = leidas[parte] if parte in leidas else anterior.filas_hoja(parte)
+		bloques.append(bloque)
+		estados[parte] = EstadoHoja(huellas[parte], inicio, inicio + len(bloque))
+		inicio += len(bloque)
+	# Las columnas categóricas de partes distintas se concatenan como texto: se vuelven a tipar
+	df_nuevo = preparar_evaluaciones(pd.concat(bloques, ignore_index=True))
+	# Si todas las partes compartían categorías se concatenan como categóricas: se quitan las de filas que ya no están
+	df_nuevo = df_nuevo.assign(**{
+		columna: df_nuevo[columna].cat.remove_unused_categories()
+		for columna in df_nuevo.select_dtypes("category").columns
+	})
+
+	# Calidad: la de cada parte (las no releídas, de la versión anterior) más las inversiones DER/IZQ,
+	# que comparan con la sesión anterior del jugador y se revisan sobre el dataset completo
+	for parte in partes:
+		if parte in calidad_partes:
+			continue
+		if parte in anterior.calidad_partes:
+			calidad_partes[parte] = anterior.calidad_partes[parte]
+		else:
+			calidad_partes[parte] = validar_evaluaciones(anterior.filas_hoja(parte), inversiones=False)
+	calidad = combinar_calidad(
+		len(df_nuevo),
+		[(estados[parte].inicio, calidad_partes[parte]) for parte in partes],
+		detectar_inversiones(df_nuevo)
+	)
+
+	cambios = _cambios(anterior, df_nuevo, leidas, eliminadas, agregadas, quitadas)
+	historial = None
+	if anterior.historial is not None:
+		historial = anterior.historial.actualizar(df_nuevo, cambios.fechas, cambios.categorias)
+	version = VersionDataset(anterior.numero + 1, df_nuevo, estados, historial=historial, calidad_partes=calidad_partes, calidad=calidad)
+	return version, cambios
+
+
+def _cambios(anterior, df_nuevo, leidas, eliminadas, agregadas, quitadas):
+	"""
+	Categorías y fechas afectadas por las filas agregadas y quitadas
+
+	Un jugador con filas nuevas puede dejar de aparecer en la foto de otra
+	categoría (por ejemplo, si pasó de Reserva a Primera), así que también se
+	marcan las categorías de todas sus filas, antes y después del cambio.
+	"""
+	distintas = pd.concat([*agregadas, *quitadas], ignore_index=True)
+	# Solo deportistas: las filas MEDIA/SD se repiten en todas las categorías
+	jugadores = distintas.loc[mascara_filas_jugador(distintas), "Deportista"].unique() if "Deportista" in distintas.columns else []
+	categorias = set(distintas["categoria"].dropna()) if "categoria" in distintas.columns else set()
+	for df in (anterior.df, df_nuevo):
+		if df is not None and len(jugadores) and "Deportista" in df.columns:
+			categorias.update(df.loc[df["Deportista"].isin(jugadores), "categoria"].dropna())
+	fechas = set(distintas["FECHA"].dropna()) if "FECHA" in distintas.columns else set()
+	return CambiosIngesta(
+		hojas_nuevas=tuple(hoja for hoja in leidas if hoja not in anterior.hojas),
+		hojas_modificadas=tuple(hoja for hoja in leidas if hoja in anterior.hojas),
+		hojas_eliminadas=eliminadas,
+		filas_agregadas=sum(len(df) for df in agregadas),
+		filas_eliminadas=sum(len(df) for df in quitadas),
+		categorias=frozenset(categorias),
+		fechas=frozenset(pd.Timestamp(fecha) for fecha in fechas)
+	)
+
+
+# clave (ruta absoluta o manifiesto) → ingesta compartida por todas las sesiones del proceso
+_INGESTAS = {}
+_LOCK_INGESTAS = threading.Lock()
+
+
+def ingesta_compartida(clave, crear, vigilar=0):
+	"""
+	Ingesta registrada con `clave` (la crea con `crear()` la primera vez)
+
+	Args:
+		clave: Identificador de la ingesta en el proceso
+		crear: Función sin argumentos que crea la ingesta
+		vigilar: Segundos entre revisiones del hilo vigilante (0 = sin hilo)
+	"""
+	with _LOCK_INGESTAS:
+		if clave not in _INGESTAS:
+			_INGESTAS[clave] = crear()
+		ingesta = _INGESTAS[clave]
+		if vigilar > 0:
+			ingesta.iniciar_vigilancia(vigilar)
+	return ingesta
+
+
+def ingesta_registrada(clave):
+	"""Ingesta registrada con `clave`, o None"""
+	with _LOCK_INGESTAS:
+		return _INGESTAS.get(clave)
+
+
+def clave_ingesta(ruta):
+	"""Clave de registro del Excel local `ruta`"""
+	return os.path.abspath(ruta)
+
+
+def obtener_ingesta(ruta, vigilar=0):
+	"""
+	IngestaIncremental del archivo (una por ruta y proceso)
+
+	Args:
+		ruta: Ruta del .xlsx
+		vigilar: Segundos entre revisiones del hilo vigilante (0 = sin hilo)
+	"""
+	return ingesta_compartida(clave_ingesta(ruta), lambda: IngestaIncremental(ruta), vigilar)
+
+
+def calidad_ingesta(df):
+	"""Control de calidad de la ingesta cuya versión actual es `df`, o None"""
+	with _LOCK_INGESTAS:
+		ingestas = list(_INGESTAS.values())
+	for ingesta in ingestas:
+		calidad = ingesta.calidad_para(df)
+		if calidad is not None:
+			return calidad
+	return None
+
+
+def historial_ingesta(df):
+	"""Historial compartido de la ingesta cuya versión actual es `df`, o None"""
+	with _LOCK_INGESTAS:
+		ingestas = list(_INGESTAS.values())
+	for ingesta in ingestas:
+		historial = ingesta.historial_para(df)
+		if historial is not None:
+			return historial
+	return None
@@ -0,0 +1,200 @@
+"""
+Almacén longitudinal de evaluaciones indexado por (categoría, jugador, fecha)
+
+El Excel puede tener una hoja por sesión de evaluación ("EVALUACION 2910",
+"EVALUACION 1712", ...). `leer_evaluaciones_excel` las concatena y este módulo
+ordena el historial una sola vez por (categoria, Deportista, FECHA) para que:
+
+- el historial de un jugador sea un slice contiguo (sin recorrer toda la tabla);
+  como en utils.particiones, el jugador se identifica por (categoria, Deportista)
+  para no mezclar homónimos de categorías distintas,
+- la consulta "a una fecha" (as-of) sea una búsqueda binaria sobre sus fechas,
+- las vistas existentes reciban una foto con una fila por jugador a la fecha elegida.
+
+Cuando se agregan o corrigen sesiones (utils.ingesta), `actualizar` arma el
+historial nuevo reutilizando las fotos anteriores a la primera fecha afectada y
+los resultados ya calculados de las categorías que no cambiaron.
+"""
+
+import numpy as np
+import pandas as pd
+
+from utils.particiones import COLUMNA_CATEGORIA, agrupar_por_categoria, derivados_heredables, sembrar_derivados
+
+COLUMNA_FECHA = "FECHA"
+COLUMNA_JUGADOR = "Deportista"
+
+
+class EvaluacionesLongitudinales:
+	"""Historial de evaluaciones con índice por jugador y consultas por fecha"""
+
+	def __init__(self, df):
+		"""
+		Args:
+			df: DataFrame con todas las sesiones (una fila por jugador y fecha)
+		"""
+		df = df.copy()
+		if COLUMNA_FECHA in df.columns:
+			df[COLUMNA_FECHA] = pd.to_datetime(df[COLUMNA_FECHA], errors='coerce')
+		else:
+			df[COLUMNA_FECHA] = pd.NaT
+		if COLUMNA_CATEGORIA not in df.columns:
+			df[COLUMNA_CATEGORIA] = np.nan
+
+		# Orden estable: dentro de cada jugador y fecha se respeta el orden del Excel.
+		# El índice conserva la posición de carga para devolver las fotos en ese orden.
+		df = df.reset_index(drop=True)
+		self._df = df.sort_values(
+			[COLUMNA_CATEGORIA, COLUMNA_JUGADOR, COLUMNA_FECHA], kind='stable', na_position='first'
+		)
+
+		categorias = self._df[COLUMNA_CATEGORIA].to_numpy()
+		jugadores = self._df[COLUMNA_JUGADOR].to_numpy()
+		fechas = self._df[COLUMNA_FECHA].to_numpy(dtype='datetime64[ns]')
+
+		# Índice (categoria, Deportista) → (inicio, fin) del bloque contiguo y sus fechas ordenadas
+		self._rangos = {}
+		self._fechas_jugador = {}
+		if len(self._df):
+			cambios = (jugadores[1:] != jugadores[:-1]) | (categorias[1:] != categorias[:-1])
+			cortes = np.flatnonzero(cambios) + 1
+			inicios = np.concatenate(([0], cortes))
+			fines = np.concatenate((cortes, [len(jugadores)]))
+			for inicio, fin in zip(inicios, fines):
+				clave = (categorias[inicio], jugadores[inicio])
+				if pd.isna(clave[0]) or pd.isna(clave[1]):
+					continue
+				self._rangos[clave] = (int(inicio), int(fin))
+				self._fechas_jugador[clave] = fechas[inicio:fin]
+
+		self._fechas = np.unique(fechas[~np.isnat(fechas)])
+		self._fotos = {}
+		# Derivados heredados de la versión anterior, por fecha de sesión anterior vigente
+		self._fechas_anteriores = self._fechas[:0]
+		self._herencias = {}
+
+	def __len__(self):
+		return len(self._df)
+
+	@property
+	def df(self):
+		"""Tabla completa ordenada por (categoria, Deportista, FECHA); el índice es la posición de carga"""
+		return self._df
+
+	def fechas(self):
+		"""Fechas de evaluación disponibles (ascendentes)"""
+		return [pd.Timestamp(fecha) for fecha in self._fechas]
+
+	def ultima_fecha(self):
+		"""Fecha de la evaluación más reciente o None si no hay fechas"""
+		return pd.Timestamp(self._fechas[-1]) if len(self._fechas) else None
+
+	def jugadores(self):
+		"""Jugadores con al menos una evaluación, como pares (categoria, Deportista)"""
+		return list(self._rangos)
+
+	def historial(self, categoria, jugador):
+		"""
+		Devuelve todas las evaluaciones de un jugador de la categoría ordenadas por fecha
+
+		Usa el índice de rangos: O(1) para ubicar el bloque, sin filtrar la tabla.
+		"""
+		clave = (categoria, jugador)
+		if clave not in self._rangos:
+			return self._df.iloc[0:0]
+		inicio, fin = self._rangos[clave]
+		return self._df.iloc[inicio:fin]
+
+	def al(self, categoria, jugador, fecha=None):
+		"""
+		Evaluación vigente del jugador a una fecha (la última con FECHA <= fecha)
+
+		Args:
+			categoria: Categoría del jugador
+			jugador: Nombre del deportista
+			fecha: Fecha de corte; None = última evaluación
+
+		Returns:
+			Series con la fila o None si el jugador no tenía evaluaciones a esa fecha
+		"""
+		clave = (categoria, jugador)
+		if clave not in self._rangos:
+			return None
+		inicio, fin = self._rangos[clave]
+		fechas = self._fechas_jugador[clave]
+
+		if fecha is None:
+			posicion = fin - inicio - 1
+		else:
+			posicion = int(np.searchsorted(fechas, np.datetime64(pd.Timestamp(fecha), 'ns'), side='right')) - 1
+			if posicion < 0:
+				return None
+		# Con filas repetidas en la misma fecha se devuelve la primera (como df[...].iloc[0])
+		if not np.isnat(fechas[posicion]):
+			posicion = int(np.searchsorted(fechas, fechas[posicion], side='left'))
+		return self._df.iloc[inicio + posicion]
+
+	def foto(self, fecha=None):
+		"""
+		Estado del plantel a una fecha: para cada jugador, las filas de su última
+		evaluación con FECHA <= fecha. Es el DataFrame que consumen las vistas.
+
+		Args:
+			fecha: Fecha de corte; None = última fecha disponible
+
+		Returns:
+			DataFrame con el mismo formato que el Excel de una sola sesión
+		"""
+		if not len(self._fechas):
+			# Sin fechas no hay historial que recortar
+			return agrupar_por_categoria(self._df.sort_index())
+
+		fecha = self.ultima_fecha() if fecha is None else pd.Timestamp(fecha)
+		if fecha not in self._fotos:
+			fechas = self._df[COLUMNA_FECHA]
+			vigentes = self._df[fechas <= fecha]
+			ultima = vigentes.groupby(
+				[COLUMNA_CATEGORIA, COLUMNA_JUGADOR], sort=False, dropna=False, observed=True
+			)[COLUMNA_FECHA].transform('max')
+			# Volver al orden de carga (posición en el Excel), como espera el resto de la app,
+			# con cada categoría contigua para que la partición por categoría sean slices
+			self._fotos[fecha] = agrupar_por_categoria(vigentes[vigentes[COLUMNA_FECHA] == ultima].sort_index())
+			if self._herencias:
+				sembrar_derivados(self._fotos[fecha], self._herencias.get(_fecha_vigente(self._fechas_anteriores, fecha)))
+		return self._fotos[fecha]
+
+	def actualizar(self, df, fechas_afectadas, categorias_afectadas):
+		"""
+		Historial de una versión nueva del dataset que reutiliza lo calculado sobre esta
+
+		- Las fotos anteriores a la primera fecha afectada no cambian: se reutilizan
+		  tal cual, con su partición y sus resultados (normas, secciones).
+		- Las demás se recalculan al pedirlas, heredando los resultados de las
+		  categorías no afectadas de la foto anterior con la misma sesión vigente
+		  (por ejemplo, la foto de una fecha nueva hereda de la última foto).
+
+		Args:
+			df: Dataset completo de la versión nueva (todas las sesiones)
+			fechas_afectadas: Fechas de las filas agregadas, corregidas o eliminadas
+			categorias_afectadas: Categorías cuyas filas (o las de sus jugadores) cambiaron
+
+		Returns:
+			EvaluacionesLongitudinales de `df`
+		"""
+		nuevo = EvaluacionesLongitudinales(df)
+		fechas = pd.DatetimeIndex(pd.to_datetime(list(fechas_afectadas), errors='coerce')).dropna()
+		primera = fechas.min() if len(fechas) else None
+		categorias = set(categorias_afectadas)
+		nuevo._fechas_anteriores = self._fechas
+		# Copia: otras sesiones pueden estar agregando fotos mientras se actualiza
+		for fecha, foto in list(self._fotos.items()):
+			if primera is not None and fecha < primera:
+				nuevo._fotos[fecha] = foto
+			nuevo._herencias[_fecha_vigente(self._fechas, fecha)] = derivados_heredables(foto, categorias)
+		return nuevo
+
+
+def _fecha_vigente(fechas, fecha):
+	"""Última fecha de `fechas` (ordenadas) que es <= fecha, o None"""
+	posicion = int(np.searchsorted(fechas, np.datetime64(pd.Timestamp(fecha), 'ns'), side='right')) - 1
+	return None if posicion < 0 else fechas[posicion]
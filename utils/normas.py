@@ -0,0 +1,133 @@
+"""
+Servicio de normas: estadísticas de referencia por categoría y grupos externos
+
+Las tablas "jugador vs grupo" comparaban contra la categoría con más filas del
+dataset (`df["categoria"].value_counts().index[0]`), recalculada en cada vista y
+en cada exportación. Este servicio:
+
+- precalcula media, desviación estándar y n de todas las métricas para cada
+  categoría en una sola pasada (groupby) al construirse,
+- se guarda junto a la partición por categoría del DataFrame, así que se
+  calcula una vez por versión del dataset (cada foto de EvaluacionesLongitudinales),
+- suma los grupos de referencia externos definidos en NORMAS_EXTERNAS_PATH,
+- y deja que cada vista o reporte elija la referencia de forma explícita
+  (por defecto, la categoría del jugador).
+"""
+
+import json
+import os
+
+import pandas as pd
+
+from config.settings import NORMAS_EXTERNAS_PATH
+from utils.data_utils import obtener_particion_categorias, mascara_filas_jugador
+
+COLUMNAS_IDENTIDAD = ("categoria", "Deportista", "JUGADOR", "FECHA")
+
+# Caché de grupos externos: (ruta, fecha de modificación) → grupos
+_EXTERNAS = {}
+
+
+def cargar_normas_externas(ruta=NORMAS_EXTERNAS_PATH):
+	"""
+	Lee los grupos de referencia externos (se relee solo si el archivo cambió)
+
+	Returns:
+		Dict nombre → {"media": {...}, "std": {...}, "n_jugadores": int}; vacío si no hay archivo
+	"""
+	if not ruta or not os.path.exists(ruta):
+		return {}
+	clave = (ruta, os.path.getmtime(ruta))
+	if clave not in _EXTERNAS:
+		with open(ruta, encoding="utf-8") as archivo:
+			datos = json.load(archivo)
+		_EXTERNAS.clear()
+		_EXTERNAS[clave] = {
+			str(nombre): {
+				'media': {col: float(v) for col, v in grupo.get('media', {}).items()},
+				'std': {col: float(v) for col, v in grupo.get('std', {}).items()},
+				'n_jugadores': int(grupo.get('n_jugadores', 0))
+			}
+			for nombre, grupo in datos.items()
+		}
+	return _EXTERNAS[clave]
+
+
+class ServicioNormas:
+	"""Estadísticas de referencia (media, SD, n) por categoría y por grupo externo"""
+
+	def __init__(self, df, externas=None):
+		"""
+		Args:
+			df: DataFrame con una fila por jugador (foto a una fecha)
+			externas: Grupos externos (por defecto, los de NORMAS_EXTERNAS_PATH)
+		"""
+		particion = obtener_particion_categorias(df)
+		self._categorias = particion.categorias()
+		self._externas = cargar_normas_externas() if externas is None else externas
+
+		columnas = [col for col in df.columns if col not in COLUMNAS_IDENTIDAD]
+		validas = df[mascara_filas_jugador(df)]
+		valores = validas[columnas].apply(pd.to_numeric, errors='coerce').astype(float)
+		grupos = valores.groupby(validas['categoria'], sort=False)
+
+		# Una sola pasada agrupada para todas las categorías y métricas
+		self._media = grupos.mean().round(1)
+		self._std = grupos.std().round(1)
+		self._n = validas.groupby('categoria', sort=False).size()
+
+	def referencias(self):
+		"""Grupos de referencia disponibles: categorías del dataset y grupos externos"""
+		return self._categorias + [nombre for nombre in self._externas if nombre not in self._categorias]
+
+	def es_externa(self, referencia):
+		"""True si la referencia es un grupo externo (no una categoría del dataset)"""
+		return referencia not in self._categorias and referencia in self._externas
+
+	def estadisticas(self, referencia, columnas_tabla, columnas_totales):
+		"""
+		Estadísticas del grupo de referencia en el formato de calcular_estadisticas_completas_categoria
+
+		Args:
+			referencia: Categoría del dataset o nombre de un grupo externo
+			columnas_tabla: Dict columna DER → columna IZQ
+			columnas_totales: Lista de columnas totales
+
+		Returns:
+			Dict {"media": {col: valor}, "std": {col: valor}, "n_jugadores": int}.
+			Las métricas sin datos valen 0.0, igual que antes.
+		"""
+		columnas = [col for par in columnas_tabla.items() for col in par] + list(columnas_totales)
+
+		if referencia in self._categorias:
+			media = self._media.loc[referencia] if referencia in self._media.index else pd.Series(dtype=float)
+			std = self._std.loc[referencia] if referencia in self._std.index else pd.Series(dtype=float)
+			n_jugadores = int(self._n.get(referencia, 0))
+		elif referencia in self._externas:
+			grupo = self._externas[referencia]
+			media, std, n_jugadores = pd.Series(grupo['media'], dtype=float), pd.Series(grupo['std'], dtype=float), grupo['n_jugadores']
+		else:
+			raise ValueError(f"Grupo de referencia desconocido: {referencia}")
+
+		def _valor(serie, col):
+			valor = serie.get(col)
+			return 0.0 if valor is None or pd.isna(valor) else float(valor)
+
+		return {
+			'media': {col: _valor(media, col) for col in columnas},
+			'std': {col: _valor(std, col) if n_jugadores > 1 else 0.0 for col in columnas},
+			'n_jugadores': n_jugadores
+		}
+
+
+def obtener_servicio_normas(df):
+	"""Servicio de normas del DataFrame, construido una vez por versión del dataset"""
+	derivados = obtener_particion_categorias(df).derivados
+	if 'normas' not in derivados:
+		derivados['normas'] = ServicioNormas(df)
+	return derivados['normas']
+
+
+def estadisticas_referencia(df, referencia, columnas_tabla, columnas_totales):
+	"""Atajo: estadísticas de `referencia` para las columnas pedidas"""
+	return obtener_servicio_normas(df).estadisticas(referencia, columnas_tabla, columnas_totales)
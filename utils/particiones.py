@@ -0,0 +1,242 @@
+"""
+Partición del dataset por categoría
+
+Las vistas filtran una y otra vez por categoría (`df[df["categoria"] == cat]`),
+lo que recorre todas las filas en cada rerun. Este módulo agrupa las filas de
+cada categoría una sola vez por DataFrame:
+
+- la consulta por categoría es un acceso a diccionario (O(1)),
+- la fila de un jugador sale de un índice hash (categoria, Deportista) → posición,
+- si las filas de la categoría son contiguas (lo habitual: una hoja o archivo
+  por categoría) se guarda un slice; si no lo son, se guardan solo sus
+  posiciones. La partición no retiene copias de las categorías: cada consulta
+  entrega una copia propia (`.copy()`), así modificarla nunca altera el
+  DataFrame original, con o sin copy-on-write de pandas.
+"""
+
+import weakref
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+COLUMNA_CATEGORIA = "categoria"
+COLUMNA_JUGADOR = "Deportista"
+COLUMNA_FECHA = "FECHA"
+
+# id(df) → (weakref al df, partición). La entrada se borra cuando el df se libera.
+_PARTICIONES = {}
+# id(df) → (weakref al df, derivados heredados) a sembrar cuando se construya su partición
+_HERENCIAS = {}
+
+
+def _como_slice(posiciones):
+	"""Convierte posiciones consecutivas en slice (vista); si no lo son, las devuelve tal cual"""
+	if len(posiciones) == 0:
+		return slice(0, 0)
+	if posiciones[-1] - posiciones[0] + 1 == len(posiciones):
+		return slice(int(posiciones[0]), int(posiciones[-1]) + 1)
+	return posiciones
+
+
+@dataclass(frozen=True)
+class RegistroJugador:
+	"""Evaluación de un jugador: identificadores tipados más la fila completa"""
+	deportista: str
+	categoria: str
+	fecha: Optional[pd.Timestamp]
+	posicion: int
+	datos: pd.Series
+
+	def valor(self, columna, defecto=np.nan):
+		"""Valor numérico de una columna (defecto si falta o no es numérico)"""
+		valor = pd.to_numeric(self.datos.get(columna), errors='coerce')
+		return defecto if pd.isna(valor) else float(valor)
+
+
+class ParticionCategorias:
+	"""Filas de cada categoría de un DataFrame, indexadas por nombre de categoría"""
+
+	def __init__(self, df, filas_validas=None):
+		"""
+		Args:
+			df: DataFrame con la columna "categoria"
+			filas_validas: Máscara booleana de filas a conservar (por ejemplo, sin
+				filas de resumen MEDIA/SD); None = todas
+		"""
+		# Referencia débil: la partición vive en la caché sin retener al DataFrame
+		self._df = weakref.ref(df)
+		if COLUMNA_CATEGORIA not in df.columns:
+			codigos, categorias = np.full(len(df), -1), pd.Index([])
+		else:
+			# factorize respeta el orden de aparición, como `unique()`
+			codigos, categorias = pd.factorize(df[COLUMNA_CATEGORIA])
+
+		validas = np.ones(len(df), dtype=bool) if filas_validas is None else np.asarray(filas_validas, dtype=bool)
+		self._categorias = list(categorias)
+		self._filas = {}
+		self._filas_validas = {}
+
+		# Un único argsort estable agrupa las posiciones de cada categoría
+		orden = np.argsort(codigos, kind='stable')
+		cortes = np.searchsorted(codigos[orden], np.arange(len(categorias) + 1))
+		for i, categoria in enumerate(self._categorias):
+			posiciones = orden[cortes[i]:cortes[i + 1]]
+			self._filas[categoria] = _como_slice(posiciones)
+			self._filas_validas[categoria] = _como_slice(posiciones[validas[posiciones]])
+
+		self._jugadores = {}
+		# Resultados derivados de este DataFrame (por ejemplo, normas de referencia):
+		# viven lo mismo que la partición, es decir, una versión del dataset. Las
+		# claves (tipo, categoria, ...) son propias de una categoría y pueden pasar a
+		# la versión siguiente si esa categoría no cambió (ver derivados_heredables).
+		self.derivados = {}
+
+		# Índice hash (categoria, Deportista) → posición de su primera fila (como `.iloc[0]`)
+		self._posiciones = {}
+		if COLUMNA_CATEGORIA in df.columns and COLUMNA_JUGADOR in df.columns:
+			identidad = df[[COLUMNA_CATEGORIA, COLUMNA_JUGADOR]]
+			primeras = ~identidad.duplicated(keep='first').to_numpy() & identidad.notna().all(axis=1).to_numpy()
+			posiciones = np.flatnonzero(primeras)
+			claves = zip(identidad[COLUMNA_CATEGORIA].to_numpy()[posiciones], identidad[COLUMNA_JUGADOR].to_numpy()[posiciones])
+			self._posiciones = dict(zip(claves, posiciones.tolist()))
+
+	def categorias(self):
+		"""Categorías en orden de aparición (sin NaN)"""
+		return list(self._categorias)
+
+	def filas(self, categoria, solo_validas=False):
+		"""
+		Filas de la categoría
+
+		Args:
+			categoria: Nombre de la categoría
+			solo_validas: Aplicar la máscara `filas_validas` de la construcción
+
+		Returns:
+			DataFrame (copia: modificarlo no altera el original); vacío si la categoría no existe
+		"""
+		return self._seleccion(categoria, solo_validas).copy()
+
+	def _seleccion(self, categoria, solo_validas=False):
+		"""Filas de la categoría sin copiar (slice del original si son contiguas); solo para lectura"""
+		df = self._df()
+		indice = (self._filas_validas if solo_validas else self._filas).get(categoria)
+		if indice is None:
+			return df.iloc[0:0]
+		return df.iloc[indice]
+
+	def posicion(self, categoria, jugador):
+		"""Posición (iloc) de la fila del jugador en la categoría o None"""
+		return self._posiciones.get((categoria, jugador))
+
+	def fila(self, categoria, jugador):
+		"""Fila del jugador en la categoría (Series, copia) o None si no está"""
+		posicion = self.posicion(categoria, jugador)
+		return None if posicion is None else self._df().iloc[posicion].copy()
+
+	def registro(self, categoria, jugador):
+		"""Fila del jugador como RegistroJugador o None si no está"""
+		posicion = self.posicion(categoria, jugador)
+		if posicion is None:
+			return None
+		datos = self._df().iloc[posicion].copy()
+		fecha = pd.to_datetime(datos.get(COLUMNA_FECHA), errors='coerce')
+		return RegistroJugador(
+			deportista=jugador,
+			categoria=categoria,
+			fecha=None if pd.isna(fecha) else fecha,
+			posicion=posicion,
+			datos=datos
+		)
+
+	def jugadores(self, categoria, columna_jugador):
+		"""Valores únicos (sin NaN) de la columna de jugador en la categoría, calculados una vez"""
+		clave = (categoria, columna_jugador)
+		if clave not in self._jugadores:
+			self._jugadores[clave] = self._seleccion(categoria)[columna_jugador].dropna().unique()
+		return self._jugadores[clave]
+
+
+def agrupar_por_categoria(df):
+	"""
+	Reordena el DataFrame para que las filas de cada categoría queden contiguas
+
+	El orden es estable: se respeta el orden original dentro de cada categoría y
+	las categorías quedan en orden de aparición. Si ya estaban agrupadas se
+	devuelve el mismo DataFrame (sin copiar).
+	"""
+	if COLUMNA_CATEGORIA not in df.columns or len(df) < 2:
+		return df
+	codigos, _ = pd.factorize(df[COLUMNA_CATEGORIA])
+	# NaN (-1) al final para no romper la contigüidad de las categorías
+	codigos = np.where(codigos < 0, codigos.max() + 1, codigos)
+	if np.all(codigos[1:] >= codigos[:-1]):
+		return df
+	return df.iloc[np.argsort(codigos, kind='stable')]
+
+
+def obtener_particion(df, filas_validas=None):
+	"""
+	Partición por categoría del DataFrame, construida la primera vez y reutilizada
+
+	La caché es por objeto: las fotos de EvaluacionesLongitudinales y el DataFrame
+	cargado se mantienen entre reruns, así que la partición se construye una vez
+	por dataset. `filas_validas` puede ser un callable que recibe el df (solo se
+	evalúa al construir).
+
+	Args:
+		df: DataFrame con la columna "categoria"
+		filas_validas: Máscara o callable(df) → máscara de filas válidas
+
+	Returns:
+		ParticionCategorias
+	"""
+	clave = id(df)
+	entrada = _PARTICIONES.get(clave)
+	if entrada is not None and entrada[0]() is df:
+		return entrada[1]
+
+	if callable(filas_validas):
+		filas_validas = filas_validas(df)
+	particion = ParticionCategorias(df, filas_validas)
+	herencia = _HERENCIAS.pop(clave, None)
+	if herencia is not None and herencia[0]() is df:
+		particion.derivados.update(herencia[1])
+	_PARTICIONES[clave] = (weakref.ref(df), particion)
+	weakref.finalize(df, _PARTICIONES.pop, clave, None)
+	return particion
+
+
+def derivados_heredables(df, categorias_afectadas):
+	"""
+	Resultados derivados de `df` que siguen valiendo en una versión nueva del dataset
+
+	Son las entradas de `derivados` con clave (tipo, categoria, ...) cuya categoría
+	no está entre las afectadas. Las demás (por ejemplo, las normas, que resumen
+	todas las categorías) se descartan y se recalculan al pedirlas.
+
+	Returns:
+		Dict {clave: resultado}; vacío si `df` no tiene partición construida
+	"""
+	entrada = _PARTICIONES.get(id(df))
+	if entrada is None or entrada[0]() is not df:
+		return {}
+	return {
+		clave: valor for clave, valor in entrada[1].derivados.items()
+		if isinstance(clave, tuple) and len(clave) > 1 and clave[1] not in categorias_afectadas
+	}
+
+
+def sembrar_derivados(df, derivados):
+	"""Agrega derivados heredados a la partición de `df` (ahora o cuando se construya)"""
+	if not derivados:
+		return
+	clave = id(df)
+	entrada = _PARTICIONES.get(clave)
+	if entrada is not None and entrada[0]() is df:
+		entrada[1].derivados.update(derivados)
+		return
+	_HERENCIAS[clave] = (weakref.ref(df), dict(derivados))
+	weakref.finalize(df, _HERENCIAS.pop, clave, None)
@@ -0,0 +1,322 @@
+"""
+Motores de PDF intercambiables para los reportes
+
+Todos reciben el mismo `ReporteJugadorContexto` (gráficos + tablas ya calculados)
+y devuelven los bytes del PDF:
+
+- "weasyprint": renderiza la plantilla HTML/CSS (máxima fidelidad visual). Necesita
+  las librerías nativas de Pango/Cairo.
+- "fpdf2": dibuja cabecera, gráficos y tablas directamente con fpdf2, sin motor de
+  layout HTML. Es mucho más rápido para lotes grandes y funciona en hosts donde
+  weasyprint no se puede instalar (con gráficos SVG tampoco necesita kaleido).
+
+Para agregar otro motor: heredar de `BackendPDF` y registrarlo con `registrar_backend_pdf`.
+"""
+
+import base64
+import io
+import re
+import struct
+from abc import ABC, abstractmethod
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+from config.settings import BACKEND_PDF, VISTAS_GRUPALES, nombre_categoria
+
+try:
+	from weasyprint import HTML
+except (ModuleNotFoundError, OSError):
+	# OSError: weasyprint instalado pero sin las librerías nativas (pango/cairo)
+	HTML = None
+
+
+class BackendPDF(ABC):
+	"""Interfaz común de los motores de PDF"""
+
+	nombre = ""
+	# Formato de gráficos recomendado para el motor ("png" o "svg")
+	formato_graficos = "png"
+	mensaje_no_disponible = "El motor de PDF no está disponible en este entorno."
+
+	@classmethod
+	def disponible(cls):
+		"""Indica si el motor puede usarse en este entorno"""
+		return True
+
+	@abstractmethod
+	def generar(self, contexto, plantilla="reporte_jugador.html"):
+		"""Genera el PDF a partir del contexto y devuelve sus bytes"""
+
+
+class BackendWeasyPrint(BackendPDF):
+	"""Renderiza la plantilla Jinja2 y la convierte a PDF con WeasyPrint"""
+
+	nombre = "weasyprint"
+	formato_graficos = "png"
+	mensaje_no_disponible = (
+		"La librería 'weasyprint' no está instalada. Instálala con 'pip install weasyprint' para habilitar la exportación a PDF."
+	)
+
+	@classmethod
+	def disponible(cls):
+		return HTML is not None
+
+	def generar(self, contexto, plantilla="reporte_jugador.html"):
+		if HTML is None:
+			raise RuntimeError(self.mensaje_no_disponible)
+		from utils.pdf_report import generar_html_reporte
+
+		# La plantilla se consume por fragmentos, sin armar antes el HTML completo
+		flujo = _FlujoFragmentos(generar_html_reporte(contexto, plantilla=plantilla))
+		return HTML(file_obj=flujo, encoding="utf-8", base_url=contexto.base_url).write_pdf()
+
+
+class _FlujoFragmentos(io.RawIOBase):
+	"""Archivo de solo lectura (bytes UTF-8) sobre un iterador de fragmentos de texto"""
+
+	def __init__(self, fragmentos):
+		self._fragmentos = iter(fragmentos)
+		self._pendiente = b""
+
+	def readable(self):
+		return True
+
+	def readinto(self, buffer):
+		while not self._pendiente:
+			fragmento = next(self._fragmentos, None)
+			if fragmento is None:
+				return 0
+			self._pendiente = fragmento.encode("utf-8")
+		n = min(len(buffer), len(self._pendiente))
+		buffer[:n] = self._pendiente[:n]
+		self._pendiente = self._pendiente[n:]
+		return n
+
+
+# ========= BACKEND FPDF2 ==========
+
+# Colores de la plantilla HTML (RGB)
+ROJO = (220, 38, 38)
+PANEL = (30, 41, 59)
+NEGRO = (17, 24, 39)
+GRIS_BORDE = (156, 163, 175)
+GRIS_FILA = (249, 250, 251)
+BLANCO = (255, 255, 255)
+TEXTO = (17, 24, 39)
+
+# Caracteres frecuentes fuera de latin-1 (las fuentes core de PDF no los tienen); el resto (emojis) se omite
+_REEMPLAZOS_LATIN1 = str.maketrans({"–": "-", "—": "-", "“": '"', "”": '"', "‘": "'", "’": "'", "…": "...", "•": "-"})
+
+
+def _latin1(texto):
+	"""Adapta el texto a latin-1 para las fuentes core de fpdf2"""
+	return str(texto).translate(_REEMPLAZOS_LATIN1).encode("latin-1", "ignore").decode("latin-1")
+
+
+def _formatear_celda(valor):
+	"""Formatea un valor de tabla como texto"""
+	if isinstance(valor, float):
+		return "-" if valor != valor else f"{valor:.2f}"
+	return _latin1(valor)
+
+
+def _leer_grafico(ruta, base_url):
+	"""Devuelve (bytes, es_svg) de un gráfico del contexto (data URI o archivo relativo a base_url)"""
+	if ruta.startswith("data:"):
+		cabecera, datos = ruta.split(",", 1)
+		return base64.b64decode(datos), "svg" in cabecera
+
+	directorio = Path(url2pathname(unquote(urlparse(base_url).path))) if base_url else Path.cwd()
+	return (directorio / ruta).read_bytes(), ruta.lower().endswith(".svg")
+
+
+def _proporcion_imagen(datos, es_svg):
+	"""Relación alto/ancho de un SVG (atributos width/height) o PNG (cabecera IHDR)"""
+	if es_svg:
+		encontrado = re.search(rb'<svg[^>]*\swidth="([\d.]+)"[^>]*\sheight="([\d.]+)"', datos[:500])
+		if encontrado:
+			return float(encontrado[2]) / float(encontrado[1])
+	elif datos[:8] == b"\x89PNG\r\n\x1a\n":
+		ancho, alto = struct.unpack(">II", datos[16:24])
+		return alto / ancho
+	return 620 / 1000
+
+
+class BackendFPDF(BackendPDF):
+	"""Dibuja el reporte directamente con fpdf2 (sin HTML/CSS)"""
+
+	nombre = "fpdf2"
+	formato_graficos = "svg"
+	mensaje_no_disponible = "La librería 'fpdf2' no está instalada. Instálala con 'pip install fpdf2'."
+	margen = 18  # mm, equivalente al @page de la plantilla
+
+	@classmethod
+	def disponible(cls):
+		try:
+			import fpdf  # noqa: F401
+		except ModuleNotFoundError:
+			return False
+		return True
+
+	def generar(self, contexto, plantilla="reporte_jugador.html"):
+		from fpdf import FPDF
+
+		pdf = FPDF(orientation="portrait", unit="mm", format="A4")
+		pdf.set_margins(self.margen, self.margen, self.margen)
+		pdf.set_auto_page_break(auto=True, margin=self.margen)
+		pdf.set_title(_latin1(f"Informe de Evaluación Física - {contexto.nombre_jugador}"))
+		pdf.add_page()
+
+		self._cabecera(pdf, contexto)
+		self._titulo_seccion(pdf, "Resultados gráficos")
+		for i, ruta in enumerate(contexto.graficos_paths, start=1):
+			self._grafico(pdf, i, *_leer_grafico(ruta, contexto.base_url))
+
+		self._titulo_seccion(pdf, "Tablas de métricas")
+		for df_tabla in contexto.tablas:
+			self._tabla(pdf, df_tabla)
+
+		return bytes(pdf.output())
+
+	def _cabecera(self, pdf, contexto):
+		"""Banda roja con el título y panel de información del jugador"""
+		filas = []
+		if contexto.vista not in VISTAS_GRUPALES:
+			filas.append(("Jugador", contexto.nombre_jugador))
+		filas.append(("Categoría", str(nombre_categoria(contexto.categoria))))
+		filas.append(("Perfil", f"{contexto.vista} - {contexto.seccion}"))
+
+		alto_panel = 4 + 6 * len(filas)
+		pdf.set_fill_color(*ROJO)
+		pdf.rect(0, 0, pdf.w, self.margen + 14 + alto_panel, style="F")
+
+		pdf.set_xy(self.margen, 8)
+		pdf.set_font("helvetica", "B", 20)
+		pdf.set_text_color(*BLANCO)
+		pdf.cell(pdf.epw, 12, _latin1("Informe de Evaluación Física"), align="C")
+
+		y = 8 + 14
+		pdf.set_fill_color(*PANEL)
+		pdf.set_draw_color(*NEGRO)
+		pdf.rect(self.margen, y, pdf.epw, alto_panel, style="DF", round_corners=True, corner_radius=1.5)
+		pdf.set_xy(self.margen + 3, y + 2)
+		for etiqueta, valor in filas:
+			pdf.set_font("helvetica", "B", 10)
+			pdf.cell(pdf.epw * 0.2, 6, _latin1(etiqueta))
+			pdf.set_font("helvetica", "", 10)
+			pdf.cell(pdf.epw * 0.8 - 6, 6, _latin1(valor), new_x="LEFT", new_y="NEXT")
+			pdf.set_x(self.margen + 3)
+
+		pdf.set_y(y + alto_panel + 8)
+
+	def _titulo_seccion(self, pdf, titulo):
+		"""Título de sección en rojo con línea inferior"""
+		if pdf.will_page_break(20):
+			pdf.add_page()
+		pdf.set_font("helvetica", "B", 14)
+		pdf.set_text_color(*ROJO)
+		pdf.cell(pdf.epw, 8, _latin1(titulo), new_x="LMARGIN", new_y="NEXT")
+		pdf.set_draw_color(55, 65, 81)
+		pdf.line(self.margen, pdf.get_y(), self.margen + pdf.epw, pdf.get_y())
+		pdf.ln(3)
+
+	def _grafico(self, pdf, indice, datos, es_svg):
+		"""Gráfico dentro de un bloque oscuro, sin partirlo entre páginas"""
+		if es_svg:
+			# Las fuentes core solo cubren latin-1; el SVG se vuelve a codificar en UTF-8
+			datos = _latin1(datos.decode("utf-8")).encode("utf-8")
+
+		ancho = pdf.epw - 6
+		# Sin superar el alto útil de la página (heatmaps de planteles grandes)
+		alto = min(ancho * _proporcion_imagen(datos, es_svg), pdf.eph - 16)
+		alto_bloque = alto + 12
+		if pdf.will_page_break(alto_bloque):
+			pdf.add_page()
+
+		x, y = self.margen, pdf.get_y()
+		pdf.set_fill_color(*NEGRO)
+		pdf.set_draw_color(31, 41, 55)
+		pdf.rect(x, y, pdf.epw, alto_bloque, style="DF", round_corners=True, corner_radius=2)
+		pdf.set_xy(x + 3, y + 2)
+		pdf.set_font("helvetica", "B", 10)
+		pdf.set_text_color(229, 231, 235)
+		pdf.cell(ancho, 6, f"Gráfico {indice}")
+		pdf.image(io.BytesIO(datos), x=x + 3, y=y + 9, w=ancho, h=alto, keep_aspect_ratio=True)
+		pdf.set_xy(self.margen, y + alto_bloque + 4)
+
+	def _tabla(self, pdf, df_tabla):
+		"""Tabla con encabezado rojo y primera columna (métrica) destacada"""
+		from fpdf.fonts import FontFace
+
+		df_tabla = df_tabla.reset_index()
+		columnas = [_latin1(c) for c in df_tabla.columns]
+		if pdf.will_page_break(8 * min(len(df_tabla) + 1, 6)):
+			pdf.add_page()
+
+		pdf.set_font("helvetica", "", 9)
+		pdf.set_text_color(*TEXTO)
+		pdf.set_draw_color(*GRIS_BORDE)
+		estilo_encabezado = FontFace(emphasis="BOLD", color=BLANCO, fill_color=ROJO)
+		estilo_metrica = FontFace(emphasis="BOLD", color=BLANCO, fill_color=NEGRO)
+		alineacion = ["LEFT"] + ["RIGHT"] * (len(columnas) - 1)
+		with pdf.table(
+			headings_style=estilo_encabezado,
+			cell_fill_color=GRIS_FILA,
+			cell_fill_mode="ROWS",
+			text_align=alineacion,
+			line_height=6,
+			first_row_as_headings=True,
+		) as tabla:
+			fila_encabezado = tabla.row()
+			for columna in columnas:
+				fila_encabezado.cell(columna)
+			for valores in df_tabla.itertuples(index=False):
+				fila = tabla.row()
+				for j, valor in enumerate(valores):
+					fila.cell(_formatear_celda(valor), style=estilo_metrica if j == 0 else None)
+		pdf.ln(5)
+
+
+# Orden = preferencia cuando BACKEND_PDF es "auto"
+BACKENDS_PDF = {
+	BackendWeasyPrint.nombre: BackendWeasyPrint,
+	BackendFPDF.nombre: BackendFPDF,
+}
+
+
+def registrar_backend_pdf(clase):
+	"""Registra un motor de PDF adicional (se puede usar como decorador)"""
+	BACKENDS_PDF[clase.nombre] = clase
+	return clase
+
+
+def backends_pdf_disponibles():
+	"""Nombres de los motores utilizables en este entorno, en orden de preferencia"""
+	return [nombre for nombre, clase in BACKENDS_PDF.items() if clase.disponible()]
+
+
+def obtener_backend_pdf(nombre=None):
+	"""Devuelve una instancia del motor pedido.
+
+	Args:
+		nombre: "weasyprint", "fpdf2", "auto" o None (usa BACKEND_PDF de settings)
+
+	Raises:
+		ValueError: si el motor no existe
+		RuntimeError: si no hay ningún motor disponible o el pedido no está disponible
+	"""
+	nombre = nombre or BACKEND_PDF
+	if nombre == "auto":
+		disponibles = backends_pdf_disponibles()
+		if not disponibles:
+			raise RuntimeError("No hay ningún motor de PDF disponible. Instala 'weasyprint' o 'fpdf2'.")
+		nombre = disponibles[0]
+
+	if nombre not in BACKENDS_PDF:
+		raise ValueError(f"Motor de PDF desconocido: {nombre}. Opciones: {', '.join(BACKENDS_PDF)}")
+
+	clase = BACKENDS_PDF[nombre]
+	if not clase.disponible():
+		raise RuntimeError(clase.mensaje_no_disponible)
+	return clase()
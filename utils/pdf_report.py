@@ -5,36 +5,47 @@ los datos ya procesados (jugador, sección, gráficos y tabla) y devuelve
 los bytes de un PDF listo para descargar.
 
 Requiere:
-- weasyprint
-- kaleido (para exportar gráficos de Plotly a imagen, si se usan figuras directamente)
+- weasyprint o fpdf2 (ver `utils.pdf_backends`)
+- kaleido (para exportar gráficos de Plotly a PNG; el modo SVG usa un exportador
+  vectorial propio para barras y radares y solo recurre a kaleido para otras figuras)
 
 La integración con Streamlit se hará desde app.py usando st.download_button.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Optional
 
 import base64
 import io
+import os
 import pandas as pd
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
 
-try:
-	from weasyprint import HTML
-except ModuleNotFoundError:
-	HTML = None  # Se validará en tiempo de ejecución
+from config.metricas import columnas_seccion
+from config.settings import JINJA_BYTECODE_CACHE_DIR, METRICAS_HEATMAP, VISTAS_GRUPALES, nombre_categoria
 
-from modules.fuerza_analysis import obtener_componentes_perfil_fuerza, obtener_componentes_perfil_fuerza_grupal
-from modules.movilidad_analysis import obtener_componentes_perfil_movilidad, obtener_componentes_perfil_movilidad_grupal
+from modules.secciones import componentes_vista, secciones_disponibles
+from modules.heatmap_analysis import obtener_componentes_heatmap_grupal
+from modules.evolucion_analysis import obtener_componentes_evolucion
+from utils.tendencias import VENTANA_POR_DEFECTO
+from utils.pdf_backends import obtener_backend_pdf
+from visualizations.svg_export import figura_a_svg
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 TEMPLATES_DIR = BASE_DIR / "templates"
 
+# Formatos de gráficos soportados en el reporte → tipo MIME
+FORMATOS_GRAFICOS = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+}
+
 
 @dataclass
 class ReporteJugadorContexto:
@@ -45,18 +56,67 @@ class ReporteJugadorContexto:
     vista: str    # "Perfil del Jugador", "Perfil del Grupo", etc.
     graficos_paths: List[str]
     tablas_html: List[str]
+    # Directorio desde el que se resuelven los gráficos guardados como archivo (None = inline)
+    base_url: Optional[str] = None
+    # Tablas originales (DataFrames) para los motores que no usan HTML (fpdf2)
+    tablas: List[pd.DataFrame] = field(default_factory=list)
 
 
+@lru_cache(maxsize=1)
 def _get_jinja_env() -> Environment:
-    """Devuelve un entorno Jinja2 configurado para las plantillas del proyecto."""
+    """Devuelve el entorno Jinja2 del proceso (se crea una sola vez).
+
+    - Las plantillas compiladas quedan en la cache del entorno, así que un lote de
+      cientos de reportes compila `reporte_jugador.html` una sola vez.
+    - `auto_reload` vuelve a cargar una plantilla si su archivo cambió en disco.
+    - El bytecode se guarda en `JINJA_BYTECODE_CACHE_DIR` para que otros procesos
+      (por ejemplo, ejecuciones sucesivas de la CLI) no tengan que recompilar.
+    """
+
+    bytecode_cache = None
+    try:
+        os.makedirs(JINJA_BYTECODE_CACHE_DIR, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(JINJA_BYTECODE_CACHE_DIR)
+    except OSError:
+        # Sistema de archivos de solo lectura: se trabaja solo con la cache en memoria
+        pass
 
     env = Environment(
         loader=FileSystemLoader(str(TEMPLATES_DIR)),
         autoescape=select_autoescape(["html", "xml"]),
+        auto_reload=True,
+        bytecode_cache=bytecode_cache,
     )
     return env
 
 
+def _variables_plantilla(contexto: ReporteJugadorContexto) -> dict:
+    """Variables que recibe la plantilla HTML del reporte."""
+
+    return {
+        "nombre_jugador": contexto.nombre_jugador,
+        "categoria": contexto.categoria,
+        "nombre_categoria": nombre_categoria(contexto.categoria),
+        "fecha": contexto.fecha,
+        "seccion": contexto.seccion,
+        "vista": contexto.vista,
+        "vista_grupal": contexto.vista in VISTAS_GRUPALES,
+        "graficos_paths": contexto.graficos_paths,
+        "tablas_html": contexto.tablas_html,
+    }
+
+
+def generar_html_reporte(contexto: ReporteJugadorContexto, plantilla: str = "reporte_jugador.html") -> Iterator[str]:
+    """Renderiza el HTML del reporte por fragmentos (`Template.generate`).
+
+    Permite escribir el HTML a disco o pasarlo al motor de PDF sin construir
+    antes el documento completo como un único string.
+    """
+
+    template = _get_jinja_env().get_template(plantilla)
+    return template.generate(**_variables_plantilla(contexto))
+
+
 def renderizar_html_reporte(contexto: ReporteJugadorContexto, plantilla: str = "reporte_jugador.html") -> str:
     """Renderiza el HTML del reporte del jugador usando Jinja2.
 
@@ -73,26 +133,19 @@ def renderizar_html_reporte(contexto: ReporteJugadorContexto, plantilla: str = "
         HTML completo del reporte.
     """
 
-    env = _get_jinja_env()
-    template = env.get_template(plantilla)
-    html = template.render(
-        nombre_jugador=contexto.nombre_jugador,
-        categoria=contexto.categoria,
-        fecha=contexto.fecha,
-        seccion=contexto.seccion,
-        vista=contexto.vista,
-        graficos_paths=contexto.graficos_paths,
-        tablas_html=contexto.tablas_html,
-    )
-    return html
+    return "".join(generar_html_reporte(contexto, plantilla=plantilla))
 
 
-def generar_pdf_reporte(contexto: ReporteJugadorContexto, plantilla: str = "reporte_jugador.html") -> bytes:
+def generar_pdf_reporte(
+    contexto: ReporteJugadorContexto,
+    plantilla: str = "reporte_jugador.html",
+    backend: Optional[str] = None,
+) -> bytes:
     """Genera un PDF en memoria a partir del contexto del reporte.
 
     Esta función NO sabe nada de Streamlit ni de cómo se obtienen los datos.
-    Solo recibe un contexto ya preparado, renderiza la plantilla HTML y lo
-    convierte a PDF usando WeasyPrint.
+    Solo recibe un contexto ya preparado y lo delega en el motor de PDF elegido
+    (WeasyPrint sobre la plantilla HTML, o fpdf2 dibujando directamente).
 
     Parameters
     ----------
@@ -100,6 +153,8 @@ def generar_pdf_reporte(contexto: ReporteJugadorContexto, plantilla: str = "repo
         Datos ya preparados para el reporte.
     plantilla : str
         Nombre del archivo de plantilla HTML dentro de la carpeta `templates`.
+    backend : str | None
+        "weasyprint", "fpdf2" o "auto". Por defecto se usa `BACKEND_PDF` de settings.
 
     Returns
     -------
@@ -107,20 +162,27 @@ def generar_pdf_reporte(contexto: ReporteJugadorContexto, plantilla: str = "repo
         Contenido del PDF listo para ser enviado al navegador o guardado en disco.
     """
 
-    if HTML is None:
-        raise RuntimeError(
-            "La librería 'weasyprint' no está instalada. Instálala con 'pip install weasyprint' para habilitar la exportación a PDF."
-        )
+    return obtener_backend_pdf(backend).generar(contexto, plantilla=plantilla)
+
 
-    html_str = renderizar_html_reporte(contexto, plantilla=plantilla)
-    pdf_bytes = HTML(string=html_str).write_pdf()
-    return pdf_bytes
+def _fig_to_bytes(fig, formato: str = "png") -> bytes:
+	"""Exporta una figura de Plotly a PNG o SVG.
 
+	En SVG se usa primero el exportador vectorial propio (sin kaleido); si la
+	figura tiene trazas que no soporta, se recurre a kaleido igual que en PNG.
+	"""
 
-def _fig_to_data_uri(fig) -> str:
+	if formato not in FORMATOS_GRAFICOS:
+		raise ValueError(f"Formato de gráfico no soportado: {formato}")
+
+	if formato == "svg":
+		try:
+			return figura_a_svg(fig).encode("utf-8")
+		except ValueError:
+			pass
 
 	try:
-		img_bytes = fig.to_image(format="png")
+		return fig.to_image(format=formato)
 	except Exception as e:
 		# En entornos como Streamlit Cloud, Kaleido o sus dependencias (Chrome) pueden no estar disponibles.
 		# En ese caso, dejamos claro que la exportación a PDF no está soportada en ese entorno.
@@ -129,8 +191,91 @@ def _fig_to_data_uri(fig) -> str:
 			"En este entorno no están disponibles, por lo que la generación de PDF solo está soportada en ejecución local."
 		) from e
 
+
+def _fig_to_data_uri(fig, formato: str = "png") -> str:
+
+	img_bytes = _fig_to_bytes(fig, formato)
 	b64 = base64.b64encode(img_bytes).decode("ascii")
-	return f"data:image/png;base64,{b64}"
+	return f"data:{FORMATOS_GRAFICOS[formato]};base64,{b64}"
+
+
+def _fig_to_archivo(fig, directorio: Path, nombre: str, formato: str = "png") -> str:
+	"""Guarda la figura en `directorio` y devuelve el nombre de archivo para referenciarla en el HTML."""
+
+	nombre_archivo = "".join(c if c.isalnum() or c in "-_." else "_" for c in f"{nombre}.{formato}")
+	(directorio / nombre_archivo).write_bytes(_fig_to_bytes(fig, formato))
+	return nombre_archivo
+
+
+def obtener_fecha_reporte(datos_jugador) -> str:
+    """Devuelve la fecha de evaluación del jugador formateada como dd/mm/aaaa.
+
+    El Excel actual usa la columna 'FECHA'; se mantiene 'Fecha' por compatibilidad.
+    """
+
+    fecha_valor = datos_jugador.get("Fecha", datos_jugador.get("FECHA", ""))
+    if hasattr(fecha_valor, "strftime"):
+        return fecha_valor.strftime("%d/%m/%Y")
+    return str(fecha_valor)
+
+
+def obtener_componentes_reporte(df, datos_jugador, jugador: str, categoria: str, seccion: str, vista: str,
+                                referencia: Optional[str] = None, df_historial=None, fecha_corte=None,
+                                metrica: Optional[str] = None, ventana: int = VENTANA_POR_DEFECTO) -> dict:
+    """Obtiene las figuras y tablas del reporte según la vista y la sección.
+
+    Devuelve el mismo diccionario que las funciones `obtener_componentes_perfil_*`
+    ({"figuras": [...], "tablas": {...}}) y no depende de Streamlit. `referencia`
+    es el grupo contra el que se compara al jugador (None = su categoría).
+
+    La vista "Evolución Longitudinal" usa `df_historial` (todas las sesiones, no
+    la foto `df`) hasta `fecha_corte`, con la `metrica` (None = la primera de la
+    sección) y la `ventana` elegidas en la vista.
+    """
+
+    # Preparar datos base en formato dict para poder modificarlos según la vista
+    if hasattr(datos_jugador, "to_dict"):
+        datos_dict = datos_jugador.to_dict()
+    else:
+        datos_dict = dict(datos_jugador)
+
+    # Columnas de fuerza del registro de métricas (pares DER/IZQ y totales)
+    columnas_fuerza = columnas_seccion("Fuerza")
+
+    if seccion not in secciones_disponibles():
+        raise ValueError(f"Sección no soportada para reporte PDF: {seccion}")
+
+    if vista == "Evolución Longitudinal":
+        if df_historial is None:
+            raise ValueError("El reporte de evolución necesita el historial de evaluaciones (df_historial).")
+        metrica = metrica or next(iter(METRICAS_HEATMAP[seccion].values()))
+        return obtener_componentes_evolucion(df_historial, jugador, categoria, seccion, metrica, fecha_corte, ventana)
+
+    # Vistas grupales: componentes de la categoría (sin jugador)
+    if vista == "Heatmap del Grupo":
+        return obtener_componentes_heatmap_grupal(df, categoria, seccion)
+    if vista == "Perfil del Grupo":
+        return componentes_vista(vista, seccion, df, categoria)
+
+    # Para las vistas basadas en jugador (Perfil del Jugador, Comparación), mantenemos la lógica individual
+    # Validación básica de datos para evitar PDFs "vacíos" en Fuerza
+    if seccion == "Fuerza":
+        valores_validos = []
+        for col in columnas_fuerza:
+            if col in datos_dict:
+                valor = datos_dict[col]
+                try:
+                    valor_float = float(valor)
+                except (TypeError, ValueError):
+                    continue
+                if valor_float != 0.0:
+                    valores_validos.append(valor_float)
+        if not valores_validos:
+            raise ValueError(
+                "Sin datos de fuerza válidos para este jugador. Verifica que las métricas de fuerza estén cargadas antes de exportar el PDF."
+            )
+
+    return componentes_vista(vista, seccion, df, categoria, jugador, datos_dict, referencia=referencia)
 
 
 def construir_contexto_reporte_perfil(
@@ -141,91 +286,66 @@ def construir_contexto_reporte_perfil(
     seccion: str,
     vista: str,
     fecha: str,
+    formato_graficos: str = "png",
+    directorio_graficos: Optional[str] = None,
+    referencia: Optional[str] = None,
+    df_historial=None,
+    fecha_corte=None,
+    metrica: Optional[str] = None,
+    ventana: int = VENTANA_POR_DEFECTO,
 ) -> ReporteJugadorContexto:
+    """Construye el contexto del reporte (gráficos + tablas) listo para renderizar.
 
-    # Preparar datos base en formato dict para poder modificarlos según la vista
-    if hasattr(datos_jugador, "to_dict"):
-        datos_dict = datos_jugador.to_dict()
-    else:
-        datos_dict = dict(datos_jugador)
-
-    # Definir columnas principales de fuerza y movilidad
-    columnas_fuerza = [
-        "CUAD DER (N)",
-        "CUAD IZQ (N)",
-        "WOLLIN DER",
-        "WOLLIN IZQ",
-        "F PICO DER (IMTP) (N)",
-        "F PICO IZQ (IMTP) (N)",
-        "FP DER (CMJ) (N)",
-        "FP IZQ (CMJ) (N)",
-        "FF DER (CMJ) (N)",
-        "FF IZQ (CMJ) (N)",
-        "TRIPLE SALTO DER",
-        "TRIPLE SALTO IZQ",
-        "F PICO (IMTP) (N)",
-        "FP (CMJ) (N)",
-        "FF (CMJ) (N)",
-    ]
-
-    columnas_movilidad = [
-        "AKE DER",
-        "AKE IZQ",
-        "THOMAS DER",
-        "THOMAS IZQ",
-        "LUNGE DER",
-        "LUNGE IZQ",
-    ]
-
-    # Si estamos en PERFIL DEL GRUPO, usar componentes específicos de grupo
-    if vista == "Perfil del Grupo" and seccion == "Fuerza":
-        componentes = obtener_componentes_perfil_fuerza_grupal(df, categoria)
-    elif vista == "Perfil del Grupo" and seccion == "Movilidad":
-        componentes = obtener_componentes_perfil_movilidad_grupal(df, categoria)
-    else:
-        # Para las vistas basadas en jugador (Perfil del Jugador, Comparación), mantenemos la lógica individual
-        pass
+    Parameters
+    ----------
+    formato_graficos : str
+        "png" (por defecto) o "svg". El SVG es vectorial: pesa menos y WeasyPrint
+        no necesita decodificar imágenes grandes.
+    directorio_graficos : str | None
+        Si se indica, los gráficos se guardan como archivos en ese directorio y el
+        HTML los referencia por nombre (con `base_url`) en lugar de incrustarlos en base64.
+    referencia : str | None
+        Grupo de referencia de las tablas comparativas (None = categoría del jugador).
+    df_historial, fecha_corte, metrica, ventana
+        Solo para "Evolución Longitudinal" (ver `obtener_componentes_reporte`).
+    """
 
-        # Validación básica de datos para evitar PDFs "vacíos" en Fuerza
-        if seccion == "Fuerza":
-            valores_validos = []
-            for col in columnas_fuerza:
-                if col in datos_dict:
-                    valor = datos_dict[col]
-                    try:
-                        valor_float = float(valor)
-                    except (TypeError, ValueError):
-                        continue
-                    if valor_float != 0.0:
-                        valores_validos.append(valor_float)
-            if not valores_validos:
-                raise ValueError(
-                    "Sin datos de fuerza válidos para este jugador. Verifica que las métricas de fuerza estén cargadas antes de exportar el PDF."
-                )
-
-            componentes = obtener_componentes_perfil_fuerza(df, datos_dict, jugador, categoria)
-        elif seccion == "Movilidad":
-            componentes = obtener_componentes_perfil_movilidad(df, datos_dict, jugador, categoria)
-        else:
-            raise ValueError(f"Sección no soportada para reporte PDF: {seccion}")
+    componentes = obtener_componentes_reporte(
+        df, datos_jugador, jugador, categoria, seccion, vista, referencia,
+        df_historial=df_historial, fecha_corte=fecha_corte, metrica=metrica, ventana=ventana,
+    )
 
     figuras = componentes.get("figuras", [])
     tablas = componentes.get("tablas", {})
 
-    graficos_paths = [_fig_to_data_uri(fig) for fig in figuras]
+    base_url = None
+    if directorio_graficos is None:
+        graficos_paths = [_fig_to_data_uri(fig, formato_graficos) for fig in figuras]
+    else:
+        directorio = Path(directorio_graficos).resolve()
+        directorio.mkdir(parents=True, exist_ok=True)
+        base_url = directorio.as_uri() + "/"
+        graficos_paths = [
+            _fig_to_archivo(fig, directorio, f"{jugador}_{seccion}_{vista}_{i}", formato_graficos)
+            for i, fig in enumerate(figuras, start=1)
+        ]
 
     tablas_html: List[str] = []
+    tablas_df: List[pd.DataFrame] = []
 
     # Seleccionar qué tablas incluir según la vista/sección
-    if vista == "Perfil del Grupo" and seccion in ("Fuerza", "Movilidad"):
+    if vista in VISTAS_GRUPALES:
         keys_tablas = ["comparativa_grupal"]
+    elif vista == "Evolución Longitudinal":
+        keys_tablas = ["tendencias", "cambios_significativos"]
     else:
         keys_tablas = ["zscores", "comparativa"]
 
     for key in keys_tablas:
         df_tabla = tablas.get(key)
         if df_tabla is not None and not df_tabla.empty:
-            tablas_html.append(df_tabla.to_html(classes="tabla-metrica", border=0))
+            tablas_html.append(df_tabla.to_html(classes="tabla-metrica", border=0, na_rep="—"))
+            tablas_df.append(df_tabla)
 
     contexto = ReporteJugadorContexto(
         nombre_jugador=jugador,
@@ -235,5 +355,7 @@ def construir_contexto_reporte_perfil(
         vista=vista,
         graficos_paths=graficos_paths,
         tablas_html=tablas_html,
+        base_url=base_url,
+        tablas=tablas_df,
     )
     return contexto
@@ -0,0 +1,254 @@
+"""
+Motor de tendencias longitudinales (ventanas móviles por jugador)
+
+Calcula para cada jugador, métrica y evaluación:
+- media móvil de las últimas `ventana` evaluaciones,
+- pendiente (regresión lineal valor ~ días) expresada como cambio cada 30 días,
+- coeficiente de variación (%) dentro de la ventana.
+
+Todo se resuelve en una sola pasada vectorizada sobre el historial ordenado por
+(Deportista, FECHA): sumas acumuladas por columna y diferencias entre el final
+de la ventana y su inicio (recortado al comienzo del bloque de cada jugador),
+sin bucles de Python sobre jugadores.
+"""
+
+import numpy as np
+import pandas as pd
+
+from config.settings import CACHE_TTL, FACTOR_SWC, MIN_JUGADORES_ERROR_TIPICO
+from utils.cache_utils import cache_data
+
+COLUMNA_FECHA = "FECHA"
+COLUMNA_JUGADOR = "Deportista"
+VENTANA_POR_DEFECTO = 3
+DIAS_POR_MES = 30.0
+
+
+def _sumas_ventana(valores, inicio, fin):
+	"""Suma por columna de valores[inicio:fin] para cada fila (vía suma acumulada)"""
+	acumulado = np.zeros((valores.shape[0] + 1, valores.shape[1]))
+	np.cumsum(valores, axis=0, out=acumulado[1:])
+	return acumulado[fin] - acumulado[inicio]
+
+
+def _sumas_por_grupo(valores, codigos, grupos):
+	"""Suma por columna de las filas de cada grupo (codigos en [0, grupos))"""
+	sumas = np.zeros((grupos, valores.shape[1]))
+	np.add.at(sumas, codigos, valores)
+	return sumas
+
+
+@cache_data(ttl=CACHE_TTL['estadisticas'])
+def calcular_tendencias(df_historial, metricas, ventana=VENTANA_POR_DEFECTO):
+	"""
+	Calcula media móvil, pendiente y CV por jugador y métrica sobre todo el historial
+
+	Args:
+		df_historial: DataFrame con varias evaluaciones por jugador (columnas
+			Deportista, FECHA y las métricas)
+		metricas: Dict columna → etiqueta (por ejemplo METRICAS_HEATMAP["Fuerza"])
+		ventana: Cantidad de evaluaciones de la ventana móvil
+
+	Returns:
+		DataFrame largo con columnas: Deportista, FECHA, metrica, valor, n,
+		media_movil, pendiente_mensual, cv. Una fila por (jugador, fecha, métrica).
+	"""
+	columnas = [col for col in metricas if col in df_historial.columns]
+	df = df_historial[df_historial[COLUMNA_JUGADOR].notna() & df_historial[COLUMNA_FECHA].notna()]
+	df = df.sort_values([COLUMNA_JUGADOR, COLUMNA_FECHA], kind='stable')
+
+	jugadores = df[COLUMNA_JUGADOR].astype(str).to_numpy()
+	fechas = pd.to_datetime(df[COLUMNA_FECHA]).to_numpy(dtype='datetime64[ns]')
+	valores = df[columnas].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+	filas = len(df)
+
+	if filas == 0 or not columnas:
+		return pd.DataFrame(columns=[COLUMNA_JUGADOR, COLUMNA_FECHA, 'metrica', 'valor', 'n', 'media_movil', 'pendiente_mensual', 'cv'])
+
+	# Inicio del bloque de cada jugador, propagado a todas sus filas
+	posiciones = np.arange(filas)
+	nuevo_bloque = np.empty(filas, dtype=bool)
+	nuevo_bloque[0] = True
+	nuevo_bloque[1:] = jugadores[1:] != jugadores[:-1]
+	inicio_bloque = np.maximum.accumulate(np.where(nuevo_bloque, posiciones, 0))
+
+	# Ventana [inicio, fin) recortada al bloque del jugador
+	fin = posiciones + 1
+	inicio = np.maximum(fin - ventana, inicio_bloque)
+
+	# Tiempo en días desde la primera evaluación del jugador (números chicos = sumas estables)
+	dias = ((fechas - fechas[inicio_bloque]) / np.timedelta64(1, 'D')).astype(float)[:, None]
+
+	# Centrar cada métrica en su media global mejora la precisión de las sumas acumuladas
+	validos = ~np.isnan(valores)
+	cuenta = validos.sum(axis=0)
+	centro = np.where(cuenta > 0, np.where(validos, valores, 0.0).sum(axis=0) / np.maximum(cuenta, 1), 0.0)
+	x = np.where(validos, valores - centro, 0.0)
+	t = np.where(validos, dias, 0.0)
+
+	n = _sumas_ventana(validos.astype(float), inicio, fin)
+	sx = _sumas_ventana(x, inicio, fin)
+	sxx = _sumas_ventana(x * x, inicio, fin)
+	st = _sumas_ventana(t, inicio, fin)
+	stt = _sumas_ventana(t * t, inicio, fin)
+	stx = _sumas_ventana(t * x, inicio, fin)
+
+	with np.errstate(divide='ignore', invalid='ignore'):
+		media = np.where(n > 0, sx / n, np.nan) + centro
+		varianza = np.where(n > 1, (sxx - sx * sx / n) / (n - 1), np.nan)
+		desviacion = np.sqrt(np.clip(varianza, 0.0, None))
+		cv = np.where(np.abs(media) > 0, desviacion / np.abs(media) * 100, np.nan)
+		denominador = n * stt - st * st
+		pendiente = np.where((n > 1) & (denominador > 0), (n * stx - st * sx) / denominador, np.nan) * DIAS_POR_MES
+
+	etiquetas = np.array([metricas[col] for col in columnas], dtype=object)
+	m = len(columnas)
+	return pd.DataFrame({
+		COLUMNA_JUGADOR: np.repeat(df[COLUMNA_JUGADOR].to_numpy(), m),
+		COLUMNA_FECHA: np.repeat(fechas, m),
+		'metrica': np.tile(etiquetas, filas),
+		'valor': valores.ravel(),
+		'n': n.ravel().astype(int),
+		'media_movil': np.round(media.ravel(), 2),
+		'pendiente_mensual': np.round(pendiente.ravel(), 2),
+		'cv': np.round(cv.ravel(), 1)
+	})
+
+
+def resumir_tendencias(tendencias, fecha=None):
+	"""
+	Tendencia vigente de cada jugador y métrica (su última evaluación <= fecha)
+
+	Args:
+		tendencias: Resultado de calcular_tendencias
+		fecha: Fecha de corte; None = última evaluación de cada jugador
+
+	Returns:
+		DataFrame con una fila por (Deportista, metrica)
+	"""
+	if fecha is not None:
+		tendencias = tendencias[tendencias[COLUMNA_FECHA] <= pd.Timestamp(fecha)]
+	# calcular_tendencias devuelve filas ordenadas por jugador y fecha: la última es la vigente
+	return tendencias.drop_duplicates([COLUMNA_JUGADOR, 'metrica'], keep='last').reset_index(drop=True)
+
+
+@cache_data(ttl=CACHE_TTL['estadisticas'])
+def calcular_cambios_sesion(df_historial, metricas):
+	"""
+	Cambio de cada jugador y métrica respecto de su evaluación anterior
+
+	Para cada sesión (FECHA) y métrica:
+	- SWC = FACTOR_SWC × SD entre jugadores evaluados en esa sesión,
+	- error típico = SD de las diferencias / √2 entre los jugadores con ambas
+	  evaluaciones (se necesita un mínimo de MIN_JUGADORES_ERROR_TIPICO).
+
+	Un cambio es significativo cuando |delta| supera al SWC y al error típico.
+	Todo se calcula sobre la matriz (filas × métricas) en una sola pasada.
+
+	Args:
+		df_historial: DataFrame con varias evaluaciones por jugador
+		metricas: Dict columna → etiqueta
+
+	Returns:
+		DataFrame largo con columnas: Deportista, FECHA, FECHA_ANTERIOR, metrica,
+		anterior, actual, delta, delta_pct, swc, error_tipico, magnitud, significativo,
+		reevaluada. Hay una fila por par de sesiones consecutivas y métrica; si la
+		métrica falta en alguna de las dos, reevaluada es False y delta queda en NaN.
+	"""
+	columnas_salida = [
+		COLUMNA_JUGADOR, COLUMNA_FECHA, 'FECHA_ANTERIOR', 'metrica', 'anterior', 'actual',
+		'delta', 'delta_pct', 'swc', 'error_tipico', 'magnitud', 'significativo', 'reevaluada'
+	]
+	columnas = [col for col in metricas if col in df_historial.columns]
+	df = df_historial[df_historial[COLUMNA_JUGADOR].notna() & df_historial[COLUMNA_FECHA].notna()]
+	# Una evaluación por jugador y fecha (la primera, igual que EvaluacionesLongitudinales.al)
+	df = df.sort_values([COLUMNA_JUGADOR, COLUMNA_FECHA], kind='stable')
+	df = df.drop_duplicates([COLUMNA_JUGADOR, COLUMNA_FECHA], keep='first')
+
+	if len(df) < 2 or not columnas:
+		return pd.DataFrame(columns=columnas_salida)
+
+	jugadores = df[COLUMNA_JUGADOR].astype(str).to_numpy()
+	fechas = pd.to_datetime(df[COLUMNA_FECHA]).to_numpy(dtype='datetime64[ns]')
+	valores = df[columnas].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+	# SWC por sesión: SD entre jugadores de cada fecha (ddof=1), vía sumas agrupadas
+	codigos_fecha, fechas_unicas = pd.factorize(fechas, sort=True)
+	validos = ~np.isnan(valores)
+	x = np.where(validos, valores, 0.0)
+	n_fecha = _sumas_por_grupo(validos.astype(float), codigos_fecha, len(fechas_unicas))
+	s_fecha = _sumas_por_grupo(x, codigos_fecha, len(fechas_unicas))
+	ss_fecha = _sumas_por_grupo(x * x, codigos_fecha, len(fechas_unicas))
+	with np.errstate(divide='ignore', invalid='ignore'):
+		sd_fecha = np.sqrt(np.clip(np.where(n_fecha > 1, (ss_fecha - s_fecha * s_fecha / n_fecha) / (n_fecha - 1), np.nan), 0.0, None))
+	swc = FACTOR_SWC * sd_fecha[codigos_fecha]
+
+	# Pares consecutivos: fila i contra i-1 cuando ambas son del mismo jugador
+	mismo_jugador = np.zeros(len(df), dtype=bool)
+	mismo_jugador[1:] = jugadores[1:] == jugadores[:-1]
+	filas = np.flatnonzero(mismo_jugador)
+	anterior = valores[filas - 1]
+	actual = valores[filas]
+	delta = actual - anterior
+	con_par = ~np.isnan(delta)
+
+	# Error típico por sesión: SD de las diferencias entre jugadores / √2
+	codigos_par = codigos_fecha[filas]
+	d = np.where(con_par, delta, 0.0)
+	n_par = _sumas_por_grupo(con_par.astype(float), codigos_par, len(fechas_unicas))
+	s_par = _sumas_por_grupo(d, codigos_par, len(fechas_unicas))
+	ss_par = _sumas_por_grupo(d * d, codigos_par, len(fechas_unicas))
+	with np.errstate(divide='ignore', invalid='ignore'):
+		var_par = np.where(n_par >= MIN_JUGADORES_ERROR_TIPICO, (ss_par - s_par * s_par / n_par) / (n_par - 1), np.nan)
+		error_tipico = (np.sqrt(np.clip(var_par, 0.0, None)) / np.sqrt(2))[codigos_par]
+		delta_pct = np.where(anterior != 0, delta / np.abs(anterior) * 100, np.nan)
+		swc_par = swc[filas]
+		magnitud = np.where(swc_par > 0, np.abs(delta) / swc_par, np.nan)
+	# Sin error típico estimable solo se exige superar el SWC
+	umbral = np.fmax(swc_par, np.nan_to_num(error_tipico, nan=0.0))
+	significativo = con_par & (swc_par > 0) & (np.abs(delta) > umbral)
+
+	m = len(columnas)
+	etiquetas = np.array([metricas[col] for col in columnas], dtype=object)
+	resultado = pd.DataFrame({
+		COLUMNA_JUGADOR: np.repeat(df[COLUMNA_JUGADOR].to_numpy()[filas], m),
+		COLUMNA_FECHA: np.repeat(fechas[filas], m),
+		'FECHA_ANTERIOR': np.repeat(fechas[filas - 1], m),
+		'metrica': np.tile(etiquetas, len(filas)),
+		'anterior': anterior.ravel(),
+		'actual': actual.ravel(),
+		'delta': np.round(delta.ravel(), 2),
+		'delta_pct': np.round(delta_pct.ravel(), 1),
+		'swc': np.round(swc_par.ravel(), 2),
+		'error_tipico': np.round(error_tipico.ravel(), 2),
+		'magnitud': np.round(magnitud.ravel(), 2),
+		'significativo': significativo.ravel(),
+		'reevaluada': con_par.ravel()
+	})
+	return resultado
+
+
+def cambios_significativos(cambios, fecha=None, solo_significativos=True):
+	"""
+	Tabla "cambios significativos" de la última sesión de cada jugador, ordenada por magnitud
+
+	Solo cuenta el par de sesiones más reciente de cada jugador (hasta la fecha de
+	corte): una métrica que no se reevaluó en él no muestra el cambio de un par
+	anterior como vigente, sino una fila sin delta (reevaluada = False).
+
+	Args:
+		cambios: Resultado de calcular_cambios_sesion
+		fecha: Fecha de corte; None = todas las sesiones
+		solo_significativos: Si es False incluye todos los cambios del par
+
+	Returns:
+		DataFrame ordenado de mayor a menor |delta| / SWC (las no reevaluadas al final)
+	"""
+	if fecha is not None:
+		cambios = cambios[cambios[COLUMNA_FECHA] <= pd.Timestamp(fecha)]
+	ultima = cambios.groupby(COLUMNA_JUGADOR, sort=False)[COLUMNA_FECHA].transform('max')
+	# Del par vigente, las métricas evaluadas en al menos una de las dos sesiones
+	cambios = cambios[(cambios[COLUMNA_FECHA] == ultima) & (cambios['anterior'].notna() | cambios['actual'].notna())]
+	if solo_significativos:
+		cambios = cambios[cambios['significativo'] | ~cambios['reevaluada']]
+	return cambios.sort_values('magnitud', ascending=False, kind='stable', na_position='last').reset_index(drop=True)
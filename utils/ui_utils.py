@@ -3,9 +3,8 @@ Utilidades para interfaz de usuario
 """
 
 import base64
-import streamlit as st
 from functools import lru_cache
-from config.settings import ESCUDO_PATH
+from config.settings import ESCUDO_PATH, VIGILANCIA_EXCEL_SEGUNDOS
 
 @lru_cache(maxsize=32)
 def get_base64_image(image_path):
@@ -16,8 +15,12 @@ def get_base64_image(image_path):
 
 def inicializar_session_state():
 	"""Inicializa variables del session state"""
+	import streamlit as st
+
 	if 'df_cache' not in st.session_state:
 		st.session_state.df_cache = None
+	if 'historial_cache' not in st.session_state:
+		st.session_state.historial_cache = None
 	if 'ultimo_jugador' not in st.session_state:
 		st.session_state.ultimo_jugador = None
 	if 'ultima_categoria' not in st.session_state:
@@ -25,6 +28,28 @@ def inicializar_session_state():
 	if 'metricas_cache' not in st.session_state:
 		st.session_state.metricas_cache = {}
 
+def refrescar_con_datos_nuevos():
+	"""
+	Vuelve a ejecutar la app cuando el vigilante de los archivos locales publica una versión nueva
+
+	Un fragmento revisa cada VIGILANCIA_EXCEL_SEGUNDOS si la ingesta (utils.ingesta)
+	tiene un DataFrame distinto al de la sesión; la revisión es una comparación de
+	identidad, la lectura del Excel ya la hizo el hilo vigilante.
+	"""
+	import streamlit as st
+	from utils.data_utils import hay_datos_nuevos
+
+	# st.fragment(run_every=...) existe desde Streamlit 1.37; Drive no tiene vigilante
+	if VIGILANCIA_EXCEL_SEGUNDOS <= 0 or not hasattr(st, "fragment") or st.session_state.get('ingesta_clave') is None:
+		return
+
+	@st.fragment(run_every=VIGILANCIA_EXCEL_SEGUNDOS)
+	def revisar_version_datos():
+		if hay_datos_nuevos():
+			st.rerun()
+
+	revisar_version_datos()
+
 def configurar_tema_oscuro():
 	"""Configura el tema oscuro programáticamente"""
 	# Configuración del tema mediante st.config
@@ -43,6 +68,8 @@ def aplicar_estilos_css():
 	Aplica estilos mínimos y coherentes con el tema oscuro general del dashboard.
 	No modifica los componentes de Streamlit directamente.
 	"""
+	import streamlit as st
+
 	st.markdown(
 		"""
 		<style>
@@ -62,6 +89,8 @@ def aplicar_estilos_css():
 
 def crear_header_principal():
 	"""Crea el header principal de la aplicación pegado arriba con títulos destacados"""
+	import streamlit as st
+
 	escudo_base64 = get_base64_image(ESCUDO_PATH)
 	
 	# CSS para eliminar padding superior global
@@ -121,6 +150,8 @@ def crear_header_principal():
 
 def crear_footer():
 	"""Crea el footer de la aplicación"""
+	import streamlit as st
+
 	st.markdown("<br><br>", unsafe_allow_html=True)
 	st.markdown("""
 	<div style='background: linear-gradient(135deg, rgba(220, 38, 38, 0.9), rgba(17, 24, 39, 0.9)); 
@@ -2,13 +2,32 @@
 Módulo de visualizaciones - Gráficos y charts
 """
 
-import streamlit as st
 import plotly.graph_objects as go
+import numpy as np
 import pandas as pd
 from config.settings import CACHE_TTL, COLORES, Z_SCORE_METRICAS, METRICAS_ZSCORE_FUERZA, METRICAS_ZSCORE_RADAR_SIMPLE, METRICAS_ZSCORE_MOVILIDAD, ESCUDO_PATH
 from utils.ui_utils import get_base64_image
+from config.metricas import obtener_metrica, es_total
+from utils.cache_utils import cache_data
+from utils.bandas import clasificar_zscores
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico de fuerza...")
+# Colores de anotación por zona LSI (relleno, borde)
+_COLORES_ZONA_LSI = {
+	"optimo": (COLORES['verde_optimo'], "rgba(50, 205, 50, 1)"),
+	"alerta": (COLORES['naranja_alerta'], "rgba(255, 165, 0, 1)"),
+	"riesgo": (COLORES['rojo_riesgo'], "rgba(255, 69, 0, 1)")
+}
+
+def _colores_lsi(metrica, lsi_val):
+	"""Colores (relleno, borde) de la anotación LSI según los umbrales registrados de la métrica"""
+	return _COLORES_ZONA_LSI[obtener_metrica(metrica).zona_lsi(lsi_val)]
+
+def _unidades(metricas):
+	"""Unidad de cada métrica (customdata de las barras)"""
+	return [obtener_metrica(metrica).unidad for metrica in metricas]
+
+
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico de fuerza...")
 def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metricas_columnas):
 	"""Crea gráfico de multifuerza con cache optimizado"""
 	# Usar directamente el dict de datos del jugador
@@ -23,9 +42,9 @@ def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metric
 
 	for metrica in metricas_seleccionadas:
 		# Métricas totales (no bilaterales)
-		if metrica in ["IMTP Total", "CMJ FP Total", "CMJ FF Total"]:
+		if es_total(metrica):
 			col_total = metricas_columnas[metrica][0]  # Usar la primera columna (son iguales)
-			val_total = datos_jugador.get(col_total, 0)
+			val_total = datos_jugador.get(col_total, np.nan)
 			valores_totales.append(val_total)
 			nombres_totales.append(metrica)
 			metricas_totales.append(metrica)
@@ -33,8 +52,8 @@ def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metric
 		# Métricas bilaterales tradicionales
 		else:
 			col_der, col_izq = metricas_columnas[metrica]
-			val_der = datos_jugador.get(col_der, 0)
-			val_izq = datos_jugador.get(col_izq, 0)
+			val_der = datos_jugador.get(col_der, np.nan)
+			val_izq = datos_jugador.get(col_izq, np.nan)
 			barras_der.append(val_der)
 			barras_izq.append(val_izq)
 			nombres_bilaterales.append(metrica)
@@ -52,6 +71,7 @@ def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metric
 		fig.add_trace(go.Bar(
 			x=nombres_bilaterales,
 			y=barras_der,
+			customdata=_unidades(nombres_bilaterales),
 			name="🔴 Derecho",
 			marker=dict(
 				color=COLORES['rojo_colon'],
@@ -62,10 +82,10 @@ def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metric
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f} N" for v in barras_der],
+			text=["" if pd.isna(v) else f"{v:.0f} {u}" for v, u in zip(barras_der, _unidades(nombres_bilaterales))],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
-			hovertemplate='<b>🔴 Derecho</b><br>%{x}: %{y:.0f} N<br><i>Lado dominante</i><extra></extra>',
+			hovertemplate='<b>🔴 Derecho</b><br>%{x}: %{y:.0f} %{customdata}<br><i>Lado dominante</i><extra></extra>',
 			offsetgroup=1,
 			hoverlabel=dict(
 				bgcolor="rgba(220, 38, 38, 0.9)",
@@ -77,6 +97,7 @@ def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metric
 		fig.add_trace(go.Bar(
 			x=nombres_bilaterales,
 			y=barras_izq,
+			customdata=_unidades(nombres_bilaterales),
 			name="⚫ Izquierdo",
 			marker=dict(
 				color=COLORES['negro_colon'],
@@ -87,10 +108,10 @@ def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metric
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f} N" for v in barras_izq],
+			text=["" if pd.isna(v) else f"{v:.0f} {u}" for v, u in zip(barras_izq, _unidades(nombres_bilaterales))],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
-			hovertemplate='<b>⚫ Izquierdo</b><br>%{x}: %{y:.0f} N<br><i>Lado no dominante</i><extra></extra>',
+			hovertemplate='<b>⚫ Izquierdo</b><br>%{x}: %{y:.0f} %{customdata}<br><i>Lado no dominante</i><extra></extra>',
 			offsetgroup=2,
 			hoverlabel=dict(
 				bgcolor="rgba(31, 41, 55, 0.9)",
@@ -104,6 +125,7 @@ def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metric
 		fig.add_trace(go.Bar(
 			x=nombres_totales,
 			y=valores_totales,
+			customdata=_unidades(nombres_totales),
 			name="🟡 Total",
 			marker=dict(
 				color="rgba(255, 193, 7, 0.9)",  # Color dorado para totales
@@ -114,10 +136,10 @@ def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metric
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f} N" for v in valores_totales],
+			text=["" if pd.isna(v) else f"{v:.0f} {u}" for v, u in zip(valores_totales, _unidades(nombres_totales))],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
-			hovertemplate='<b>🟡 Total</b><br>%{x}: %{y:.0f} N<br><i>Valor bilateral combinado</i><extra></extra>',
+			hovertemplate='<b>🟡 Total</b><br>%{x}: %{y:.0f} %{customdata}<br><i>Valor bilateral combinado</i><extra></extra>',
 			offsetgroup=3,
 			hoverlabel=dict(
 				bgcolor="rgba(255, 193, 7, 0.9)",
@@ -131,16 +153,8 @@ def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metric
 		lsi_val = lsi_labels.get(name)
 		
 		if lsi_val and lsi_val > 0:
-			# Determinar color según rango LSI
-			if 90 <= lsi_val <= 110:  # Zona óptima
-				lsi_color = COLORES['verde_optimo']
-				border_color = "rgba(50, 205, 50, 1)"
-			elif 80 <= lsi_val < 90 or 110 < lsi_val <= 120:  # Zona de alerta
-				lsi_color = COLORES['naranja_alerta']
-				border_color = "rgba(255, 165, 0, 1)"
-			else:  # Zona de riesgo
-				lsi_color = COLORES['rojo_riesgo']
-				border_color = "rgba(255, 69, 0, 1)"
+			# Color según la zona LSI de la métrica (umbrales del registro)
+			lsi_color, border_color = _colores_lsi(name, lsi_val)
 			
 			fig.add_annotation(
 				text=f"<b>LSI: {lsi_val:.1f}%</b>",
@@ -242,7 +256,7 @@ def crear_grafico_multifuerza(datos_jugador_dict, metricas_seleccionadas, metric
 	return fig
 
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico comparativo de movilidad...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico comparativo de movilidad...")
 def crear_grafico_multimovilidad_comparativo(datos_jugador_dict, estadisticas_grupales, metricas_seleccionadas, metricas_columnas, jugador_nombre):
 	"""Crea gráfico de multimovilidad COMPARATIVO (Jugador vs Grupo superpuesto)"""
 	# Usar directamente el dict de datos del jugador
@@ -259,8 +273,8 @@ def crear_grafico_multimovilidad_comparativo(datos_jugador_dict, estadisticas_gr
 		col_der, col_izq = metricas_columnas[metrica]
 
 		# JUGADOR
-		val_der_jugador = datos_jugador.get(col_der, 0)
-		val_izq_jugador = datos_jugador.get(col_izq, 0)
+		val_der_jugador = datos_jugador.get(col_der, np.nan)
+		val_izq_jugador = datos_jugador.get(col_izq, np.nan)
 		barras_der_jugador.append(val_der_jugador)
 		barras_izq_jugador.append(val_izq_jugador)
 		nombres_bilaterales.append(metrica)
@@ -294,7 +308,7 @@ def crear_grafico_multimovilidad_comparativo(datos_jugador_dict, estadisticas_gr
 				line=dict(color="rgba(59, 130, 246, 0.8)", width=1),
 				opacity=0.6,
 			),
-			text=[f"{v:.0f}" for v in barras_der_grupo],
+			text=["" if pd.isna(v) else f"{v:.0f}" for v in barras_der_grupo],
 			textposition="outside",
 			textfont=dict(size=11, color="rgba(59, 130, 246, 0.9)", family="Roboto"),
 			hovertemplate='<b>🔵 Grupo Derecho</b><br>%{x}: %{y:.0f}°<br><i>Media grupal</i><extra></extra>',
@@ -316,7 +330,7 @@ def crear_grafico_multimovilidad_comparativo(datos_jugador_dict, estadisticas_gr
 				line=dict(color="rgba(59, 130, 246, 0.6)", width=1),
 				opacity=0.5,
 			),
-			text=[f"{v:.0f}" for v in barras_izq_grupo],
+			text=["" if pd.isna(v) else f"{v:.0f}" for v in barras_izq_grupo],
 			textposition="outside",
 			textfont=dict(size=11, color="rgba(59, 130, 246, 0.8)", family="Roboto"),
 			hovertemplate='<b>🔵 Grupo Izquierdo</b><br>%{x}: %{y:.0f}°<br><i>Media grupal</i><extra></extra>',
@@ -344,7 +358,7 @@ def crear_grafico_multimovilidad_comparativo(datos_jugador_dict, estadisticas_gr
 				),
 				opacity=0.9,
 			),
-			text=[f"{v:.0f}°" for v in barras_der_jugador],
+			text=["" if pd.isna(v) else f"{v:.0f}°" for v in barras_der_jugador],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
 			hovertemplate=f'<b>🔴 {jugador_nombre} Derecho</b><br>%{{x}}: %{{y:.0f}}°<br><i>Jugador individual</i><extra></extra>',
@@ -370,7 +384,7 @@ def crear_grafico_multimovilidad_comparativo(datos_jugador_dict, estadisticas_gr
 				),
 				opacity=0.9,
 			),
-			text=[f"{v:.0f}°" for v in barras_izq_jugador],
+			text=["" if pd.isna(v) else f"{v:.0f}°" for v in barras_izq_jugador],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
 			hovertemplate=f'<b>⚫ {jugador_nombre} Izquierdo</b><br>%{{x}}: %{{y:.0f}}°<br><i>Jugador individual</i><extra></extra>',
@@ -387,16 +401,8 @@ def crear_grafico_multimovilidad_comparativo(datos_jugador_dict, estadisticas_gr
 		lsi_val_jugador = lsi_labels_jugador.get(name)
 
 		if lsi_val_jugador and lsi_val_jugador > 0:
-			# Determinar color según rango LSI
-			if 90 <= lsi_val_jugador <= 110:
-				lsi_color = COLORES['verde_optimo']
-				border_color = "rgba(50, 205, 50, 1)"
-			elif 80 <= lsi_val_jugador < 90 or 110 < lsi_val_jugador <= 120:
-				lsi_color = COLORES['naranja_alerta']
-				border_color = "rgba(255, 165, 0, 1)"
-			else:
-				lsi_color = COLORES['rojo_riesgo']
-				border_color = "rgba(255, 69, 0, 1)"
+			# Color según la zona LSI de la métrica (umbrales del registro)
+			lsi_color, border_color = _colores_lsi(name, lsi_val_jugador)
 
 			# Calcular altura máxima entre jugador y grupo
 			max_altura = max(
@@ -509,7 +515,7 @@ def crear_grafico_multimovilidad_comparativo(datos_jugador_dict, estadisticas_gr
 
 	return fig
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar Z-Score...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar Z-Score...")
 def crear_radar_zscore_automatico(zscores_jugador, jugador_nombre):
 	"""
 	Crea un radar chart con Z-Scores calculados automáticamente
@@ -686,7 +692,7 @@ def crear_radar_zscore_automatico(zscores_jugador, jugador_nombre):
 	return fig
 
 # Mantener función legacy para compatibilidad
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar Z-Score...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar Z-Score...")
 def crear_radar_zscore(datos_jugador_dict, jugador_nombre):
 	"""Función legacy - mantener para compatibilidad con Z-Scores existentes en Excel"""
 	# Usar directamente el dict de datos del jugador
@@ -797,7 +803,7 @@ def crear_radar_zscore(datos_jugador_dict, jugador_nombre):
 	
 	return fig
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar Z-Score simplificado...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar Z-Score simplificado...")
 def crear_radar_zscore_simple(zscores_radar, jugador_nombre):
 	"""
 	Crea un radar chart simplificado estilo deportivo (máximo 5 métricas)
@@ -834,16 +840,12 @@ def crear_radar_zscore_simple(zscores_radar, jugador_nombre):
 	valores_originales = []
 	medias_poblacion = []
 	
-	# Orden específico para mejor visualización
-	orden_metricas = ['CUAD', 'ISQ Wollin', 'IMTP', 'CMJ Propulsiva', 'CMJ Frenado']
-	
-	for metrica in orden_metricas:
-		if metrica in zscores_radar:
-			data = zscores_radar[metrica]
-			valores.append(data['zscore'])
-			etiquetas.append(metrica)
-			valores_originales.append(data['valor_original'])
-			medias_poblacion.append(data['media_poblacion'])
+	# En el orden del registro de métricas (orden de `zscores_radar`)
+	for metrica, data in zscores_radar.items():
+		valores.append(data['zscore'])
+		etiquetas.append(metrica)
+		valores_originales.append(data['valor_original'])
+		medias_poblacion.append(data['media_poblacion'])
 	
 	if not valores:
 		# Sin valores válidos
@@ -953,7 +955,7 @@ def crear_radar_zscore_simple(zscores_radar, jugador_nombre):
 	
 	return fig
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico grupal de fuerza...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico grupal de fuerza...")
 def crear_grafico_multifuerza_grupal(estadisticas_grupales, metricas_seleccionadas, categoria):
 	"""Crea gráfico de multifuerza GRUPAL con medias del grupo"""
 	
@@ -967,7 +969,7 @@ def crear_grafico_multifuerza_grupal(estadisticas_grupales, metricas_seleccionad
 	for metrica in metricas_seleccionadas:
 		if metrica in estadisticas_grupales:
 			# Métricas totales (no bilaterales)
-			if metrica in ["IMTP Total", "CMJ FP Total", "CMJ FF Total"]:
+			if es_total(metrica):
 				val_total = estadisticas_grupales[metrica]['media_total']
 				valores_totales.append(val_total)
 				nombres_totales.append(metrica)
@@ -994,6 +996,7 @@ def crear_grafico_multifuerza_grupal(estadisticas_grupales, metricas_seleccionad
 		fig.add_trace(go.Bar(
 			x=nombres_bilaterales,
 			y=barras_der,
+			customdata=_unidades(nombres_bilaterales),
 			name="🔴 Derecho (Grupo)",
 			marker=dict(
 				color="rgba(220, 38, 38, 0.9)",  # Rojo igual al individual
@@ -1004,10 +1007,10 @@ def crear_grafico_multifuerza_grupal(estadisticas_grupales, metricas_seleccionad
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f} N" for v in barras_der],
+			text=["" if pd.isna(v) else f"{v:.0f} {u}" for v, u in zip(barras_der, _unidades(nombres_bilaterales))],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
-			hovertemplate='<b>🔴 Derecho (Grupo)</b><br>%{x}: %{y:.0f} N<br><i>Media grupal</i><extra></extra>',
+			hovertemplate='<b>🔴 Derecho (Grupo)</b><br>%{x}: %{y:.0f} %{customdata}<br><i>Media grupal</i><extra></extra>',
 			offsetgroup=1,
 			hoverlabel=dict(
 				bgcolor="rgba(220, 38, 38, 0.9)",
@@ -1019,6 +1022,7 @@ def crear_grafico_multifuerza_grupal(estadisticas_grupales, metricas_seleccionad
 		fig.add_trace(go.Bar(
 			x=nombres_bilaterales,
 			y=barras_izq,
+			customdata=_unidades(nombres_bilaterales),
 			name="⚫ Izquierdo (Grupo)",
 			marker=dict(
 				color="rgba(31, 41, 55, 0.9)",  # Negro igual al individual
@@ -1029,10 +1033,10 @@ def crear_grafico_multifuerza_grupal(estadisticas_grupales, metricas_seleccionad
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f} N" for v in barras_izq],
+			text=["" if pd.isna(v) else f"{v:.0f} {u}" for v, u in zip(barras_izq, _unidades(nombres_bilaterales))],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
-			hovertemplate='<b>⚫ Izquierdo (Grupo)</b><br>%{x}: %{y:.0f} N<br><i>Media grupal</i><extra></extra>',
+			hovertemplate='<b>⚫ Izquierdo (Grupo)</b><br>%{x}: %{y:.0f} %{customdata}<br><i>Media grupal</i><extra></extra>',
 			offsetgroup=2,
 			hoverlabel=dict(
 				bgcolor="rgba(31, 41, 55, 0.9)",
@@ -1046,6 +1050,7 @@ def crear_grafico_multifuerza_grupal(estadisticas_grupales, metricas_seleccionad
 		fig.add_trace(go.Bar(
 			x=nombres_totales,
 			y=valores_totales,
+			customdata=_unidades(nombres_totales),
 			name="🟡 Total (Grupo)",
 			marker=dict(
 				color="rgba(255, 193, 7, 0.9)",  # Color dorado para totales
@@ -1056,10 +1061,10 @@ def crear_grafico_multifuerza_grupal(estadisticas_grupales, metricas_seleccionad
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f} N" for v in valores_totales],
+			text=["" if pd.isna(v) else f"{v:.0f} {u}" for v, u in zip(valores_totales, _unidades(nombres_totales))],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
-			hovertemplate='<b>🟡 Total (Grupo)</b><br>%{x}: %{y:.0f} N<br><i>Media grupal bilateral</i><extra></extra>',
+			hovertemplate='<b>🟡 Total (Grupo)</b><br>%{x}: %{y:.0f} %{customdata}<br><i>Media grupal bilateral</i><extra></extra>',
 			offsetgroup=3,
 			hoverlabel=dict(
 				bgcolor="rgba(255, 193, 7, 0.9)",
@@ -1073,16 +1078,8 @@ def crear_grafico_multifuerza_grupal(estadisticas_grupales, metricas_seleccionad
 		lsi_val = lsi_labels.get(name)
 		
 		if lsi_val and lsi_val > 0:
-			# Determinar color según rango LSI
-			if 90 <= lsi_val <= 110:  # Zona óptima
-				lsi_color = COLORES['verde_optimo']
-				border_color = "rgba(50, 205, 50, 1)"
-			elif 80 <= lsi_val < 90 or 110 < lsi_val <= 120:  # Zona de alerta
-				lsi_color = COLORES['naranja_alerta']
-				border_color = "rgba(255, 165, 0, 1)"
-			else:  # Zona de riesgo
-				lsi_color = COLORES['rojo_riesgo']
-				border_color = "rgba(255, 69, 0, 1)"
+			# Color según la zona LSI de la métrica (umbrales del registro)
+			lsi_color, border_color = _colores_lsi(name, lsi_val)
 			
 			fig.add_annotation(
 				text=f"<b>LSI Grupal: {lsi_val:.1f}%</b>",
@@ -1183,7 +1180,7 @@ def crear_grafico_multifuerza_grupal(estadisticas_grupales, metricas_seleccionad
 
 	return fig
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar grupal...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar grupal...")
 def crear_radar_zscore_grupal(datos_grupo_radar, nombre_grupo):
 	"""
 	Crea un radar chart para análisis GRUPAL mostrando solo las medias del grupo
@@ -1218,15 +1215,11 @@ def crear_radar_zscore_grupal(datos_grupo_radar, nombre_grupo):
 	etiquetas = []
 	valores_originales = []
 	
-	# Orden específico para mejor visualización
-	orden_metricas = ['CUAD', 'ISQ Wollin', 'IMTP', 'CMJ Propulsiva', 'CMJ Frenado']
-	
-	for metrica in orden_metricas:
-		if metrica in datos_grupo_radar:
-			data = datos_grupo_radar[metrica]
-			valores.append(data['zscore'])  # Siempre 0 para grupo
-			etiquetas.append(metrica)
-			valores_originales.append(data['valor_original'])
+	# En el orden del registro de métricas (orden de `datos_grupo_radar`)
+	for metrica, data in datos_grupo_radar.items():
+		valores.append(data['zscore'])  # Siempre 0 para grupo
+		etiquetas.append(metrica)
+		valores_originales.append(data['valor_original'])
 	
 	if not valores:
 		# Sin valores válidos
@@ -1314,7 +1307,7 @@ def crear_radar_zscore_grupal(datos_grupo_radar, nombre_grupo):
 	
 	return fig
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico de distribución grupal...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico de distribución grupal...")
 def crear_grafico_distribucion_grupal(estadisticas_radar_grupal, categoria_display):
 	"""
 	Crea un gráfico de barras con rangos para análisis grupal
@@ -1351,17 +1344,12 @@ def crear_grafico_distribucion_grupal(estadisticas_radar_grupal, categoria_displ
 	minimos = []
 	maximos = []
 	
-	# Orden específico para mejor visualización - TODAS las métricas de fuerza
-	orden_metricas = ['CUAD', 'ISQ Wollin', 'IMTP Total', 'CMJ FP Total', 'CMJ FF Total', 'TRIPLE SALTO']
-	
-	for metrica in orden_metricas:
-		for metrica_key, stats in estadisticas_radar_grupal.items():
-			if stats['label'] == metrica:
-				metricas.append(metrica)
-				medias.append(stats['media'])
-				minimos.append(stats['minimo'])
-				maximos.append(stats['maximo'])
-				break
+	# En el orden del registro de métricas (orden de `estadisticas_radar_grupal`)
+	for stats in estadisticas_radar_grupal.values():
+		metricas.append(stats['label'])
+		medias.append(stats['media'])
+		minimos.append(stats['minimo'])
+		maximos.append(stats['maximo'])
 	
 	if not metricas:
 		# Sin métricas válidas
@@ -1393,7 +1381,7 @@ def crear_grafico_distribucion_grupal(estadisticas_radar_grupal, categoria_displ
 			color="rgba(220, 38, 38, 0.8)",
 			line=dict(color="rgba(220, 38, 38, 1)", width=2)
 		),
-		text=[f"{v:.0f}" for v in medias],
+		text=["" if pd.isna(v) else f"{v:.0f}" for v in medias],
 		textposition="outside",
 		textfont=dict(size=14, color="white", family="Roboto", weight="bold"),
 		hovertemplate='<b>%{x}</b><br>' +
@@ -1471,7 +1459,7 @@ def crear_grafico_distribucion_grupal(estadisticas_radar_grupal, categoria_displ
 	
 	return fig
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico comparativo...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico comparativo...")
 def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupales, metricas_seleccionadas, metricas_columnas, jugador_nombre):
 	"""Crea gráfico de multifuerza COMPARATIVO (Jugador vs Grupo superpuesto)"""
 	# Usar directamente el dict de datos del jugador
@@ -1492,10 +1480,10 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 
 	for metrica in metricas_seleccionadas:
 		# Métricas totales (no bilaterales)
-		if metrica in ["IMTP Total", "CMJ FP Total", "CMJ FF Total"]:
+		if es_total(metrica):
 			# JUGADOR
 			col_total = metricas_columnas[metrica][0]
-			val_total_jugador = datos_jugador.get(col_total, 0)
+			val_total_jugador = datos_jugador.get(col_total, np.nan)
 			valores_totales_jugador.append(val_total_jugador)
 			nombres_totales.append(metrica)
 			metricas_totales.append(metrica)
@@ -1512,8 +1500,8 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 			col_der, col_izq = metricas_columnas[metrica]
 			
 			# JUGADOR
-			val_der_jugador = datos_jugador.get(col_der, 0)
-			val_izq_jugador = datos_jugador.get(col_izq, 0)
+			val_der_jugador = datos_jugador.get(col_der, np.nan)
+			val_izq_jugador = datos_jugador.get(col_izq, np.nan)
 			barras_der_jugador.append(val_der_jugador)
 			barras_izq_jugador.append(val_izq_jugador)
 			nombres_bilaterales.append(metrica)
@@ -1542,16 +1530,17 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 		fig.add_trace(go.Bar(
 			x=nombres_bilaterales,
 			y=barras_der_grupo,
+			customdata=_unidades(nombres_bilaterales),
 			name="🔵 Grupo Derecho",
 			marker=dict(
 				color="rgba(59, 130, 246, 0.4)",
 				line=dict(color="rgba(59, 130, 246, 0.8)", width=1),
 				opacity=0.6
 			),
-			text=[f"{v:.0f}" for v in barras_der_grupo],
+			text=["" if pd.isna(v) else f"{v:.0f}" for v in barras_der_grupo],
 			textposition="outside",
 			textfont=dict(size=11, color="rgba(59, 130, 246, 0.9)", family="Roboto"),
-			hovertemplate='<b>🔵 Grupo Derecho</b><br>%{x}: %{y:.0f} N<br><i>Media grupal</i><extra></extra>',
+			hovertemplate='<b>🔵 Grupo Derecho</b><br>%{x}: %{y:.0f} %{customdata}<br><i>Media grupal</i><extra></extra>',
 			offsetgroup=1,
 			hoverlabel=dict(
 				bgcolor="rgba(59, 130, 246, 0.9)",
@@ -1564,16 +1553,17 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 		fig.add_trace(go.Bar(
 			x=nombres_bilaterales,
 			y=barras_izq_grupo,
+			customdata=_unidades(nombres_bilaterales),
 			name="🔵 Grupo Izquierdo",
 			marker=dict(
 				color="rgba(59, 130, 246, 0.3)",
 				line=dict(color="rgba(59, 130, 246, 0.6)", width=1),
 				opacity=0.5
 			),
-			text=[f"{v:.0f}" for v in barras_izq_grupo],
+			text=["" if pd.isna(v) else f"{v:.0f}" for v in barras_izq_grupo],
 			textposition="outside",
 			textfont=dict(size=11, color="rgba(59, 130, 246, 0.8)", family="Roboto"),
-			hovertemplate='<b>🔵 Grupo Izquierdo</b><br>%{x}: %{y:.0f} N<br><i>Media grupal</i><extra></extra>',
+			hovertemplate='<b>🔵 Grupo Izquierdo</b><br>%{x}: %{y:.0f} %{customdata}<br><i>Media grupal</i><extra></extra>',
 			offsetgroup=2,
 			hoverlabel=dict(
 				bgcolor="rgba(59, 130, 246, 0.9)",
@@ -1588,6 +1578,7 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 		fig.add_trace(go.Bar(
 			x=nombres_bilaterales,
 			y=barras_der_jugador,
+			customdata=_unidades(nombres_bilaterales),
 			name=f"🔴 {jugador_nombre} Derecho",
 			marker=dict(
 				color=COLORES['rojo_colon'],
@@ -1598,10 +1589,10 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f} N" for v in barras_der_jugador],
+			text=["" if pd.isna(v) else f"{v:.0f} {u}" for v, u in zip(barras_der_jugador, _unidades(nombres_bilaterales))],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
-			hovertemplate=f'<b>🔴 {jugador_nombre} Derecho</b><br>%{{x}}: %{{y:.0f}} N<br><i>Jugador individual</i><extra></extra>',
+			hovertemplate=f'<b>🔴 {jugador_nombre} Derecho</b><br>%{{x}}: %{{y:.0f}} %{{customdata}}<br><i>Jugador individual</i><extra></extra>',
 			offsetgroup=3,
 			hoverlabel=dict(
 				bgcolor="rgba(220, 38, 38, 0.9)",
@@ -1614,6 +1605,7 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 		fig.add_trace(go.Bar(
 			x=nombres_bilaterales,
 			y=barras_izq_jugador,
+			customdata=_unidades(nombres_bilaterales),
 			name=f"⚫ {jugador_nombre} Izquierdo",
 			marker=dict(
 				color=COLORES['negro_colon'],
@@ -1624,10 +1616,10 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f} N" for v in barras_izq_jugador],
+			text=["" if pd.isna(v) else f"{v:.0f} {u}" for v, u in zip(barras_izq_jugador, _unidades(nombres_bilaterales))],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
-			hovertemplate=f'<b>⚫ {jugador_nombre} Izquierdo</b><br>%{{x}}: %{{y:.0f}} N<br><i>Jugador individual</i><extra></extra>',
+			hovertemplate=f'<b>⚫ {jugador_nombre} Izquierdo</b><br>%{{x}}: %{{y:.0f}} %{{customdata}}<br><i>Jugador individual</i><extra></extra>',
 			offsetgroup=4,
 			hoverlabel=dict(
 				bgcolor="rgba(31, 41, 55, 0.9)",
@@ -1642,16 +1634,17 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 		fig.add_trace(go.Bar(
 			x=nombres_totales,
 			y=valores_totales_grupo,
+			customdata=_unidades(nombres_totales),
 			name="🔵 Grupo Total",
 			marker=dict(
 				color="rgba(59, 130, 246, 0.4)",
 				line=dict(color="rgba(59, 130, 246, 0.8)", width=1),
 				opacity=0.6
 			),
-			text=[f"{v:.0f}" for v in valores_totales_grupo],
+			text=["" if pd.isna(v) else f"{v:.0f}" for v in valores_totales_grupo],
 			textposition="outside",
 			textfont=dict(size=11, color="rgba(59, 130, 246, 0.9)", family="Roboto"),
-			hovertemplate='<b>🔵 Grupo Total</b><br>%{x}: %{y:.0f} N<br><i>Media grupal bilateral</i><extra></extra>',
+			hovertemplate='<b>🔵 Grupo Total</b><br>%{x}: %{y:.0f} %{customdata}<br><i>Media grupal bilateral</i><extra></extra>',
 			offsetgroup=5,
 			hoverlabel=dict(
 				bgcolor="rgba(59, 130, 246, 0.9)",
@@ -1664,6 +1657,7 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 		fig.add_trace(go.Bar(
 			x=nombres_totales,
 			y=valores_totales_jugador,
+			customdata=_unidades(nombres_totales),
 			name=f"🟡 {jugador_nombre} Total",
 			marker=dict(
 				color="rgba(255, 193, 7, 0.9)",
@@ -1674,10 +1668,10 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f} N" for v in valores_totales_jugador],
+			text=["" if pd.isna(v) else f"{v:.0f} {u}" for v, u in zip(valores_totales_jugador, _unidades(nombres_totales))],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
-			hovertemplate=f'<b>🟡 {jugador_nombre} Total</b><br>%{{x}}: %{{y:.0f}} N<br><i>Valor bilateral combinado</i><extra></extra>',
+			hovertemplate=f'<b>🟡 {jugador_nombre} Total</b><br>%{{x}}: %{{y:.0f}} %{{customdata}}<br><i>Valor bilateral combinado</i><extra></extra>',
 			offsetgroup=6,
 			hoverlabel=dict(
 				bgcolor="rgba(255, 193, 7, 0.9)",
@@ -1691,16 +1685,8 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 		lsi_val_jugador = lsi_labels_jugador.get(name)
 		
 		if lsi_val_jugador and lsi_val_jugador > 0:
-			# Determinar color según rango LSI
-			if 90 <= lsi_val_jugador <= 110:
-				lsi_color = COLORES['verde_optimo']
-				border_color = "rgba(50, 205, 50, 1)"
-			elif 80 <= lsi_val_jugador < 90 or 110 < lsi_val_jugador <= 120:
-				lsi_color = COLORES['naranja_alerta']
-				border_color = "rgba(255, 165, 0, 1)"
-			else:
-				lsi_color = COLORES['rojo_riesgo']
-				border_color = "rgba(255, 69, 0, 1)"
+			# Color según la zona LSI de la métrica (umbrales del registro)
+			lsi_color, border_color = _colores_lsi(name, lsi_val_jugador)
 			
 			# Calcular altura máxima entre jugador y grupo
 			max_altura = max(
@@ -1809,7 +1795,7 @@ def crear_grafico_multifuerza_comparativo(datos_jugador_dict, estadisticas_grupa
 
 	return fig
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar comparativo...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar comparativo...")
 def crear_radar_zscore_comparativo(zscores_jugador, datos_grupo_radar, jugador_nombre, categoria_nombre):
 	"""
 	Crea un radar chart COMPARATIVO (Jugador vs Grupo superpuesto)
@@ -1849,20 +1835,16 @@ def crear_radar_zscore_comparativo(zscores_jugador, datos_grupo_radar, jugador_n
 	valores_originales_jugador = []
 	medias_poblacion = []
 	
-	# Orden específico para mejor visualización
-	orden_metricas = ['CUAD', 'ISQ Wollin', 'IMTP', 'CMJ Propulsiva', 'CMJ Frenado']
-	
-	for metrica in orden_metricas:
-		if metrica in zscores_jugador:
-			# Datos del jugador
-			data_jugador = zscores_jugador[metrica]
-			valores_jugador.append(data_jugador['zscore'])
-			etiquetas.append(metrica)
-			valores_originales_jugador.append(data_jugador['valor_original'])
-			medias_poblacion.append(data_jugador['media_poblacion'])
-			
-			# Datos del grupo (siempre 0 en Z-Score)
-			valores_grupo.append(0)  # Media del grupo siempre es 0 en Z-Score
+	# En el orden del registro de métricas (orden de `zscores_jugador`)
+	for metrica, data_jugador in zscores_jugador.items():
+		# Datos del jugador
+		valores_jugador.append(data_jugador['zscore'])
+		etiquetas.append(metrica)
+		valores_originales_jugador.append(data_jugador['valor_original'])
+		medias_poblacion.append(data_jugador['media_poblacion'])
+		
+		# Datos del grupo (siempre 0 en Z-Score)
+		valores_grupo.append(0)  # Media del grupo siempre es 0 en Z-Score
 	
 	if not valores_jugador:
 		# Sin valores válidos
@@ -1972,7 +1954,7 @@ def crear_radar_zscore_comparativo(zscores_jugador, datos_grupo_radar, jugador_n
 
 # ========= FUNCIONES DE MOVILIDAD =========
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico de movilidad...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico de movilidad...")
 def crear_grafico_multimovilidad(datos_jugador_dict, metricas_seleccionadas, metricas_columnas):
 	"""Crea gráfico de multimovilidad con cache optimizado - EXACTAMENTE IGUAL A FUERZA"""
 	# Usar directamente el dict de datos del jugador
@@ -1984,8 +1966,8 @@ def crear_grafico_multimovilidad(datos_jugador_dict, metricas_seleccionadas, met
 
 	for metrica in metricas_seleccionadas:
 		col_der, col_izq = metricas_columnas[metrica]
-		val_der = datos_jugador.get(col_der, 0)
-		val_izq = datos_jugador.get(col_izq, 0)
+		val_der = datos_jugador.get(col_der, np.nan)
+		val_izq = datos_jugador.get(col_izq, np.nan)
 		barras_der.append(val_der)
 		barras_izq.append(val_izq)
 		nombres_bilaterales.append(metrica)
@@ -2011,7 +1993,7 @@ def crear_grafico_multimovilidad(datos_jugador_dict, metricas_seleccionadas, met
 			),
 			opacity=0.9
 		),
-		text=[f"{v:.0f}°" for v in barras_der],
+		text=["" if pd.isna(v) else f"{v:.0f}°" for v in barras_der],
 		textposition="outside",
 		textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
 		hovertemplate='<b>🔴 Derecho</b><br>%{x}: %{y:.0f}°<br><i>Lado dominante</i><extra></extra>',
@@ -2036,7 +2018,7 @@ def crear_grafico_multimovilidad(datos_jugador_dict, metricas_seleccionadas, met
 			),
 			opacity=0.9
 		),
-		text=[f"{v:.0f}°" for v in barras_izq],
+		text=["" if pd.isna(v) else f"{v:.0f}°" for v in barras_izq],
 		textposition="outside",
 		textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
 		hovertemplate='<b>⚫ Izquierdo</b><br>%{x}: %{y:.0f}°<br><i>Lado no dominante</i><extra></extra>',
@@ -2053,16 +2035,8 @@ def crear_grafico_multimovilidad(datos_jugador_dict, metricas_seleccionadas, met
 		lsi_val = lsi_labels.get(name)
 		
 		if lsi_val and lsi_val > 0:
-			# Determinar color según rango LSI
-			if 90 <= lsi_val <= 110:  # Zona óptima
-				lsi_color = COLORES['verde_optimo']
-				border_color = "rgba(50, 205, 50, 1)"
-			elif 80 <= lsi_val < 90 or 110 < lsi_val <= 120:  # Zona de alerta
-				lsi_color = COLORES['naranja_alerta']
-				border_color = "rgba(255, 165, 0, 1)"
-			else:  # Zona de riesgo
-				lsi_color = COLORES['rojo_riesgo']
-				border_color = "rgba(255, 69, 0, 1)"
+			# Color según la zona LSI de la métrica (umbrales del registro)
+			lsi_color, border_color = _colores_lsi(name, lsi_val)
 			
 			fig.add_annotation(
 				text=f"<b>LSI: {lsi_val:.1f}%</b>",
@@ -2163,7 +2137,7 @@ def crear_grafico_multimovilidad(datos_jugador_dict, metricas_seleccionadas, met
 
 	return fig
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar Z-Score de movilidad...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando radar Z-Score de movilidad...")
 def crear_radar_zscore_simple_movilidad(zscores_radar, jugador_nombre):
 	"""
 	Crea un radar chart simplificado para movilidad - EXACTAMENTE IGUAL A FUERZA
@@ -2199,16 +2173,12 @@ def crear_radar_zscore_simple_movilidad(zscores_radar, jugador_nombre):
 	valores_originales = []
 	medias_poblacion = []
 	
-	# Orden específico para mejor visualización de movilidad
-	orden_metricas = ['AKE', 'THOMAS', 'LUNGE']
-	
-	for metrica in orden_metricas:
-		if metrica in zscores_radar:
-			data = zscores_radar[metrica]
-			valores.append(data['zscore'])
-			etiquetas.append(metrica)
-			valores_originales.append(data['valor_original'])
-			medias_poblacion.append(data['media_poblacion'])
+	# En el orden del registro de métricas (orden de `zscores_radar`)
+	for metrica, data in zscores_radar.items():
+		valores.append(data['zscore'])
+		etiquetas.append(metrica)
+		valores_originales.append(data['valor_original'])
+		medias_poblacion.append(data['media_poblacion'])
 	
 	if not valores:
 		# Sin valores válidos
@@ -2315,7 +2285,7 @@ def crear_radar_zscore_simple_movilidad(zscores_radar, jugador_nombre):
 	
 	return fig
 
-@st.cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico grupal de movilidad...")
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico grupal de movilidad...")
 def crear_grafico_multimovilidad_grupal(estadisticas_grupales, metricas_seleccionadas, categoria):
 	"""Crea gráfico de multimovilidad GRUPAL con medias del grupo"""
 	
@@ -2356,7 +2326,7 @@ def crear_grafico_multimovilidad_grupal(estadisticas_grupales, metricas_seleccio
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f}°" for v in barras_der],
+			text=["" if pd.isna(v) else f"{v:.0f}°" for v in barras_der],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
 			hovertemplate='<b>🔴 Derecho (Grupo)</b><br>%{x}: %{y:.0f}°<br><i>Media grupal</i><extra></extra>',
@@ -2381,7 +2351,7 @@ def crear_grafico_multimovilidad_grupal(estadisticas_grupales, metricas_seleccio
 				),
 				opacity=0.9
 			),
-			text=[f"{v:.0f}°" for v in barras_izq],
+			text=["" if pd.isna(v) else f"{v:.0f}°" for v in barras_izq],
 			textposition="outside",
 			textfont=dict(size=13, color="white", family="Roboto", weight="bold"),
 			hovertemplate='<b>⚫ Izquierdo (Grupo)</b><br>%{x}: %{y:.0f}°<br><i>Media grupal</i><extra></extra>',
@@ -2398,16 +2368,8 @@ def crear_grafico_multimovilidad_grupal(estadisticas_grupales, metricas_seleccio
 		lsi_val = lsi_labels.get(name)
 		
 		if lsi_val and lsi_val > 0:
-			# Determinar color según rango LSI
-			if 90 <= lsi_val <= 110:  # Zona óptima
-				lsi_color = COLORES['verde_optimo']
-				border_color = "rgba(50, 205, 50, 1)"
-			elif 80 <= lsi_val < 90 or 110 < lsi_val <= 120:  # Zona de alerta
-				lsi_color = COLORES['naranja_alerta']
-				border_color = "rgba(255, 165, 0, 1)"
-			else:  # Zona de riesgo
-				lsi_color = COLORES['rojo_riesgo']
-				border_color = "rgba(255, 69, 0, 1)"
+			# Color según la zona LSI de la métrica (umbrales del registro)
+			lsi_color, border_color = _colores_lsi(name, lsi_val)
 			
 			fig.add_annotation(
 				text=f"<b>LSI Grupal: {lsi_val:.1f}%</b>",
@@ -2507,3 +2469,422 @@ def crear_grafico_multimovilidad_grupal(estadisticas_grupales, metricas_seleccio
 	)
 
 	return fig
+
+# Escalas del heatmap del grupo (mismos colores que las bandas clínicas y el LSI)
+ESCALA_ZSCORE = [
+	[0.0, "#dc2626"],
+	[0.3, "#f59e0b"],
+	[0.5, "#1f2937"],
+	[0.7, "#16a34a"],
+	[1.0, "#22c55e"]
+]
+ESCALA_LSI = [
+	[0.0, "#dc2626"],
+	[0.5, "#f59e0b"],
+	[0.75, "#fbbf24"],
+	[1.0, "#22c55e"]
+]
+
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando gráfico de distribución grupal de movilidad...")
+def crear_grafico_distribucion_grupal_movilidad(estadisticas_radar_grupal, categoria_display):
+	"""
+	Crea el gráfico de distribución grupal de movilidad (medias del grupo en grados)
+	
+	Args:
+		estadisticas_radar_grupal: Dict con estadísticas del grupo (calcular_distribucion_movilidad)
+		categoria_display: Nombre amigable de la categoría
+		
+	Returns:
+		Figura de Plotly con gráfico de distribución grupal
+	"""
+	# En el orden del registro de métricas
+	metricas = [stats['label'] for stats in estadisticas_radar_grupal.values()]
+	medias = [stats['media'] for stats in estadisticas_radar_grupal.values()]
+	
+	fig = go.Figure()
+	
+	# Barras principales (medias del grupo)
+	fig.add_trace(go.Bar(
+		x=metricas,
+		y=medias,
+		name="Media del Grupo",
+		marker=dict(
+			color="rgba(220, 38, 38, 0.8)",
+			line=dict(color="rgba(220, 38, 38, 1)", width=2)
+		),
+		text=["" if pd.isna(v) else f"{v:.0f}°" for v in medias],
+		textposition="outside",
+		textfont=dict(size=14, color="white", family="Roboto", weight="bold"),
+		hovertemplate='<b>%{x}</b><br>' +
+					  'Media: %{y:.1f}°<br>' +
+					  '<extra></extra>',
+		hoverlabel=dict(
+			bgcolor="rgba(220, 38, 38, 0.9)",
+			bordercolor="rgba(220, 38, 38, 1)",
+			font=dict(color="white", family="Roboto")
+		)
+	))
+	
+	# Agregar logo del club como marca de agua
+	try:
+		escudo_base64 = get_base64_image(ESCUDO_PATH)
+		fig.add_layout_image(
+			dict(
+				source=f"data:image/png;base64,{escudo_base64}",
+				xref="paper", yref="paper",
+				x=0.95, y=0.05,
+				sizex=0.15, sizey=0.15,
+				xanchor="right", yanchor="bottom",
+				opacity=0.1,
+				layer="below"
+			)
+		)
+	except:
+		pass
+
+	fig.update_layout(
+		title=dict(
+			text=f"Distribución Grupal – {categoria_display}<br><span style='font-size:16px; color:rgba(255,255,255,0.8);'>Métricas de Movilidad – Medias del Grupo</span>",
+			font=dict(size=18, family="Source Sans Pro", weight=600, color="rgba(220, 38, 38, 1)"),
+			y=0.94,
+			x=0.5,
+			xanchor="center"
+		),
+		xaxis=dict(
+			title=dict(
+				text="Métrica", 
+				font=dict(size=14, family="Roboto"),
+				standoff=20
+			),
+			tickfont=dict(size=12, family="Roboto"),
+			showgrid=True,
+			gridwidth=1,
+			gridcolor="rgba(255,255,255,0.1)",
+			tickangle=0,
+			categoryorder="array",
+			categoryarray=metricas
+		),
+		yaxis=dict(
+			title=dict(
+				text="Movilidad (°)", 
+				font=dict(size=14, family="Roboto"),
+				standoff=15
+			),
+			tickfont=dict(size=12, family="Roboto"),
+			showgrid=True,
+			gridwidth=1,
+			gridcolor="rgba(255,255,255,0.1)",
+			zeroline=True,
+			zerolinewidth=2,
+			zerolinecolor="rgba(255,255,255,0.3)"
+		),
+		legend=dict(
+			orientation="h",
+			yanchor="bottom",
+			y=1.02,
+			xanchor="center",
+			x=0.5,
+			font=dict(size=12, family="Roboto"),
+			bgcolor="rgba(220, 38, 38, 0.2)",
+			bordercolor="rgba(220, 38, 38, 0.5)",
+			borderwidth=2
+		),
+		plot_bgcolor=COLORES['fondo_oscuro'],
+		paper_bgcolor=COLORES['fondo_oscuro'],
+		font=dict(color="white", family="Roboto"),
+		height=600,
+		margin=dict(t=140, b=60, l=60, r=60),
+		showlegend=True,
+		hovermode="x unified"
+	)
+	
+	return fig
+
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando heatmap del grupo...")
+def crear_heatmap_grupal(matriz, valores_originales, nombre_grupo, seccion, capa="Z-Score"):
+	"""
+	Crea el heatmap jugadores × métricas del grupo como un único go.Heatmap
+	
+	Args:
+		matriz: DataFrame ya ordenado (jugadores × métricas) con Z-Scores o LSI
+		valores_originales: DataFrame alineado con los valores crudos (para el hover) o None
+		nombre_grupo: Nombre de la categoría para el subtítulo
+		seccion: "Fuerza" o "Movilidad"
+		capa: "Z-Score" o "LSI"
+		
+	Returns:
+		Figura de Plotly
+	"""
+	fig = go.Figure()
+	
+	if matriz is None or matriz.empty:
+		fig.add_annotation(
+			text="<b>Sin datos para el heatmap</b><br>Verificar métricas del grupo",
+			x=0.5, y=0.5,
+			xref="paper", yref="paper",
+			showarrow=False,
+			font=dict(size=16, color="white", family="Roboto"),
+			align="center"
+		)
+		fig.update_layout(
+			plot_bgcolor=COLORES['fondo_oscuro'],
+			paper_bgcolor=COLORES['fondo_oscuro'],
+			height=500
+		)
+		return fig
+	
+	# Posiciones numéricas en Y: los nombres repetidos no se fusionan en una sola fila
+	jugadores = [str(j) for j in matriz.index]
+	filas = list(range(len(jugadores)))
+	z = matriz.to_numpy(dtype=float)
+	# customdata[i][j] = [jugador, valor crudo] construido de forma vectorizada
+	nombres = np.repeat(np.array(jugadores, dtype=object)[:, None], z.shape[1], axis=1)
+	
+	if capa == "LSI":
+		escala = ESCALA_LSI
+		rango = dict(zmin=70, zmax=100)
+		plantilla_texto = "%{z:.0f}"
+		hover = "<b>%{customdata[0]}</b><br>%{x}<br>LSI: %{z:.1f}%<extra></extra>"
+		titulo_barra = "LSI (%)"
+		customdata = nombres[:, :, None]
+	else:
+		escala = ESCALA_ZSCORE
+		rango = dict(zmin=-2.5, zmax=2.5, zmid=0)
+		plantilla_texto = "%{z:.1f}"
+		hover = "<b>%{customdata[0]}</b><br>%{x}<br>Z-Score: %{z:.2f} · %{customdata[2]}<br>Valor: %{customdata[1]}<extra></extra>"
+		titulo_barra = "Z-Score"
+		if valores_originales is not None:
+			crudos = valores_originales.to_numpy(dtype=float)
+			textos = np.where(np.isnan(crudos), "-", np.char.mod("%.1f", crudos))
+		else:
+			textos = np.full(z.shape, "-", dtype=object)
+		# Banda clínica de todas las celdas en una sola clasificación
+		customdata = np.dstack([nombres, textos, clasificar_zscores(z).interpretacion])
+	
+	fig.add_trace(go.Heatmap(
+		z=z,
+		x=list(matriz.columns),
+		y=filas,
+		customdata=customdata,
+		colorscale=escala,
+		**rango,
+		xgap=2,
+		ygap=2,
+		texttemplate=plantilla_texto,
+		textfont=dict(size=11, color="white", family="Roboto"),
+		hovertemplate=hover,
+		hoverongaps=False,
+		colorbar=dict(
+			title=dict(text=titulo_barra, font=dict(color="white")),
+			tickfont=dict(color="white"),
+			thickness=14
+		)
+	))
+	
+	fig.update_layout(
+		title=dict(
+			text=f"{seccion} – Heatmap del grupo ({capa})<br><span style='font-size:16px; color:rgba(255,255,255,0.8);'>{nombre_grupo} · {len(jugadores)} jugadores</span>",
+			font=dict(size=20, color="white", family="Source Sans Pro", weight=600),
+			x=0.5,
+			xanchor="center",
+			y=0.98
+		),
+		xaxis=dict(
+			side="top",
+			tickangle=-35,
+			tickfont=dict(size=12, color="white", family="Roboto"),
+			showgrid=False
+		),
+		yaxis=dict(
+			tickmode="array",
+			tickvals=filas,
+			ticktext=jugadores,
+			autorange="reversed",
+			tickfont=dict(size=12, color="white", family="Roboto"),
+			showgrid=False
+		),
+		plot_bgcolor=COLORES['fondo_oscuro'],
+		paper_bgcolor=COLORES['fondo_oscuro'],
+		font=dict(color="white", family="Roboto"),
+		# Altura proporcional al plantel para que las celdas sigan siendo legibles
+		height=max(450, 26 * len(jugadores) + 220),
+		margin=dict(t=190, b=40, l=140, r=40)
+	)
+	
+	return fig
+
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando tendencia del jugador...")
+def crear_grafico_tendencia_jugador(tendencia_jugador, jugador_nombre, metrica):
+	"""
+	Evolución de una métrica del jugador con su media móvil y pendiente vigente
+	
+	Args:
+		tendencia_jugador: Filas de calcular_tendencias para el jugador y la métrica (ordenadas por fecha)
+		jugador_nombre: Nombre del jugador
+		metrica: Etiqueta de la métrica
+		
+	Returns:
+		Figura de Plotly
+	"""
+	fig = go.Figure()
+	datos = tendencia_jugador.dropna(subset=['valor'])
+	
+	if datos.empty:
+		fig.add_annotation(
+			text="<b>Sin evaluaciones para esta métrica</b>",
+			x=0.5, y=0.5,
+			xref="paper", yref="paper",
+			showarrow=False,
+			font=dict(size=16, color="white", family="Roboto"),
+			align="center"
+		)
+		fig.update_layout(
+			plot_bgcolor=COLORES['fondo_oscuro'],
+			paper_bgcolor=COLORES['fondo_oscuro'],
+			height=450
+		)
+		return fig
+	
+	fechas = pd.to_datetime(datos['FECHA'])
+	
+	fig.add_trace(go.Scatter(
+		x=fechas,
+		y=datos['valor'],
+		mode='lines+markers',
+		name=metrica,
+		line=dict(color=COLORES['rojo_colon'], width=3),
+		marker=dict(size=10, color=COLORES['rojo_colon'], line=dict(color='white', width=1.5)),
+		hovertemplate="<b>%{x|%d/%m/%Y}</b><br>Valor: %{y:.1f}<extra></extra>"
+	))
+	
+	fig.add_trace(go.Scatter(
+		x=fechas,
+		y=datos['media_movil'],
+		mode='lines',
+		name="Media móvil",
+		line=dict(color=COLORES['azul_zscore'], width=2, dash='dash'),
+		hovertemplate="<b>%{x|%d/%m/%Y}</b><br>Media móvil: %{y:.1f}<extra></extra>"
+	))
+	
+	pendiente = datos['pendiente_mensual'].iloc[-1]
+	if pd.isna(pendiente):
+		texto_pendiente = "Pendiente: se necesitan al menos 2 evaluaciones"
+	else:
+		color = COLORES['verde_optimo'] if pendiente >= 0 else COLORES['rojo_riesgo']
+		texto_pendiente = f"<span style='color:{color};'>Pendiente: {pendiente:+.1f} / mes</span>"
+	
+	fig.update_layout(
+		title=dict(
+			text=f"{metrica} – Evolución<br><span style='font-size:16px; color:rgba(255,255,255,0.8);'>{jugador_nombre} · {texto_pendiente}</span>",
+			font=dict(size=20, color="white", family="Source Sans Pro", weight=600),
+			x=0.5,
+			xanchor="center",
+			y=0.95
+		),
+		xaxis=dict(
+			tickformat="%d/%m/%Y",
+			tickfont=dict(size=12, color="white", family="Roboto"),
+			gridcolor="rgba(255,255,255,0.1)"
+		),
+		yaxis=dict(
+			tickfont=dict(size=12, color="white", family="Roboto"),
+			gridcolor="rgba(255,255,255,0.1)"
+		),
+		legend=dict(
+			orientation="h",
+			x=0.5,
+			xanchor="center",
+			y=-0.15,
+			font=dict(color="white", family="Roboto")
+		),
+		plot_bgcolor=COLORES['fondo_oscuro'],
+		paper_bgcolor=COLORES['fondo_oscuro'],
+		font=dict(color="white", family="Roboto"),
+		height=450,
+		margin=dict(t=110, b=60, l=60, r=40)
+	)
+	
+	return fig
+
+@cache_data(ttl=CACHE_TTL['graficos'], show_spinner="Generando tendencias del grupo...")
+def crear_grafico_pendientes_grupo(resumen_metrica, nombre_grupo, metrica, jugador_destacado=None):
+	"""
+	Barras horizontales con la pendiente mensual vigente de cada jugador en una métrica
+	
+	Args:
+		resumen_metrica: Filas de resumir_tendencias para la métrica (una por jugador)
+		nombre_grupo: Nombre de la categoría para el subtítulo
+		metrica: Etiqueta de la métrica
+		jugador_destacado: Jugador a resaltar (opcional)
+		
+	Returns:
+		Figura de Plotly
+	"""
+	fig = go.Figure()
+	datos = resumen_metrica.dropna(subset=['pendiente_mensual']).sort_values('pendiente_mensual')
+	
+	if datos.empty:
+		fig.add_annotation(
+			text="<b>Sin tendencias para el grupo</b><br>Se necesitan al menos 2 evaluaciones por jugador",
+			x=0.5, y=0.5,
+			xref="paper", yref="paper",
+			showarrow=False,
+			font=dict(size=16, color="white", family="Roboto"),
+			align="center"
+		)
+		fig.update_layout(
+			plot_bgcolor=COLORES['fondo_oscuro'],
+			paper_bgcolor=COLORES['fondo_oscuro'],
+			height=450
+		)
+		return fig
+	
+	jugadores = datos['Deportista'].astype(str).to_numpy()
+	pendientes = datos['pendiente_mensual'].to_numpy(dtype=float)
+	# Colores vectorizados: verde mejora, rojo empeora; el jugador destacado con borde blanco
+	colores = np.where(pendientes >= 0, COLORES['verde_optimo'], COLORES['rojo_riesgo'])
+	bordes = np.where(jugadores == str(jugador_destacado), 3, 0)
+	filas = list(range(len(jugadores)))
+	
+	fig.add_trace(go.Bar(
+		x=pendientes,
+		y=filas,
+		orientation='h',
+		marker=dict(color=colores.tolist(), line=dict(color='white', width=bordes.tolist())),
+		customdata=jugadores,
+		text=[f"{p:+.1f}" for p in pendientes],
+		textposition='outside',
+		textfont=dict(size=11, color="white", family="Roboto"),
+		hovertemplate="<b>%{customdata}</b><br>Pendiente: %{x:+.2f} / mes<extra></extra>"
+	))
+	
+	fig.update_layout(
+		title=dict(
+			text=f"{metrica} – Tendencia del grupo<br><span style='font-size:16px; color:rgba(255,255,255,0.8);'>{nombre_grupo} · cambio cada 30 días</span>",
+			font=dict(size=20, color="white", family="Source Sans Pro", weight=600),
+			x=0.5,
+			xanchor="center",
+			y=0.97
+		),
+		xaxis=dict(
+			zeroline=True,
+			zerolinecolor="rgba(255,255,255,0.5)",
+			tickfont=dict(size=12, color="white", family="Roboto"),
+			gridcolor="rgba(255,255,255,0.1)"
+		),
+		yaxis=dict(
+			tickmode="array",
+			tickvals=filas,
+			ticktext=jugadores.tolist(),
+			tickfont=dict(size=12, color="white", family="Roboto"),
+			showgrid=False
+		),
+		showlegend=False,
+		plot_bgcolor=COLORES['fondo_oscuro'],
+		paper_bgcolor=COLORES['fondo_oscuro'],
+		font=dict(color="white", family="Roboto"),
+		height=max(400, 24 * len(jugadores) + 160),
+		margin=dict(t=110, b=40, l=140, r=60)
+	)
+	
+	return fig
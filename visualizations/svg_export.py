@@ -0,0 +1,578 @@
+"""
+Exportación vectorial simplificada de figuras Plotly a SVG (sin kaleido)
+
+Cubre los gráficos que se incluyen en los reportes PDF:
+- Barras agrupadas (go.Bar) con etiquetas, anotaciones LSI y leyenda
+- Barras horizontales (go.Bar orientation='h') con una fila por jugador
+- Líneas en el tiempo (go.Scatter) con marcadores, trazo punteado y leyenda
+- Radares (go.Scatterpolar) con grilla radial y referencia del grupo
+- Heatmaps (go.Heatmap) con escala de colores y valor en cada celda
+
+Para otro tipo de trazas se lanza ValueError y el caller puede recurrir a kaleido.
+"""
+
+import base64
+import math
+import re
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+ANCHO_SVG = 1000
+ALTO_SVG = 620
+FUENTE_SVG = "Source Sans Pro, Roboto, sans-serif"
+
+_TAGS_HTML = re.compile(r"<[^>]+>")
+_ATRIBUTO_RGBA = re.compile(r'(fill|stroke)="rgba\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*\)"')
+
+
+def _texto_plano(texto):
+	"""Convierte el texto con HTML de Plotly (<br>, <b>, <span>) en líneas planas"""
+	if not texto:
+		return []
+	lineas = re.split(r"<br\s*/?>", str(texto))
+	return [escape(_TAGS_HTML.sub("", linea)).strip() for linea in lineas if _TAGS_HTML.sub("", linea).strip()]
+
+
+def _color(valor, defecto):
+	"""Devuelve un color CSS válido para SVG o el valor por defecto"""
+	if isinstance(valor, str) and valor:
+		return valor
+	return defecto
+
+
+def _rgba_a_opacidad(svg):
+	"""Reescribe fill/stroke="rgba(...)" como rgb + *-opacity (SVG 1.1).
+
+	Los navegadores aceptan rgba, pero renderizadores más estrictos (fpdf2, librsvg)
+	solo entienden rgb(); la transparencia va en el atributo de opacidad.
+	"""
+	return _ATRIBUTO_RGBA.sub(
+		lambda m: f'{m[1]}="rgb({m[2]},{m[3]},{m[4]})" {m[1]}-opacity="{m[5]}"',
+		svg,
+	)
+
+
+def _arreglo(valor):
+	"""Datos de una traza como lista; decodifica el typed array ({"dtype", "bdata", "shape"}) con que Plotly guarda los arrays NumPy al serializar la figura (p. ej. al pasar por st.cache_data)"""
+	if isinstance(valor, dict) and "bdata" in valor:
+		datos = np.frombuffer(base64.b64decode(valor["bdata"]), dtype=np.dtype(valor["dtype"]))
+		if valor.get("shape"):
+			datos = datos.reshape([int(n) for n in str(valor["shape"]).split(",")])
+		return datos.tolist()
+	return [] if valor is None else list(valor)
+
+
+def _numero(valor):
+	"""Convierte a float devolviendo 0.0 para None/NaN"""
+	try:
+		valor = float(valor)
+	except (TypeError, ValueError):
+		return 0.0
+	return 0.0 if math.isnan(valor) else valor
+
+
+def _paso_redondo(paso_bruto):
+	"""Menor paso 'redondo' (1, 2, 2.5 o 5 × 10^k) mayor o igual que paso_bruto"""
+	magnitud = 10 ** math.floor(math.log10(paso_bruto))
+	for factor in (1, 2, 2.5, 5, 10):
+		paso = factor * magnitud
+		if paso >= paso_bruto:
+			break
+	return paso
+
+
+def _ticks(maximo, n=5):
+	"""Calcula ticks 'redondos' entre 0 y maximo"""
+	if maximo <= 0:
+		return [0.0]
+	paso = _paso_redondo(maximo / n)
+	return [i * paso for i in range(int(maximo // paso) + 1)]
+
+
+def _ticks_rango(minimo, maximo, n=5):
+	"""Calcula ticks 'redondos' que cubren [minimo, maximo] (admite negativos)"""
+	amplitud = maximo - minimo or abs(maximo) or 1.0
+	paso = _paso_redondo(amplitud / n)
+	inicio = math.floor(minimo / paso) * paso
+	return [inicio + i * paso for i in range(math.ceil((maximo - inicio) / paso - 1e-9) + 1)]
+
+
+def _titulo(fig, ancho):
+	"""Dibuja el título de la figura (primera línea destacada)"""
+	lineas = _texto_plano(fig.layout.title.text)
+	color_titulo = _color(fig.layout.title.font.color, "white")
+	partes = []
+	for i, linea in enumerate(lineas[:2]):
+		size = 20 if i == 0 else 14
+		color = color_titulo if i == 0 else "rgba(255,255,255,0.8)"
+		partes.append(
+			f'<text x="{ancho / 2:.1f}" y="{32 + i * 22}" text-anchor="middle" font-size="{size}" '
+			f'font-weight="{600 if i == 0 else 400}" fill="{color}">{linea}</text>'
+		)
+	return partes
+
+
+def _leyenda(trazas, ancho, y):
+	"""Dibuja una leyenda horizontal centrada con el nombre de cada traza"""
+	nombres = [
+		(escape(str(t.name)), _color(t.marker.color or (t.line.color if t.type == "scatter" else None), "white"))
+		for t in trazas if t.name
+	]
+	if not nombres:
+		return []
+	ancho_item = 150
+	x0 = ancho / 2 - ancho_item * len(nombres) / 2
+	partes = []
+	for i, (nombre, color) in enumerate(nombres):
+		x = x0 + i * ancho_item
+		partes.append(f'<rect x="{x:.1f}" y="{y - 10}" width="12" height="12" fill="{color}"/>')
+		partes.append(f'<text x="{x + 18:.1f}" y="{y}" font-size="12" fill="white">{nombre}</text>')
+	return partes
+
+
+def _anotaciones_paper(fig, ancho, alto):
+	"""Dibuja anotaciones con referencia al papel (mensajes de 'Sin datos')"""
+	partes = []
+	for anotacion in fig.layout.annotations:
+		if anotacion.xref != "paper" or anotacion.yref != "paper":
+			continue
+		for i, linea in enumerate(_texto_plano(anotacion.text)):
+			partes.append(
+				f'<text x="{_numero(anotacion.x) * ancho:.1f}" y="{(1 - _numero(anotacion.y)) * alto + i * 20:.1f}" '
+				f'text-anchor="middle" font-size="16" fill="white">{linea}</text>'
+			)
+	return partes
+
+
+def _svg_barras(fig, ancho, alto):
+	"""Dibuja barras agrupadas (una ranura por traza, igual que barmode='group')"""
+	trazas = [t for t in fig.data if t.type == "bar"]
+
+	categorias = list(fig.layout.xaxis.categoryarray or [])
+	for traza in trazas:
+		for x in _arreglo(traza.x):
+			if x not in categorias:
+				categorias.append(x)
+
+	maximo = max([_numero(v) for t in trazas for v in _arreglo(t.y)] + [0.0])
+	anotaciones_datos = [a for a in fig.layout.annotations if a.xref != "paper" and a.x in categorias]
+	maximo = max([maximo] + [_numero(a.y) for a in anotaciones_datos])
+	ticks = _ticks(maximo * 1.1 if maximo > 0 else 1.0)
+	tope = ticks[-1] if ticks[-1] > 0 else 1.0
+
+	izq, der, arriba, abajo = 70, 30, 110, 60
+	alto_plot = alto - arriba - abajo
+	ancho_plot = ancho - izq - der
+
+	def y_px(valor):
+		return arriba + alto_plot * (1 - _numero(valor) / tope)
+
+	partes = []
+	# Grilla y eje Y
+	for tick in ticks:
+		y = y_px(tick)
+		partes.append(f'<line x1="{izq}" y1="{y:.1f}" x2="{ancho - der}" y2="{y:.1f}" stroke="rgba(255,255,255,0.1)"/>')
+		partes.append(f'<text x="{izq - 8}" y="{y + 4:.1f}" text-anchor="end" font-size="11" fill="white">{tick:g}</text>')
+
+	titulo_y = _texto_plano(fig.layout.yaxis.title.text)
+	if titulo_y:
+		partes.append(
+			f'<text x="18" y="{arriba + alto_plot / 2:.1f}" text-anchor="middle" font-size="13" fill="white" '
+			f'transform="rotate(-90 18 {arriba + alto_plot / 2:.1f})">{titulo_y[0]}</text>'
+		)
+
+	if categorias:
+		ancho_categoria = ancho_plot / len(categorias)
+		ancho_barra = ancho_categoria * 0.7 / max(len(trazas), 1)
+		for i, categoria in enumerate(categorias):
+			x_centro = izq + ancho_categoria * (i + 0.5)
+			partes.append(
+				f'<text x="{x_centro:.1f}" y="{alto - abajo + 20}" text-anchor="middle" font-size="12" '
+				f'fill="white">{escape(str(categoria))}</text>'
+			)
+
+		for j, traza in enumerate(trazas):
+			color = _color(traza.marker.color, "rgba(220, 38, 38, 0.85)")
+			textos = list(traza.text) if traza.text is not None and not isinstance(traza.text, str) else []
+			for k, (x, y) in enumerate(zip(_arreglo(traza.x), _arreglo(traza.y))):
+				i = categorias.index(x)
+				x_barra = izq + ancho_categoria * i + ancho_categoria * 0.15 + j * ancho_barra
+				y_barra = y_px(y)
+				partes.append(
+					f'<rect x="{x_barra:.1f}" y="{y_barra:.1f}" width="{ancho_barra:.1f}" '
+					f'height="{arriba + alto_plot - y_barra:.1f}" fill="{color}"/>'
+				)
+				if k < len(textos):
+					partes.append(
+						f'<text x="{x_barra + ancho_barra / 2:.1f}" y="{y_barra - 6:.1f}" text-anchor="middle" '
+						f'font-size="12" font-weight="600" fill="white">{escape(str(textos[k]))}</text>'
+					)
+
+		# Anotaciones sobre los datos (LSI)
+		for anotacion in anotaciones_datos:
+			x_centro = izq + ancho_categoria * (categorias.index(anotacion.x) + 0.5)
+			y = y_px(anotacion.y)
+			texto = " ".join(_texto_plano(anotacion.text))
+			fondo = _color(anotacion.bgcolor, "rgba(31, 41, 55, 0.85)")
+			partes.append(f'<rect x="{x_centro - 55:.1f}" y="{y - 16:.1f}" width="110" height="22" rx="4" fill="{fondo}"/>')
+			partes.append(
+				f'<text x="{x_centro:.1f}" y="{y:.1f}" text-anchor="middle" font-size="11" '
+				f'font-weight="600" fill="white">{texto}</text>'
+			)
+
+	if fig.layout.showlegend is not False:
+		partes.extend(_leyenda(trazas, ancho, arriba - 25))
+	return partes
+
+
+def _barras_horizontales(fig):
+	"""True si la figura es de barras horizontales (orientation='h')"""
+	return any(t.type == "bar" and t.orientation == "h" for t in fig.data)
+
+
+def _svg_barras_horizontales(fig, ancho, alto):
+	"""Dibuja barras horizontales (una fila por valor de y) con eje X que admite negativos"""
+	trazas = [t for t in fig.data if t.type == "bar"]
+	valores_x = [_numero(v) for t in trazas for v in _arreglo(t.x)]
+	if not valores_x:
+		return []
+
+	yaxis = fig.layout.yaxis
+	etiquetas = dict(zip(_arreglo(yaxis.tickvals), _arreglo(yaxis.ticktext)))
+	filas = []
+	for traza in trazas:
+		for y in _arreglo(traza.y):
+			if y not in filas:
+				filas.append(y)
+
+	# Margen para los textos exteriores de las barras
+	minimo, maximo = min(valores_x + [0.0]), max(valores_x + [0.0])
+	margen = (maximo - minimo or 1.0) * 0.15
+	ticks = _ticks_rango(minimo - margen if minimo < 0 else 0.0, maximo + margen if maximo > 0 else 0.0)
+	x_min, x_max = ticks[0], ticks[-1]
+
+	izq, der, arriba, abajo = 160, 40, 110, 50
+	alto_plot = alto - arriba - abajo
+	ancho_plot = ancho - izq - der
+	alto_fila = alto_plot / len(filas)
+
+	def x_px(valor):
+		return izq + ancho_plot * (_numero(valor) - x_min) / (x_max - x_min)
+
+	partes = []
+	for tick in ticks:
+		x = x_px(tick)
+		trazo = "rgba(255,255,255,0.5)" if tick == 0 else "rgba(255,255,255,0.1)"
+		partes.append(f'<line x1="{x:.1f}" y1="{arriba}" x2="{x:.1f}" y2="{arriba + alto_plot}" stroke="{trazo}"/>')
+		partes.append(
+			f'<text x="{x:.1f}" y="{arriba + alto_plot + 18}" text-anchor="middle" font-size="11" fill="white">{tick:g}</text>'
+		)
+
+	# Como en Plotly, la primera fila queda abajo
+	for i, fila in enumerate(filas):
+		y_centro = arriba + alto_plot - alto_fila * (i + 0.5)
+		partes.append(
+			f'<text x="{izq - 8}" y="{y_centro + 4:.1f}" text-anchor="end" font-size="12" '
+			f'fill="white">{escape(str(etiquetas.get(fila, fila)))}</text>'
+		)
+
+	cero = x_px(0.0)
+	for traza in trazas:
+		colores = _arreglo(traza.marker.color) if not isinstance(traza.marker.color, str) else []
+		bordes = _arreglo(traza.marker.line.width) if not isinstance(traza.marker.line.width, (int, float)) else []
+		textos = list(traza.text) if traza.text is not None and not isinstance(traza.text, str) else []
+		for k, (x, y) in enumerate(zip(_arreglo(traza.x), _arreglo(traza.y))):
+			color = _color(colores[k] if k < len(colores) else traza.marker.color, "rgba(220, 38, 38, 0.85)")
+			borde = _numero(bordes[k]) if k < len(bordes) else _numero(traza.marker.line.width)
+			trazo = f' stroke="white" stroke-width="{borde:g}"' if borde else ""
+			y_barra = arriba + alto_plot - alto_fila * (filas.index(y) + 0.85)
+			x_valor = x_px(x)
+			partes.append(
+				f'<rect x="{min(cero, x_valor):.1f}" y="{y_barra:.1f}" width="{abs(x_valor - cero):.1f}" '
+				f'height="{alto_fila * 0.7:.1f}" fill="{color}"{trazo}/>'
+			)
+			if k < len(textos):
+				positivo = _numero(x) >= 0
+				partes.append(
+					f'<text x="{x_valor + (6 if positivo else -6):.1f}" y="{y_barra + alto_fila * 0.35 + 4:.1f}" '
+					f'text-anchor="{"start" if positivo else "end"}" font-size="11" fill="white">{escape(str(textos[k]))}</text>'
+				)
+	return partes
+
+
+def _posiciones_x(valores):
+	"""Posición numérica y etiqueta de cada x de una traza de líneas (fechas en días, dd/mm/aaaa)"""
+	valores = _arreglo(valores)
+	try:
+		dias = np.asarray(valores, dtype="datetime64[D]")
+	except (TypeError, ValueError):
+		return [_numero(v) for v in valores], [escape(str(v)) for v in valores]
+	return dias.astype(np.int64).astype(float).tolist(), [d.item().strftime("%d/%m/%Y") for d in dias]
+
+
+def _svg_lineas(fig, ancho, alto):
+	"""Dibuja trazas de líneas (go.Scatter) sobre un eje X de fechas o números"""
+	trazas = [t for t in fig.data if t.type == "scatter"]
+	series = []
+	for traza in trazas:
+		xs, etiquetas = _posiciones_x(traza.x)
+		puntos = [
+			(x, float(y), etiqueta) for x, y, etiqueta in zip(xs, _arreglo(traza.y), etiquetas)
+			if y is not None and not math.isnan(float(y))
+		]
+		series.append((traza, puntos))
+	todos = [punto for _, puntos in series for punto in puntos]
+	if not todos:
+		return []
+
+	x_min, x_max = min(p[0] for p in todos), max(p[0] for p in todos)
+	valores_y = [p[1] for p in todos]
+	margen = (max(valores_y) - min(valores_y) or abs(max(valores_y)) or 1.0) * 0.1
+	ticks = _ticks_rango(min(valores_y) - margen, max(valores_y) + margen)
+	y_min, y_max = ticks[0], ticks[-1]
+
+	izq, der, arriba, abajo = 70, 40, 110, 90
+	alto_plot = alto - arriba - abajo
+	ancho_plot = ancho - izq - der
+
+	def x_px(valor):
+		if x_max == x_min:
+			return izq + ancho_plot / 2
+		return izq + ancho_plot * (0.05 + 0.9 * (valor - x_min) / (x_max - x_min))
+
+	def y_px(valor):
+		return arriba + alto_plot * (1 - (valor - y_min) / (y_max - y_min))
+
+	partes = []
+	for tick in ticks:
+		y = y_px(tick)
+		partes.append(f'<line x1="{izq}" y1="{y:.1f}" x2="{ancho - der}" y2="{y:.1f}" stroke="rgba(255,255,255,0.1)"/>')
+		partes.append(f'<text x="{izq - 8}" y="{y + 4:.1f}" text-anchor="end" font-size="11" fill="white">{tick:g}</text>')
+
+	etiquetas_x = {x: etiqueta for x, _, etiqueta in todos}
+	for x, etiqueta in sorted(etiquetas_x.items()):
+		partes.append(
+			f'<text x="{x_px(x):.1f}" y="{arriba + alto_plot + 20}" text-anchor="middle" font-size="12" '
+			f'fill="white">{etiqueta}</text>'
+		)
+
+	for traza, puntos in series:
+		if not puntos:
+			continue
+		color = _color(traza.line.color or traza.marker.color, "rgba(220, 38, 38, 1)")
+		guiones = ' stroke-dasharray="8,6"' if traza.line.dash == "dash" else ""
+		ancho_linea = _numero(traza.line.width) or 2
+		recorrido = " ".join(f"{x_px(x):.1f},{y_px(y):.1f}" for x, y, _ in puntos)
+		if "lines" in (traza.mode or "lines"):
+			partes.append(
+				f'<polyline points="{recorrido}" fill="none" stroke="{color}" stroke-width="{ancho_linea:g}"{guiones}/>'
+			)
+		if "markers" in (traza.mode or ""):
+			radio = (_numero(traza.marker.size) or 6) / 2
+			for x, y, _ in puntos:
+				partes.append(
+					f'<circle cx="{x_px(x):.1f}" cy="{y_px(y):.1f}" r="{radio:g}" fill="{color}" stroke="white" stroke-width="1.5"/>'
+				)
+
+	if fig.layout.showlegend is not False:
+		partes.extend(_leyenda(trazas, ancho, alto - 30))
+	return partes
+
+
+def _svg_radar(fig, ancho, alto):
+	"""Dibuja un radar (Scatterpolar) con grilla poligonal y una capa por traza"""
+	trazas = [t for t in fig.data if t.type == "scatterpolar"]
+	ejes = list(trazas[0].theta or [])
+	if not ejes:
+		return []
+
+	radial = fig.layout.polar.radialaxis
+	angular = fig.layout.polar.angularaxis
+	valores = [_numero(v) for t in trazas for v in _arreglo(t.r)]
+	r_min, r_max = radial.range if radial.range else (min(valores + [0.0]), max(valores + [1.0]))
+	ticks = list(radial.tickvals) if radial.tickvals else _ticks(r_max)
+	rotacion = _numero(angular.rotation) if angular.rotation is not None else 90.0
+	signo = -1 if angular.direction == "clockwise" else 1
+
+	cx, cy = ancho / 2, alto / 2 + 30
+	radio = min(ancho, alto) / 2 - 90
+
+	def punto(indice, valor):
+		fraccion = (_numero(valor) - r_min) / (r_max - r_min) if r_max != r_min else 0.0
+		fraccion = min(max(fraccion, 0.0), 1.0)
+		angulo = math.radians(rotacion + signo * 360.0 * indice / len(ejes))
+		return cx + radio * fraccion * math.cos(angulo), cy - radio * fraccion * math.sin(angulo)
+
+	def poligono(valores_eje):
+		return " ".join(f"{x:.1f},{y:.1f}" for x, y in (punto(i, v) for i, v in enumerate(valores_eje)))
+
+	partes = []
+	# Grilla radial y rayos
+	for tick in ticks:
+		partes.append(
+			f'<polygon points="{poligono([tick] * len(ejes))}" fill="none" stroke="rgba(255,255,255,0.3)"/>'
+		)
+		x, y = punto(0, tick)
+		partes.append(f'<text x="{x + 4:.1f}" y="{y - 2:.1f}" font-size="11" fill="rgba(255,255,255,0.9)">{tick:g}</text>')
+	for i, eje in enumerate(ejes):
+		x, y = punto(i, r_max)
+		partes.append(f'<line x1="{cx:.1f}" y1="{cy:.1f}" x2="{x:.1f}" y2="{y:.1f}" stroke="rgba(255,255,255,0.3)"/>')
+		x_txt, y_txt = cx + (x - cx) * 1.15, cy + (y - cy) * 1.15
+		partes.append(
+			f'<text x="{x_txt:.1f}" y="{y_txt + 5:.1f}" text-anchor="middle" font-size="15" font-weight="600" '
+			f'fill="white">{escape(str(eje))}</text>'
+		)
+
+	# Capas de datos (referencia del grupo primero, jugador después)
+	for traza in trazas:
+		linea = _color(traza.line.color, "rgba(220, 38, 38, 1)")
+		relleno = _color(traza.fillcolor, "none") if traza.fill == "toself" else "none"
+		guiones = ' stroke-dasharray="8,6"' if traza.line.dash == "dash" else ""
+		ancho_linea = _numero(traza.line.width) or 2
+		partes.append(
+			f'<polygon points="{poligono(_arreglo(traza.r))}" fill="{relleno}" stroke="{linea}" '
+			f'stroke-width="{ancho_linea:g}"{guiones}/>'
+		)
+		for i, valor in enumerate(_arreglo(traza.r)):
+			x, y = punto(i, valor)
+			partes.append(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="5" fill="{linea}" stroke="white" stroke-width="2"/>')
+
+	if fig.layout.showlegend:
+		nombres = [(escape(str(t.name)), _color(t.line.color, "white")) for t in trazas if t.name]
+		for i, (nombre, color) in enumerate(nombres):
+			partes.append(f'<rect x="20" y="{alto - 40 + i * 18 - 30}" width="12" height="12" fill="{color}"/>')
+			partes.append(f'<text x="38" y="{alto - 40 + i * 18 - 19}" font-size="12" fill="white">{nombre}</text>')
+	return partes
+
+
+def _hex_a_rgb(color):
+	"""Convierte '#rrggbb' en una tupla (r, g, b)"""
+	color = color.lstrip("#")
+	return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def _color_escala(escala, fraccion):
+	"""Interpola linealmente una escala de Plotly [[pos, '#hex'], ...] en `fraccion` (0-1)"""
+	fraccion = min(max(fraccion, 0.0), 1.0)
+	for (p0, c0), (p1, c1) in zip(escala, escala[1:]):
+		if fraccion <= p1:
+			t = (fraccion - p0) / (p1 - p0) if p1 > p0 else 0.0
+			a, b = _hex_a_rgb(c0), _hex_a_rgb(c1)
+			return "rgb({},{},{})".format(*(round(x + (y - x) * t) for x, y in zip(a, b)))
+	return "rgb({},{},{})".format(*_hex_a_rgb(escala[-1][1]))
+
+
+def _alto_heatmap(fig):
+	"""Alto del lienzo SVG para un heatmap o barras horizontales: crece con la cantidad de filas"""
+	if not fig.data:
+		filas = 0
+	elif fig.data[0].type == "heatmap":
+		filas = len(_arreglo(fig.data[0].z))
+	else:
+		filas = len(_arreglo(fig.data[0].y))
+	return max(ALTO_SVG, 150 + 24 * filas)
+
+
+def _svg_heatmap(fig, ancho, alto):
+	"""Dibuja un heatmap con una celda por valor, etiquetas de filas/columnas y barra de color"""
+	traza = [t for t in fig.data if t.type == "heatmap"][0]
+	z = [list(fila) for fila in _arreglo(traza.z)]
+	columnas = _arreglo(traza.x)
+	if not z or not columnas:
+		return []
+
+	filas = fig.layout.yaxis.ticktext or _arreglo(traza.y) or list(range(len(z)))
+	escala = [list(paso) for paso in traza.colorscale]
+	z_min = _numero(traza.zmin)
+	z_max = _numero(traza.zmax) or 1.0
+	formato_lsi = "LSI" in str(traza.colorbar.title.text)
+
+	izq, der, arriba, abajo = 150, 90, 140, 20
+	ancho_celda = (ancho - izq - der) / len(columnas)
+	alto_celda = (alto - arriba - abajo) / len(z)
+	size_texto = 11 if alto_celda >= 16 else 8
+
+	partes = []
+	for j, columna in enumerate(columnas):
+		x = izq + ancho_celda * (j + 0.5)
+		partes.append(
+			f'<text x="{x:.1f}" y="{arriba - 8}" font-size="11" fill="white" '
+			f'transform="rotate(-35 {x:.1f} {arriba - 8})">{escape(str(columna))}</text>'
+		)
+
+	for i, fila in enumerate(z):
+		y = arriba + alto_celda * i
+		partes.append(
+			f'<text x="{izq - 8}" y="{y + alto_celda / 2 + 4:.1f}" text-anchor="end" font-size="{size_texto}" '
+			f'fill="white">{escape(str(filas[i]))}</text>'
+		)
+		for j, valor in enumerate(fila):
+			x = izq + ancho_celda * j
+			if valor is None or valor != valor:
+				continue
+			fraccion = (float(valor) - z_min) / (z_max - z_min) if z_max != z_min else 0.5
+			partes.append(
+				f'<rect x="{x + 1:.1f}" y="{y + 1:.1f}" width="{ancho_celda - 2:.1f}" height="{alto_celda - 2:.1f}" '
+				f'fill="{_color_escala(escala, fraccion)}"/>'
+			)
+			texto = f"{float(valor):.0f}" if formato_lsi else f"{float(valor):.1f}"
+			partes.append(
+				f'<text x="{x + ancho_celda / 2:.1f}" y="{y + alto_celda / 2 + 4:.1f}" text-anchor="middle" '
+				f'font-size="{size_texto}" fill="white">{texto}</text>'
+			)
+
+	# Barra de color
+	x_barra, alto_barra = ancho - der + 20, min(300, alto - arriba - abajo)
+	pasos = 20
+	for k in range(pasos):
+		fraccion = 1 - (k + 0.5) / pasos
+		partes.append(
+			f'<rect x="{x_barra}" y="{arriba + alto_barra * k / pasos:.1f}" width="14" '
+			f'height="{alto_barra / pasos + 0.5:.1f}" fill="{_color_escala(escala, fraccion)}"/>'
+		)
+	for valor, y in ((z_max, arriba), (z_min, arriba + alto_barra)):
+		partes.append(f'<text x="{x_barra + 18}" y="{y + 4:.1f}" font-size="11" fill="white">{valor:g}</text>')
+	return partes
+
+
+def figura_a_svg(fig, ancho=ANCHO_SVG, alto=ALTO_SVG):
+	"""Convierte una figura de barras, líneas, radar o heatmap en un SVG nativo (str).
+
+	Args:
+		fig: Figura de Plotly generada en visualizations.charts
+		ancho: Ancho del lienzo en px
+		alto: Alto del lienzo en px (los heatmaps crecen según la cantidad de filas)
+
+	Returns:
+		str con el documento SVG
+
+	Raises:
+		ValueError: si la figura contiene trazas no soportadas
+	"""
+	tipos = {traza.type for traza in fig.data}
+	if tipos not in ({"bar"}, {"scatter"}, {"scatterpolar"}, {"heatmap"}, set()):
+		raise ValueError(f"Trazas no soportadas para SVG nativo: {sorted(tipos)}")
+	if "heatmap" in tipos or _barras_horizontales(fig):
+		alto = max(alto, _alto_heatmap(fig))
+
+	fondo = _color(fig.layout.paper_bgcolor, "rgba(17, 24, 39, 1)")
+	partes = [
+		f'<svg xmlns="http://www.w3.org/2000/svg" width="{ancho}" height="{alto}" '
+		f'viewBox="0 0 {ancho} {alto}" font-family="{FUENTE_SVG}">',
+		f'<rect width="100%" height="100%" fill="{fondo}"/>',
+	]
+	partes.extend(_titulo(fig, ancho))
+	if _barras_horizontales(fig):
+		partes.extend(_svg_barras_horizontales(fig, ancho, alto))
+	elif "bar" in tipos:
+		partes.extend(_svg_barras(fig, ancho, alto))
+	elif "scatter" in tipos:
+		partes.extend(_svg_lineas(fig, ancho, alto))
+	elif "scatterpolar" in tipos:
+		partes.extend(_svg_radar(fig, ancho, alto))
+	elif "heatmap" in tipos:
+		partes.extend(_svg_heatmap(fig, ancho, alto))
+	partes.extend(_anotaciones_paper(fig, ancho, alto))
+	partes.append("</svg>")
+	return _rgba_a_opacidad("\n".join(partes))